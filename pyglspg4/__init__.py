@@ -0,0 +1,100 @@
+# Copyright (C) 2025-2026 Kris Kirby, KE4AHR
+# SPDX-License-Identifier: LGPL-3.0-or-later
+#
+# This file is part of Pyglspg4.
+
+"""
+Pure-Python SGP-4 / SDP-4 propagation.
+
+The public API is exposed lazily: "import pyglspg4" loads no
+submodule, and each name below imports its defining module on first
+attribute access. Short-lived processes therefore pay only for what
+they use; NumPy, the EOP table and the deep-space theory load when a
+name that needs them is first touched.
+
+    import pyglspg4
+
+    sat = pyglspg4.Satellite.from_lines(line1, line2)
+    position, velocity, error = sat.at(90.0)
+
+Submodules remain importable directly, e.g.
+"from pyglspg4.tle.parser import parse_tle".
+"""
+
+import importlib
+
+# Public name -> (defining module, attribute)
+_LAZY = {
+    # TLE input
+    "TLE": ("pyglspg4.tle.parser", "TLE"),
+    "parse_tle": ("pyglspg4.tle.parser", "parse_tle"),
+    "TLECatalog": ("pyglspg4.tle.catalog", "TLECatalog"),
+    "load_catalog": ("pyglspg4.tle.catalog", "load_catalog"),
+    # Propagation
+    "Satellite": ("pyglspg4.api.satellite", "Satellite"),
+    "as_satellite": ("pyglspg4.api.satellite", "as_satellite"),
+    "propagate": ("pyglspg4.api.propagate", "propagate"),
+    "propagate_batch": ("pyglspg4.api.batch", "propagate_batch"),
+    "propagate_parallel": ("pyglspg4.api.parallel", "propagate_parallel"),
+    "propagate_vectorized": ("pyglspg4.api.vectorized", "propagate_vectorized"),
+    "stream_ephemeris": ("pyglspg4.api.stream", "stream_ephemeris"),
+    "EphemerisChunk": ("pyglspg4.api.stream", "EphemerisChunk"),
+    "SatrecArray": ("pyglspg4.sgp4.satrec_array", "SatrecArray"),
+    # Errors
+    "Pyglspg4Error": ("pyglspg4.api.exceptions", "Pyglspg4Error"),
+    "ConvergenceError": ("pyglspg4.api.exceptions", "ConvergenceError"),
+    "PropagationError": ("pyglspg4.api.exceptions", "PropagationError"),
+    "SGP4PropagationError": ("pyglspg4.api.exceptions", "SGP4PropagationError"),
+    # Frames and Earth orientation
+    "teme_to_ecef": ("pyglspg4.frames.teme_to_ecef", "teme_to_ecef"),
+    "teme_to_itrf": ("pyglspg4.frames.itrf", "teme_to_itrf"),
+    "teme_to_itrf_array": ("pyglspg4.frames.pipeline", "teme_to_itrf_array"),
+    "EOPTable": ("pyglspg4.frames.eop", "EOPTable"),
+    "DEFAULT_EOP": ("pyglspg4.frames.eop", "DEFAULT_EOP"),
+    # Ground stations
+    "GroundStation": ("pyglspg4.groundstation.station", "GroundStation"),
+    "predict_passes": ("pyglspg4.groundstation.passes", "predict_passes"),
+    "predict_passes_geodetic": (
+        "pyglspg4.groundstation.passes",
+        "predict_passes_geodetic",
+    ),
+    # Ephemeris files
+    "EphemerisFile": ("pyglspg4.export.ephemeris", "EphemerisFile"),
+    "EphemerisWriter": ("pyglspg4.export.ephemeris", "EphemerisWriter"),
+    "write_ephemeris": ("pyglspg4.export.ephemeris", "write_ephemeris"),
+    # Backends
+    "select_backend": ("pyglspg4.backend.selector", "select_backend"),
+    "available_backends": ("pyglspg4.backend.selector", "available_backends"),
+}
+
+__all__ = sorted(_LAZY)
+
+
+def _version() -> str:
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version("pyglspg4")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def __getattr__(name: str):
+    if name == "__version__":
+        value = _version()
+    else:
+        try:
+            module_name, attribute = _LAZY[name]
+        except KeyError:
+            raise AttributeError(
+                f"module {__name__!r} has no attribute {name!r}"
+            ) from None
+        value = getattr(importlib.import_module(module_name), attribute)
+
+    # Later lookups find the name directly and skip this hook
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY) | {"__version__"})
@@ -14,31 +14,55 @@ from __future__ import annotations
 
 from typing import Sequence
 
-from pyglspg4.api.propagate import propagate
+from pyglspg4.api.satellite import as_satellite
+from pyglspg4.backend.selector import select_backend
 
 
 def propagate_batch(
     parsed_tles: Sequence,
     epochs: Sequence,
-    backend: str | None = None,
+    backend=None,
 ):
     """
     Propagate multiple satellites sequentially.
 
+    Each TLE is validated and initialized once. Entries may also be
+    prebuilt Satellite handles, which are used as-is.
+
     Args:
-        parsed_tles: Sequence of ParsedTLE objects
-        epochs: Sequence of Epoch objects
-        backend: Optional backend selector ("numpy" or None)
+        parsed_tles: Sequence of ParsedTLE objects or Satellite handles
+        epochs: Sequence of Epoch objects or minutes since TLE epoch
+        backend: Optional backend: a registered name such as "numpy"
+                 or "numba", a MathBackend instance, or None for the
+                 scalar kernel. An array backend propagates the whole
+                 batch in one SatrecArray pass.
 
     Returns:
-        List of (position, velocity) tuples.
+        List of (position, velocity, error_code) tuples.
     """
     if len(parsed_tles) != len(epochs):
         raise ValueError("parsed_tles and epochs must be the same length")
 
-    results = []
-    for tle, epoch in zip(parsed_tles, epochs):
-        results.append(propagate(tle, epoch, backend))
+    sats = [as_satellite(tle, backend) for tle in parsed_tles]
+    tsince = [sat.tsince(epoch) for sat, epoch in zip(sats, epochs)]
+
+    xp = select_backend(backend)
+    if xp.is_array and sats:
+        return _propagate_array(sats, tsince, xp)
+
+    return [sat.at(t) for sat, t in zip(sats, tsince)]
+
+
+def _propagate_array(sats, tsince, xp):
+    import numpy as np
+
+    from pyglspg4.sgp4.satrec_array import SatrecArray
 
-    return results
+    array = SatrecArray.from_states([sat.record for sat in sats])
+    times = np.asarray(tsince, dtype=np.float64).reshape(len(sats), 1)
 
+    pos, vel, err = array.propagate(times, backend=xp)
+    return [
+        (tuple(pos[i, 0].tolist()), tuple(vel[i, 0].tolist()), int(err[i, 0]))
+        for i in range(len(sats))
+    ]
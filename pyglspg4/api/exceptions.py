@@ -31,3 +31,10 @@ class PropagationError(Pyglspg4Error):
     """
     pass
 
+
+
+class SGP4PropagationError(PropagationError):
+    """
+    Raised when the SGP-4 / SDP-4 kernels reject a state or time.
+    """
+    pass
@@ -13,49 +13,109 @@ deterministic behavior and thread safety.
 
 from __future__ import annotations
 
+import os
 from typing import Sequence
 
-from pyglspg4.api.propagate import propagate
+from pyglspg4.api.batch import propagate_batch
+from pyglspg4.api.satellite import as_satellite
+from pyglspg4.backend.selector import select_backend
 from pyglspg4.parallel.executors import run_threaded, run_processes
 
 
+def _propagate_task(args):
+    """
+    Propagate one (Satellite, epoch) pair.
+
+    Defined at module level so process pools can pickle it.
+    """
+    sat, epoch = args
+    return sat.at(sat.tsince(epoch))
+
+
+def _propagate_chunk(args):
+    """
+    Propagate a contiguous run of (Satellite, epoch) pairs in one
+    array pass on the given backend.
+    """
+    tasks, backend = args
+    return propagate_batch(
+        [sat for sat, _ in tasks], [epoch for _, epoch in tasks], backend
+    )
+
+
 def propagate_parallel(
     parsed_tles: Sequence,
     epochs: Sequence,
-    backend: str | None = None,
+    backend=None,
     mode: str = "thread",
     max_workers: int | None = None,
 ):
     """
     Propagate multiple satellites in parallel.
 
+    TLEs are validated and initialized once in the calling process;
+    workers only receive the resulting Satellite handles.
+
     Args:
-        parsed_tles: Sequence of ParsedTLE objects
-        epochs: Sequence of Epoch objects
-        backend: Optional backend selector ("numpy" or None)
+        parsed_tles: Sequence of ParsedTLE objects or Satellite handles
+        epochs: Sequence of Epoch objects or minutes since TLE epoch
+        backend: Optional backend, as for propagate_batch. With an
+                 array backend ("numpy", "numba") the thread and
+                 process modes hand each worker one contiguous chunk,
+                 propagated in a single array pass.
         mode: Execution mode, one of:
               - "thread"  (ThreadPoolExecutor, default)
               - "process" (ProcessPoolExecutor)
+              - "shared"  (persistent shared-memory pool, NumPy)
         max_workers: Optional maximum number of worker threads/processes
 
     Returns:
-        List of (position, velocity) tuples.
+        List of (position, velocity, error_code) tuples.
     """
 
     if len(parsed_tles) != len(epochs):
         raise ValueError("parsed_tles and epochs must be the same length")
 
-    tasks = list(zip(parsed_tles, epochs))
+    tasks = [
+        (as_satellite(tle, backend), epoch)
+        for tle, epoch in zip(parsed_tles, epochs)
+    ]
+
+    if mode in ("thread", "process"):
+        run = run_threaded if mode == "thread" else run_processes
+        if select_backend(backend).is_array and tasks:
+            chunks = _chunks(tasks, max_workers or os.cpu_count() or 1)
+            results = run(
+                _propagate_chunk,
+                [(chunk, backend) for chunk in chunks],
+                max_workers,
+            )
+            return [r for chunk in results for r in chunk]
+        return run(_propagate_task, tasks, max_workers)
+
+    if mode == "shared":
+        return _propagate_shared(tasks, max_workers)
 
-    def _task(args):
-        tle, epoch = args
-        return propagate(tle, epoch, backend)
+    raise ValueError(f"Unknown parallel execution mode: {mode}")
 
-    if mode == "thread":
-        return run_threaded(_task, tasks, max_workers)
 
-    if mode == "process":
-        return run_processes(_task, tasks, max_workers)
+def _chunks(tasks, count):
+    size = -(-len(tasks) // count)
+    return [tasks[i:i + size] for i in range(0, len(tasks), size)]
 
-    raise ValueError(f"Unknown parallel execution mode: {mode}")
 
+def _propagate_shared(tasks, max_workers):
+    import numpy as np
+
+    from pyglspg4.parallel.shared import shared_pool
+    from pyglspg4.sgp4.satrec_array import SatrecArray
+
+    array = SatrecArray.from_states([sat.record for sat, _ in tasks])
+    tsince = np.array([[sat.tsince(epoch)] for sat, epoch in tasks])
+    tsince = tsince.reshape(len(tasks), 1)
+
+    pos, vel, err = shared_pool(max_workers).propagate(array, tsince)
+    return [
+        (tuple(pos[i, 0].tolist()), tuple(vel[i, 0].tolist()), int(err[i, 0]))
+        for i in range(len(tasks))
+    ]
@@ -4,15 +4,28 @@
 # Unified propagation API.
 # Dispatches to SGP-4 (near-Earth) or SDP-4 (deep-space).
 
-from pyglspg4.tle.validator import validate_tle
-from pyglspg4.sgp4.initializer import initialize_sgp4
-from pyglspg4.sgp4.near_earth import propagate_near_earth
+from functools import lru_cache
+
+from pyglspg4.api.satellite import Satellite
+
+
+# Parsed TLEs are frozen and hashable, so repeated calls with the
+# same TLE reuse one initialized Satellite.
+_SATELLITE_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=_SATELLITE_CACHE_SIZE)
+def _satellite(tle):
+    return Satellite(tle)
 
 
 def propagate(tle, tsince_min):
     """
     Propagate satellite state from TLE.
 
+    Validation and initialization run once per distinct TLE; use
+    Satellite directly to control the lifetime of that work.
+
     Parameters
     ----------
     tle : TLE
@@ -25,10 +38,4 @@ def propagate(tle, tsince_min):
     (pos_km, vel_km_s, error_code)
     """
 
-    validate_tle(tle)
-
-    # NOTE: Deep-space detection hook reserved for SDP-4
-    state = initialize_sgp4(tle)
-
-    return propagate_near_earth(state, tsince_min)
-
+    return _satellite(tle).at(tsince_min)
@@ -0,0 +1,213 @@
+# Copyright (C) 2025-2026 Kris Kirby, KE4AHR
+# SPDX-License-Identifier: LGPL-3.0-or-later
+#
+# This file is part of Pyglspg4.
+
+"""
+Initialize-once satellite handle.
+
+A Satellite validates and initializes a TLE exactly once and keeps the
+derived coefficients in an immutable record: an SGP4Record for
+near-Earth objects, an SDP4Record for deep-space objects (period of
+225 minutes or more). Any number of propagations, threads, or worker
+processes may then share the handle without repeating the initializer.
+"""
+
+from __future__ import annotations
+
+from typing import Sequence
+
+from pyglspg4.backend.selector import select_backend
+from pyglspg4.tle.parser import parse_tle
+from pyglspg4.tle.validator import validate_tle
+from pyglspg4.sdp4.propagate import propagate_deep_space
+from pyglspg4.sdp4.record import SDP4Record
+from pyglspg4.sgp4.initializer import initialize_sgp4
+from pyglspg4.sgp4.near_earth import propagate_near_earth
+from pyglspg4.sgp4.propagate import deep_space_record
+from pyglspg4.sgp4.record import SGP4Record
+from pyglspg4.sgp4.state import SGP4State
+from pyglspg4.time.epochs import Epoch
+
+
+class Satellite:
+    """
+    Propagation handle for a single satellite.
+
+    Args:
+        tle: Parsed TLE object
+        backend: Optional backend used by at_many(): a registered name
+                 such as "numpy" or "numba", a MathBackend instance,
+                 or None for the scalar kernel (see select_backend)
+    """
+
+    __slots__ = (
+        "tle", "record", "backend", "_kernel", "_array", "_xp", "_last",
+    )
+
+    def __init__(self, tle, backend=None) -> None:
+        validate_tle(tle)
+
+        record = _freeze(initialize_sgp4(tle))
+        self._setup(tle, record, backend)
+
+    @classmethod
+    def from_lines(
+        cls,
+        line1: str,
+        line2: str,
+        backend=None,
+        cache=None,
+    ) -> "Satellite":
+        """
+        Parse, validate and initialize a TLE line pair.
+
+        Args:
+            line1: TLE line 1
+            line2: TLE line 2
+            backend: Optional backend selector, as for Satellite()
+            cache: Optional StateCache consulted before initializing
+        """
+        tle = parse_tle(line1, line2)
+        if cache is None:
+            return cls(tle, backend)
+
+        validate_tle(tle)
+        record = cache.get_or_initialize(line1, line2)
+
+        sat = cls.__new__(cls)
+        sat._setup(tle, record, backend)
+        return sat
+
+    @classmethod
+    def from_state(cls, state, backend=None) -> "Satellite":
+        """
+        Wrap an already initialized SGP4State, SGP4Record or SDP4Record.
+        """
+        sat = cls.__new__(cls)
+        sat._setup(None, _freeze(state), backend)
+        return sat
+
+    def _setup(self, tle, record, backend) -> None:
+        self.tle = tle
+        self.record = record
+        self.backend = backend
+        self._kernel = (
+            propagate_deep_space if record.is_deep_space else propagate_near_earth
+        )
+        self._array = None
+        self._xp = None
+        self._last = None
+
+    def __getstate__(self):
+        return (self.tle, self.record, self.backend)
+
+    def __setstate__(self, state) -> None:
+        self._setup(*state)
+
+    def __repr__(self) -> str:
+        return f"Satellite(satnum={self.satnum!r})"
+
+    @property
+    def satnum(self):
+        """
+        NORAD catalog number, or None when built from a bare state.
+        """
+        return self.tle.satnum if self.tle is not None else None
+
+    @property
+    def epoch_jd(self) -> float:
+        """
+        TLE epoch as a Julian date.
+        """
+        return self.record.epoch_jd
+
+    def tsince(self, epoch) -> float:
+        """
+        Minutes since the TLE epoch for an Epoch or a minute offset.
+        """
+        if isinstance(epoch, Epoch):
+            return (epoch.julian_date - self.record.epoch_jd) * 1440.0
+        return float(epoch)
+
+    def at(self, tsince_min: float):
+        """
+        Propagate to a single time.
+
+        Args:
+            tsince_min: Minutes since TLE epoch
+
+        Returns:
+            (pos_km, vel_km_s, error_code)
+        """
+        # The kernel is pure, so the last result can be reused as-is.
+        # The (time, result) pair is swapped in as one object, which
+        # keeps concurrent readers consistent.
+        last = self._last
+        if last is not None and last[0] == tsince_min:
+            return last[1]
+
+        result = self._kernel(self.record, tsince_min)
+        self._last = (tsince_min, result)
+        return result
+
+    def at_many(self, times: Sequence[float]):
+        """
+        Propagate to many times.
+
+        When the handle's backend resolves to an array backend (NumPy,
+        or Numba with its fused kernel), all times are evaluated in one
+        SatrecArray pass on that backend.
+
+        Args:
+            times: Sequence of minutes since TLE epoch
+
+        Returns:
+            List of (pos_km, vel_km_s, error_code) tuples in input order.
+        """
+        array = self._satrec_array()
+        if array is None:
+            return [self.at(t) for t in times]
+
+        positions, velocities, errors = array.propagate(
+            times, backend=self._xp
+        )
+        return [
+            (tuple(positions[0, j]), tuple(velocities[0, j]), int(errors[0, j]))
+            for j in range(positions.shape[1])
+        ]
+
+    def _satrec_array(self):
+        if self._xp is None:
+            self._xp = select_backend(self.backend)
+        if not self._xp.is_array:
+            return None
+
+        if self._array is None:
+            from pyglspg4.sgp4.satrec_array import SatrecArray
+
+            self._array = SatrecArray.from_states([self.record])
+
+        return self._array
+
+
+def _freeze(state):
+    # Immutable record the propagation kernel reads for a state
+    if state.is_deep_space:
+        return deep_space_record(state)
+    if isinstance(state, SGP4Record):
+        return state
+    return SGP4Record.from_state(state)
+
+
+def as_satellite(obj, backend=None) -> Satellite:
+    """
+    Return a Satellite for a TLE, an initialized state, or a Satellite.
+
+    Existing Satellite handles are returned unchanged.
+    """
+    if isinstance(obj, Satellite):
+        return obj
+    if isinstance(obj, (SGP4State, SGP4Record, SDP4Record)):
+        return Satellite.from_state(obj, backend)
+    return Satellite(obj, backend)
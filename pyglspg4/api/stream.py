@@ -0,0 +1,203 @@
+# Copyright (C) 2025-2026 Kris Kirby, KE4AHR
+# SPDX-License-Identifier: LGPL-3.0-or-later
+#
+# This file is part of Pyglspg4.
+
+"""
+Streaming ephemeris generation.
+
+Splits a long, regularly sampled time span into fixed-size blocks of
+samples and propagates the whole catalog one block at a time through
+SatrecArray. Blocks are yielded as they are produced, so memory stays
+bounded by the block size however long the span is.
+
+The generator is pull-driven: nothing is computed until the consumer
+asks for the next block. With prefetch > 0, a background thread keeps
+up to that many blocks ready in a bounded queue and blocks when the
+queue is full, so a slow writer throttles the producer instead of
+letting results pile up. With reuse_buffers, blocks are written into
+a fixed ring of prefetch + 2 buffers; each block is then only valid
+until the next one is requested.
+
+Requires NumPy.
+"""
+
+from __future__ import annotations
+
+import queue
+import threading
+from dataclasses import dataclass
+from typing import Iterator, Sequence, Union
+
+import numpy as np
+
+from pyglspg4.sgp4.propagate import grid_size
+from pyglspg4.sgp4.satrec_array import SatrecArray
+
+
+# Seconds between checks of the stop flag while the queue is full
+_PUT_TIMEOUT = 0.1
+
+
+@dataclass(frozen=True)
+class EphemerisChunk:
+    """
+    One block of a streamed ephemeris.
+
+    Attributes:
+        index: Position of the first sample in the whole span
+        jd: (T,) Julian dates of the samples
+        satnums: (N,) catalog numbers, in row order
+        position: (N, T, 3) TEME positions (km)
+        velocity: (N, T, 3) TEME velocities (km/s)
+        error: (N, T) SGP-4 error codes
+    """
+
+    index: int
+    jd: np.ndarray
+    satnums: np.ndarray
+    position: np.ndarray
+    velocity: np.ndarray
+    error: np.ndarray
+
+    def __len__(self) -> int:
+        return self.jd.shape[0]
+
+
+def stream_ephemeris(
+    satellites: Union[SatrecArray, Sequence],
+    jd_start: float,
+    duration_days: float,
+    step_seconds: float,
+    chunk_size: int = 3600,
+    prefetch: int = 0,
+    reuse_buffers: bool = False,
+) -> Iterator[EphemerisChunk]:
+    """
+    Propagate a catalog over a time span in fixed-size blocks.
+
+    Samples are taken at jd_start + k * step_seconds for every k with
+    k * step_seconds <= duration_days * 86400.
+
+    Args:
+        satellites: SatrecArray, or a sequence of parsed TLEs
+        jd_start: Julian date of the first sample
+        duration_days: Length of the span (days)
+        step_seconds: Sample spacing (seconds)
+        chunk_size: Samples per block; the last block may be shorter
+        prefetch: Blocks computed ahead in a background thread
+                  (0 computes each block on demand)
+        reuse_buffers: Write blocks into a fixed ring of buffers
+                       instead of allocating new arrays per block
+
+    Yields:
+        EphemerisChunk for consecutive sample ranges.
+    """
+    if step_seconds <= 0.0:
+        raise ValueError("step_seconds must be positive")
+    if duration_days < 0.0:
+        raise ValueError("duration_days must not be negative")
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    if prefetch < 0:
+        raise ValueError("prefetch must not be negative")
+
+    if not isinstance(satellites, SatrecArray):
+        satellites = SatrecArray.from_tles(satellites)
+
+    count = grid_size(0.0, duration_days * 86400.0, step_seconds)
+    blocks = _blocks(
+        satellites, jd_start, step_seconds, count, chunk_size,
+        prefetch + 2 if reuse_buffers else 0,
+    )
+
+    if prefetch == 0:
+        return blocks
+    return _prefetched(blocks, prefetch)
+
+
+def _blocks(
+    sats: SatrecArray,
+    jd_start: float,
+    step_seconds: float,
+    count: int,
+    chunk_size: int,
+    ring: int,
+) -> Iterator[EphemerisChunk]:
+    n = len(sats)
+    step_min = step_seconds / 60.0
+
+    # tsince is the offset of jd_start plus a multiple of the step,
+    # which avoids differencing large Julian dates for every sample
+    offset = ((jd_start - sats.epoch_jd) * 1440.0)[:, np.newaxis]
+
+    buffers = [
+        (np.empty((n, chunk_size, 3)), np.empty((n, chunk_size, 3)))
+        for _ in range(ring)
+    ]
+
+    for block, index in enumerate(range(0, count, chunk_size)):
+        k = np.arange(index, min(index + chunk_size, count), dtype=np.float64)
+        tsince = offset + k * step_min
+
+        out = None
+        if buffers:
+            position, velocity = buffers[block % ring]
+            out = (position[:, : k.size], velocity[:, : k.size])
+
+        position, velocity, error = sats.propagate(tsince, out=out)
+        yield EphemerisChunk(
+            index=index,
+            jd=jd_start + k * (step_seconds / 86400.0),
+            satnums=sats.satnums,
+            position=position,
+            velocity=velocity,
+            error=error,
+        )
+
+
+def _prefetched(
+    blocks: Iterator[EphemerisChunk],
+    depth: int,
+) -> Iterator[EphemerisChunk]:
+    """
+    Run a block generator in a thread, at most depth blocks ahead.
+    """
+    ready: "queue.Queue" = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+    done = object()
+
+    def put(item) -> bool:
+        while not stop.is_set():
+            try:
+                ready.put(item, timeout=_PUT_TIMEOUT)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce() -> None:
+        try:
+            for chunk in blocks:
+                if not put(chunk):
+                    return
+            put(done)
+        except BaseException as exc:
+            put(exc)
+
+    worker = threading.Thread(
+        target=produce, name="pyglspg4-ephemeris", daemon=True
+    )
+    worker.start()
+
+    try:
+        while True:
+            item = ready.get()
+            if item is done:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        stop.set()
+        worker.join()
@@ -15,7 +15,8 @@ from __future__ import annotations
 
 from typing import Sequence
 
-from pyglspg4.api.propagate import propagate
+from pyglspg4.api.satellite import Satellite
+from pyglspg4.time.epochs import Epoch
 
 
 def propagate_vectorized(
@@ -25,19 +26,45 @@ def propagate_vectorized(
     """
     Propagate multiple satellites to a common epoch using a NumPy backend.
 
-    This function is a convenience wrapper that enforces NumPy usage
-    and delegates to the standard propagation path. True state-level
-    vectorization may be introduced in future releases.
+    All satellites are initialized once and packed into a
+    SatrecArray, which evaluates the whole catalog as array
+    operations. If NumPy is not installed, each satellite is
+    propagated through the standard scalar path instead.
 
     Args:
         parsed_tles: Sequence of ParsedTLE objects
-        epoch: Epoch instance common to all satellites
+        epoch: Epoch instance common to all satellites, or minutes
+               since each satellite's own TLE epoch
 
     Returns:
-        List of (position, velocity) tuples.
+        List of (position, velocity, error_code) tuples.
+    """
+    try:
+        from pyglspg4.sgp4.satrec_array import SatrecArray
+    except ImportError:
+        return _propagate_scalar(parsed_tles, epoch)
+
+    sats = SatrecArray.from_tles(parsed_tles)
+
+    if isinstance(epoch, Epoch):
+        tsince = sats.tsince_at(epoch.julian_date)
+    else:
+        tsince = float(epoch)
+
+    positions, velocities, errors = sats.propagate(tsince)
+
+    return [
+        (tuple(positions[i, 0]), tuple(velocities[i, 0]), int(errors[i, 0]))
+        for i in range(len(sats))
+    ]
+
+
+def _propagate_scalar(parsed_tles: Sequence, epoch):
+    """
+    Pure-Python fallback used when NumPy is unavailable.
     """
     results = []
     for tle in parsed_tles:
-        results.append(propagate(tle, epoch, backend="numpy"))
+        sat = Satellite(tle)
+        results.append(sat.at(sat.tsince(epoch)))
     return results
-
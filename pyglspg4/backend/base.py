@@ -6,19 +6,68 @@
 """
 Backend protocol for numerical operations.
 
-Defines the minimal math interface required by Pyglspg4 so that
-pure-Python and NumPy backends can be used interchangeably.
+Defines the math interface the propagation and frame kernels are
+written against, so that one kernel runs on Python floats or on
+whole arrays depending on the backend it is handed.
+
+Operands are scalars for the pure-Python backend and arrays (or
+anything broadcastable against them) for array backends. Element-wise
+operations accept an optional out= buffer, which scalar backends
+ignore. Vectors are passed between kernels as (x, y, z) component
+triples; components() and stack() convert to and from the backend's
+native vector layout (tuples, or arrays with a trailing axis of 3).
 """
 
 from __future__ import annotations
 
-from typing import Protocol, Callable
+from typing import Any, Callable, Protocol, Tuple
+
+
+Unary = Callable[..., Any]
+Binary = Callable[..., Any]
 
 
 class MathBackend(Protocol):
-    sin: Callable[[float], float]
-    cos: Callable[[float], float]
-    sqrt: Callable[[float], float]
-    atan2: Callable[[float, float], float]
-    abs: Callable[[float], float]
+    name: str
+    is_array: bool
+
+    # Trigonometry and roots
+    sin: Unary
+    cos: Unary
+    tan: Unary
+    asin: Unary
+    acos: Unary
+    atan: Unary
+    atan2: Binary
+    sqrt: Unary
+    hypot: Binary
+
+    # Rounding, remainders and signs
+    abs: Unary
+    floor: Unary
+    mod: Binary
+    fmod: Binary
+    copysign: Binary
+    minimum: Binary
+    maximum: Binary
+
+    def fma(self, a: Any, b: Any, c: Any, out: Any = None) -> Any:
+        """a * b + c"""
+
+    def where(self, condition: Any, a: Any, b: Any) -> Any:
+        """a where condition holds, b elsewhere"""
+
+    def any(self, condition: Any) -> bool:
+        ...
+
+    def all(self, condition: Any) -> bool:
+        ...
+
+    def asarray(self, value: Any) -> Any:
+        ...
+
+    def components(self, vector: Any) -> Tuple[Any, Any, Any]:
+        ...
 
+    def stack(self, components: Tuple[Any, Any, Any], out: Any = None) -> Any:
+        ...
@@ -8,16 +8,76 @@ NumPy-accelerated math backend.
 
 Implements the MathBackend protocol using NumPy vectorized functions.
 This backend enables batch and parallel propagation with improved
-performance when NumPy is available.
+performance when NumPy is available. Vectors are arrays whose last
+axis holds the x, y, z components.
 """
 
 import numpy as np
 
 
 class NumPyBackend:
+    name = "numpy"
+    is_array = True
+
     sin = staticmethod(np.sin)
     cos = staticmethod(np.cos)
-    sqrt = staticmethod(np.sqrt)
+    tan = staticmethod(np.tan)
+    asin = staticmethod(np.arcsin)
+    acos = staticmethod(np.arccos)
+    atan = staticmethod(np.arctan)
     atan2 = staticmethod(np.arctan2)
+    sqrt = staticmethod(np.sqrt)
+    hypot = staticmethod(np.hypot)
+
     abs = staticmethod(np.abs)
+    floor = staticmethod(np.floor)
+    mod = staticmethod(np.mod)
+    fmod = staticmethod(np.fmod)
+    copysign = staticmethod(np.copysign)
+    minimum = staticmethod(np.minimum)
+    maximum = staticmethod(np.maximum)
+
+    @staticmethod
+    def fma(a, b, c, out=None):
+        # Two passes through one buffer instead of a temporary per step;
+        # the buffer takes the shape of all three operands, since a * b
+        # alone may broadcast to less than the result
+        if out is None:
+            shape = np.broadcast_shapes(np.shape(a), np.shape(b), np.shape(c))
+            out = np.empty(shape)
+        np.multiply(a, b, out=out)
+        return np.add(out, c, out=out)
+
+    @staticmethod
+    def where(condition, a, b):
+        return np.where(condition, a, b)
+
+    @staticmethod
+    def any(condition):
+        return bool(np.any(condition))
+
+    @staticmethod
+    def all(condition):
+        return bool(np.all(condition))
+
+    @staticmethod
+    def asarray(value):
+        return np.asarray(value, dtype=np.float64)
+
+    @staticmethod
+    def components(vector):
+        vector = np.asarray(vector, dtype=np.float64)
+        return vector[..., 0], vector[..., 1], vector[..., 2]
+
+    @staticmethod
+    def stack(components, out=None):
+        shape = np.broadcast_shapes(*(np.shape(c) for c in components))
+        if out is None:
+            out = np.empty(shape + (3,))
+        for k, c in enumerate(components):
+            out[..., k] = c
+        return out
+
 
+# Shared instance; the backend holds no state
+NUMPY = NumPyBackend()
@@ -8,16 +8,79 @@ Pure-Python math backend.
 
 Provides standard library math functions implementing the MathBackend
 protocol. This backend is deterministic and requires no external
-dependencies.
+dependencies. Operands are Python floats; out= buffers are ignored.
 """
 
 import math
 
 
+def _unary(func):
+    def op(x, out=None):
+        return func(x)
+
+    op.__name__ = func.__name__
+    return staticmethod(op)
+
+
+def _binary(func):
+    def op(x, y, out=None):
+        return func(x, y)
+
+    op.__name__ = func.__name__
+    return staticmethod(op)
+
+
 class PythonBackend:
-    sin = staticmethod(math.sin)
-    cos = staticmethod(math.cos)
-    sqrt = staticmethod(math.sqrt)
-    atan2 = staticmethod(math.atan2)
-    abs = staticmethod(abs)
+    name = "python"
+    is_array = False
+
+    sin = _unary(math.sin)
+    cos = _unary(math.cos)
+    tan = _unary(math.tan)
+    asin = _unary(math.asin)
+    acos = _unary(math.acos)
+    atan = _unary(math.atan)
+    atan2 = _binary(math.atan2)
+    sqrt = _unary(math.sqrt)
+    hypot = _binary(math.hypot)
+
+    abs = _unary(abs)
+    floor = _unary(math.floor)
+    mod = _binary(lambda x, y: x % y)
+    fmod = _binary(math.fmod)
+    copysign = _binary(math.copysign)
+    minimum = _binary(min)
+    maximum = _binary(max)
+
+    @staticmethod
+    def fma(a, b, c, out=None):
+        return a * b + c
+
+    @staticmethod
+    def where(condition, a, b):
+        return a if condition else b
+
+    @staticmethod
+    def any(condition):
+        return bool(condition)
+
+    @staticmethod
+    def all(condition):
+        return bool(condition)
+
+    @staticmethod
+    def asarray(value):
+        return float(value)
+
+    @staticmethod
+    def components(vector):
+        x, y, z = vector
+        return x, y, z
+
+    @staticmethod
+    def stack(components, out=None):
+        return tuple(components)
+
 
+# Shared instance; the backend holds no state
+PYTHON = PythonBackend()
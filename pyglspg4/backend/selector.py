@@ -6,33 +6,132 @@
 """
 Runtime backend selection.
 
-Selects an appropriate numerical backend (pure Python or NumPy)
-based on user preference and availability.
+Selects an appropriate numerical backend (pure Python, NumPy or
+Numba) based on user preference and availability. Backends are
+registered by name with a loader that imports them on first use, so
+optional dependencies are only touched when their backend is
+requested. A backend that cannot be loaded falls back along its
+registered fallback chain, ending at pure Python.
 """
 
 from __future__ import annotations
 
-from pyglspg4.backend.python import PythonBackend
+import threading
+from typing import Callable, Dict, Optional, Tuple
 
+from pyglspg4.backend.base import MathBackend
+from pyglspg4.backend.python import PYTHON
 
-def select_backend(prefer: str | None = None):
+
+def _load_numpy() -> MathBackend:
+    from pyglspg4.backend.numpy import NUMPY
+    return NUMPY
+
+
+def _load_numba() -> MathBackend:
+    from pyglspg4.backend.numba import NUMBA
+    return NUMBA
+
+
+_lock = threading.Lock()
+_LOADERS: Dict[str, Callable[[], MathBackend]] = {
+    "python": lambda: PYTHON,
+    "numpy": _load_numpy,
+    "numba": _load_numba,
+}
+_FALLBACKS: Dict[str, str] = {
+    "numba": "numpy",
+}
+_LOADED: Dict[str, MathBackend] = {}
+# Load failures, kept so an absent dependency is only searched for once
+_FAILED: Dict[str, ImportError] = {}
+
+
+def register_backend(
+    name: str,
+    loader: Callable[[], MathBackend],
+    fallback: Optional[str] = None,
+) -> None:
+    """
+    Register a backend under a name.
+
+    Args:
+        name: Name accepted by select_backend()
+        loader: Callable returning the backend instance. It is called
+                once, on first selection, and may raise ImportError
+                when a dependency is missing.
+        fallback: Name of the backend to try when this one cannot be
+                  loaded; pure Python if omitted.
+    """
+    with _lock:
+        _LOADERS[name] = loader
+        _LOADED.pop(name, None)
+        _FAILED.pop(name, None)
+        if fallback is None:
+            _FALLBACKS.pop(name, None)
+        else:
+            _FALLBACKS[name] = fallback
+
+
+def available_backends() -> Tuple[str, ...]:
+    """
+    Names of the registered backends that load in this environment.
     """
-    Select and instantiate a math backend.
+    names = []
+    for name in tuple(_LOADERS):
+        try:
+            _load(name)
+        except ImportError:
+            continue
+        names.append(name)
+    return tuple(names)
+
+
+def _load(name: str) -> MathBackend:
+    backend = _LOADED.get(name)
+    if backend is None:
+        if name in _FAILED:
+            raise _FAILED[name]
+        try:
+            backend = _LOADERS[name]()
+        except ImportError as exc:
+            _FAILED[name] = exc
+            raise
+        with _lock:
+            backend = _LOADED.setdefault(name, backend)
+    return backend
+
+
+def select_backend(prefer: str | MathBackend | None = None) -> MathBackend:
+    """
+    Select a math backend.
 
     Args:
         prefer: Optional backend preference. Supported values:
-                - "numpy": prefer NumPy backend if available
+                - a registered name such as "numpy" or "numba": use
+                  that backend if it is available, otherwise its
+                  fallback ("numba" falls back to "numpy")
+                - a backend instance: returned unchanged
                 - None or any other value: use pure-Python backend
 
     Returns:
-        An instance implementing the MathBackend protocol.
+        An instance implementing the MathBackend protocol; the
+        pure-Python backend when neither the preferred one nor any of
+        its fallbacks can be loaded.
     """
-    if prefer == "numpy":
+    if prefer is None:
+        return PYTHON
+    if not isinstance(prefer, str):
+        return prefer
+
+    seen = set()
+    name: Optional[str] = prefer
+    while name in _LOADERS and name not in seen:
+        seen.add(name)
         try:
-            from pyglspg4.backend.numpy import NumPyBackend
-            return NumPyBackend()
-        except Exception:
-            pass
+            return _load(name)
+        except ImportError:
+            name = _FALLBACKS.get(name)
 
-    return PythonBackend()
+    return PYTHON
 
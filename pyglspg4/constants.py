@@ -68,6 +68,16 @@ OMEGA_EARTH = 7.29211514670698e-5 * 60.0
 # Keplerian constants
 X2O3 = 2.0 / 3.0
 
+# ---------------------------------------------------------------------------
+# Kepler solver parameters
+# ---------------------------------------------------------------------------
+
+# Convergence threshold on the eccentric anomaly correction [rad]
+KEPLER_EPSILON = 1.0e-12
+
+# Iteration cap for the Kepler equation solvers
+MAX_KEPLER_ITERATIONS = 20
+
 # ---------------------------------------------------------------------------
 # Error codes (per NORAD)
 # ---------------------------------------------------------------------------
@@ -0,0 +1,378 @@
+# Copyright (C) 2025-2026 Kris Kirby, KE4AHR
+# SPDX-License-Identifier: LGPL-3.0-or-later
+#
+# Binary ephemeris files
+#
+# Stores a regularly sampled multi-satellite ephemeris as one
+# contiguous float64 block that can be memory-mapped and sliced by
+# satellite or by time window without reading the rest of the file.
+#
+# File layout (little-endian):
+#
+#   header   magic (8s) | satellite count N (u4) | sample count T (u4)
+#            | first sample, two-part Julian date (f8, f8)
+#            | step in seconds (f8) | frame name (8s, NUL padded)
+#            | data offset (u8)
+#   satnums  N x i8
+#   padding  to a 64-byte boundary
+#   data     N x T x 6 f8: x, y, z (km), vx, vy, vz (km/s)
+#
+# Each satellite's samples are contiguous, so one satellite is a
+# single sequential read and a time window is N short ones. Samples
+# that failed to propagate are stored as zeros, as returned by the
+# propagators.
+#
+# EphemerisWriter fills the data block chunk by chunk (e.g. from
+# pyglspg4.api.stream.stream_ephemeris) into a temporary file that
+# replaces the target only once every sample has been written.
+#
+# Requires NumPy.
+
+from __future__ import annotations
+
+import math
+import mmap
+import os
+import struct
+import tempfile
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+
+
+MAGIC = b"PGEPH001"
+
+_HEADER = struct.Struct("<8sIIddd8sQ")
+_ALIGNMENT = 64
+_SAMPLE = 6 * 8
+
+# Seconds by which window bounds may miss a sample
+_WINDOW_TOLERANCE = 1.0e-3
+
+
+def _data_offset(n: int) -> int:
+    end = _HEADER.size + 8 * n
+    return -(-end // _ALIGNMENT) * _ALIGNMENT
+
+
+def _frame_bytes(frame: str) -> bytes:
+    raw = frame.encode("ascii")
+    if not raw or len(raw) > 8:
+        raise ValueError("frame must be 1 to 8 ASCII characters")
+    return raw
+
+
+class EphemerisWriter:
+    """
+    Streaming writer of a binary ephemeris file.
+
+    Parameters
+    ----------
+    path : str or PathLike
+        Output file; replaced atomically by close()
+    satnums : sequence of int
+        Catalog numbers, in row order of the written blocks
+    jd_start : float
+        Julian date of the first sample
+    step_seconds : float
+        Sample spacing (seconds)
+    count : int
+        Number of samples per satellite
+    frame : str
+        Name of the reference frame of the vectors
+    """
+
+    def __init__(
+        self,
+        path,
+        satnums: Sequence[int],
+        jd_start: float,
+        step_seconds: float,
+        count: int,
+        frame: str = "TEME",
+    ) -> None:
+        if step_seconds <= 0.0:
+            raise ValueError("step_seconds must be positive")
+        if count < 1:
+            raise ValueError("count must be at least 1")
+
+        self.path = os.fspath(path)
+        self.satnums = np.asarray(satnums, dtype="<i8")
+        self.count = count
+        self._offset = _data_offset(self.satnums.size)
+        self._written = np.zeros(count, dtype=bool)
+
+        jd1 = math.floor(jd_start)
+        header = _HEADER.pack(
+            MAGIC, self.satnums.size, count,
+            float(jd1), jd_start - jd1, step_seconds,
+            _frame_bytes(frame), self._offset,
+        )
+
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, self._tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        self._file = os.fdopen(fd, "w+b")
+        try:
+            self._file.write(header)
+            self._file.write(self.satnums.tobytes())
+            self._file.truncate(
+                self._offset + self.satnums.size * count * _SAMPLE
+            )
+        except BaseException:
+            self.abort()
+            raise
+
+    def __enter__(self) -> "EphemerisWriter":
+        return self
+
+    def __exit__(self, exc_type, *exc) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def write(
+        self,
+        index: int,
+        position: np.ndarray,
+        velocity: np.ndarray,
+    ) -> None:
+        """
+        Store a block of samples.
+
+        Parameters
+        ----------
+        index : int
+            Sample index of the first column of the block
+        position, velocity : (N, K, 3) ndarray
+            Vectors of every satellite for samples index .. index + K - 1
+        """
+        if self._file is None:
+            raise ValueError("writer is closed")
+
+        n = self.satnums.size
+        block = np.concatenate(
+            (
+                np.asarray(position, dtype="<f8"),
+                np.asarray(velocity, dtype="<f8"),
+            ),
+            axis=-1,
+        )
+        if block.ndim != 3 or block.shape[0] != n or block.shape[2] != 6:
+            raise ValueError(f"blocks must have shape ({n}, K, 3)")
+
+        k = block.shape[1]
+        if index < 0 or index + k > self.count:
+            raise ValueError("block lies outside the sample range")
+
+        for row in range(n):
+            self._file.seek(
+                self._offset + (row * self.count + index) * _SAMPLE
+            )
+            self._file.write(block[row].tobytes())
+        self._written[index:index + k] = True
+
+    def write_chunk(self, chunk) -> None:
+        """
+        Store an EphemerisChunk of pyglspg4.api.stream.
+        """
+        self.write(chunk.index, chunk.position, chunk.velocity)
+
+    def close(self) -> None:
+        """
+        Finish the file and move it into place.
+
+        Raises ValueError (and discards the file) if samples are missing.
+        """
+        if self._file is None:
+            return
+        if not self._written.all():
+            missing = int(np.count_nonzero(~self._written))
+            self.abort()
+            raise ValueError(f"{missing} samples were never written")
+
+        self._file.close()
+        self._file = None
+        os.replace(self._tmp, self.path)
+
+    def abort(self) -> None:
+        """
+        Discard the partially written file.
+        """
+        if self._file is None:
+            return
+        self._file.close()
+        self._file = None
+        os.unlink(self._tmp)
+
+
+class EphemerisFile:
+    """
+    Memory-mapped binary ephemeris.
+
+    Parameters
+    ----------
+    path : str or PathLike
+        File written by EphemerisWriter
+
+    Attributes
+    ----------
+    satnums : (N,) ndarray
+        Catalog numbers, in row order
+    jd_start : (float, float)
+        Two-part Julian date of the first sample
+    step_seconds : float
+        Sample spacing (seconds)
+    frame : str
+        Reference frame of the vectors
+    data : (N, T, 6) ndarray
+        Read-only view of the mapped samples
+    """
+
+    def __init__(self, path) -> None:
+        self.path = os.fspath(path)
+        with open(self.path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size < _HEADER.size:
+                raise ValueError(f"{self.path}: not an ephemeris file")
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, n, count, jd1, jd2, step, frame, offset = _HEADER.unpack_from(
+            self._map, 0
+        )
+        if (
+            magic != MAGIC
+            or offset != _data_offset(n)
+            or size != offset + n * count * _SAMPLE
+        ):
+            self._map.close()
+            raise ValueError(f"{self.path}: not an ephemeris file")
+
+        self.jd_start = (jd1, jd2)
+        self.step_seconds = step
+        self.frame = frame.rstrip(b"\0").decode("ascii")
+        self.satnums = np.frombuffer(
+            self._map, dtype="<i8", count=n, offset=_HEADER.size
+        )
+        self.data = np.frombuffer(
+            self._map, dtype="<f8", count=n * count * 6, offset=offset
+        ).reshape(n, count, 6)
+        self._rows = {int(s): row for row, s in enumerate(self.satnums)}
+
+    def __enter__(self) -> "EphemerisFile":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self.data.shape[1]
+
+    def close(self) -> None:
+        """
+        Release the mapping. Arrays returned earlier keep it alive
+        until they are dropped.
+        """
+        self.satnums = self.data = None
+        try:
+            self._map.close()
+        except BufferError:
+            pass
+
+    def jd(self, start: int = 0, stop: Optional[int] = None) -> np.ndarray:
+        """
+        Julian dates of samples start .. stop - 1.
+        """
+        k = np.arange(*slice(start, stop).indices(len(self)), dtype=np.float64)
+        jd1, jd2 = self.jd_start
+        return jd1 + (jd2 + k * (self.step_seconds / 86400.0))
+
+    def satellite(self, satnum: int) -> np.ndarray:
+        """
+        (T, 6) samples of one satellite.
+        """
+        try:
+            row = self._rows[int(satnum)]
+        except KeyError:
+            raise KeyError(
+                f"satellite {satnum} is not in {self.path}"
+            ) from None
+        return self.data[row]
+
+    def window(
+        self,
+        jd_start: float,
+        jd_stop: float,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Samples of every satellite with jd_start <= jd <= jd_stop.
+
+        Returns
+        -------
+        jd : (K,) ndarray
+            Julian dates of the selected samples
+        samples : (N, K, 6) ndarray
+            View of the mapped data
+        """
+        # Julian dates resolve ~40 us; bounds closer than that to a
+        # sample include it
+        tol = _WINDOW_TOLERANCE / self.step_seconds
+        first, last = self._index(jd_start), self._index(jd_stop)
+        start = max(0, math.ceil(first - tol))
+        stop = min(len(self), math.floor(last + tol) + 1)
+        stop = max(start, stop)
+        return self.jd(start, stop), self.data[:, start:stop]
+
+    def _index(self, jd: float) -> float:
+        days = (jd - self.jd_start[0]) - self.jd_start[1]
+        return days * 86400.0 / self.step_seconds
+
+
+def write_ephemeris(
+    path,
+    satellites,
+    jd_start: float,
+    duration_days: float,
+    step_seconds: float,
+    chunk_size: int = 3600,
+    prefetch: int = 1,
+) -> None:
+    """
+    Propagate a catalog over a time span straight into an ephemeris file.
+
+    Parameters
+    ----------
+    path : str or PathLike
+        Output file
+    satellites : SatrecArray or sequence of parsed TLEs
+        Rows without catalog numbers are numbered 0 .. N - 1
+    jd_start, duration_days, step_seconds, chunk_size, prefetch
+        As for pyglspg4.api.stream.stream_ephemeris
+    """
+    from pyglspg4.api.stream import stream_ephemeris
+    from pyglspg4.sgp4.propagate import grid_size
+    from pyglspg4.sgp4.satrec_array import SatrecArray
+
+    if not isinstance(satellites, SatrecArray):
+        satellites = SatrecArray.from_tles(satellites)
+
+    satnums = satellites.satnums
+    if satnums.size != len(satellites):
+        satnums = np.arange(len(satellites))
+
+    stream = stream_ephemeris(
+        satellites, jd_start, duration_days, step_seconds,
+        chunk_size=chunk_size, prefetch=prefetch, reuse_buffers=True,
+    )
+    try:
+        with EphemerisWriter(
+            path,
+            satnums,
+            jd_start,
+            step_seconds,
+            grid_size(0.0, duration_days * 86400.0, step_seconds),
+        ) as writer:
+            for chunk in stream:
+                writer.write_chunk(chunk)
+    finally:
+        stream.close()
@@ -17,10 +17,11 @@ import json
 from dataclasses import dataclass, asdict
 from typing import List, Tuple
 
-from pyglspg4.sgp4.propagate import propagate
+from pyglspg4.api.satellite import as_satellite
 from pyglspg4.frames.itrf import teme_to_itrf
 from pyglspg4.groundstation.doppler import doppler_shift
 from pyglspg4.groundstation.topocentric import topocentric
+from pyglspg4.sgp4.propagate import iter_grid
 
 
 @dataclass(frozen=True)
@@ -47,8 +48,8 @@ def generate_frequency_table(
 
     Parameters
     ----------
-    state : SGP4State
-        Initialized propagator state
+    state : Satellite or SGP4State
+        Satellite handle, or an initialized propagator state
     lat, lon, alt : float
         Ground station geodetic coordinates (rad, rad, km)
     jd_start : float
@@ -67,13 +68,13 @@ def generate_frequency_table(
     list of FrequencyPoint
     """
 
+    sat = as_satellite(state)
     points: List[FrequencyPoint] = []
+    if los < aos:
+        return points
 
-    t = aos
-    while t <= los:
-        r_teme, v_teme, err = propagate(state, t)
+    for t, r_teme, v_teme, err in iter_grid(sat.record, aos, los, step):
         if err != 0:
-            t += step
             continue
 
         jd = jd_start + t / 1440.0
@@ -102,8 +103,6 @@ def generate_frequency_table(
             )
         )
 
-        t += step
-
     return points
 
 
@@ -6,35 +6,132 @@
 # Supports ingestion of IERS finals2000A-style data files
 # and provides polar motion and UT1-UTC corrections.
 #
+# Values are stored in contiguous float64 columns indexed by
+# (MJD - first MJD), with NaN marking days absent from the source.
+# A load builds a complete new set of columns and publishes it with
+# a single attribute assignment, so readers never take a lock.
+#
+# Parsed finals2000A files are saved to a binary cache next to the
+# source (see load_finals2000a). Layout, little-endian:
+#
+#   header   magic (8s) | day count (u4) | first MJD (i4)
+#            | source mtime (i8, ns) | source size (i8)
+#            | source digest (16s, BLAKE2b)
+#   columns  xp[count] | yp[count] | ut1_utc[count]   (f8 each)
+#
+# Later loads memory-map the cache and use the columns in place. The
+# source is re-hashed unless its mtime and size match the header and
+# predate the cache file itself by _RACY_WINDOW_NS.
+#
 # Reference:
 #   IERS Conventions (2010)
 #   Vallado, Fundamentals of Astrodynamics and Applications
 
 from __future__ import annotations
 
+import hashlib
+import math
+import mmap
+import os
+import struct
+import sys
+import tempfile
 import threading
+from array import array
 from dataclasses import dataclass
-from typing import Dict, Optional
+from typing import Dict, Iterable, Optional, Sequence, Tuple
+
+
+# Interpolation schemes accepted by EOPTable
+INTERPOLATION_METHODS = ("linear", "lagrange")
+
+# Points used by Lagrange interpolation (cubic)
+LAGRANGE_POINTS = 4
+
+_NAN = float("nan")
+
+CACHE_MAGIC = b"PGEOP001"
+CACHE_SUFFIX = ".pgeop"
+
+_CACHE_HEADER = struct.Struct("<8sIiqq16s")
+
+# A source modified less than this long before its cache was written
+# is re-hashed on load; covers coarse (e.g. FAT's 2 s) mtime resolution
+_RACY_WINDOW_NS = 2 * 10**9
 
 
 @dataclass(frozen=True)
 class EOPRecord:
-    mjd: int
+    mjd: float
     xp: float        # arcseconds
     yp: float        # arcseconds
     ut1_utc: float   # seconds
 
+    @property
+    def xp_arcsec(self) -> float:
+        return self.xp
+
+    @property
+    def yp_arcsec(self) -> float:
+        return self.yp
+
+
+@dataclass(frozen=True)
+class _Columns:
+    """
+    Immutable snapshot of the table contents.
+    """
+    first_mjd: int
+    xp: array           # array("d") or a float64 memoryview
+    yp: array
+    ut1_utc: array
+
+    def __len__(self) -> int:
+        return len(self.xp)
+
+
+_EMPTY = _Columns(0, array("d"), array("d"), array("d"))
+
 
 class EOPTable:
     """
     Thread-safe Earth Orientation Parameter table.
+
+    Reads (get, interpolate, interpolate_many) are lock-free; the
+    lock only serializes loads. revision is incremented whenever the
+    table contents change, so values derived from the table can be
+    cached against it.
+
+    Args:
+        method: Default interpolation, "linear" or "lagrange"
     """
 
-    def __init__(self) -> None:
+    def __init__(self, method: str = "linear") -> None:
+        _check_method(method)
+        self.method = method
         self._lock = threading.Lock()
-        self._records: Dict[int, EOPRecord] = {}
+        self._columns = _EMPTY
+        self.revision = 0
 
-    def load_finals2000a(self, path: str) -> None:
+    def __len__(self) -> int:
+        return len(self._columns)
+
+    @property
+    def first_mjd(self) -> Optional[int]:
+        columns = self._columns
+        return columns.first_mjd if len(columns) else None
+
+    @property
+    def last_mjd(self) -> Optional[int]:
+        columns = self._columns
+        return columns.first_mjd + len(columns) - 1 if len(columns) else None
+
+    def load_finals2000a(
+        self,
+        path: str,
+        cache: bool = True,
+        cache_path: Optional[str] = None,
+    ) -> None:
         """
         Load an IERS finals2000A file.
 
@@ -42,26 +139,89 @@ class EOPTable:
         ----------
         path : str
             Path to finals2000A.data or equivalent
+        cache : bool
+            Use and maintain a binary cache of the parsed file. The
+            text is parsed only when the source's contents hash no
+            longer matches the cache; the hash is skipped when the
+            modification time and size match and predate the cache
+            write. A source that cannot be read never validates the
+            cache. Failure to write the cache is not an error.
+        cache_path : str, optional
+            Cache location (default: path + CACHE_SUFFIX)
+        """
+        if cache_path is None:
+            cache_path = path + CACHE_SUFFIX
+        # Cached columns are mapped in native (little-endian) order
+        cache = cache and sys.byteorder == "little"
+
+        if cache:
+            columns = _read_cache(cache_path, path)
+            if columns is not None:
+                self._load_columns(columns)
+                return
+
+        with open(path, "rb") as f:
+            data = f.read()
+        stat = os.stat(path)
+
+        columns = _columns_from(
+            {
+                int(rec.mjd): (rec.xp, rec.yp, rec.ut1_utc)
+                for rec in _parse_finals2000a(data)
+            }
+        )
+        self._load_columns(columns)
+
+        if cache:
+            try:
+                _write_cache(cache_path, columns, stat, _digest(data))
+            except OSError:
+                pass
+
+    def load_records(self, records: Iterable[EOPRecord]) -> None:
+        """
+        Merge daily records into the table.
+
+        Records for days already present replace the stored values.
         """
         with self._lock:
-            with open(path, "r", encoding="ascii", errors="ignore") as f:
-                for line in f:
-                    if len(line) < 68:
-                        continue
-                    try:
-                        mjd = int(line[7:15])
-                        xp = float(line[18:27])
-                        yp = float(line[37:46])
-                        ut1_utc = float(line[58:68])
-                    except ValueError:
-                        continue
-
-                    self._records[mjd] = EOPRecord(
-                        mjd=mjd,
-                        xp=xp,
-                        yp=yp,
-                        ut1_utc=ut1_utc,
+            merged: Dict[int, Tuple[float, float, float]] = {}
+            old = self._columns
+            for k in range(len(old)):
+                if not math.isnan(old.xp[k]):
+                    merged[old.first_mjd + k] = (
+                        old.xp[k],
+                        old.yp[k],
+                        old.ut1_utc[k],
                     )
+            for rec in records:
+                merged[int(rec.mjd)] = (rec.xp, rec.yp, rec.ut1_utc)
+
+            self._publish(merged)
+
+    def _publish(self, merged: Dict[int, Tuple[float, float, float]]) -> None:
+        self._columns = _columns_from(merged)
+        self.revision += 1
+
+    def _load_columns(self, columns: _Columns) -> None:
+        with self._lock:
+            empty = len(self._columns) == 0
+            if empty:
+                # Use the (possibly memory-mapped) columns in place
+                self._columns = columns
+                self.revision += 1
+
+        if not empty:
+            self.load_records(
+                EOPRecord(
+                    mjd=columns.first_mjd + k,
+                    xp=columns.xp[k],
+                    yp=columns.yp[k],
+                    ut1_utc=columns.ut1_utc[k],
+                )
+                for k in range(len(columns))
+                if not math.isnan(columns.xp[k])
+            )
 
     def get(self, mjd: int) -> Optional[EOPRecord]:
         """
@@ -75,10 +235,357 @@ class EOPTable:
         -------
         EOPRecord or None
         """
-        with self._lock:
-            return self._records.get(mjd)
+        columns = self._columns
+        k = int(mjd) - columns.first_mjd
+        if not 0 <= k < len(columns) or math.isnan(columns.xp[k]):
+            return None
+        return EOPRecord(
+            mjd=int(mjd),
+            xp=columns.xp[k],
+            yp=columns.yp[k],
+            ut1_utc=columns.ut1_utc[k],
+        )
+
+    def interpolate(
+        self,
+        mjd: float,
+        method: Optional[str] = None,
+    ) -> Optional[EOPRecord]:
+        """
+        Interpolate EOP values to a fractional Modified Julian Date.
+
+        Parameters
+        ----------
+        mjd : float
+            Modified Julian Date (UTC)
+        method : {"linear", "lagrange"}, optional
+            Interpolation scheme; the table default if omitted
+
+        Returns
+        -------
+        EOPRecord or None
+            None when mjd is not covered by the table
+        """
+        method = method or self.method
+        _check_method(method)
+
+        columns = self._columns
+        window = _window(columns, mjd, method)
+        if window is None:
+            return None
+
+        start, size = window
+        x = mjd - (columns.first_mjd + start)
+        weights = _weights(x, size)
+        base = int(math.floor(x))
+
+        values = []
+        for col in (columns.xp, columns.yp, columns.ut1_utc):
+            samples = col[start:start + size]
+            if col is columns.ut1_utc:
+                samples = _remove_leap_seconds(samples, base)
+            values.append(sum(w * s for w, s in zip(weights, samples)))
+
+        return EOPRecord(mjd=mjd, xp=values[0], yp=values[1], ut1_utc=values[2])
+
+    def interpolate_many(
+        self,
+        mjds: Sequence[float],
+        method: Optional[str] = None,
+    ):
+        """
+        Interpolate EOP values to many Modified Julian Dates.
+
+        Parameters
+        ----------
+        mjds : array_like
+            Modified Julian Dates (UTC)
+        method : {"linear", "lagrange"}, optional
+            Interpolation scheme; the table default if omitted
+
+        Returns
+        -------
+        (xp, yp, ut1_utc)
+            Arrays shaped like mjds (lists without NumPy), in
+            arcseconds and seconds. Dates not covered by the table
+            give NaN.
+        """
+        method = method or self.method
+        _check_method(method)
+
+        try:
+            import numpy as np
+        except ImportError:
+            return _interpolate_python(self, mjds, method)
+
+        return _interpolate_numpy(np, self._columns, mjds, method)
+
+
+# ---------------------------------------------------------------------------
+# Parsing and binary cache
+# ---------------------------------------------------------------------------
+
+def _parse_finals2000a(data: bytes):
+    for line in data.decode("ascii", errors="ignore").splitlines():
+        if len(line) < 68:
+            continue
+        try:
+            mjd = int(float(line[7:15]))
+            xp = float(line[18:27])
+            yp = float(line[37:46])
+            ut1_utc = float(line[58:68])
+        except ValueError:
+            continue
+
+        yield EOPRecord(mjd=mjd, xp=xp, yp=yp, ut1_utc=ut1_utc)
+
+
+def _columns_from(merged: Dict[int, Tuple[float, float, float]]) -> _Columns:
+    if not merged:
+        return _EMPTY
+
+    first = min(merged)
+    n = max(merged) - first + 1
+    columns = _Columns(
+        first,
+        array("d", [_NAN]) * n,
+        array("d", [_NAN]) * n,
+        array("d", [_NAN]) * n,
+    )
+    for mjd, (xp, yp, ut1_utc) in merged.items():
+        k = mjd - first
+        columns.xp[k] = xp
+        columns.yp[k] = yp
+        columns.ut1_utc[k] = ut1_utc
+    return columns
+
+
+def _digest(data: bytes) -> bytes:
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def _read_cache(cache_path: str, source: str) -> Optional[_Columns]:
+    """
+    Map a cache file and return its columns, or None if it is
+    missing, malformed or stale.
+    """
+    try:
+        with open(cache_path, "rb") as f:
+            cache_stat = os.fstat(f.fileno())
+            size = cache_stat.st_size
+            if size < _CACHE_HEADER.size:
+                return None
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        stat = os.stat(source)
+    except (OSError, ValueError):
+        return None
+
+    magic, count, first, mtime, src_size, digest = _CACHE_HEADER.unpack_from(
+        mapped, 0
+    )
+    if magic != CACHE_MAGIC or size != _CACHE_HEADER.size + 24 * count:
+        return None
+
+    # A matching mtime only proves the source is unchanged if the cache
+    # was written comfortably after it; otherwise a same-size edit
+    # within the timestamp granularity would go unnoticed.
+    trusted = (
+        (mtime, src_size) == (stat.st_mtime_ns, stat.st_size)
+        and mtime < cache_stat.st_mtime_ns - _RACY_WINDOW_NS
+    )
+    if not trusted:
+        try:
+            with open(source, "rb") as f:
+                if _digest(f.read()) != digest:
+                    return None
+        except OSError:
+            return None
+
+        # Verified: record the current stat so later loads skip the hash
+        try:
+            with open(cache_path, "r+b") as f:
+                f.write(
+                    _CACHE_HEADER.pack(
+                        CACHE_MAGIC, count, first,
+                        stat.st_mtime_ns, stat.st_size, digest,
+                    )
+                )
+        except OSError:
+            pass
+
+    values = memoryview(mapped)[_CACHE_HEADER.size:].cast("d")
+    return _Columns(
+        first,
+        values[:count],
+        values[count:2 * count],
+        values[2 * count:],
+    )
+
+
+def _write_cache(
+    cache_path: str,
+    columns: _Columns,
+    stat: os.stat_result,
+    digest: bytes,
+) -> None:
+    directory = os.path.dirname(os.path.abspath(cache_path))
+    fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(
+                _CACHE_HEADER.pack(
+                    CACHE_MAGIC, len(columns), columns.first_mjd,
+                    stat.st_mtime_ns, stat.st_size, digest,
+                )
+            )
+            for col in (columns.xp, columns.yp, columns.ut1_utc):
+                f.write(col.tobytes())
+        os.replace(tmp, cache_path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+# ---------------------------------------------------------------------------
+# Interpolation helpers
+# ---------------------------------------------------------------------------
+
+def _check_method(method: str) -> None:
+    if method not in INTERPOLATION_METHODS:
+        raise ValueError(f"method must be one of {INTERPOLATION_METHODS}")
+
+
+def _window(columns: _Columns, mjd: float, method: str):
+    """
+    (start index, point count) of the samples used at mjd, or None.
+
+    Lagrange windows are centred on the bracketing days and shifted
+    inward at the ends of the table; they fall back to the linear
+    pair when they would include a missing day.
+    """
+    n = len(columns)
+    x = mjd - columns.first_mjd
+    if not (0.0 <= x <= n - 1):
+        return None
+    if n == 1:
+        return 0, 1
+
+    k = min(int(math.floor(x)), n - 2)
+    if math.isnan(columns.xp[k]) or math.isnan(columns.xp[k + 1]):
+        return None
+
+    if method == "lagrange" and n >= LAGRANGE_POINTS:
+        start = k - (LAGRANGE_POINTS // 2 - 1)
+        start = max(0, min(start, n - LAGRANGE_POINTS))
+        if not any(
+            math.isnan(columns.xp[i])
+            for i in range(start, start + LAGRANGE_POINTS)
+        ):
+            return start, LAGRANGE_POINTS
+
+    return k, 2
+
+
+def _weights(x: float, size: int):
+    # Lagrange basis weights for nodes 0 .. size-1 evaluated at x
+    weights = []
+    for j in range(size):
+        w = 1.0
+        for m in range(size):
+            if m != j:
+                w *= (x - m) / (j - m)
+        weights.append(w)
+    return weights
+
+
+def _remove_leap_seconds(samples, base: int):
+    # UT1-UTC jumps by a whole second at each leap second while the
+    # daily drift is a few milliseconds, so rounding recovers the
+    # steps. Samples are made continuous with the day being
+    # interpolated.
+    base = min(max(base, 0), len(samples) - 1)
+    ref = samples[base]
+    return [s - round(s - ref) for s in samples]
+
+
+def _interpolate_python(table: EOPTable, mjds, method: str):
+    xp, yp, ut1_utc = [], [], []
+    for mjd in mjds:
+        rec = table.interpolate(float(mjd), method)
+        if rec is None:
+            rec = EOPRecord(mjd=mjd, xp=_NAN, yp=_NAN, ut1_utc=_NAN)
+        xp.append(rec.xp)
+        yp.append(rec.yp)
+        ut1_utc.append(rec.ut1_utc)
+    return xp, yp, ut1_utc
+
+
+def _interpolate_numpy(np, columns: _Columns, mjds, method: str):
+    mjds = np.asarray(mjds, dtype=np.float64)
+    shape = mjds.shape
+    m = mjds.ravel()
+
+    n = len(columns)
+    out = np.full((3, m.shape[0]), np.nan)
+    if n == 0:
+        return out[0].reshape(shape), out[1].reshape(shape), out[2].reshape(shape)
+
+    cols = [
+        np.frombuffer(col, dtype=np.float64)
+        for col in (columns.xp, columns.yp, columns.ut1_utc)
+    ]
+
+    x = m - columns.first_mjd
+    covered = (x >= 0.0) & (x <= n - 1)
+    x_safe = np.where(covered, x, 0.0)
+
+    if n == 1:
+        for c in range(3):
+            out[c] = np.where(covered, cols[c][0], np.nan)
+        return out[0].reshape(shape), out[1].reshape(shape), out[2].reshape(shape)
+
+    k = np.minimum(np.floor(x_safe).astype(np.int64), n - 2)
+    missing = np.isnan(cols[0])
+
+    # Linear pairs
+    start = k
+    size = np.full(k.shape, 2)
+    covered &= ~(missing[k] | missing[k + 1])
+
+    if method == "lagrange" and n >= LAGRANGE_POINTS:
+        lag_start = np.clip(k - (LAGRANGE_POINTS // 2 - 1), 0, n - LAGRANGE_POINTS)
+        offsets = np.arange(LAGRANGE_POINTS)
+        lag_ok = ~missing[lag_start[:, np.newaxis] + offsets].any(axis=1)
+        start = np.where(lag_ok, lag_start, start)
+        size = np.where(lag_ok, LAGRANGE_POINTS, size)
+
+    width = int(size.max()) if size.size else 2
+    offsets = np.arange(width)
+    index = np.minimum(start[:, np.newaxis] + offsets, n - 1)
+
+    # Basis weights; unused nodes beyond a window's size get zero
+    t = (x_safe - start)[:, np.newaxis]
+    weights = np.ones((m.shape[0], width))
+    for j in range(width):
+        for q in range(width):
+            if q != j:
+                term = (t[:, 0] - q) / (j - q)
+                weights[:, j] *= np.where(q < size, term, 1.0)
+    weights[offsets[np.newaxis, :] >= size[:, np.newaxis]] = 0.0
+
+    base = np.clip(np.floor(t[:, 0]).astype(np.int64), 0, size - 1)
+    rows = np.arange(m.shape[0])
+
+    for c in range(3):
+        samples = cols[c][index]
+        if c == 2:
+            ref = samples[rows, base][:, np.newaxis]
+            samples = samples - np.round(samples - ref)
+        samples = np.where(np.isnan(samples), 0.0, samples)
+        out[c] = np.where(covered, (weights * samples).sum(axis=1), np.nan)
+
+    return out[0].reshape(shape), out[1].reshape(shape), out[2].reshape(shape)
 
 
 # Global default EOP table
 DEFAULT_EOP = EOPTable()
-
@@ -19,21 +19,22 @@ from __future__ import annotations
 import math
 from typing import Tuple
 
+from pyglspg4.backend.selector import select_backend
 from pyglspg4.frames.gmst import gmst_from_jd
 from pyglspg4.frames.eop import DEFAULT_EOP
-from pyglspg4.frames.teme_to_ecef import OMEGA_EARTH
+from pyglspg4.frames.teme_to_ecef import earth_rotation
 
 ARCSEC_TO_RAD = math.pi / (180.0 * 3600.0)
 
 
-def _polar_motion_matrix(xp_rad: float, yp_rad: float):
+def _polar_motion_matrix(backend, xp_rad, yp_rad):
     """
     Construct polar motion rotation matrix.
     """
-    cx = math.cos(xp_rad)
-    sx = math.sin(xp_rad)
-    cy = math.cos(yp_rad)
-    sy = math.sin(yp_rad)
+    cx = backend.cos(xp_rad)
+    sx = backend.sin(xp_rad)
+    cy = backend.cos(yp_rad)
+    sy = backend.sin(yp_rad)
 
     return (
         (cy, 0.0, sy),
@@ -50,10 +51,29 @@ def _mat_vec(m, v):
     )
 
 
+def _polar_motion(backend, jd_ut1):
+    """
+    Pole coordinates (radians) at jd_ut1; zero outside the EOP table.
+    """
+    if backend.is_array:
+        mjd = backend.asarray(jd_ut1) - 2400000.5
+        x, y, _ = DEFAULT_EOP.interpolate_many(mjd)
+        # NaN marks dates the table does not cover
+        x = backend.where(x == x, x, 0.0)
+        y = backend.where(y == y, y, 0.0)
+        return x * ARCSEC_TO_RAD, y * ARCSEC_TO_RAD
+
+    eop = DEFAULT_EOP.interpolate(jd_ut1 - 2400000.5)
+    if eop is None:
+        return 0.0, 0.0
+    return eop.xp * ARCSEC_TO_RAD, eop.yp * ARCSEC_TO_RAD
+
+
 def teme_to_itrf(
     r_teme: Tuple[float, float, float],
     v_teme: Tuple[float, float, float],
     jd_ut1: float,
+    backend=None,
 ) -> Tuple[Tuple[float, float, float], Tuple[float, float, float]]:
     """
     Convert TEME position and velocity vectors to ITRF.
@@ -66,6 +86,10 @@ def teme_to_itrf(
         TEME velocity vector (km/s)
     jd_ut1 : float
         Julian Date (UT1)
+    backend : str or MathBackend, optional
+        Math backend (see pyglspg4.backend.selector). With "numpy"
+        or "numba", r_teme and v_teme may be (..., 3) arrays and
+        jd_ut1 an array that broadcasts against their leading axes.
 
     Returns
     -------
@@ -73,50 +97,24 @@ def teme_to_itrf(
         Position and velocity in ITRF frame
     """
 
+    xp = select_backend(backend)
+
     # Step 1: TEME -> ECEF via Earth rotation
     theta = gmst_from_jd(jd_ut1)
-    cos_t = math.cos(theta)
-    sin_t = math.sin(theta)
-
-    r_ecef = (
-        cos_t * r_teme[0] + sin_t * r_teme[1],
-        -sin_t * r_teme[0] + cos_t * r_teme[1],
-        r_teme[2],
-    )
-
-    v_rot = (
-        cos_t * v_teme[0] + sin_t * v_teme[1],
-        -sin_t * v_teme[0] + cos_t * v_teme[1],
-        v_teme[2],
-    )
-
-    omega_cross_r = (
-        -OMEGA_EARTH * r_ecef[1],
-        OMEGA_EARTH * r_ecef[0],
-        0.0,
-    )
-
-    v_ecef = (
-        v_rot[0] + omega_cross_r[0],
-        v_rot[1] + omega_cross_r[1],
-        v_rot[2] + omega_cross_r[2],
-    )
-
-    # Step 2: Polar motion (ECEF -> ITRF)
-    mjd = int(jd_ut1 - 2400000.5)
-    eop = DEFAULT_EOP.get(mjd)
-
-    if eop is not None:
-        xp = eop.xp * ARCSEC_TO_RAD
-        yp = eop.yp * ARCSEC_TO_RAD
+    fused = getattr(xp, "fused_earth_rotation", None)
+    if fused is not None:
+        r_ecef, v_ecef = (
+            xp.components(a) for a in fused(r_teme, v_teme, theta)
+        )
     else:
-        xp = 0.0
-        yp = 0.0
+        r_ecef, v_ecef = earth_rotation(
+            xp, xp.components(r_teme), xp.components(v_teme), theta
+        )
 
-    pm = _polar_motion_matrix(xp, yp)
+    # Step 2: Polar motion (ECEF -> ITRF)
+    pm = _polar_motion_matrix(xp, *_polar_motion(xp, jd_ut1))
 
     r_itrf = _mat_vec(pm, r_ecef)
     v_itrf = _mat_vec(pm, v_ecef)
 
-    return r_itrf, v_itrf
-
+    return xp.stack(r_itrf), xp.stack(v_itrf)
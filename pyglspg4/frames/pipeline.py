@@ -0,0 +1,314 @@
+# Copyright (C) 2025-2026 Kris Kirby, KE4AHR
+# SPDX-License-Identifier: LGPL-3.0-or-later
+#
+# Batched TEME -> ITRF frame pipeline
+#
+# Builds the Earth rotation and polar motion matrices once per time
+# sample, combines them, and applies them to whole (..., T, 3)
+# position / velocity arrays with batched matrix products.
+#
+# Two rotation models are provided, matching the scalar routines:
+#   - "gmst": IAU-82 GMST on a UT1 date, with polar motion
+#             (pyglspg4.frames.itrf)
+#   - "era":  Earth Rotation Angle on UT1 = UTC + (UT1-UTC), with
+#             polar motion (pyglspg4.frames.teme_to_itrf)
+#
+# Rotation sets are kept in a bounded cache keyed by model, EOP
+# table revision and the exact time samples, so converting several
+# ephemerides on one grid builds the matrices once.
+#
+# Requires NumPy.
+#
+# Reference:
+#   Vallado, Fundamentals of Astrodynamics and Applications
+#   IERS Conventions (2010)
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+import numpy as np
+
+from pyglspg4.frames.eop import DEFAULT_EOP, EOPTable
+from pyglspg4.frames.polar_motion import ARCSEC_TO_RAD
+from pyglspg4.frames.sidereal import era, gmst
+from pyglspg4.frames.teme_to_ecef import OMEGA_EARTH
+from pyglspg4.time.julian import jd_to_mjd
+
+
+METHODS = ("gmst", "era")
+
+# Maps a vector to OMEGA_EARTH x vector / OMEGA_EARTH
+_OMEGA_CROSS = np.array(
+    [[0.0, -1.0, 0.0], [1.0, 0.0, 0.0], [0.0, 0.0, 0.0]]
+)
+
+
+@dataclass(frozen=True)
+class FrameRotations:
+    """
+    Per-sample TEME -> ITRF rotations.
+
+    matrix[k] rotates a TEME vector at jd[k] into ITRF. The velocity
+    transport term is folded into omega_matrix[k], so that
+
+        r_itrf = matrix @ r_teme
+        v_itrf = matrix @ v_teme - omega_matrix @ r_teme
+    """
+
+    jd: np.ndarray              # (T,)
+    matrix: np.ndarray          # (T, 3, 3)
+    omega_matrix: np.ndarray    # (T, 3, 3)
+
+    def __len__(self) -> int:
+        return self.jd.shape[0]
+
+    def apply(
+        self,
+        r_teme,
+        v_teme=None,
+    ) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        """
+        Rotate TEME vectors sampled on this time grid into ITRF.
+
+        Parameters
+        ----------
+        r_teme : array_like, shape (..., T, 3)
+            TEME positions (km); the time axis is second to last
+        v_teme : array_like, shape (..., T, 3), optional
+            TEME velocities (km/s)
+
+        Returns
+        -------
+        r_itrf, v_itrf : ndarray
+            ITRF positions and velocities (v_itrf is None when no
+            velocities are given)
+        """
+
+        r = np.asarray(r_teme, dtype=np.float64)
+        if r.shape[-2:] != (len(self), 3):
+            raise ValueError(
+                f"vectors must have shape (..., {len(self)}, 3)"
+            )
+
+        r_itrf = _rotate(self.matrix, r)
+        if v_teme is None:
+            return r_itrf, None
+
+        v = np.asarray(v_teme, dtype=np.float64)
+        if v.shape != r.shape:
+            raise ValueError("v_teme must have the same shape as r_teme")
+
+        v_itrf = _rotate(self.matrix, v)
+        v_itrf -= _rotate(self.omega_matrix, r)
+        return r_itrf, v_itrf
+
+
+def _rotate(matrices: np.ndarray, vectors: np.ndarray) -> np.ndarray:
+    # (T, 3, 3) x (..., T, 3) -> (..., T, 3)
+    return np.matmul(matrices, vectors[..., np.newaxis])[..., 0]
+
+
+def _z_rotation(theta: np.ndarray) -> np.ndarray:
+    c = np.cos(theta)
+    s = np.sin(theta)
+    zero = np.zeros_like(theta)
+    one = np.ones_like(theta)
+    return np.stack(
+        (
+            np.stack((c, s, zero), -1),
+            np.stack((-s, c, zero), -1),
+            np.stack((zero, zero, one), -1),
+        ),
+        axis=-2,
+    )
+
+
+def _polar_matrices(xp: np.ndarray, yp: np.ndarray, method: str):
+    # Element for element the matrices of frames.itrf (gmst) and
+    # frames.polar_motion (era); xp, yp in radians
+    cx, sx = np.cos(xp), np.sin(xp)
+    cy, sy = np.cos(yp), np.sin(yp)
+    zero = np.zeros_like(xp)
+
+    if method == "gmst":
+        rows = (
+            (cy, zero, sy),
+            (sx * sy, cx, -sx * cy),
+            (-cx * sy, sx, cx * cy),
+        )
+    else:
+        rows = (
+            (cy, zero, -sy),
+            (sx * sy, cx, sx * cy),
+            (cx * sy, -sx, cx * cy),
+        )
+
+    return np.stack([np.stack(row, -1) for row in rows], axis=-2)
+
+
+def _eop_values(eop: EOPTable, mjd: np.ndarray):
+    """
+    Interpolated xp, yp (arcsec) and UT1-UTC (s) for each sample.
+    Dates the table does not cover give zeros.
+    """
+    return tuple(
+        np.nan_to_num(values, nan=0.0)
+        for values in eop.interpolate_many(mjd)
+    )
+
+
+def frame_rotations(
+    jd,
+    method: str = "gmst",
+    eop: Optional[EOPTable] = None,
+) -> FrameRotations:
+    """
+    Build TEME -> ITRF rotations for a grid of Julian dates.
+
+    Parameters
+    ----------
+    jd : array_like, shape (T,)
+        Julian dates: UT1 for "gmst", UTC for "era"
+    method : {"gmst", "era"}
+        Earth rotation model
+    eop : EOPTable, optional
+        Earth orientation parameters (DEFAULT_EOP by default)
+
+    Returns
+    -------
+    FrameRotations
+    """
+
+    if method not in METHODS:
+        raise ValueError(f"method must be one of {METHODS}")
+    if eop is None:
+        eop = DEFAULT_EOP
+
+    jd = np.atleast_1d(np.asarray(jd, dtype=np.float64))
+    if jd.ndim != 1:
+        raise ValueError("jd must be one-dimensional")
+
+    xp, yp, ut1_utc = _eop_values(eop, jd_to_mjd(jd))
+
+    if method == "gmst":
+        earth = _z_rotation(gmst(jd))
+    else:
+        earth = _z_rotation(era(jd, ut1_utc / 86400.0))
+
+    polar = _polar_matrices(xp * ARCSEC_TO_RAD, yp * ARCSEC_TO_RAD, method)
+
+    matrix = np.matmul(polar, earth)
+    omega_matrix = OMEGA_EARTH * np.matmul(polar, np.matmul(_OMEGA_CROSS, earth))
+
+    for array in (jd, matrix, omega_matrix):
+        array.flags.writeable = False
+
+    return FrameRotations(jd=jd, matrix=matrix, omega_matrix=omega_matrix)
+
+
+class RotationCache:
+    """
+    Bounded LRU cache of FrameRotations.
+
+    Entries are keyed by the rotation model, the identity and
+    revision of the EOP table and the exact time samples, so
+    reloading the table invalidates them. hits and misses count
+    lookups answered from and added to the cache.
+
+    Args:
+        max_entries: Number of time grids kept
+    """
+
+    def __init__(self, max_entries: int = 16) -> None:
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[tuple, FrameRotations]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def rotations(
+        self,
+        jd,
+        method: str = "gmst",
+        eop: Optional[EOPTable] = None,
+    ) -> FrameRotations:
+        """
+        Cached equivalent of frame_rotations().
+        """
+        if eop is None:
+            eop = DEFAULT_EOP
+
+        jd = np.atleast_1d(np.asarray(jd, dtype=np.float64))
+        key = (method, id(eop), eop.revision, jd.shape, jd.tobytes())
+
+        with self._lock:
+            found = self._entries.get(key)
+            if found is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return found
+            self.misses += 1
+
+        rotations = frame_rotations(jd, method, eop)
+
+        with self._lock:
+            self._entries[key] = rotations
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+        return rotations
+
+
+# Process-wide cache used by teme_to_itrf_array
+DEFAULT_ROTATION_CACHE = RotationCache()
+
+
+def teme_to_itrf_array(
+    r_teme,
+    v_teme,
+    jd,
+    method: str = "gmst",
+    eop: Optional[EOPTable] = None,
+    cache: Optional[RotationCache] = DEFAULT_ROTATION_CACHE,
+) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    """
+    Convert TEME ephemeris arrays to ITRF.
+
+    Parameters
+    ----------
+    r_teme : array_like, shape (..., T, 3)
+        TEME positions (km), e.g. the (N, T, 3) SatrecArray output
+    v_teme : array_like, shape (..., T, 3) or None
+        TEME velocities (km/s)
+    jd : array_like, shape (T,)
+        Julian dates of the samples: UT1 for "gmst", UTC for "era"
+    method : {"gmst", "era"}
+        Earth rotation model
+    eop : EOPTable, optional
+        Earth orientation parameters (DEFAULT_EOP by default)
+    cache : RotationCache or None
+        Rotation cache; None builds the matrices without caching
+
+    Returns
+    -------
+    r_itrf, v_itrf : ndarray
+        ITRF positions (km) and velocities (km/s)
+    """
+
+    if cache is None:
+        rotations = frame_rotations(jd, method, eop)
+    else:
+        rotations = cache.rotations(jd, method, eop)
+
+    return rotations.apply(r_teme, v_teme)
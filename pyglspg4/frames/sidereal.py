@@ -6,20 +6,147 @@
 # Implements Greenwich Mean Sidereal Time (GMST)
 # suitable for TEME -> Earth-fixed transformations.
 #
+# Dates may be given as one Julian Date or split into a whole and a
+# fractional part; the day fraction, which drives almost all of the
+# rotation, is then taken from the parts without forming their sum.
+# Arrays of dates are evaluated in one NumPy pass. Scalar results are
+# memoized in a bounded cache, so satellites sharing an epoch reuse
+# one evaluation.
+#
 # References:
 #   Vallado, Fundamentals of Astrodynamics and Applications
 #   IAU 2006 precession model (simplified GMST)
+#   IERS Conventions (2010), Eq. 5.15 (ERA)
 
 from __future__ import annotations
 
 import math
-
-from pyglspg4.time.julian import jd_to_mjd
+from functools import lru_cache
+from typing import Tuple
 
 
 SECONDS_PER_DAY = 86400.0
 TWO_PI = 2.0 * math.pi
 
+J2000_JD = 2451545.0
+
+# Scalar angles memoized per model
+SIDEREAL_CACHE_SIZE = 4096
+
+_SEC_TO_RAD = TWO_PI / SECONDS_PER_DAY
+
+
+def split_jd(jd, jd_frac=0.0) -> Tuple[float, float]:
+    """
+    Normalize a Julian Date to (whole days, fraction in [0, 1)).
+
+    Parameters
+    ----------
+    jd : float
+        Julian Date, or its whole-day part
+    jd_frac : float
+        Additional fraction of a day
+
+    Returns
+    -------
+    (whole, frac)
+    """
+    whole = math.floor(jd)
+    frac = (jd - whole) + jd_frac
+    carry = math.floor(frac)
+    return whole + carry, frac - carry
+
+
+def _gmst_parts(whole, frac, np=math):
+    # IAU-82 GMST (Vallado Eq. 3-45). The 876600 h * T term is a whole
+    # number of days plus SECONDS_PER_DAY * frac, since whole - J2000_JD
+    # is integral; only the fraction is kept.
+    tut1 = ((whole - J2000_JD) + frac) / 36525.0
+
+    gmst_sec = (
+        -6.2e-6 * tut1 * tut1 * tut1
+        + 0.093104 * tut1 * tut1
+        + 8640184.812866 * tut1
+        + 67310.54841
+        + SECONDS_PER_DAY * frac
+    )
+    return np.fmod(np.fmod(gmst_sec * _SEC_TO_RAD, TWO_PI) + TWO_PI, TWO_PI)
+
+
+def _era_parts(whole, frac, np=math):
+    days = (whole - J2000_JD) + frac
+
+    era = TWO_PI * (frac + 0.7790572732640 + 0.00273781191135448 * days)
+    return np.fmod(np.fmod(era, TWO_PI) + TWO_PI, TWO_PI)
+
+
+@lru_cache(maxsize=SIDEREAL_CACHE_SIZE)
+def _gmst_cached(whole: float, frac: float) -> float:
+    return _gmst_parts(whole, frac)
+
+
+@lru_cache(maxsize=SIDEREAL_CACHE_SIZE)
+def _era_cached(whole: float, frac: float) -> float:
+    return _era_parts(whole, frac)
+
+
+def _evaluate(jd_ut1, jd_frac, cached, parts):
+    if isinstance(jd_ut1, (int, float)) and isinstance(jd_frac, (int, float)):
+        return cached(*split_jd(jd_ut1, jd_frac))
+
+    import numpy as np
+
+    jd_ut1 = np.asarray(jd_ut1, dtype=np.float64)
+    whole = np.floor(jd_ut1)
+    frac = (jd_ut1 - whole) + np.asarray(jd_frac, dtype=np.float64)
+    return parts(whole, frac, np)
+
+
+def gmst(jd_ut1, jd_frac=0.0):
+    """
+    Greenwich Mean Sidereal Time (IAU 1982).
+
+    Parameters
+    ----------
+    jd_ut1 : float or array_like
+        Julian Date in UT1, or its whole-day part
+    jd_frac : float or array_like
+        Additional fraction of a day (UT1)
+
+    Returns
+    -------
+    float or ndarray
+        GMST (radians) in [0, 2π); arrays require NumPy
+    """
+    return _evaluate(jd_ut1, jd_frac, _gmst_cached, _gmst_parts)
+
+
+def era(jd_ut1, jd_frac=0.0):
+    """
+    Earth Rotation Angle.
+
+    Parameters
+    ----------
+    jd_ut1 : float or array_like
+        Julian Date in UT1, or its whole-day part
+    jd_frac : float or array_like
+        Additional fraction of a day (UT1)
+
+    Returns
+    -------
+    float or ndarray
+        ERA (radians) in [0, 2π); arrays require NumPy
+    """
+    return _evaluate(jd_ut1, jd_frac, _era_cached, _era_parts)
+
+
+def clear_sidereal_cache() -> None:
+    """
+    Drop all memoized GMST and ERA values.
+    """
+    _gmst_cached.cache_clear()
+    _era_cached.cache_clear()
+
 
 def gmst_from_ut1(jd_ut1: float) -> float:
     """
@@ -36,22 +163,7 @@ def gmst_from_ut1(jd_ut1: float) -> float:
         Greenwich Mean Sidereal Time (radians),
         normalized to [0, 2π)
     """
-
-    # Convert JD to centuries since J2000
-    T = (jd_ut1 - 2451545.0) / 36525.0
-
-    # Vallado Eq. 3-41 (arcseconds)
-    gmst_sec = (
-        67310.54841
-        + (876600.0 * 3600.0 + 8640184.812866) * T
-        + 0.093104 * T * T
-        - 6.2e-6 * T * T * T
-    )
-
-    # Convert to radians
-    gmst_rad = (gmst_sec % SECONDS_PER_DAY) * (TWO_PI / SECONDS_PER_DAY)
-
-    return gmst_rad
+    return gmst(jd_ut1)
 
 
 def earth_rotation_angle(jd_ut1: float) -> float:
@@ -71,10 +183,4 @@ def earth_rotation_angle(jd_ut1: float) -> float:
     era : float
         Earth rotation angle (radians)
     """
-
-    d = jd_ut1 - 2451545.0
-    f = d % 1.0
-
-    era = TWO_PI * (f + 0.7790572732640 + 0.00273781191135448 * d)
-    return era % TWO_PI
-
+    return era(jd_ut1)
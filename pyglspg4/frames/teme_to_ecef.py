@@ -17,8 +17,7 @@
 
 from __future__ import annotations
 
-import math
-
+from pyglspg4.backend.selector import select_backend
 from pyglspg4.frames.gmst import gmst_from_jd
 
 # Earth rotation rate (rad/s)
@@ -29,6 +28,7 @@ def teme_to_ecef(
     r_teme: tuple[float, float, float],
     v_teme: tuple[float, float, float],
     jd_ut1: float,
+    backend=None,
 ) -> tuple[tuple[float, float, float], tuple[float, float, float]]:
     """
     Convert TEME position and velocity vectors to ECEF.
@@ -41,6 +41,10 @@ def teme_to_ecef(
         Velocity vector in TEME frame (km/s)
     jd_ut1 : float
         Julian Date (UT1)
+    backend : str or MathBackend, optional
+        Math backend (see pyglspg4.backend.selector). With "numpy"
+        or "numba", r_teme and v_teme may be (..., 3) arrays and
+        jd_ut1 an array that broadcasts against their leading axes.
 
     Returns
     -------
@@ -48,10 +52,40 @@ def teme_to_ecef(
         Position and velocity in ECEF frame
     """
 
+    xp = select_backend(backend)
     theta = gmst_from_jd(jd_ut1)
 
-    cos_t = math.cos(theta)
-    sin_t = math.sin(theta)
+    fused = getattr(xp, "fused_earth_rotation", None)
+    if fused is not None:
+        return fused(r_teme, v_teme, theta)
+
+    r_ecef, v_ecef = earth_rotation(
+        xp, xp.components(r_teme), xp.components(v_teme), theta
+    )
+    return xp.stack(r_ecef), xp.stack(v_ecef)
+
+
+def earth_rotation(backend, r_teme, v_teme, theta):
+    """
+    Rotate TEME component triples into the Earth-fixed frame.
+
+    Parameters
+    ----------
+    backend : MathBackend
+        Backend the components belong to
+    r_teme, v_teme : (x, y, z)
+        TEME position (km) and velocity (km/s) components
+    theta : float or array
+        Sidereal angle (radians)
+
+    Returns
+    -------
+    (r_ecef, v_ecef)
+        Earth-fixed position and velocity component triples
+    """
+
+    cos_t = backend.cos(theta)
+    sin_t = backend.sin(theta)
 
     # Rotation matrix about Z-axis
     r_ecef = (
@@ -75,10 +109,9 @@ def teme_to_ecef(
     )
 
     v_ecef = (
-        v_rot[0] + omega_cross_r[0],
-        v_rot[1] + omega_cross_r[1],
-        v_rot[2] + omega_cross_r[2],
+        v_rot[0] - omega_cross_r[0],
+        v_rot[1] - omega_cross_r[1],
+        v_rot[2] - omega_cross_r[2],
     )
 
     return r_ecef, v_ecef
-
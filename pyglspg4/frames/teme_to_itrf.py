@@ -15,7 +15,7 @@ from __future__ import annotations
 import math
 from typing import Tuple
 
-from pyglspg4.frames.eop import EOPTable
+from pyglspg4.frames.eop import EOPRecord, EOPTable
 from pyglspg4.frames.sidereal import earth_rotation_angle
 from pyglspg4.frames.polar_motion import (
     polar_motion_matrix,
@@ -60,6 +60,9 @@ def teme_to_itrf(
     # ------------------------------------------------------------------
     mjd_utc = jd_to_mjd(jd_utc)
     eop_rec = eop.interpolate(mjd_utc)
+    if eop_rec is None:
+        # Outside the table: no UT1 or polar motion correction
+        eop_rec = EOPRecord(mjd=mjd_utc, xp=0.0, yp=0.0, ut1_utc=0.0)
 
     jd_ut1 = jd_utc + eop_rec.ut1_utc / 86400.0
 
@@ -14,12 +14,12 @@ from __future__ import annotations
 
 import datetime
 from dataclasses import dataclass
-from typing import Callable, List, Tuple
+from typing import Callable, List, Optional, Tuple
 
 from pyglspg4.frames.teme_to_itrf import teme_to_itrf
 from pyglspg4.ground.enu import ecef_to_enu
-from pyglspg4.ground.geodetic import ecef_to_geodetic
 from pyglspg4.ground.visibility import az_el_range
+from pyglspg4.groundstation.passes import coarse_step_from_vectors, find_passes
 from pyglspg4.time.julian import datetime_to_jd
 
 
@@ -39,16 +39,22 @@ def predict_passes(
     site_lon_rad: float,
     start_time: datetime.datetime,
     end_time: datetime.datetime,
-    step_seconds: int = 30,
+    step_seconds: Optional[float] = None,
     min_elevation_rad: float = 0.0,
+    tolerance_seconds: float = 0.1,
 ) -> List[PassEvent]:
     """
     Predict satellite passes over a ground station.
 
+    Elevation is scanned on a coarse grid, then AOS and LOS are
+    refined by root bracketing and TCA by golden-section search
+    (see pyglspg4.groundstation.passes.find_passes).
+
     Parameters
     ----------
     propagate_fn : callable
-        Function returning TEME position & velocity given tsince_minutes
+        Function returning TEME position & velocity given minutes
+        since start_time
     eop : EOPTable
         Earth Orientation Parameters
     site_ecef : (x, y, z)
@@ -59,57 +65,54 @@ def predict_passes(
         Ground station longitude (radians)
     start_time, end_time : datetime
         Search window (UTC)
-    step_seconds : int
-        Time step (seconds)
+    step_seconds : float, optional
+        Coarse scan step (seconds). Estimated from the orbit at
+        start_time by default.
     min_elevation_rad : float
         Elevation mask (radians)
+    tolerance_seconds : float
+        Accuracy of the reported event times (seconds)
 
     Returns
     -------
     passes : list of PassEvent
     """
 
-    passes: List[PassEvent] = []
-
-    in_pass = False
-    aos = los = tca = None
-    max_el = -1.0
-
-    t = start_time
-    while t <= end_time:
-        jd = datetime_to_jd(t)
-        tsince_min = (jd - datetime_to_jd(start_time)) * 1440.0
+    jd_start = datetime_to_jd(start_time)
 
+    def elevation(tsince_min: float) -> float:
         r_teme, v_teme = propagate_fn(tsince_min)
-        r_ecef, _ = teme_to_itrf(r_teme, v_teme, jd, eop)
+        r_ecef, _ = teme_to_itrf(
+            r_teme, v_teme, jd_start + tsince_min / 1440.0, eop
+        )
 
         e, n, u = ecef_to_enu(r_ecef, site_ecef, site_lat_rad, site_lon_rad)
-        az, el, _ = az_el_range(e, n, u)
-
-        if el >= min_elevation_rad:
-            if not in_pass:
-                in_pass = True
-                aos = t
-                max_el = el
-                tca = t
-            else:
-                if el > max_el:
-                    max_el = el
-                    tca = t
-        else:
-            if in_pass:
-                los = t
-                passes.append(
-                    PassEvent(
-                        aos=aos,
-                        los=los,
-                        tca=tca,
-                        max_elevation_rad=max_el,
-                    )
-                )
-                in_pass = False
-
-        t += datetime.timedelta(seconds=step_seconds)
-
-    return passes
-
+        _, el, _ = az_el_range(e, n, u)
+        return el
+
+    if step_seconds is None:
+        step = coarse_step_from_vectors(*propagate_fn(0.0), min_elevation_rad)
+    else:
+        step = step_seconds / 60.0
+
+    events = find_passes(
+        elevation,
+        0.0,
+        (end_time - start_time).total_seconds() / 60.0,
+        step,
+        min_elevation_rad,
+        tolerance_seconds / 60.0,
+    )
+
+    def at(tsince_min: float) -> datetime.datetime:
+        return start_time + datetime.timedelta(minutes=tsince_min)
+
+    return [
+        PassEvent(
+            aos=at(p.aos),
+            los=at(p.los),
+            tca=at(p.t_max),
+            max_elevation_rad=p.max_el,
+        )
+        for p in events
+    ]
@@ -6,20 +6,43 @@
 # Computes AOS, LOS, and maximum elevation events for
 # satellites relative to a fixed ground station.
 #
+# The search scans elevation on a coarse grid whose step is derived
+# from the shortest pass the orbit can produce, then refines:
+#   - AOS / LOS with Brent's method on (elevation - mask)
+#   - the time of closest approach with a golden-section search
+# Passes that peak above the mask between two coarse samples are
+# recovered by refining every sampled elevation maximum near the mask.
+#
 # Reference:
 #   Vallado, Fundamentals of Astrodynamics and Applications
 
 from __future__ import annotations
 
+import datetime
 import math
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Callable, List, Optional, Tuple
 
-from pyglspg4.sgp4.propagate import propagate
+from pyglspg4.api.satellite import as_satellite
+from pyglspg4.constants import EARTH_RADIUS_KM, MU
 from pyglspg4.frames.itrf import teme_to_itrf
-from pyglspg4.frames.geodetic import ecef_to_geodetic
+from pyglspg4.frames.teme_to_ecef import OMEGA_EARTH
+from pyglspg4.groundstation.station import GroundStation
 from pyglspg4.groundstation.topocentric import topocentric
-from pyglspg4.groundstation.visibility import is_visible
+from pyglspg4.math.numerics import find_root_brent, maximize_golden
+from pyglspg4.time.julian import datetime_to_jd, jd_to_datetime
+
+
+# Event time tolerance (minutes); 0.1 s
+DEFAULT_TOLERANCE = 1.0 / 600.0
+
+# Bounds on the derived coarse step (minutes)
+MIN_COARSE_STEP = 0.05
+MAX_COARSE_STEP = 10.0
+
+# Sampled elevation maxima within this distance below the mask are
+# refined in case the true maximum clears it (rad)
+_PEAK_MARGIN = math.radians(10.0)
 
 
 @dataclass(frozen=True)
@@ -30,31 +53,211 @@ class PassEvent:
     t_max: float        # minutes since epoch
 
 
-def _sign(x: float) -> int:
-    if x > 0.0:
-        return 1
-    if x < 0.0:
-        return -1
-    return 0
+def coarse_step(state, min_elevation: float = 0.0) -> float:
+    """
+    Coarse search step for an orbit and elevation mask.
+
+    The step is a quarter of the shortest possible pass: an overhead
+    pass at perigee height, crossing the station at the perigee
+    angular rate plus the Earth's rotation rate.
 
+    Parameters
+    ----------
+    state : SGP4State or SGP4Record
+        Initialized SGP-4 state
+    min_elevation : float
+        Elevation mask (rad)
 
-def predict_passes(
+    Returns
+    -------
+    float
+        Step (minutes)
+    """
+
+    e = state.eccentricity
+    r_perigee = state.semi_major_axis * (1.0 - e) * EARTH_RADIUS_KM
+    rate = state.mean_motion * math.sqrt(1.0 - e * e) / (1.0 - e) ** 2
+
+    return _coarse_step(r_perigee, rate, min_elevation)
+
+
+def coarse_step_from_vectors(
+    r_teme: Tuple[float, float, float],
+    v_teme: Tuple[float, float, float],
+    min_elevation: float = 0.0,
+) -> float:
+    """
+    Coarse search step estimated from one osculating state vector.
+
+    Used when only a propagation callback is available.
+
+    Parameters
+    ----------
+    r_teme : (x, y, z)
+        Position (km)
+    v_teme : (vx, vy, vz)
+        Velocity (km/s)
+    min_elevation : float
+        Elevation mask (rad)
+
+    Returns
+    -------
+    float
+        Step (minutes)
+    """
+
+    r = math.sqrt(sum(c * c for c in r_teme))
+    v2 = sum(c * c for c in v_teme)
+    h = math.sqrt(sum(c * c for c in _cross(r_teme, v_teme)))
+
+    energy = 0.5 * v2 - MU / r
+    if energy >= 0.0:
+        return MIN_COARSE_STEP
+
+    a = -MU / (2.0 * energy)
+    e = math.sqrt(max(0.0, 1.0 - h * h / (MU * a)))
+    r_perigee = a * (1.0 - e)
+
+    return _coarse_step(r_perigee, 60.0 * h / r_perigee ** 2, min_elevation)
+
+
+def _coarse_step(r_perigee: float, rate: float, min_elevation: float) -> float:
+    # r_perigee in km, rate in rad/min
+    if r_perigee <= EARTH_RADIUS_KM:
+        return MIN_COARSE_STEP
+
+    # Earth central half-angle of the visibility cone at perigee height
+    half_angle = (
+        math.acos(EARTH_RADIUS_KM * math.cos(min_elevation) / r_perigee)
+        - min_elevation
+    )
+
+    step = 0.5 * half_angle / (rate + OMEGA_EARTH * 60.0)
+    return min(max(step, MIN_COARSE_STEP), MAX_COARSE_STEP)
+
+
+def _cross(a, b):
+    return (
+        a[1] * b[2] - a[2] * b[1],
+        a[2] * b[0] - a[0] * b[2],
+        a[0] * b[1] - a[1] * b[0],
+    )
+
+
+def find_passes(
+    elevation: Callable[[float], float],
+    t_start: float,
+    t_end: float,
+    step: float,
+    min_elevation: float = 0.0,
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> List[PassEvent]:
+    """
+    Find intervals where an elevation function exceeds a mask.
+
+    Parameters
+    ----------
+    elevation : callable
+        Elevation (rad) as a function of time (minutes)
+    t_start, t_end : float
+        Search window (minutes)
+    step : float
+        Coarse scan step (minutes)
+    min_elevation : float
+        Elevation mask (rad)
+    tolerance : float
+        Accuracy of the refined event times (minutes)
+
+    Returns
+    -------
+    list of PassEvent
+        Passes that set within the window. A pass already in
+        progress at t_start reports t_start as its AOS.
+    """
+
+    def above(t: float) -> float:
+        return elevation(t) - min_elevation
+
+    n = int(math.floor((t_end - t_start) / step + 1.0e-9)) + 1
+    times = [t_start + k * step for k in range(n)]
+    if times[-1] < t_end:
+        times.append(t_end)
+    values = [above(t) for t in times]
+
+    def refine(a: float, b: float, fa: float, fb: float) -> float:
+        return find_root_brent(above, a, b, fa, fb, tol=tolerance)
+
+    def culminate(aos: float, los: float, k: int) -> PassEvent:
+        # Bracket the maximum with the coarse samples around the best one
+        lo = max(aos, times[k - 1] if k > 0 else aos)
+        hi = min(los, times[k + 1] if k + 1 < len(times) else los)
+        t_max, f_max = maximize_golden(above, lo, hi, tol=tolerance)
+        return PassEvent(
+            aos=aos,
+            los=los,
+            max_el=f_max + min_elevation,
+            t_max=t_max,
+        )
+
+    events: List[PassEvent] = []
+    aos: Optional[float] = t_start if values[0] >= 0.0 else None
+    best = 0    # index of the highest coarse sample in the current pass
+
+    for k in range(1, len(times)):
+        fa, fb = values[k - 1], values[k]
+
+        if fa < 0.0 <= fb:
+            aos = refine(times[k - 1], times[k], fa, fb)
+            best = k
+        elif fa >= 0.0 > fb and aos is not None:
+            los = refine(times[k - 1], times[k], fa, fb)
+            events.append(culminate(aos, los, best))
+            aos = None
+        elif fa >= 0.0 and fb >= 0.0:
+            if fb > values[best]:
+                best = k
+        elif (
+            fa < 0.0
+            and fb < 0.0
+            and k + 1 < len(times)
+            and fa < fb >= values[k + 1]
+            and fb > -_PEAK_MARGIN
+        ):
+            # Short pass hidden between coarse samples
+            t_max, f_max = maximize_golden(
+                above, times[k - 1], times[k + 1], tol=tolerance
+            )
+            if f_max >= 0.0:
+                events.append(
+                    PassEvent(
+                        aos=refine(times[k - 1], t_max, fa, f_max),
+                        los=refine(t_max, times[k + 1], f_max, values[k + 1]),
+                        max_el=f_max + min_elevation,
+                        t_max=t_max,
+                    )
+                )
+
+    return events
+
+
+def predict_passes_geodetic(
     state,
     lat: float,
     lon: float,
     alt: float,
     jd_start: float,
     minutes: float,
-    step: float = 30.0,
+    step: Optional[float] = None,
     min_elevation: float = 0.0,
+    tolerance: float = DEFAULT_TOLERANCE,
 ) -> List[PassEvent]:
     """
-    Predict satellite passes over a ground station.
+    Predict satellite passes over geodetic station coordinates.
 
     Parameters
     ----------
-    state : SGP4State
-        Initialized SGP-4 / SDP-4 state
+    state : Satellite, TLE or SGP4State
+        Satellite handle, parsed TLE, or an initialized SGP-4 state
     lat : float
         Ground station latitude (rad)
     lon : float
@@ -65,60 +268,103 @@ def predict_passes(
         Start Julian Date (UTC/UT1 aligned)
     minutes : float
         Duration to search forward (minutes)
-    step : float
-        Time step for coarse search (minutes)
+    step : float, optional
+        Coarse search step (minutes). Derived from the orbit and the
+        mask by default.
     min_elevation : float
         Elevation mask (rad)
+    tolerance : float
+        Accuracy of AOS, LOS and t_max (minutes)
 
     Returns
     -------
     list of PassEvent
+        Event times in minutes since the TLE epoch
+
+    See Also
+    --------
+    predict_passes : GroundStation and datetime interface
     """
 
-    events: List[PassEvent] = []
+    sat = as_satellite(state)
+    if step is None:
+        step = coarse_step(sat.record, min_elevation)
 
-    t = 0.0
-    visible_prev = False
-    aos: Optional[float] = None
-    max_el = -math.pi / 2.0
-    t_max = 0.0
+    epoch_jd = sat.epoch_jd
 
-    while t <= minutes:
-        r_teme, v_teme, err = propagate(state, t)
+    def elevation(t: float) -> float:
+        r_teme, v_teme, err = sat.at(t)
         if err != 0:
-            t += step
-            continue
-
-        jd = jd_start + t / 1440.0
-        r_itrf, _ = teme_to_itrf(r_teme, v_teme, jd)
-
-        az, el, _ = topocentric(r_itrf, lat, lon, alt)
-        visible = is_visible(el, min_elevation)
-
-        if visible and not visible_prev:
-            aos = t
-            max_el = el
-            t_max = t
-
-        if visible:
-            if el > max_el:
-                max_el = el
-                t_max = t
-
-        if not visible and visible_prev and aos is not None:
-            events.append(
-                PassEvent(
-                    aos=aos,
-                    los=t,
-                    max_el=max_el,
-                    t_max=t_max,
-                )
-            )
-            aos = None
-            max_el = -math.pi / 2.0
+            return -math.pi / 2.0
+        r_itrf, _ = teme_to_itrf(r_teme, v_teme, epoch_jd + t / 1440.0)
+        return topocentric(r_itrf, lat, lon, alt)[1]
 
-        visible_prev = visible
-        t += step
+    t_start = (jd_start - epoch_jd) * 1440.0
+    return find_passes(
+        elevation,
+        t_start,
+        t_start + minutes,
+        step,
+        min_elevation,
+        tolerance,
+    )
 
-    return events
 
+def predict_passes(
+    state,
+    station: GroundStation,
+    start: datetime.datetime,
+    end: datetime.datetime,
+    step_sec: Optional[float] = None,
+    min_elevation_deg: float = 0.0,
+) -> List[dict]:
+    """
+    Predict passes over a GroundStation between two UTC datetimes.
+
+    Parameters
+    ----------
+    state : Satellite, TLE or SGP4State
+        Satellite to track
+    station : GroundStation
+        Observing station
+    start, end : datetime
+        Search window (UTC; naive datetimes are taken as UTC)
+    step_sec : float, optional
+        Coarse search step (seconds), derived from the orbit by default
+    min_elevation_deg : float
+        Elevation mask (degrees)
+
+    Returns
+    -------
+    list of dict
+        One dict per pass with "aos", "los" and "tca" (naive UTC
+        datetimes) and "max_el" (degrees)
+    """
+
+    sat = as_satellite(state)
+    jd_start = datetime_to_jd(start)
+    minutes = (end - start).total_seconds() / 60.0
+
+    events = predict_passes_geodetic(
+        sat,
+        station.lat,
+        station.lon,
+        station.alt,
+        jd_start,
+        minutes,
+        step=None if step_sec is None else step_sec / 60.0,
+        min_elevation=math.radians(min_elevation_deg),
+    )
+
+    def utc(t: float) -> datetime.datetime:
+        return jd_to_datetime(sat.epoch_jd + t / 1440.0)
+
+    return [
+        {
+            "aos": utc(p.aos),
+            "los": utc(p.los),
+            "tca": utc(p.t_max),
+            "max_el": math.degrees(p.max_el),
+        }
+        for p in events
+    ]
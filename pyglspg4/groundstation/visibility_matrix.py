@@ -0,0 +1,303 @@
+# Copyright (C) 2025-2026 Kris Kirby, KE4AHR
+# SPDX-License-Identifier: LGPL-3.0-or-later
+#
+# Multi-station x multi-satellite visibility engine
+#
+# Evaluates azimuth, elevation and range for every (station,
+# satellite, time) triple as NumPy broadcasts, and reduces an
+# elevation mask test to sparse visibility intervals.
+#
+# Station ECEF positions and ENU rotation rows are computed once per
+# StationArray rather than on every call.
+#
+# Requires NumPy.
+#
+# Reference:
+#   Vallado, Fundamentals of Astrodynamics and Applications
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Iterator, Optional, Sequence, Tuple
+
+import numpy as np
+
+from pyglspg4.frames.geodetic import WGS84_A, WGS84_E2
+
+
+# Upper bound on elements in one (stations, satellites, times) block;
+# each block's float64 temporaries are a small multiple of this
+_BLOCK_ELEMENTS = 1 << 22
+
+
+class StationArray:
+    """
+    Fixed set of ground stations in columnar form.
+
+    Parameters
+    ----------
+    lat, lon : array_like, shape (S,)
+        Geodetic latitude and longitude (rad)
+    alt : array_like, shape (S,)
+        Altitude above the WGS-84 ellipsoid (km)
+    min_elevation : float or array_like, shape (S,)
+        Per-station elevation mask (rad)
+    """
+
+    def __init__(self, lat, lon, alt, min_elevation=0.0) -> None:
+        self.lat = np.atleast_1d(np.asarray(lat, dtype=np.float64))
+        self.lon = np.atleast_1d(np.asarray(lon, dtype=np.float64))
+        self.alt = np.atleast_1d(np.asarray(alt, dtype=np.float64))
+        self.lat, self.lon, self.alt = np.broadcast_arrays(
+            self.lat, self.lon, self.alt
+        )
+        self.min_elevation = np.broadcast_to(
+            np.asarray(min_elevation, dtype=np.float64), self.lat.shape
+        )
+
+        sin_lat = np.sin(self.lat)
+        cos_lat = np.cos(self.lat)
+        sin_lon = np.sin(self.lon)
+        cos_lon = np.cos(self.lon)
+
+        n = WGS84_A / np.sqrt(1.0 - WGS84_E2 * sin_lat * sin_lat)
+        self.ecef = np.stack(
+            (
+                (n + self.alt) * cos_lat * cos_lon,
+                (n + self.alt) * cos_lat * sin_lon,
+                (n * (1.0 - WGS84_E2) + self.alt) * sin_lat,
+            ),
+            axis=-1,
+        )
+
+        # Rows of the ECEF -> ENU rotation, shape (S, 3, 3)
+        self.enu = np.stack(
+            (
+                np.stack((-sin_lon, cos_lon, np.zeros_like(sin_lon)), -1),
+                np.stack((-sin_lat * cos_lon, -sin_lat * sin_lon, cos_lat), -1),
+                np.stack((cos_lat * cos_lon, cos_lat * sin_lon, sin_lat), -1),
+            ),
+            axis=1,
+        )
+        self._enu_offset = np.einsum("sij,sj->si", self.enu, self.ecef)
+
+    def __len__(self) -> int:
+        return self.lat.shape[0]
+
+    @classmethod
+    def from_stations(
+        cls,
+        stations: Sequence,
+        min_elevation=0.0,
+    ) -> "StationArray":
+        """
+        Build from GroundStation objects.
+        """
+        return cls(
+            [s.lat for s in stations],
+            [s.lon for s in stations],
+            [s.alt for s in stations],
+            min_elevation,
+        )
+
+    def _enu(self, r_itrf: np.ndarray, select=slice(None)):
+        # ENU components, each of shape (S, N, T)
+        rot = self.enu[select]
+        offset = self._enu_offset[select]
+        return tuple(
+            np.tensordot(rot[:, k, :], r_itrf, axes=([1], [2]))
+            - offset[:, k, np.newaxis, np.newaxis]
+            for k in range(3)
+        )
+
+
+def _blocks(n_station: int, n_sat: int, n_time: int):
+    """
+    (stations, satellites, times) slices tiling the full grid.
+
+    Each block holds at most _BLOCK_ELEMENTS samples. Time is the
+    innermost loop, so the blocks of one (stations, satellites) tile
+    arrive in time order.
+    """
+    n_t = max(1, min(n_time, _BLOCK_ELEMENTS))
+    n_n = max(1, min(n_sat, _BLOCK_ELEMENTS // n_t))
+    n_s = max(1, _BLOCK_ELEMENTS // (n_n * n_t))
+
+    for s in range(0, n_station, n_s):
+        for n in range(0, n_sat, n_n):
+            for t in range(0, n_time, n_t):
+                yield slice(s, s + n_s), slice(n, n + n_n), slice(t, t + n_t)
+
+
+def _as_satellite_grid(r_itrf) -> np.ndarray:
+    r = np.asarray(r_itrf, dtype=np.float64)
+    if r.ndim == 2:
+        r = r[np.newaxis]
+    if r.ndim != 3 or r.shape[-1] != 3:
+        raise ValueError("r_itrf must have shape (N, T, 3) or (T, 3)")
+    return r
+
+
+def look_angles(
+    stations: StationArray,
+    r_itrf,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Azimuth, elevation and range for every station / satellite / time.
+
+    Parameters
+    ----------
+    stations : StationArray
+        S ground stations
+    r_itrf : array_like, shape (N, T, 3) or (T, 3)
+        Satellite ITRF positions (km) on a common time grid
+
+    Returns
+    -------
+    az, el, rho : ndarray, shape (S, N, T)
+        Azimuth (rad, east of north in [0, 2π)), elevation (rad) and
+        slant range (km)
+
+    Notes
+    -----
+    Besides the three results, memory use is bounded by the block
+    size: intermediates are formed one grid block at a time.
+    """
+
+    r = _as_satellite_grid(r_itrf)
+    shape = (len(stations),) + r.shape[:2]
+    az = np.empty(shape)
+    el = np.empty(shape)
+    rho = np.empty(shape)
+
+    for s, n, t in _blocks(*shape):
+        east, north, up = stations._enu(r[n, t], s)
+
+        block_rho = np.sqrt(east * east + north * north + up * up)
+        rho[s, n, t] = block_rho
+        np.arctan2(east, north, out=east)
+        az[s, n, t] = np.mod(east, 2.0 * np.pi, out=east)
+        el[s, n, t] = np.arcsin(np.divide(up, block_rho, out=up), out=up)
+
+    return az, el, rho
+
+
+@dataclass(frozen=True)
+class VisibilityIntervals:
+    """
+    Sparse visibility intervals.
+
+    Entry i says that satellite[i] is above the mask of station[i]
+    for every grid sample from index start[i] to stop[i] inclusive,
+    i.e. from time_start[i] to time_stop[i].
+    """
+
+    station: np.ndarray
+    satellite: np.ndarray
+    start: np.ndarray
+    stop: np.ndarray
+    time_start: np.ndarray
+    time_stop: np.ndarray
+
+    def __len__(self) -> int:
+        return self.station.shape[0]
+
+    def __iter__(self) -> Iterator[Tuple[int, int, float, float]]:
+        for i in range(len(self)):
+            yield (
+                int(self.station[i]),
+                int(self.satellite[i]),
+                float(self.time_start[i]),
+                float(self.time_stop[i]),
+            )
+
+
+def visible_intervals(
+    stations: StationArray,
+    r_itrf,
+    times: Optional[Sequence[float]] = None,
+) -> VisibilityIntervals:
+    """
+    Sparse intervals in which satellites clear each station's mask.
+
+    The mask test is done as up >= rho * sin(mask), so no inverse
+    trigonometry is evaluated. The grid is processed in (station,
+    satellite, time) blocks of at most _BLOCK_ELEMENTS samples, so
+    peak memory does not grow with the network, the catalog or the
+    span; intervals crossing a time block boundary are joined.
+
+    Parameters
+    ----------
+    stations : StationArray
+        S ground stations with their elevation masks
+    r_itrf : array_like, shape (N, T, 3) or (T, 3)
+        Satellite ITRF positions (km) on a common time grid
+    times : array_like, shape (T,), optional
+        Grid times reported in the result; sample indices by default
+
+    Returns
+    -------
+    VisibilityIntervals
+        Ordered by station, then satellite, then start time
+    """
+
+    r = _as_satellite_grid(r_itrf)
+    n_sat, n_time = r.shape[:2]
+    times = (
+        np.arange(n_time, dtype=np.float64)
+        if times is None
+        else np.asarray(times, dtype=np.float64)
+    )
+    if times.shape != (n_time,):
+        raise ValueError("times must have one entry per grid sample")
+
+    sin_mask = np.sin(stations.min_elevation)
+
+    rising = []
+    falling = []
+    for s, n, t in _blocks(len(stations), n_sat, n_time):
+        east, north, up = stations._enu(r[n, t], s)
+
+        threshold = np.sqrt(east * east + north * north + up * up)
+        threshold *= sin_mask[s, np.newaxis, np.newaxis]
+        visible = up >= threshold
+
+        # Rising and falling edges along the time axis, continuing the
+        # previous time block of this tile and closing the last one
+        if t.start == 0:
+            carry = np.zeros(visible.shape[:2] + (1,), dtype=bool)
+        padded = [carry, visible]
+        if t.start + visible.shape[-1] == n_time:
+            padded.append(np.zeros_like(carry))
+        edges = np.diff(np.concatenate(padded, axis=-1).astype(np.int8))
+        carry = visible[..., -1:]
+
+        offset = (s.start, n.start, t.start)
+        rising.append(_shift(np.nonzero(edges == 1), offset))
+        falling.append(_shift(np.nonzero(edges == -1), offset))
+
+    station, satellite, start = _ordered(rising)
+    _, _, stop = _ordered(falling)
+    stop -= 1
+
+    return VisibilityIntervals(
+        station=station,
+        satellite=satellite,
+        start=start,
+        stop=stop,
+        time_start=times[start],
+        time_stop=times[stop],
+    )
+
+
+def _shift(indices, offset):
+    return tuple(index + first for index, first in zip(indices, offset))
+
+
+def _ordered(parts):
+    # (station, satellite, time) index arrays sorted in that order
+    if not parts:
+        return tuple(np.empty(0, dtype=np.intp) for _ in range(3))
+    station, satellite, time = (np.concatenate(c) for c in zip(*parts))
+    order = np.lexsort((time, satellite, station))
+    return station[order], satellite[order], time[order]
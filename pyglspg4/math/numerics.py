@@ -7,11 +7,18 @@
 Numerical solvers and utilities.
 
 Contains a robust, bounded Kepler equation solver used by both
-SGP-4 and SDP-4 propagation paths.
+SGP-4 and SDP-4 propagation paths, in scalar and array form.
+
+All variants share the same starting guess and Halley update, so a
+satellite gives the same eccentric anomaly whether it is propagated
+alone or as part of a catalog.
 """
 
 from __future__ import annotations
 
+import math
+from typing import Tuple
+
 from pyglspg4.constants import KEPLER_EPSILON, MAX_KEPLER_ITERATIONS
 
 
@@ -22,13 +29,181 @@ class ConvergenceError(RuntimeError):
     pass
 
 
+# Eccentricity above which Danby's starting guess is used
+_DANBY_THRESHOLD = 0.8
+
+
+def kepler_start(mean_anomaly: float, eccentricity: float) -> float:
+    """
+    Starting guess for Kepler's equation.
+
+    Uses the third-order series E0 = M + e sin M (1 + e cos M) for
+    moderate eccentricity and Danby's E0 = M + 0.85 e sign(sin M)
+    for highly eccentric orbits.
+    """
+    sin_m = math.sin(mean_anomaly)
+    if eccentricity > _DANBY_THRESHOLD:
+        return mean_anomaly + 0.85 * math.copysign(eccentricity, sin_m)
+    return mean_anomaly + eccentricity * sin_m * (
+        1.0 + eccentricity * math.cos(mean_anomaly)
+    )
+
+
+def _solve_halley(
+    mean_anomaly: float,
+    eccentricity: float,
+    tol: float,
+    max_iter: int,
+    sin=math.sin,
+    cos=math.cos,
+    fabs=abs,
+) -> Tuple[float, bool, int]:
+    """
+    The scalar Halley iteration behind every scalar Kepler solver.
+
+    Returns:
+        Tuple of (eccentric anomaly E, converged flag, Halley
+        iterations performed).
+    """
+    if eccentricity < 1.0e-8:
+        return mean_anomaly, True, 0
+
+    E = kepler_start(mean_anomaly, eccentricity)
+    for n in range(1, max_iter + 1):
+        e_sin = eccentricity * sin(E)
+        e_cos = eccentricity * cos(E)
+        f = E - e_sin - mean_anomaly
+        f_prime = 1.0 - e_cos
+        delta = -f / (f_prime - 0.5 * f * e_sin / f_prime)
+        E += delta
+        if fabs(delta) < tol:
+            return E, True, n
+
+    return E, False, max_iter
+
+
+def solve_kepler_scalar(
+    mean_anomaly: float,
+    eccentricity: float,
+    tol: float = KEPLER_EPSILON,
+    max_iter: int = MAX_KEPLER_ITERATIONS,
+) -> Tuple[float, bool]:
+    """
+    Solve Kepler's equation E - e * sin(E) = M for one element.
+
+    Args:
+        mean_anomaly: Mean anomaly M (radians)
+        eccentricity: Orbital eccentricity e
+        tol: Convergence threshold on the Halley correction (radians)
+        max_iter: Maximum number of Halley iterations
+
+    Returns:
+        Tuple of (eccentric anomaly E, converged flag). When the
+        solver does not converge the last iterate is returned.
+    """
+    E, converged, _ = _solve_halley(mean_anomaly, eccentricity, tol, max_iter)
+    return E, converged
+
+
+def solve_kepler_array(
+    mean_anomaly,
+    eccentricity,
+    tol: float = KEPLER_EPSILON,
+    max_iter: int = MAX_KEPLER_ITERATIONS,
+):
+    """
+    Solve Kepler's equation element-wise for NumPy arrays.
+
+    Elements drop out of the iteration as soon as their Halley
+    correction falls below tol, so the cost follows the slowest
+    elements only for those elements.
+
+    Args:
+        mean_anomaly: Array of mean anomalies M (radians)
+        eccentricity: Array of eccentricities, broadcastable to M
+        tol: Convergence threshold on the Halley correction (radians)
+        max_iter: Maximum number of Halley iterations
+
+    Returns:
+        Tuple of (eccentric anomaly array, boolean converged array),
+        both with the broadcast shape of the inputs.
+    """
+    import numpy as np
+
+    M, e = np.broadcast_arrays(
+        np.asarray(mean_anomaly, dtype=np.float64),
+        np.asarray(eccentricity, dtype=np.float64),
+    )
+    shape = M.shape
+    M = M.ravel()
+    e = e.ravel()
+
+    sin_m = np.sin(M)
+    E = np.where(
+        e > _DANBY_THRESHOLD,
+        M + 0.85 * np.copysign(e, sin_m),
+        M + e * sin_m * (1.0 + e * np.cos(M)),
+    )
+
+    converged = e < 1.0e-8
+    E[converged] = M[converged]
+    active = np.flatnonzero(~converged)
+
+    for _ in range(max_iter):
+        if active.size == 0:
+            break
+
+        Ea = E[active]
+        ea = e[active]
+        e_sin = ea * np.sin(Ea)
+        e_cos = ea * np.cos(Ea)
+        f = Ea - e_sin - M[active]
+        f_prime = 1.0 - e_cos
+        delta = -f / (f_prime - 0.5 * f * e_sin / f_prime)
+        E[active] = Ea + delta
+
+        done = np.abs(delta) < tol
+        converged[active[done]] = True
+        active = active[~done]
+
+    return E.reshape(shape), converged.reshape(shape)
+
+
+def solve_kepler_backend(
+    backend,
+    mean_anomaly,
+    eccentricity,
+    tol: float = KEPLER_EPSILON,
+    max_iter: int = MAX_KEPLER_ITERATIONS,
+):
+    """
+    Solve Kepler's equation on the operands of a MathBackend.
+
+    Array backends use the masked solve_kepler_array, scalar backends
+    solve_kepler_scalar; both return the same iterates.
+
+    Args:
+        backend: MathBackend the operands belong to
+        mean_anomaly: Mean anomaly M (radians)
+        eccentricity: Orbital eccentricity e
+        tol: Convergence threshold on the Halley correction (radians)
+        max_iter: Maximum number of Halley iterations
+
+    Returns:
+        Tuple of (eccentric anomaly, converged flag or array).
+    """
+    if backend.is_array:
+        return solve_kepler_array(mean_anomaly, eccentricity, tol, max_iter)
+    return solve_kepler_scalar(mean_anomaly, eccentricity, tol, max_iter)
+
+
 def solve_kepler(mean_anomaly: float, eccentricity: float, backend) -> float:
     """
     Solve Kepler's equation:
 
         E - e * sin(E) = M
 
-    using a bounded Newton-Raphson iteration.
+    using a bounded Halley iteration.
 
     Args:
         mean_anomaly: Mean anomaly M (radians)
@@ -41,17 +216,145 @@ def solve_kepler(mean_anomaly: float, eccentricity: float, backend) -> float:
     Raises:
         ConvergenceError if the solver does not converge.
     """
-    if eccentricity < 1.0e-8:
-        return mean_anomaly
-
-    E = mean_anomaly
-    for _ in range(MAX_KEPLER_ITERATIONS):
-        f = E - eccentricity * backend.sin(E) - mean_anomaly
-        f_prime = 1.0 - eccentricity * backend.cos(E)
-        delta = -f / f_prime
-        E += delta
-        if backend.abs(delta) < KEPLER_EPSILON:
-            return E
+    E, converged, _ = _solve_halley(
+        mean_anomaly,
+        eccentricity,
+        KEPLER_EPSILON,
+        MAX_KEPLER_ITERATIONS,
+        backend.sin,
+        backend.cos,
+        backend.abs,
+    )
+    if converged:
+        return E
 
     raise ConvergenceError("Kepler solver failed to converge")
 
+
+def find_root_brent(
+    func,
+    a: float,
+    b: float,
+    fa: float | None = None,
+    fb: float | None = None,
+    tol: float = 1.0e-10,
+    max_iter: int = 100,
+) -> float:
+    """
+    Find a root of func bracketed by [a, b] using Brent's method.
+
+    Combines bisection, secant and inverse quadratic interpolation, so
+    smooth functions converge superlinearly while convergence is never
+    slower than bisection.
+
+    Args:
+        func: Scalar function of one variable
+        a, b: Bracket with func(a) and func(b) of opposite sign
+        fa, fb: Optional precomputed func(a), func(b)
+        tol: Absolute tolerance on the root
+        max_iter: Maximum number of iterations
+
+    Returns:
+        Root location
+
+    Raises:
+        ValueError if [a, b] does not bracket a root.
+        ConvergenceError if max_iter is exceeded.
+    """
+    fa = func(a) if fa is None else fa
+    fb = func(b) if fb is None else fb
+
+    if fa == 0.0:
+        return a
+    if fb == 0.0:
+        return b
+    if (fa > 0.0) == (fb > 0.0):
+        raise ValueError("Root is not bracketed")
+
+    c, fc = a, fa
+    d = e = b - a
+
+    for _ in range(max_iter):
+        if (fb > 0.0) == (fc > 0.0):
+            c, fc = a, fa
+            d = e = b - a
+        if abs(fc) < abs(fb):
+            a, b, c = b, c, b
+            fa, fb, fc = fb, fc, fb
+
+        tol1 = 2.0e-16 * abs(b) + 0.5 * tol
+        xm = 0.5 * (c - b)
+        if abs(xm) <= tol1 or fb == 0.0:
+            return b
+
+        if abs(e) >= tol1 and abs(fa) > abs(fb):
+            s = fb / fa
+            if a == c:
+                p = 2.0 * xm * s
+                q = 1.0 - s
+            else:
+                q = fa / fc
+                r = fb / fc
+                p = s * (2.0 * xm * q * (q - r) - (b - a) * (r - 1.0))
+                q = (q - 1.0) * (r - 1.0) * (s - 1.0)
+            if p > 0.0:
+                q = -q
+            p = abs(p)
+            if 2.0 * p < min(3.0 * xm * q - abs(tol1 * q), abs(e * q)):
+                e = d
+                d = p / q
+            else:
+                d = e = xm
+        else:
+            d = e = xm
+
+        a, fa = b, fb
+        b += d if abs(d) > tol1 else math.copysign(tol1, xm)
+        fb = func(b)
+
+    raise ConvergenceError("Brent root finder failed to converge")
+
+
+# 1 / golden ratio
+_INV_PHI = (math.sqrt(5.0) - 1.0) / 2.0
+
+
+def maximize_golden(
+    func,
+    a: float,
+    b: float,
+    tol: float = 1.0e-10,
+) -> Tuple[float, float]:
+    """
+    Locate the maximum of a unimodal function on [a, b].
+
+    Uses golden-section search, which needs one function evaluation
+    per iteration and shrinks the bracket by 0.618 each time.
+
+    Args:
+        func: Scalar function of one variable
+        a, b: Search interval
+        tol: Absolute tolerance on the location of the maximum
+
+    Returns:
+        Tuple of (location, function value) of the maximum.
+    """
+    if b < a:
+        a, b = b, a
+
+    x1 = b - _INV_PHI * (b - a)
+    x2 = a + _INV_PHI * (b - a)
+    f1 = func(x1)
+    f2 = func(x2)
+
+    while b - a > tol:
+        if f1 < f2:
+            a, x1, f1 = x1, x2, f2
+            x2 = a + _INV_PHI * (b - a)
+            f2 = func(x2)
+        else:
+            b, x2, f2 = x2, x1, f1
+            x1 = b - _INV_PHI * (b - a)
+            f1 = func(x1)
+
+    return (x1, f1) if f1 >= f2 else (x2, f2)
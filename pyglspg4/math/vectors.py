@@ -2,10 +2,13 @@
 # SPDX-License-Identifier: LGPL-3.0-or-later
 #
 # Minimal vector math utilities for orbital mechanics.
-# Explicit implementation, no NumPy dependency.
+# Explicit implementation, no NumPy dependency; the orbital-plane
+# rotation also runs on array backends.
 
 import math
 
+from pyglspg4.backend.python import PYTHON
+
 
 def dot(a, b):
     return a[0] * b[0] + a[1] * b[1] + a[2] * b[2]
@@ -26,3 +29,52 @@ def add(a, b):
 def sub(a, b):
     return (a[0] - b[0], a[1] - b[1], a[2] - b[2])
 
+
+
+def teme_position_velocity(
+    x_orb,
+    y_orb,
+    vx_orb,
+    vy_orb,
+    inclination,
+    raan,
+    arg_perigee,
+    backend=PYTHON,
+):
+    """
+    Rotate orbital-plane position and velocity into the TEME frame.
+
+    The in-plane x axis points at perigee. Returns a pair of
+    (position, velocity) component triples in the same units as the
+    inputs; the components are arrays when backend is an array
+    backend.
+    """
+    xp = backend
+    sin_i = xp.sin(inclination)
+    cos_i = xp.cos(inclination)
+    sin_o = xp.sin(raan)
+    cos_o = xp.cos(raan)
+    sin_w = xp.sin(arg_perigee)
+    cos_w = xp.cos(arg_perigee)
+
+    # Perifocal unit vectors P (towards perigee) and Q (90 deg ahead)
+    px = cos_o * cos_w - sin_o * sin_w * cos_i
+    py = sin_o * cos_w + cos_o * sin_w * cos_i
+    pz = sin_w * sin_i
+
+    qx = -cos_o * sin_w - sin_o * cos_w * cos_i
+    qy = -sin_o * sin_w + cos_o * cos_w * cos_i
+    qz = cos_w * sin_i
+
+    position = (
+        x_orb * px + y_orb * qx,
+        x_orb * py + y_orb * qy,
+        x_orb * pz + y_orb * qz,
+    )
+    velocity = (
+        vx_orb * px + vy_orb * qx,
+        vx_orb * py + vy_orb * qy,
+        vx_orb * pz + vy_orb * qz,
+    )
+
+    return position, velocity
@@ -13,10 +13,24 @@ deterministic behavior.
 
 from __future__ import annotations
 
+import multiprocessing
 from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 from typing import Callable, Iterable, List, Any
 
 
+def process_context():
+    """
+    Multiprocessing context used for worker processes.
+
+    Forking a parent whose Numba (TBB/OpenMP) or BLAS worker threads
+    are running can deadlock the children, so workers start from a
+    forkserver where the platform has one and are spawned otherwise.
+    """
+    methods = multiprocessing.get_all_start_methods()
+    method = "forkserver" if "forkserver" in methods else "spawn"
+    return multiprocessing.get_context(method)
+
+
 def run_threaded(
     func: Callable[[Any], Any],
     tasks: Iterable[Any],
@@ -55,9 +69,14 @@ def run_processes(
         List of results in task order.
 
     Notes:
-        Functions and arguments must be pickleable.
+        Functions and arguments must be pickleable, and func must be
+        importable by the workers (see process_context). Every task and
+        result is pickled; for large catalogs use
+        pyglspg4.parallel.shared.SharedPool instead.
     """
-    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+    with ProcessPoolExecutor(
+        max_workers=max_workers, mp_context=process_context()
+    ) as executor:
         results = list(executor.map(func, tasks))
     return results
 
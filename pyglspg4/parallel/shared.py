@@ -0,0 +1,277 @@
+# Copyright (C) 2025-2026 Kris Kirby, KE4AHR
+# SPDX-License-Identifier: LGPL-3.0-or-later
+#
+# This file is part of Pyglspg4.
+
+"""
+Shared-memory process pool for catalog propagation.
+
+The packed SatrecArray columns, the requested times and the output
+arrays all live in one multiprocessing.shared_memory segment. Workers
+receive only the segment name, the array sizes and an index range of
+satellites; they propagate that range straight into the shared output
+arrays. Nothing but these small task descriptors crosses the process
+boundary, so throughput scales with the number of cores rather than
+with pickling bandwidth. The SDP4Records of deep-space satellites are
+the exception: they are sent with the task covering their rows.
+
+The pool and its segment persist across calls. A SharedPool can be
+created explicitly, or the process-wide instance returned by
+shared_pool() can be reused.
+
+Requires NumPy.
+"""
+
+from __future__ import annotations
+
+import atexit
+import os
+import threading
+import weakref
+from concurrent.futures import ProcessPoolExecutor, wait
+from multiprocessing import shared_memory
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from pyglspg4.parallel.executors import process_context
+from pyglspg4.sgp4.satrec_array import COLUMNS, SatrecArray
+
+
+# Task granularity: ranges handed out per worker and call. More than
+# one range per worker keeps cores busy when some ranges contain
+# slower (highly eccentric) orbits.
+_RANGES_PER_WORKER = 4
+
+# Segment attachments held by each worker process, keyed by name
+_ATTACHED: Dict[str, shared_memory.SharedMemory] = {}
+
+
+def _layout(n: int, m: int, per_satellite_times: bool):
+    """
+    Byte offsets of the arrays stored in the segment.
+
+    Returns a dict of name -> (offset, shape, dtype) and the total size.
+    """
+    shapes = (
+        ("columns", (len(COLUMNS), n), np.float64),
+        ("times", (n, m) if per_satellite_times else (m,), np.float64),
+        ("position", (n, m, 3), np.float64),
+        ("velocity", (n, m, 3), np.float64),
+        ("error", (n, m), np.int64),
+    )
+
+    layout = {}
+    offset = 0
+    for name, shape, dtype in shapes:
+        layout[name] = (offset, shape, dtype)
+        offset += int(np.prod(shape)) * np.dtype(dtype).itemsize
+    return layout, offset
+
+
+def _views(buf, layout):
+    return {
+        name: np.ndarray(shape, dtype=dtype, buffer=buf, offset=offset)
+        for name, (offset, shape, dtype) in layout.items()
+    }
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    shm = _ATTACHED.get(name)
+    if shm is None:
+        # Drop attachments to segments the parent has since replaced
+        for old in _ATTACHED.values():
+            old.close()
+        _ATTACHED.clear()
+
+        shm = shared_memory.SharedMemory(name=name)
+        _ATTACHED[name] = shm
+    return shm
+
+
+def _propagate_range(spec, start: int, stop: int, deep_space=()) -> None:
+    """
+    Worker entry point: propagate satellites [start, stop).
+
+    deep_space pairs the range-relative row of each deep-space
+    satellite with its SDP4Record.
+    """
+    name, n, m, per_satellite_times = spec
+    layout, _ = _layout(n, m, per_satellite_times)
+    views = _views(_attach(name).buf, layout)
+
+    columns = views["columns"]
+    array = SatrecArray(
+        {col: columns[k, start:stop] for k, col in enumerate(COLUMNS)},
+        deep_space=deep_space,
+    )
+
+    times = views["times"]
+    if per_satellite_times:
+        times = times[start:stop]
+
+    _, _, error = array.propagate(
+        times,
+        out=(views["position"][start:stop], views["velocity"][start:stop]),
+    )
+    views["error"][start:stop] = error
+
+
+def _deep_space_range(array: SatrecArray, start: int, stop: int):
+    # SDP4Records are not columnar, so the few deep-space rows of a
+    # range travel with its task descriptor
+    return [
+        (int(row) - start, record)
+        for row, record in zip(array.deep_rows, array.deep_records)
+        if start <= row < stop
+    ]
+
+
+class SharedPool:
+    """
+    Persistent process pool that propagates SatrecArrays in place.
+
+    Args:
+        max_workers: Number of worker processes (default: CPU count)
+
+    The pool is safe to call from several threads; calls are
+    serialized because they share one segment.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None) -> None:
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.max_workers, mp_context=process_context()
+        )
+        self._lock = threading.Lock()
+        self._shm: Optional[shared_memory.SharedMemory] = None
+        self._packed = None   # (weakref to SatrecArray, n) in the segment
+        self._closed = False
+
+    def __enter__(self) -> "SharedPool":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Shut down the workers and release the shared segment.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._executor.shutdown(wait=True)
+            self._release()
+
+    def propagate(
+        self,
+        array: SatrecArray,
+        tsince_minutes,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Propagate every satellite of array across the worker pool.
+
+        Arguments and return values are as for SatrecArray.propagate.
+        """
+        t = np.asarray(tsince_minutes, dtype=np.float64)
+        per_satellite_times = t.ndim == 2
+        if per_satellite_times and t.shape[0] != len(array):
+            raise ValueError("tsince_minutes rows must match satellite count")
+        if not per_satellite_times:
+            t = np.atleast_1d(t)
+
+        n = len(array)
+        m = t.shape[-1]
+        layout, size = _layout(n, m, per_satellite_times)
+
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("SharedPool is closed")
+
+            self._reserve(size)
+            views = _views(self._shm.buf, layout)
+
+            packed = self._packed
+            if packed is None or packed[0]() is not array or packed[1] != n:
+                for k, col in enumerate(COLUMNS):
+                    views["columns"][k] = getattr(array, col)
+                self._packed = (weakref.ref(array), n)
+            views["times"][...] = t
+
+            spec = (self._shm.name, n, m, per_satellite_times)
+            bounds = np.linspace(
+                0,
+                n,
+                min(n, self.max_workers * _RANGES_PER_WORKER) + 1,
+                dtype=np.int64,
+            )
+            futures = [
+                self._executor.submit(
+                    _propagate_range,
+                    spec,
+                    int(a),
+                    int(b),
+                    _deep_space_range(array, int(a), int(b)),
+                )
+                for a, b in zip(bounds[:-1], bounds[1:])
+                if b > a
+            ]
+            wait(futures)
+            for future in futures:
+                future.result()
+
+            result = (
+                views["position"].copy(),
+                views["velocity"].copy(),
+                views["error"].copy(),
+            )
+            del views
+            return result
+
+    def _reserve(self, size: int) -> None:
+        if self._shm is not None and self._shm.size >= size:
+            return
+        self._release()
+        # Grow geometrically so slowly increasing catalogs do not
+        # reallocate on every call
+        self._shm = shared_memory.SharedMemory(
+            create=True, size=max(size, 1 << 16) * 5 // 4
+        )
+
+    def _release(self) -> None:
+        self._packed = None
+        if self._shm is not None:
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+
+
+_DEFAULT_POOL: Optional[SharedPool] = None
+_DEFAULT_LOCK = threading.Lock()
+
+
+def shared_pool(max_workers: Optional[int] = None) -> SharedPool:
+    """
+    Return the process-wide SharedPool, creating it on first use.
+
+    The pool is recreated if a different max_workers is requested.
+    """
+    global _DEFAULT_POOL
+
+    with _DEFAULT_LOCK:
+        pool = _DEFAULT_POOL
+        wanted = max_workers or os.cpu_count() or 1
+        if pool is None or pool._closed or pool.max_workers != wanted:
+            if pool is not None:
+                pool.close()
+            pool = SharedPool(wanted)
+            _DEFAULT_POOL = pool
+        return pool
+
+
+@atexit.register
+def _close_default_pool() -> None:
+    if _DEFAULT_POOL is not None:
+        _DEFAULT_POOL.close()
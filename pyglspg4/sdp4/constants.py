@@ -9,6 +9,8 @@ from __future__ import annotations
 
 import math
 
+from pyglspg4.constants import CK2, CK4
+
 # ---------------------------------------------------------------------------
 # Fundamental constants
 # ---------------------------------------------------------------------------
@@ -16,6 +18,15 @@ import math
 PI = math.pi
 TWO_PI = 2.0 * PI
 
+# ---------------------------------------------------------------------------
+# Zonal harmonics (WGS-72), unnormalized
+# ---------------------------------------------------------------------------
+
+J2 = 2.0 * CK2
+J3 = -2.53881e-6
+J4 = -8.0 / 3.0 * CK4
+J3OJ2 = J3 / J2
+
 # ---------------------------------------------------------------------------
 # Lunar–solar perturbation constants (per NORAD)
 # ---------------------------------------------------------------------------
@@ -24,31 +35,61 @@ TWO_PI = 2.0 * PI
 ZES = 0.01675
 ZNS = 1.19459e-5
 C1SS = 2.9864797e-6
-C1L = 4.7968065e-7
-ZNL = 1.5835218e-4
-ZEL = 0.05490
+ZSINIS = 0.39785416
+ZCOSIS = 0.91744867
+ZCOSGS = 0.1945905
+ZSINGS = -0.98088458
 
 # Lunar terms
-ZES_LUNAR = 0.01675
-ZNS_LUNAR = 1.19459e-5
-C1L_LUNAR = 4.7968065e-7
-ZNL_LUNAR = 1.5835218e-4
-ZEL_LUNAR = 0.05490
+ZEL = 0.05490
+ZNL = 1.5835218e-4
+C1L = 4.7968065e-7
+
+# Days from the 1950 epoch (JD 2433281.5) to the solar / lunar
+# reference epoch used by dscom
+DAY_OFFSET = 18261.5
+
+# Julian Date of 1950 January 0.0, the SGP-4 epoch origin
+JD_1950 = 2433281.5
 
 # ---------------------------------------------------------------------------
 # Resonance coefficients
 # ---------------------------------------------------------------------------
 
-# Synchronous resonance (Earth rotation)
+# Half-day (12 hour) resonance
 ROOT22 = 1.7891679e-6
 ROOT32 = 3.7393792e-7
 ROOT44 = 7.3636953e-9
 ROOT52 = 1.1428639e-7
 ROOT54 = 2.1765803e-9
 
-# 12-hour resonance (Molniya)
+# Synchronous (24 hour) resonance
+Q22 = 1.7891679e-6
+Q31 = 2.1460748e-6
+Q33 = 2.2123015e-7
+
+# Resonance phase angles
+FASX2 = 0.13130908
+FASX4 = 2.8843198
+FASX6 = 0.37448087
+G22 = 5.7686396
+G32 = 0.95240898
+G44 = 1.8014998
+G52 = 1.0508330
+G54 = 4.4108898
+
+# Earth rotation rate [rad/min]
 THDT = 4.37526908801129966e-3
 
+# Mean motion band (rad/min) of the synchronous resonance, and of the
+# half-day resonance for eccentric orbits
+SYNCHRONOUS_BAND = (0.0034906585, 0.0052359877)
+HALF_DAY_BAND = (8.26e-3, 9.24e-3)
+HALF_DAY_MIN_ECCENTRICITY = 0.5
+
+# Inclination (rad) within which lunar-solar node rates are dropped
+SMALL_INCLINATION = 5.2359877e-2
+
 # ---------------------------------------------------------------------------
 # Integration step parameters
 # ---------------------------------------------------------------------------
@@ -56,6 +97,5 @@ THDT = 4.37526908801129966e-3
 # Step size for deep-space integrator [minutes]
 DEEP_SPACE_STEP = 720.0
 
-# Max number of integration steps
-MAX_DEEP_STEPS = 10000
-
+# Half the square of the step, used by the Euler-Maclaurin update
+DEEP_SPACE_STEP2 = 0.5 * DEEP_SPACE_STEP * DEEP_SPACE_STEP
@@ -0,0 +1,308 @@
+# Copyright (C) 2025-2026 Kris Kirby, KE4AHR
+# SPDX-License-Identifier: LGPL-3.0-or-later
+#
+# Vectorized SDP-4 deep-space propagation
+#
+# Propagates N deep-space objects to T times at once. Every stage of
+# pyglspg4.sdp4.propagate runs as an (N, T) array operation: the
+# secular update, the resonance integrators (ResonanceArray), the
+# lunar-solar periodics (PeriodicArray), the J3 long-period terms,
+# the Kepler solve and the J2 short-period terms. Samples that fail
+# carry the error code the scalar kernel would return and zero
+# vectors.
+#
+# Requires NumPy.
+#
+# References:
+#   NORAD Spacetrack Report #3
+#   Vallado et al., AIAA 2006-6753
+
+from __future__ import annotations
+
+from typing import Sequence, Tuple
+
+import numpy as np
+
+from pyglspg4.constants import (
+    EARTH_RADIUS_KM,
+    SGP4_ERROR_DEEP_SPACE,
+    SGP4_ERROR_ECCENTRICITY,
+    SGP4_ERROR_MEAN_MOTION,
+    SGP4_ERROR_NONE,
+    SGP4_ERROR_ORBITAL_DECAY,
+    SGP4_ERROR_SUBORBITAL,
+    TWO_PI,
+    X2O3,
+    XKE,
+)
+from pyglspg4.sdp4.constants import J2, J3OJ2, PI, THDT
+from pyglspg4.sdp4.dpper_array import PeriodicArray
+from pyglspg4.sdp4.propagate import (
+    _INCLINATION_DIVISOR,
+    _KEPLER_MAX_ITERATIONS,
+    _KEPLER_MAX_STEP,
+    _KEPLER_TOLERANCE,
+)
+from pyglspg4.sdp4.record import (
+    RESONANCE_NONE,
+    RESONANCE_SYNCHRONOUS,
+    SDP4Record,
+)
+from pyglspg4.sdp4.resonance_array import ResonanceArray
+
+# SDP4Record fields packed as (N, 1) columns
+COLUMNS = (
+    "inclination", "raan", "eccentricity", "arg_perigee", "mean_anomaly",
+    "mean_motion", "bstar", "xmdot", "omgdot", "xnodot", "cc1", "cc4",
+    "nodecf", "t2cof", "gsto",
+    "dedt", "didt", "dmdt", "dnodt", "domdt",
+)
+
+
+class DeepSpaceArray:
+    """
+    Columnar SDP-4 coefficients of N deep-space objects.
+
+    Args:
+        records: SDP4Record objects
+    """
+
+    def __init__(self, records: Sequence[SDP4Record]) -> None:
+        self.size = len(records)
+        for name in COLUMNS:
+            setattr(
+                self,
+                name,
+                np.fromiter(
+                    (getattr(r, name) for r in records),
+                    dtype=np.float64,
+                    count=self.size,
+                )[:, np.newaxis],
+            )
+
+        irez = np.array([r.irez for r in records], dtype=np.int64)
+        self.periodic = PeriodicArray(records)
+        self._resonant = np.flatnonzero(irez != RESONANCE_NONE)
+        self._synchronous = irez[self._resonant] == RESONANCE_SYNCHRONOUS
+        self._resonance = (
+            ResonanceArray([records[k] for k in self._resonant])
+            if self._resonant.size
+            else None
+        )
+
+    def __len__(self) -> int:
+        return self.size
+
+    def propagate(self, tsince) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Propagate every object to the requested times.
+
+        Parameters
+        ----------
+        tsince : (T,) or (N, T) array_like
+            Minutes since each object's epoch; a 1-D array is shared
+            by all objects
+
+        Returns
+        -------
+        position_km : (N, T, 3) ndarray
+            TEME position vectors (km)
+        velocity_km_s : (N, T, 3) ndarray
+            TEME velocity vectors (km/s)
+        error_code : (N, T) ndarray of int
+            SDP-4 error codes
+        """
+
+        t = np.asarray(tsince, dtype=np.float64)
+        if t.ndim <= 1:
+            t = np.broadcast_to(np.atleast_1d(t), (self.size, t.size))
+        elif t.shape[0] != self.size:
+            raise ValueError("tsince rows must match the object count")
+
+        error = np.full(t.shape, SGP4_ERROR_NONE, dtype=np.int64)
+
+        def fail(mask, code):
+            error[(error == SGP4_ERROR_NONE) & mask] = code
+
+        with np.errstate(all="ignore"):
+            position, velocity = self._propagate(t, fail)
+
+        failed = error != SGP4_ERROR_NONE
+        position[failed] = 0.0
+        velocity[failed] = 0.0
+        return position, velocity, error
+
+    def _propagate(self, t, fail):
+        # ------------------------------------------------------------------
+        # 1. Geopotential secular effects and drag
+        # ------------------------------------------------------------------
+        mean_anomaly = self.mean_anomaly + self.xmdot * t
+        arg_perigee = self.arg_perigee + self.omgdot * t
+        raan = self.raan + self.xnodot * t + self.nodecf * t * t
+
+        tempa = 1.0 - self.cc1 * t
+        tempe = self.bstar * self.cc4 * t
+        templ = self.t2cof * t * t
+
+        # ------------------------------------------------------------------
+        # 2. Lunar-solar secular effects and resonances
+        # ------------------------------------------------------------------
+        ecc = self.eccentricity + self.dedt * t
+        inclination = self.inclination + self.didt * t
+        arg_perigee = arg_perigee + self.domdt * t
+        raan = raan + self.dnodt * t
+        mean_anomaly = mean_anomaly + self.dmdt * t
+        nm = np.broadcast_to(self.mean_motion, t.shape).copy()
+
+        if self._resonance is not None:
+            rows = self._resonant
+            xn, xl, _, _, _ = self._resonance.integrate(t[rows])
+            theta = np.fmod(self.gsto[rows] + t[rows] * THDT, TWO_PI)
+            mean_anomaly[rows] = np.where(
+                self._synchronous[:, np.newaxis],
+                xl - raan[rows] - arg_perigee[rows] + theta,
+                xl - 2.0 * raan[rows] + 2.0 * theta,
+            )
+            nm[rows] = xn
+
+        fail(nm <= 0.0, SGP4_ERROR_MEAN_MOTION)
+
+        am = (XKE / nm) ** X2O3 * tempa * tempa
+        nm = XKE / am ** 1.5
+        ecc = ecc - tempe
+
+        fail((ecc >= 1.0) | (ecc < -0.001), SGP4_ERROR_ECCENTRICITY)
+        ecc = np.where(ecc < 1.0e-6, 1.0e-6, ecc)
+
+        mean_anomaly = mean_anomaly + self.mean_motion * templ
+        xlm = mean_anomaly + arg_perigee + raan
+
+        raan = np.fmod(raan, TWO_PI)
+        arg_perigee = np.mod(arg_perigee, TWO_PI)
+        xlm = np.mod(xlm, TWO_PI)
+        mean_anomaly = np.mod(xlm - arg_perigee - raan, TWO_PI)
+
+        # ------------------------------------------------------------------
+        # 3. Lunar-solar long-period periodics
+        # ------------------------------------------------------------------
+        ecc, inclination, raan, arg_perigee, mean_anomaly = self.periodic.apply(
+            t, ecc, inclination, raan, arg_perigee, mean_anomaly
+        )
+        flip = inclination < 0.0
+        inclination = np.where(flip, -inclination, inclination)
+        raan = np.where(flip, raan + PI, raan)
+        arg_perigee = np.where(flip, arg_perigee - PI, arg_perigee)
+
+        fail((ecc < 0.0) | (ecc > 1.0), SGP4_ERROR_DEEP_SPACE)
+
+        # ------------------------------------------------------------------
+        # 4. Long-period periodics (J3)
+        # ------------------------------------------------------------------
+        sinip = np.sin(inclination)
+        cosip = np.cos(inclination)
+
+        aycof = -0.5 * J3OJ2 * sinip
+        divisor = 1.0 + cosip
+        divisor = np.where(
+            np.abs(divisor) <= _INCLINATION_DIVISOR, _INCLINATION_DIVISOR, divisor
+        )
+        xlcof = -0.25 * J3OJ2 * sinip * (3.0 + 5.0 * cosip) / divisor
+
+        axnl = ecc * np.cos(arg_perigee)
+        temp = 1.0 / (am * (1.0 - ecc * ecc))
+        aynl = ecc * np.sin(arg_perigee) + temp * aycof
+        xl = mean_anomaly + arg_perigee + raan + temp * xlcof * axnl
+
+        # ------------------------------------------------------------------
+        # 5. Solve Kepler's Equation
+        # ------------------------------------------------------------------
+        # Iterates exactly as the scalar loop: sin/cos are those of the
+        # last estimate an element was corrected from
+        u = np.fmod(xl - raan, TWO_PI)
+        eo1 = u.copy()
+        sineo1 = np.empty_like(u)
+        coseo1 = np.empty_like(u)
+        active = np.ones(u.shape, dtype=bool)
+        for _ in range(_KEPLER_MAX_ITERATIONS):
+            sineo1 = np.where(active, np.sin(eo1), sineo1)
+            coseo1 = np.where(active, np.cos(eo1), coseo1)
+            tem5 = 1.0 - coseo1 * axnl - sineo1 * aynl
+            tem5 = (u - aynl * coseo1 + axnl * sineo1 - eo1) / tem5
+            tem5 = np.clip(tem5, -_KEPLER_MAX_STEP, _KEPLER_MAX_STEP)
+            eo1 = np.where(active, eo1 + tem5, eo1)
+            active &= np.abs(tem5) >= _KEPLER_TOLERANCE
+            if not active.any():
+                break
+
+        # ------------------------------------------------------------------
+        # 6. Short-period periodics (J2)
+        # ------------------------------------------------------------------
+        ecose = axnl * coseo1 + aynl * sineo1
+        esine = axnl * sineo1 - aynl * coseo1
+        el2 = axnl * axnl + aynl * aynl
+        pl = am * (1.0 - el2)
+        fail(pl < 0.0, SGP4_ERROR_SUBORBITAL)
+
+        rl = am * (1.0 - ecose)
+        rdotl = np.sqrt(am) * esine / rl
+        rvdotl = np.sqrt(pl) / rl
+        betal = np.sqrt(1.0 - el2)
+        temp = esine / (1.0 + betal)
+        sinu = am / rl * (sineo1 - aynl - axnl * temp)
+        cosu = am / rl * (coseo1 - axnl + aynl * temp)
+        su = np.arctan2(sinu, cosu)
+        sin2u = (cosu + cosu) * sinu
+        cos2u = 1.0 - 2.0 * sinu * sinu
+        temp = 1.0 / pl
+        temp1 = 0.5 * J2 * temp
+        temp2 = temp1 * temp
+
+        cosisq = cosip * cosip
+        con41 = 3.0 * cosisq - 1.0
+        x1mth2 = 1.0 - cosisq
+        x7thm1 = 7.0 * cosisq - 1.0
+
+        mrt = (
+            rl * (1.0 - 1.5 * temp2 * betal * con41)
+            + 0.5 * temp1 * x1mth2 * cos2u
+        )
+        su = su - 0.25 * temp2 * x7thm1 * sin2u
+        xnode = raan + 1.5 * temp2 * cosip * sin2u
+        xinc = inclination + 1.5 * temp2 * cosip * sinip * cos2u
+        mvt = rdotl - nm * temp1 * x1mth2 * sin2u / XKE
+        rvdot = rvdotl + nm * temp1 * (x1mth2 * cos2u + 1.5 * con41) / XKE
+
+        fail(mrt < 1.0, SGP4_ERROR_ORBITAL_DECAY)
+
+        # ------------------------------------------------------------------
+        # 7. Orientation vectors and physical units
+        # ------------------------------------------------------------------
+        sinsu = np.sin(su)
+        cossu = np.cos(su)
+        snod = np.sin(xnode)
+        cnod = np.cos(xnode)
+        sini = np.sin(xinc)
+        cosi = np.cos(xinc)
+        xmx = -snod * cosi
+        xmy = cnod * cosi
+
+        ux = xmx * sinsu + cnod * cossu
+        uy = xmy * sinsu + snod * cossu
+        uz = sini * sinsu
+        vx = xmx * cossu - cnod * sinsu
+        vy = xmy * cossu - snod * sinsu
+        vz = sini * cossu
+
+        mr = mrt * EARTH_RADIUS_KM
+        vkmpersec = EARTH_RADIUS_KM * XKE / 60.0
+
+        position = np.stack((mr * ux, mr * uy, mr * uz), axis=-1)
+        velocity = np.stack(
+            (
+                (mvt * ux + rvdot * vx) * vkmpersec,
+                (mvt * uy + rvdot * vy) * vkmpersec,
+                (mvt * uz + rvdot * vz) * vkmpersec,
+            ),
+            axis=-1,
+        )
+        return position, velocity
@@ -2,7 +2,17 @@
 # SPDX-License-Identifier: LGPL-3.0-or-later
 #
 # SDP-4 deep-space periodic perturbations (dpper)
-# Full harmonic expansion per NORAD Spacetrack Report #3
+#
+# Adds the lunar-solar long-period periodics to the secularly
+# updated mean elements. The periodics are those of the dscom
+# coefficients evaluated at the solar and lunar mean anomalies of the
+# requested time. Below 0.2 rad inclination they are applied with the
+# Lyddane modification, which avoids the singularity at zero
+# inclination.
+#
+# The "improved" operation mode of the reference implementation is
+# followed, i.e. the node is not wrapped into [0, 2π) before the
+# Lyddane step.
 #
 # References:
 #   Vallado et al., AIAA 2006-6753, Section 7.4
@@ -10,47 +20,110 @@
 from __future__ import annotations
 
 import math
+from typing import Tuple
+
+from pyglspg4.sdp4.constants import PI, TWO_PI, ZEL, ZES, ZNL, ZNS
+from pyglspg4.sdp4.record import SDP4Record
 
-from pyglspg4.sdp4.state import SDP4State
+# Inclination (rad) below which the Lyddane form is used
+LYDDANE_INCLINATION = 0.2
 
 
-def dpper(state: SDP4State, tsince: float) -> None:
+def dpper(
+    record: SDP4Record,
+    tsince: float,
+    ecc: float,
+    inclination: float,
+    raan: float,
+    arg_perigee: float,
+    mean_anomaly: float,
+) -> Tuple[float, float, float, float, float]:
     """
-    Apply deep-space periodic perturbations.
-
-    Updates orbital elements in-place:
-      - eccentricity
-      - inclination
-      - argument of perigee
-      - mean anomaly
-      - RAAN
+    Apply deep-space long-period periodics.
+
+    Parameters
+    ----------
+    record : SDP4Record
+        Deep-space coefficients
+    tsince : float
+        Minutes since epoch
+    ecc, inclination, raan, arg_perigee, mean_anomaly : float
+        Secularly updated mean elements (radians)
+
+    Returns
+    -------
+    (ecc, inclination, raan, arg_perigee, mean_anomaly)
+        Elements including the periodic terms
     """
 
-    # --- Long-period corrections ---
-    pe = state.pe
-    pinc = state.pinc
-    pl = state.pl
-    pgh = state.pgh
-    ph = state.ph
-
-    # --- Inclination singularity handling ---
-    sin_inc = math.sin(state.inclination)
-    if abs(sin_inc) < 1e-6:
-        ph = 0.0
-    else:
-        ph /= sin_inc
-
-    # --- Apply corrections ---
-    state.eccentricity += pe
-    state.inclination += pinc
-
-    state.mean_anomaly += pl
-    state.arg_perigee += pgh
-    state.raan += ph
-
-    # --- Normalize angles ---
-    twopi = 2.0 * math.pi
-    state.mean_anomaly %= twopi
-    state.arg_perigee %= twopi
-    state.raan %= twopi
+    r = record
+
+    # ------------------------------------------------------------------
+    # 1. Solar terms
+    # ------------------------------------------------------------------
+    zm = r.zmos + ZNS * tsince
+    zf = zm + 2.0 * ZES * math.sin(zm)
+    sinzf = math.sin(zf)
+    f2 = 0.5 * sinzf * sinzf - 0.25
+    f3 = -0.5 * sinzf * math.cos(zf)
+    ses = r.se2 * f2 + r.se3 * f3
+    sis = r.si2 * f2 + r.si3 * f3
+    sls = r.sl2 * f2 + r.sl3 * f3 + r.sl4 * sinzf
+    sghs = r.sgh2 * f2 + r.sgh3 * f3 + r.sgh4 * sinzf
+    shs = r.sh2 * f2 + r.sh3 * f3
+
+    # ------------------------------------------------------------------
+    # 2. Lunar terms
+    # ------------------------------------------------------------------
+    zm = r.zmol + ZNL * tsince
+    zf = zm + 2.0 * ZEL * math.sin(zm)
+    sinzf = math.sin(zf)
+    f2 = 0.5 * sinzf * sinzf - 0.25
+    f3 = -0.5 * sinzf * math.cos(zf)
+    sel = r.ee2 * f2 + r.e3 * f3
+    sil = r.xi2 * f2 + r.xi3 * f3
+    sll = r.xl2 * f2 + r.xl3 * f3 + r.xl4 * sinzf
+    sghl = r.xgh2 * f2 + r.xgh3 * f3 + r.xgh4 * sinzf
+    shll = r.xh2 * f2 + r.xh3 * f3
+
+    pe = ses + sel
+    pinc = sis + sil
+    pl = sls + sll
+    pgh = sghs + sghl
+    ph = shs + shll
+
+    # ------------------------------------------------------------------
+    # 3. Apply to the elements
+    # ------------------------------------------------------------------
+    inclination += pinc
+    ecc += pe
+    sinip = math.sin(inclination)
+    cosip = math.cos(inclination)
+
+    if inclination >= LYDDANE_INCLINATION:
+        ph /= sinip
+        pgh -= cosip * ph
+        arg_perigee += pgh
+        raan += ph
+        mean_anomaly += pl
+        return ecc, inclination, raan, arg_perigee, mean_anomaly
+
+    # Lyddane modification
+    sinop = math.sin(raan)
+    cosop = math.cos(raan)
+    alfdp = sinip * sinop + (ph * cosop + pinc * cosip * sinop)
+    betdp = sinip * cosop + (-ph * sinop + pinc * cosip * cosop)
+
+    raan = math.fmod(raan, TWO_PI)
+    xls = (
+        mean_anomaly + arg_perigee + pl + pgh
+        + (cosip - pinc * sinip) * raan
+    )
+    xnoh = raan
+    raan = math.atan2(alfdp, betdp)
+    if abs(xnoh - raan) > PI:
+        raan += TWO_PI if raan < xnoh else -TWO_PI
 
+    mean_anomaly += pl
+    arg_perigee = xls - mean_anomaly - cosip * raan
+    return ecc, inclination, raan, arg_perigee, mean_anomaly
@@ -0,0 +1,214 @@
+# Copyright (C) 2025-2026 Kris Kirby, KE4AHR
+# SPDX-License-Identifier: LGPL-3.0-or-later
+#
+# Batched SDP-4 deep-space periodic perturbations (dpper)
+#
+# The lunar-solar long-period periodics split into time terms -- the
+# solar and lunar mean anomalies and the f2, f3 and sin(zf) factors
+# derived from them -- and per-object coefficient sums. The
+# coefficient sums and the element updates run as array operations
+# over all objects.
+#
+# As in the reference implementation, the anomalies are those of the
+# object's epoch (zmos, zmol) advanced by tsince. Objects are grouped
+# by those epoch anomalies once, when the array is built; on a time
+# grid shared by all objects the time terms are evaluated once per
+# group and sample. Results agree with pyglspg4.sdp4.dpper term for
+# term.
+#
+# Requires NumPy.
+#
+# References:
+#   Vallado et al., AIAA 2006-6753, Section 7.4
+
+from __future__ import annotations
+
+from typing import Sequence, Tuple
+
+import numpy as np
+
+from pyglspg4.sdp4.constants import PI, TWO_PI, ZEL, ZES, ZNL, ZNS
+from pyglspg4.sdp4.dpper import LYDDANE_INCLINATION
+from pyglspg4.sdp4.record import PERIODIC_FIELDS, SDP4Record
+
+
+def lunar_solar_terms(
+    zmo: np.ndarray,
+    rate: float,
+    eccentricity: float,
+    tsince: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Time terms of one perturbing body.
+
+    Parameters
+    ----------
+    zmo : ndarray
+        Mean anomaly of the body at epoch (zmos or zmol)
+    rate, eccentricity : float
+        ZNS, ZES for the Sun or ZNL, ZEL for the Moon
+    tsince : ndarray
+        Minutes since epoch, broadcastable against zmo
+
+    Returns
+    -------
+    (f2, f3, sinzf)
+    """
+    zm = zmo + rate * tsince
+    zf = zm + 2.0 * eccentricity * np.sin(zm)
+    sinzf = np.sin(zf)
+    f2 = 0.5 * sinzf * sinzf - 0.25
+    f3 = -0.5 * sinzf * np.cos(zf)
+    return f2, f3, sinzf
+
+
+class PeriodicArray:
+    """
+    Lunar-solar periodic coefficients of N deep-space objects.
+
+    Args:
+        records: SDP4Record objects
+    """
+
+    def __init__(self, records: Sequence[SDP4Record]) -> None:
+        self.size = len(records)
+        for name in PERIODIC_FIELDS:
+            setattr(
+                self,
+                name,
+                np.fromiter(
+                    (getattr(r, name) for r in records),
+                    dtype=np.float64,
+                    count=self.size,
+                )[:, np.newaxis],
+            )
+
+        # Objects sharing both epoch anomalies share all time terms
+        pairs, group = np.unique(
+            np.column_stack((self.zmos, self.zmol)),
+            axis=0,
+            return_inverse=True,
+        )
+        if len(pairs) < self.size:
+            self._group_zmos = pairs[:, 0:1]
+            self._group_zmol = pairs[:, 1:2]
+            self._group = group.reshape(-1)
+        else:
+            self._group = None
+
+    def __len__(self) -> int:
+        return self.size
+
+    def terms(self, tsince: np.ndarray) -> Tuple[np.ndarray, ...]:
+        """
+        Solar and lunar time terms for every object and sample.
+
+        Parameters
+        ----------
+        tsince : (N, T) or (1, T) ndarray
+            Minutes since each object's epoch
+
+        Returns
+        -------
+        (f2s, f3s, sinzfs, f2l, f3l, sinzfl), each (N, T)
+        """
+
+        # A grid shared by all objects arrives as a broadcast view
+        shared = tsince.shape[0] == 1 or tsince.strides[0] == 0
+        if self._group is None or not shared:
+            solar = lunar_solar_terms(self.zmos, ZNS, ZES, tsince)
+            lunar = lunar_solar_terms(self.zmol, ZNL, ZEL, tsince)
+            return solar + lunar
+
+        t = tsince[:1]
+        solar = lunar_solar_terms(self._group_zmos, ZNS, ZES, t)
+        lunar = lunar_solar_terms(self._group_zmol, ZNL, ZEL, t)
+        return tuple(term[self._group] for term in solar + lunar)
+
+    def apply(
+        self,
+        tsince: np.ndarray,
+        ecc: np.ndarray,
+        inclination: np.ndarray,
+        raan: np.ndarray,
+        arg_perigee: np.ndarray,
+        mean_anomaly: np.ndarray,
+    ) -> Tuple[np.ndarray, ...]:
+        """
+        Vectorized pyglspg4.sdp4.dpper.dpper.
+
+        Parameters
+        ----------
+        tsince : (N, T) ndarray
+            Minutes since each object's epoch
+        ecc, inclination, raan, arg_perigee, mean_anomaly : (N, T) ndarray
+            Secularly updated mean elements (radians)
+
+        Returns
+        -------
+        (ecc, inclination, raan, arg_perigee, mean_anomaly)
+            New (N, T) arrays including the periodic terms
+        """
+
+        f2s, f3s, sinzfs, f2l, f3l, sinzfl = self.terms(tsince)
+
+        pe = (
+            (self.se2 * f2s + self.se3 * f3s)
+            + (self.ee2 * f2l + self.e3 * f3l)
+        )
+        pinc = (
+            (self.si2 * f2s + self.si3 * f3s)
+            + (self.xi2 * f2l + self.xi3 * f3l)
+        )
+        pl = (
+            (self.sl2 * f2s + self.sl3 * f3s + self.sl4 * sinzfs)
+            + (self.xl2 * f2l + self.xl3 * f3l + self.xl4 * sinzfl)
+        )
+        pgh = (
+            (self.sgh2 * f2s + self.sgh3 * f3s + self.sgh4 * sinzfs)
+            + (self.xgh2 * f2l + self.xgh3 * f3l + self.xgh4 * sinzfl)
+        )
+        ph = (
+            (self.sh2 * f2s + self.sh3 * f3s)
+            + (self.xh2 * f2l + self.xh3 * f3l)
+        )
+
+        inclination = inclination + pinc
+        ecc = ecc + pe
+        sinip = np.sin(inclination)
+        cosip = np.cos(inclination)
+
+        # Direct form
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ph_direct = ph / sinip
+        direct_raan = raan + ph_direct
+        direct_arg_perigee = arg_perigee + (pgh - cosip * ph_direct)
+
+        # Lyddane modification
+        sinop = np.sin(raan)
+        cosop = np.cos(raan)
+        alfdp = sinip * sinop + (ph * cosop + pinc * cosip * sinop)
+        betdp = sinip * cosop + (-ph * sinop + pinc * cosip * cosop)
+
+        xnoh = np.fmod(raan, TWO_PI)
+        xls = (
+            mean_anomaly + arg_perigee + pl + pgh
+            + (cosip - pinc * sinip) * xnoh
+        )
+        lyddane_raan = np.arctan2(alfdp, betdp)
+        lyddane_raan = np.where(
+            np.abs(xnoh - lyddane_raan) > PI,
+            np.where(
+                lyddane_raan < xnoh,
+                lyddane_raan + TWO_PI,
+                lyddane_raan - TWO_PI,
+            ),
+            lyddane_raan,
+        )
+        mean_anomaly = mean_anomaly + pl
+        lyddane_arg_perigee = xls - mean_anomaly - cosip * lyddane_raan
+
+        direct = inclination >= LYDDANE_INCLINATION
+        raan = np.where(direct, direct_raan, lyddane_raan)
+        arg_perigee = np.where(direct, direct_arg_perigee, lyddane_arg_perigee)
+        return ecc, inclination, raan, arg_perigee, mean_anomaly
@@ -1,11 +1,18 @@
 # Copyright (C) 2025-2026 Kris Kirby, KE4AHR
 # SPDX-License-Identifier: LGPL-3.0-or-later
 #
-# SDP-4 deep-space secular and resonance integrator
+# SDP-4 deep-space secular and resonance integrator (dspace)
 #
-# This module implements the NORAD deep-space (SDP-4)
-# perturbation model for satellites with orbital periods
-# >= 225 minutes.
+# Applies the lunar-solar secular rates to the mean elements and, for
+# resonant orbits, integrates the resonance equations for the mean
+# longitude and mean motion with the fixed-step Euler-Maclaurin scheme
+# of the reference implementation (720 minute steps).
+#
+# The integration is a pure function of its starting point: it
+# runs from the epoch unless the caller supplies a later whole-step
+# (atime, xli, xni) state, so records are never modified. Since the
+# path from the epoch is fixed, a stored state reproduces the same
+# result bit for bit (see pyglspg4.sdp4.resonance_cache).
 #
 # References:
 #   NORAD Spacetrack Report #3
@@ -14,139 +21,227 @@
 from __future__ import annotations
 
 import math
-from dataclasses import dataclass
-from typing import Tuple
+from typing import Optional, Tuple
 
-from pyglspg4.constants import (
+from pyglspg4.sdp4.constants import (
+    DEEP_SPACE_STEP,
+    DEEP_SPACE_STEP2,
+    FASX2,
+    FASX4,
+    FASX6,
+    G22,
+    G32,
+    G44,
+    G52,
+    G54,
+    THDT,
     TWO_PI,
-    XKE,
 )
-from pyglspg4.sdp4.constants import (
-    ZNS,
-    ZNL,
+from pyglspg4.sdp4.record import (
+    RESONANCE_NONE,
+    RESONANCE_SYNCHRONOUS,
+    SDP4Record,
 )
-from pyglspg4.sgp4.state import SGP4State
-
-
-@dataclass
-class DeepSpaceState:
-    """
-    Deep-space resonance and secular integration state.
-    """
 
-    # Resonance flags
-    is_resonant: bool = False
-    is_synch: bool = False
 
-    # Resonance coefficients
-    del1: float = 0.0
-    del2: float = 0.0
-    del3: float = 0.0
+# (atime, xli, xni): integration time (min), mean longitude and mean
+# motion of the resonance integrator
+ResonanceState = Tuple[float, float, float]
 
-    fasx2: float = 0.0
-    fasx4: float = 0.0
-    fasx6: float = 0.0
 
-    # Time bookkeeping
-    atime: float = 0.0
-    xni: float = 0.0
-    xli: float = 0.0
-
-    # Secular rates
-    dmdt: float = 0.0
-    domdt: float = 0.0
-    dnodt: float = 0.0
-
-
-def deep_space_initialize(state: SGP4State) -> None:
+def resonance_rates(
+    record: SDP4Record,
+    atime: float,
+    xli: float,
+) -> Tuple[float, float]:
     """
-    Initialize deep-space resonance parameters.
+    First and second derivatives of the resonant mean motion.
 
-    Called once during SGP-4 initialization
-    for satellites with period >= 225 minutes.
+    Returns (xndt, xnddt / xldot); multiply the second value by
+    xldot = xni + xfact to obtain xnddt.
     """
 
-    ds = DeepSpaceState()
-
-    # Mean motion in radians / minute
-    n = state.mean_motion
-
-    # Resonance determination
-    if abs(n - TWO_PI / 1440.0) < 0.0001:
-        ds.is_synch = True
-        ds.is_resonant = True
-    elif abs(n - TWO_PI / 43200.0) < 0.0001:
-        ds.is_resonant = True
-
-    # Store secular rates
-    ds.dmdt = state.xmdot
-    ds.domdt = state.omgdot
-    ds.dnodt = state.xnodot
-
-    # Initialize integrator state
-    ds.atime = 0.0
-    ds.xni = n
-    ds.xli = state.mean_anomaly + state.arg_perigee + state.raan
+    r = record
+    if r.irez == RESONANCE_SYNCHRONOUS:
+        xndt = (
+            r.del1 * math.sin(xli - FASX2)
+            + r.del2 * math.sin(2.0 * (xli - FASX4))
+            + r.del3 * math.sin(3.0 * (xli - FASX6))
+        )
+        xnddt = (
+            r.del1 * math.cos(xli - FASX2)
+            + 2.0 * r.del2 * math.cos(2.0 * (xli - FASX4))
+            + 3.0 * r.del3 * math.cos(3.0 * (xli - FASX6))
+        )
+        return xndt, xnddt
+
+    xomi = r.arg_perigee + r.omgdot * atime
+    x2omi = xomi + xomi
+    x2li = xli + xli
+    xndt = (
+        r.d2201 * math.sin(x2omi + xli - G22)
+        + r.d2211 * math.sin(xli - G22)
+        + r.d3210 * math.sin(xomi + xli - G32)
+        + r.d3222 * math.sin(-xomi + xli - G32)
+        + r.d4410 * math.sin(x2omi + x2li - G44)
+        + r.d4422 * math.sin(x2li - G44)
+        + r.d5220 * math.sin(xomi + xli - G52)
+        + r.d5232 * math.sin(-xomi + xli - G52)
+        + r.d5421 * math.sin(xomi + x2li - G54)
+        + r.d5433 * math.sin(-xomi + x2li - G54)
+    )
+    xnddt = (
+        r.d2201 * math.cos(x2omi + xli - G22)
+        + r.d2211 * math.cos(xli - G22)
+        + r.d3210 * math.cos(xomi + xli - G32)
+        + r.d3222 * math.cos(-xomi + xli - G32)
+        + r.d5220 * math.cos(xomi + xli - G52)
+        + r.d5232 * math.cos(-xomi + xli - G52)
+        + 2.0 * (
+            r.d4410 * math.cos(x2omi + x2li - G44)
+            + r.d4422 * math.cos(x2li - G44)
+            + r.d5421 * math.cos(xomi + x2li - G54)
+            + r.d5433 * math.cos(-xomi + x2li - G54)
+        )
+    )
+    return xndt, xnddt
+
+
+def epoch_resonance_state(record: SDP4Record) -> ResonanceState:
+    """
+    Integrator state at epoch.
+    """
+    return 0.0, record.xlamo, record.mean_motion
 
-    state.deep_space_state = ds
 
+def whole_steps(tsince: float) -> int:
+    """
+    Number of integrator steps taken from the epoch toward tsince.
 
-def deep_space_secular(
-    state: SGP4State,
+    The integrator stops at the last whole step that leaves less than
+    one step to go, i.e. at atime = ±720 * whole_steps(tsince).
+    """
+    n = int(abs(tsince) // DEEP_SPACE_STEP)
+    delt = DEEP_SPACE_STEP if tsince > 0.0 else -DEEP_SPACE_STEP
+    # Settle round-off exactly as the integration loop would
+    while n > 0 and abs(tsince - (n - 1) * delt) < DEEP_SPACE_STEP:
+        n -= 1
+    while abs(tsince - n * delt) >= DEEP_SPACE_STEP:
+        n += 1
+    return n
+
+
+def resonance_step(
+    record: SDP4Record,
+    state: ResonanceState,
+    delt: float,
+) -> ResonanceState:
+    """
+    Advance the integrator state by one step of delt minutes.
+    """
+    atime, xli, xni = state
+    xndt, xnddt = resonance_rates(record, atime, xli)
+    xldot = xni + record.xfact
+    xnddt *= xldot
+    return (
+        atime + delt,
+        xli + xldot * delt + xndt * DEEP_SPACE_STEP2,
+        xni + xndt * delt + xnddt * DEEP_SPACE_STEP2,
+    )
+
+
+def integrate_resonance(
+    record: SDP4Record,
     tsince: float,
-) -> None:
+    start: Optional[ResonanceState] = None,
+) -> Tuple[float, float, ResonanceState]:
     """
-    Apply deep-space secular effects.
-
-    Updates mean anomaly, argument of perigee,
-    and RAAN in-place.
+    Integrate the resonance equations to tsince.
+
+    Parameters
+    ----------
+    record : SDP4Record
+        Coefficients of a resonant object (irez != 0)
+    tsince : float
+        Minutes since epoch
+    start : (atime, xli, xni), optional
+        Integrator state to continue from, e.g. a checkpoint of
+        pyglspg4.sdp4.resonance_cache. It must be a whole-step state
+        on the way from the epoch to tsince; the epoch state is used
+        by default.
+
+    Returns
+    -------
+    xn : float
+        Mean motion at tsince (rad/min)
+    xl : float
+        Resonance mean longitude at tsince (rad)
+    last : (atime, xli, xni)
+        Last whole-step integrator state before tsince
     """
 
-    ds = state.deep_space_state
-    if ds is None:
-        return
+    state = epoch_resonance_state(record) if start is None else start
+    delt = DEEP_SPACE_STEP if tsince > 0.0 else -DEEP_SPACE_STEP
+
+    while abs(tsince - state[0]) >= DEEP_SPACE_STEP:
+        state = resonance_step(record, state, delt)
 
-    state.mean_anomaly += ds.dmdt * tsince
-    state.arg_perigee += ds.domdt * tsince
-    state.raan += ds.dnodt * tsince
+    atime, xli, xni = state
+    xndt, xnddt = resonance_rates(record, atime, xli)
+    xldot = xni + record.xfact
+    xnddt *= xldot
 
-    state.mean_anomaly %= TWO_PI
-    state.arg_perigee %= TWO_PI
-    state.raan %= TWO_PI
+    ft = tsince - atime
+    xn = xni + xndt * ft + xnddt * ft * ft * 0.5
+    xl = xli + xldot * ft + xndt * ft * ft * 0.5
+    return xn, xl, state
 
 
-def deep_space_integrate(
-    state: SGP4State,
+def dspace(
+    record: SDP4Record,
     tsince: float,
-) -> None:
+    ecc: float,
+    inclination: float,
+    raan: float,
+    arg_perigee: float,
+    mean_anomaly: float,
+    start: Optional[ResonanceState] = None,
+) -> Tuple[float, float, float, float, float, float]:
     """
-    Perform deep-space resonance integration.
-
-    This handles synchronous and 12-hour resonance
-    effects via numerical stepping.
+    Apply deep-space secular effects and resonances.
+
+    Parameters
+    ----------
+    record : SDP4Record
+        Deep-space coefficients
+    tsince : float
+        Minutes since epoch
+    ecc, inclination, raan, arg_perigee, mean_anomaly : float
+        Mean elements after the geopotential secular update (radians)
+    start : (atime, xli, xni), optional
+        Resonance integrator state to continue from
+
+    Returns
+    -------
+    (ecc, inclination, raan, arg_perigee, mean_anomaly, mean_motion)
     """
 
-    ds = state.deep_space_state
-    if ds is None or not ds.is_resonant:
-        return
-
-    # Integration step (minutes)
-    delt = 720.0 if tsince >= 0 else -720.0
-
-    while abs(tsince - ds.atime) >= abs(delt):
-        ds.atime += delt
-
-        # Mean longitude integration
-        ds.xli += ds.xni * delt
+    r = record
+    ecc += r.dedt * tsince
+    inclination += r.didt * tsince
+    arg_perigee += r.domdt * tsince
+    raan += r.dnodt * tsince
+    mean_anomaly += r.dmdt * tsince
 
-        # Update mean motion
-        ds.xni += ds.del1 * math.sin(ds.xli)
+    if r.irez == RESONANCE_NONE:
+        return ecc, inclination, raan, arg_perigee, mean_anomaly, r.mean_motion
 
-    # Final partial step
-    dt = tsince - ds.atime
-    ds.xli += ds.xni * dt
+    xn, xl, _ = integrate_resonance(r, tsince, start)
 
-    # Update orbital elements
-    state.mean_anomaly = ds.xli - state.arg_perigee - state.raan
-    state.mean_motion = ds.xni
+    theta = math.fmod(r.gsto + tsince * THDT, TWO_PI)
+    if r.irez == RESONANCE_SYNCHRONOUS:
+        mean_anomaly = xl - raan - arg_perigee + theta
+    else:
+        mean_anomaly = xl - 2.0 * raan + 2.0 * theta
 
+    return ecc, inclination, raan, arg_perigee, mean_anomaly, xn
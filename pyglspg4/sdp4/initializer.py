@@ -0,0 +1,206 @@
+# Copyright (C) 2025-2026 Kris Kirby, KE4AHR
+# SPDX-License-Identifier: LGPL-3.0-or-later
+#
+# SDP-4 initialization logic
+#
+# Runs the deep-space branch of the SGP-4 initializer once per object:
+#   - recover the un-Kozai'd mean motion and semi-major axis
+#   - drag coefficients and J2/J4 secular rates
+#   - lunar-solar terms (dscom) and resonance terms (dsinit)
+# and freezes the result in an SDP4Record.
+#
+# References:
+#   NORAD Spacetrack Report #3
+#   Vallado et al., AIAA 2006-6753
+
+from __future__ import annotations
+
+import math
+
+from pyglspg4.constants import (
+    AE,
+    EARTH_RADIUS_KM,
+    QOMS2T,
+    S,
+    X2O3,
+    XKE,
+)
+from pyglspg4.frames.sidereal import gmst
+from pyglspg4.sdp4.constants import J2, J4, JD_1950
+from pyglspg4.sdp4.record import (
+    DEEP_SPACE_FIELDS,
+    PERIODIC_FIELDS,
+    SDP4Record,
+)
+from pyglspg4.sdp4.resonance import dsinit
+from pyglspg4.sdp4.solar_lunar import dscom
+from pyglspg4.sgp4.state import SGP4State
+
+
+def initialize_deep_space(state) -> SDP4Record:
+    """
+    Initialize SDP-4 coefficients for one object.
+
+    Parameters
+    ----------
+    state : SGP4State or TLE
+        Epoch elements: an SGP4State as built by
+        pyglspg4.sgp4.initializer.state_from_tle (before
+        initialization), or a parsed TLE. An initialized SGP4State
+        is accepted when it already carries its deep-space record.
+
+    Returns
+    -------
+    SDP4Record
+    """
+
+    if not isinstance(state, SGP4State):
+        from pyglspg4.sgp4.initializer import state_from_tle
+
+        state = state_from_tle(state)
+    elif state.initialized:
+        if state.deep_space_state is None:
+            raise ValueError(
+                "initialized SGP4State carries no deep-space coefficients"
+            )
+        return state.deep_space_state
+
+    ecco = state.eccentricity
+    inclo = state.inclination
+    nodeo = state.raan
+    argpo = state.arg_perigee
+    mo = state.mean_anomaly
+
+    # ------------------------------------------------------------------
+    # 1. Recover original mean motion and semi-major axis
+    # ------------------------------------------------------------------
+    eccsq = ecco * ecco
+    omeosq = 1.0 - eccsq
+    rteosq = math.sqrt(omeosq)
+    cosio = math.cos(inclo)
+    cosio2 = cosio * cosio
+
+    ak = (XKE / state.mean_motion) ** X2O3
+    d1 = 0.75 * J2 * (3.0 * cosio2 - 1.0) / (rteosq * omeosq)
+    delta = d1 / (ak * ak)
+    adel = ak * (
+        1.0 - delta * delta - delta * (1.0 / 3.0 + 134.0 * delta * delta / 81.0)
+    )
+    delta = d1 / (adel * adel)
+    no = state.mean_motion / (1.0 + delta)
+
+    ao = (XKE / no) ** X2O3
+    po = ao * omeosq
+    con42 = 1.0 - 5.0 * cosio2
+    con41 = -con42 - cosio2 - cosio2
+    rp = ao * (1.0 - ecco)
+
+    # ------------------------------------------------------------------
+    # 2. Perigee and atmospheric parameters
+    # ------------------------------------------------------------------
+    sfour = S
+    qzms24 = QOMS2T
+    perigee_km = (rp - AE) * EARTH_RADIUS_KM
+    if perigee_km < 156.0:
+        sfour = perigee_km - 78.0 if perigee_km >= 98.0 else 20.0
+        qzms24 = ((120.0 - sfour) / EARTH_RADIUS_KM) ** 4
+        sfour = sfour / EARTH_RADIUS_KM + AE
+
+    # ------------------------------------------------------------------
+    # 3. Drag-related coefficients
+    # ------------------------------------------------------------------
+    pinvsq = 1.0 / (po * po)
+    tsi = 1.0 / (ao - sfour)
+    eta = ao * ecco * tsi
+    etasq = eta * eta
+    eeta = ecco * eta
+    psisq = abs(1.0 - etasq)
+    coef = qzms24 * tsi ** 4
+    coef1 = coef / psisq ** 3.5
+
+    cc2 = coef1 * no * (
+        ao * (1.0 + 1.5 * etasq + eeta * (4.0 + etasq))
+        + 0.375 * J2 * tsi / psisq * con41 * (8.0 + 3.0 * etasq * (8.0 + etasq))
+    )
+    cc1 = state.bstar * cc2
+    x1mth2 = 1.0 - cosio2
+    cc4 = 2.0 * no * coef1 * ao * omeosq * (
+        eta * (2.0 + 0.5 * etasq)
+        + ecco * (0.5 + 2.0 * etasq)
+        - J2 * tsi / (ao * psisq) * (
+            -3.0 * con41 * (1.0 - 2.0 * eeta + etasq * (1.5 - 0.5 * eeta))
+            + 0.75 * x1mth2 * (2.0 * etasq - eeta * (1.0 + etasq))
+            * math.cos(2.0 * argpo)
+        )
+    )
+    cc5 = 2.0 * coef1 * ao * omeosq * (1.0 + 2.75 * (etasq + eeta) + eeta * etasq)
+
+    # ------------------------------------------------------------------
+    # 4. Secular rates
+    # ------------------------------------------------------------------
+    cosio4 = cosio2 * cosio2
+    temp1 = 1.5 * J2 * pinvsq * no
+    temp2 = 0.5 * temp1 * J2 * pinvsq
+    temp3 = -0.46875 * J4 * pinvsq * pinvsq * no
+
+    xmdot = (
+        no
+        + 0.5 * temp1 * rteosq * con41
+        + 0.0625 * temp2 * rteosq * (13.0 - 78.0 * cosio2 + 137.0 * cosio4)
+    )
+    omgdot = (
+        -0.5 * temp1 * con42
+        + 0.0625 * temp2 * (7.0 - 114.0 * cosio2 + 395.0 * cosio4)
+        + temp3 * (3.0 - 36.0 * cosio2 + 49.0 * cosio4)
+    )
+    xhdot1 = -temp1 * cosio
+    xnodot = xhdot1 + (
+        0.5 * temp2 * (4.0 - 19.0 * cosio2) + 2.0 * temp3 * (3.0 - 7.0 * cosio2)
+    ) * cosio
+
+    nodecf = 3.5 * omeosq * xhdot1 * cc1
+    t2cof = 1.5 * cc1
+
+    # ------------------------------------------------------------------
+    # 5. Lunar-solar and resonance terms
+    # ------------------------------------------------------------------
+    gsto = gmst(state.epoch_jd)
+
+    terms = dscom(state.epoch_jd - JD_1950, ecco, argpo, 0.0, inclo, nodeo, no)
+    deep = dsinit(
+        terms,
+        ecco,
+        inclo,
+        nodeo,
+        argpo,
+        mo,
+        no,
+        xmdot,
+        omgdot,
+        xnodot,
+        gsto,
+    )
+
+    values = dict(
+        epoch_jd=state.epoch_jd,
+        inclination=inclo,
+        raan=nodeo,
+        eccentricity=ecco,
+        arg_perigee=argpo,
+        mean_anomaly=mo,
+        mean_motion=no,
+        bstar=state.bstar,
+        semi_major_axis=ao,
+        xmdot=xmdot,
+        omgdot=omgdot,
+        xnodot=xnodot,
+        cc1=cc1,
+        cc4=cc4,
+        cc5=cc5,
+        nodecf=nodecf,
+        t2cof=t2cof,
+        gsto=gsto,
+        **{name: terms[name] for name in PERIODIC_FIELDS},
+        **deep,
+    )
+    return SDP4Record(*(values[name] for name in DEEP_SPACE_FIELDS))
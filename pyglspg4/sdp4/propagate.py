@@ -1,10 +1,18 @@
 # Copyright (C) 2025-2026 Kris Kirby, KE4AHR
 # SPDX-License-Identifier: LGPL-3.0-or-later
 #
-# SDP-4 propagation dispatcher
+# SDP-4 deep-space propagation
 #
-# This module performs full deep-space propagation
-# for satellites with orbital periods >= 225 minutes.
+# This module performs full deep-space propagation for satellites
+# with orbital periods >= 225 minutes:
+#   1. geopotential secular rates and drag
+#   2. lunar-solar secular rates and resonances (dspace)
+#   3. lunar-solar long-period periodics (dpper)
+#   4. J3 long-period and J2 short-period terms
+#
+# The record is only read, so a single SDP4Record may be shared by
+# any number of threads or processes. Resonant objects start their
+# integration from the checkpoints of a ResonanceCache.
 #
 # References:
 #   NORAD Spacetrack Report #3
@@ -13,24 +21,46 @@
 from __future__ import annotations
 
 import math
-from typing import Tuple
+from typing import Optional, Tuple
 
 from pyglspg4.constants import (
-    AE,
-    XKE,
+    EARTH_RADIUS_KM,
+    SGP4_ERROR_DEEP_SPACE,
+    SGP4_ERROR_ECCENTRICITY,
+    SGP4_ERROR_MEAN_MOTION,
+    SGP4_ERROR_NONE,
+    SGP4_ERROR_ORBITAL_DECAY,
+    SGP4_ERROR_SUBORBITAL,
     TWO_PI,
+    X2O3,
+    XKE,
 )
-from pyglspg4.sgp4.state import SGP4State
-from pyglspg4.sdp4.dspace import (
-    deep_space_secular,
-    deep_space_integrate,
+from pyglspg4.sdp4.constants import J2, J3OJ2, PI
+from pyglspg4.sdp4.dpper import dpper
+from pyglspg4.sdp4.dspace import ResonanceState, dspace
+from pyglspg4.sdp4.record import SDP4Record
+from pyglspg4.sdp4.resonance_cache import (
+    DEFAULT_RESONANCE_CACHE,
+    ResonanceCache,
+    resonance_start as cached_resonance_start,
 )
-from pyglspg4.math.vectors import teme_position_velocity
+
+# Kepler iteration for the long-period form of the equation
+_KEPLER_TOLERANCE = 1.0e-12
+_KEPLER_MAX_ITERATIONS = 10
+_KEPLER_MAX_STEP = 0.95
+
+# Guard for the xlcof divisor near 180 degrees inclination
+_INCLINATION_DIVISOR = 1.5e-12
+
+_FAILED = ((0.0, 0.0, 0.0), (0.0, 0.0, 0.0))
 
 
 def propagate_deep_space(
-    state: SGP4State,
+    record: SDP4Record,
     tsince_minutes: float,
+    resonance_start: Optional[ResonanceState] = None,
+    cache: Optional[ResonanceCache] = DEFAULT_RESONANCE_CACHE,
 ) -> Tuple[
     Tuple[float, float, float],
     Tuple[float, float, float],
@@ -41,10 +71,17 @@ def propagate_deep_space(
 
     Parameters
     ----------
-    state : SGP4State
-        Initialized SGP-4 state with deep-space parameters
+    record : SDP4Record
+        Deep-space coefficients from
+        pyglspg4.sdp4.initializer.initialize_deep_space
     tsince_minutes : float
         Minutes since TLE epoch
+    resonance_start : (atime, xli, xni), optional
+        Resonance integrator state to continue from instead of the
+        epoch (resonant objects only)
+    cache : ResonanceCache or None
+        Checkpoints that resonant objects start from when no
+        resonance_start is given; None integrates from the epoch
 
     Returns
     -------
@@ -56,63 +93,174 @@ def propagate_deep_space(
         SDP-4 error code
     """
 
-    # ------------------------------------------------------------------
-    # 1. Apply deep-space secular effects
-    # ------------------------------------------------------------------
-    deep_space_secular(state, tsince_minutes)
+    r = record
+    t = tsince_minutes
+
+    if resonance_start is None:
+        resonance_start = cached_resonance_start(r, t, cache)
 
     # ------------------------------------------------------------------
-    # 2. Apply deep-space resonance integration
+    # 1. Geopotential secular effects and drag
     # ------------------------------------------------------------------
-    deep_space_integrate(state, tsince_minutes)
+    mean_anomaly = r.mean_anomaly + r.xmdot * t
+    arg_perigee = r.arg_perigee + r.omgdot * t
+    raan = r.raan + r.xnodot * t + r.nodecf * t * t
+
+    tempa = 1.0 - r.cc1 * t
+    tempe = r.bstar * r.cc4 * t
+    templ = r.t2cof * t * t
 
     # ------------------------------------------------------------------
-    # 3. Solve Kepler's Equation
+    # 2. Lunar-solar secular effects and resonances
     # ------------------------------------------------------------------
-    M = state.mean_anomaly % TWO_PI
-    E = M
+    ecc, inclination, raan, arg_perigee, mean_anomaly, nm = dspace(
+        r,
+        t,
+        r.eccentricity,
+        r.inclination,
+        raan,
+        arg_perigee,
+        mean_anomaly,
+        resonance_start,
+    )
+
+    if nm <= 0.0:
+        return _FAILED + (SGP4_ERROR_MEAN_MOTION,)
+
+    am = (XKE / nm) ** X2O3 * tempa * tempa
+    nm = XKE / am ** 1.5
+    ecc -= tempe
+
+    if ecc >= 1.0 or ecc < -0.001:
+        return _FAILED + (SGP4_ERROR_ECCENTRICITY,)
+    if ecc < 1.0e-6:
+        ecc = 1.0e-6
 
-    for _ in range(10):
-        f = E - state.eccentricity * math.sin(E) - M
-        fp = 1.0 - state.eccentricity * math.cos(E)
-        E -= f / fp
+    mean_anomaly += r.mean_motion * templ
+    xlm = mean_anomaly + arg_perigee + raan
 
-    sinE = math.sin(E)
-    cosE = math.cos(E)
+    raan = math.fmod(raan, TWO_PI)
+    arg_perigee %= TWO_PI
+    xlm %= TWO_PI
+    mean_anomaly = (xlm - arg_perigee - raan) % TWO_PI
 
-    beta = math.sqrt(1.0 - state.eccentricity ** 2)
-    r = state.semi_major_axis * (1.0 - state.eccentricity * cosE)
+    # ------------------------------------------------------------------
+    # 3. Lunar-solar long-period periodics
+    # ------------------------------------------------------------------
+    ecc, inclination, raan, arg_perigee, mean_anomaly = dpper(
+        r, t, ecc, inclination, raan, arg_perigee, mean_anomaly
+    )
+    if inclination < 0.0:
+        inclination = -inclination
+        raan += PI
+        arg_perigee -= PI
+
+    if ecc < 0.0 or ecc > 1.0:
+        return _FAILED + (SGP4_ERROR_DEEP_SPACE,)
 
     # ------------------------------------------------------------------
-    # 4. Position and velocity in orbital plane
+    # 4. Long-period periodics (J3)
     # ------------------------------------------------------------------
-    x_orb = state.semi_major_axis * (cosE - state.eccentricity)
-    y_orb = state.semi_major_axis * beta * sinE
+    sinip = math.sin(inclination)
+    cosip = math.cos(inclination)
 
-    rdot = XKE * math.sqrt(state.semi_major_axis) * state.eccentricity * sinE / r
-    rfdot = XKE * math.sqrt(state.semi_major_axis) * beta / r
+    aycof = -0.5 * J3OJ2 * sinip
+    divisor = 1.0 + cosip
+    if abs(divisor) <= _INCLINATION_DIVISOR:
+        divisor = _INCLINATION_DIVISOR
+    xlcof = -0.25 * J3OJ2 * sinip * (3.0 + 5.0 * cosip) / divisor
 
-    vx_orb = -rdot * sinE + rfdot * cosE
-    vy_orb = rdot * cosE + rfdot * sinE
+    axnl = ecc * math.cos(arg_perigee)
+    temp = 1.0 / (am * (1.0 - ecc * ecc))
+    aynl = ecc * math.sin(arg_perigee) + temp * aycof
+    xl = mean_anomaly + arg_perigee + raan + temp * xlcof * axnl
+
+    # ------------------------------------------------------------------
+    # 5. Solve Kepler's Equation
+    # ------------------------------------------------------------------
+    u = math.fmod(xl - raan, TWO_PI)
+    eo1 = u
+    tem5 = 9999.9
+    iteration = 1
+    while abs(tem5) >= _KEPLER_TOLERANCE and iteration <= _KEPLER_MAX_ITERATIONS:
+        sineo1 = math.sin(eo1)
+        coseo1 = math.cos(eo1)
+        tem5 = 1.0 - coseo1 * axnl - sineo1 * aynl
+        tem5 = (u - aynl * coseo1 + axnl * sineo1 - eo1) / tem5
+        if abs(tem5) >= _KEPLER_MAX_STEP:
+            tem5 = _KEPLER_MAX_STEP if tem5 > 0.0 else -_KEPLER_MAX_STEP
+        eo1 += tem5
+        iteration += 1
 
     # ------------------------------------------------------------------
-    # 5. Rotate into TEME frame
+    # 6. Short-period periodics (J2)
     # ------------------------------------------------------------------
-    position, velocity = teme_position_velocity(
-        x_orb,
-        y_orb,
-        vx_orb,
-        vy_orb,
-        state.inclination,
-        state.raan,
-        state.arg_perigee,
+    ecose = axnl * coseo1 + aynl * sineo1
+    esine = axnl * sineo1 - aynl * coseo1
+    el2 = axnl * axnl + aynl * aynl
+    pl = am * (1.0 - el2)
+    if pl < 0.0:
+        return _FAILED + (SGP4_ERROR_SUBORBITAL,)
+
+    rl = am * (1.0 - ecose)
+    rdotl = math.sqrt(am) * esine / rl
+    rvdotl = math.sqrt(pl) / rl
+    betal = math.sqrt(1.0 - el2)
+    temp = esine / (1.0 + betal)
+    sinu = am / rl * (sineo1 - aynl - axnl * temp)
+    cosu = am / rl * (coseo1 - axnl + aynl * temp)
+    su = math.atan2(sinu, cosu)
+    sin2u = (cosu + cosu) * sinu
+    cos2u = 1.0 - 2.0 * sinu * sinu
+    temp = 1.0 / pl
+    temp1 = 0.5 * J2 * temp
+    temp2 = temp1 * temp
+
+    cosisq = cosip * cosip
+    con41 = 3.0 * cosisq - 1.0
+    x1mth2 = 1.0 - cosisq
+    x7thm1 = 7.0 * cosisq - 1.0
+
+    mrt = (
+        rl * (1.0 - 1.5 * temp2 * betal * con41)
+        + 0.5 * temp1 * x1mth2 * cos2u
     )
+    su -= 0.25 * temp2 * x7thm1 * sin2u
+    xnode = raan + 1.5 * temp2 * cosip * sin2u
+    xinc = inclination + 1.5 * temp2 * cosip * sinip * cos2u
+    mvt = rdotl - nm * temp1 * x1mth2 * sin2u / XKE
+    rvdot = rvdotl + nm * temp1 * (x1mth2 * cos2u + 1.5 * con41) / XKE
+
+    if mrt < 1.0:
+        return _FAILED + (SGP4_ERROR_ORBITAL_DECAY,)
 
     # ------------------------------------------------------------------
-    # 6. Convert to physical units
+    # 7. Orientation vectors and physical units
     # ------------------------------------------------------------------
-    position_km = tuple(p * AE for p in position)
-    velocity_km_s = tuple(v * AE / 60.0 for v in velocity)
+    sinsu = math.sin(su)
+    cossu = math.cos(su)
+    snod = math.sin(xnode)
+    cnod = math.cos(xnode)
+    sini = math.sin(xinc)
+    cosi = math.cos(xinc)
+    xmx = -snod * cosi
+    xmy = cnod * cosi
 
-    return position_km, velocity_km_s, 0
+    ux = xmx * sinsu + cnod * cossu
+    uy = xmy * sinsu + snod * cossu
+    uz = sini * sinsu
+    vx = xmx * cossu - cnod * sinsu
+    vy = xmy * cossu - snod * sinsu
+    vz = sini * cossu
+
+    mr = mrt * EARTH_RADIUS_KM
+    vkmpersec = EARTH_RADIUS_KM * XKE / 60.0
+
+    position_km = (mr * ux, mr * uy, mr * uz)
+    velocity_km_s = (
+        (mvt * ux + rvdot * vx) * vkmpersec,
+        (mvt * uy + rvdot * vy) * vkmpersec,
+        (mvt * uz + rvdot * vz) * vkmpersec,
+    )
 
+    return position_km, velocity_km_s, SGP4_ERROR_NONE
@@ -0,0 +1,156 @@
+# Copyright (C) 2025-2026 Kris Kirby, KE4AHR
+# SPDX-License-Identifier: LGPL-3.0-or-later
+#
+# Immutable SDP-4 coefficient record
+#
+# Holds everything the deep-space kernel reads: the epoch elements,
+# the secular rates and drag terms of the SGP-4 initializer, the
+# lunar-solar periodic coefficients (dscom) and the resonance terms
+# (dsinit). A record is built once per object by
+# pyglspg4.sdp4.initializer and never modified, so it can be shared
+# by any number of propagations, threads or worker processes.
+#
+# The first fields use the names of pyglspg4.sgp4.record so that
+# catalogs mixing near-Earth and deep-space objects pack into one
+# SatrecArray.
+#
+# References:
+#   NORAD Spacetrack Report #3
+#   Vallado et al., AIAA 2006-6753
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from pyglspg4.sgp4.record import PROPAGATION_FIELDS
+
+
+# Secular terms beyond those of the near-Earth record
+SECULAR_FIELDS = ("nodecf", "t2cof", "gsto")
+
+# Lunar-solar long-period coefficients read by dpper
+PERIODIC_FIELDS = (
+    "e3", "ee2", "se2", "se3", "sgh2", "sgh3", "sgh4", "sh2", "sh3",
+    "si2", "si3", "sl2", "sl3", "sl4", "xgh2", "xgh3", "xgh4", "xh2",
+    "xh3", "xi2", "xi3", "xl2", "xl3", "xl4", "zmol", "zmos",
+)
+
+# Lunar-solar secular rates and resonance terms read by dspace
+RESONANCE_FIELDS = (
+    "dedt", "didt", "dmdt", "dnodt", "domdt",
+    "d2201", "d2211", "d3210", "d3222", "d4410",
+    "d4422", "d5220", "d5232", "d5421", "d5433",
+    "del1", "del2", "del3", "xfact", "xlamo",
+)
+
+# Fields of SDP4Record, in storage order
+DEEP_SPACE_FIELDS = (
+    PROPAGATION_FIELDS
+    + SECULAR_FIELDS
+    + PERIODIC_FIELDS
+    + RESONANCE_FIELDS
+    + ("irez",)
+)
+
+# Resonance classes (irez)
+RESONANCE_NONE = 0
+RESONANCE_SYNCHRONOUS = 1
+RESONANCE_HALF_DAY = 2
+
+
+@dataclass(frozen=True)
+class SDP4Record:
+    """
+    Frozen SDP-4 coefficient set for one deep-space object.
+
+    Angles are in radians, time in minutes, distances in Earth radii.
+    mean_motion is the un-Kozai'd (Brouwer) mean motion and
+    semi_major_axis the matching mean semi-major axis. xmdot, omgdot
+    and xnodot are the J2/J4 secular rates of mean anomaly, argument
+    of perigee and node. irez is one of RESONANCE_NONE,
+    RESONANCE_SYNCHRONOUS or RESONANCE_HALF_DAY.
+    """
+
+    __slots__ = DEEP_SPACE_FIELDS
+
+    epoch_jd: float
+    inclination: float
+    raan: float
+    eccentricity: float
+    arg_perigee: float
+    mean_anomaly: float
+    mean_motion: float
+    bstar: float
+    semi_major_axis: float
+    xmdot: float
+    omgdot: float
+    xnodot: float
+    cc1: float
+    cc4: float
+    cc5: float
+
+    nodecf: float
+    t2cof: float
+    gsto: float
+
+    e3: float
+    ee2: float
+    se2: float
+    se3: float
+    sgh2: float
+    sgh3: float
+    sgh4: float
+    sh2: float
+    sh3: float
+    si2: float
+    si3: float
+    sl2: float
+    sl3: float
+    sl4: float
+    xgh2: float
+    xgh3: float
+    xgh4: float
+    xh2: float
+    xh3: float
+    xi2: float
+    xi3: float
+    xl2: float
+    xl3: float
+    xl4: float
+    zmol: float
+    zmos: float
+
+    dedt: float
+    didt: float
+    dmdt: float
+    dnodt: float
+    domdt: float
+    d2201: float
+    d2211: float
+    d3210: float
+    d3222: float
+    d4410: float
+    d4422: float
+    d5220: float
+    d5232: float
+    d5421: float
+    d5433: float
+    del1: float
+    del2: float
+    del3: float
+    xfact: float
+    xlamo: float
+
+    irez: int
+
+    # Records are always built by the initializer
+    initialized = True
+    is_deep_space = True
+
+    # Frozen slotted dataclasses need explicit pickle support on 3.9
+    def __getstate__(self):
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, values) -> None:
+        for name, value in zip(self.__slots__, values):
+            object.__setattr__(self, name, value)
@@ -2,7 +2,14 @@
 # SPDX-License-Identifier: LGPL-3.0-or-later
 #
 # SDP-4 resonance initialization and handling
-# Corresponds to NORAD dsinit and resonance logic
+# Corresponds to NORAD dsinit routine
+#
+# Derives the lunar-solar secular rates from the dscom sums and,
+# for orbits near a geopotential resonance, the coefficients of the
+# resonance terms integrated by dspace:
+#   - synchronous (24 hour) orbits, irez = 1
+#   - eccentric half-day (12 hour, Molniya-type) orbits, irez = 2
+#
 # References:
 #   - Spacetrack Report #3
 #   - Vallado et al. (2006), Sections 6–7
@@ -10,60 +17,261 @@
 from __future__ import annotations
 
 import math
+from typing import Dict
 
+from pyglspg4.constants import XKE, X2O3
 from pyglspg4.sdp4.constants import (
-    THDT,
+    HALF_DAY_BAND,
+    HALF_DAY_MIN_ECCENTRICITY,
+    PI,
+    Q22,
+    Q31,
+    Q33,
     ROOT22,
     ROOT32,
     ROOT44,
     ROOT52,
     ROOT54,
+    SMALL_INCLINATION,
+    SYNCHRONOUS_BAND,
+    THDT,
+    TWO_PI,
+    ZNL,
+    ZNS,
+)
+from pyglspg4.sdp4.record import (
+    RESONANCE_HALF_DAY,
+    RESONANCE_NONE,
+    RESONANCE_SYNCHRONOUS,
 )
-from pyglspg4.sdp4.state import SDP4State
 
 
-def initialize_resonance(state: SDP4State) -> None:
+def resonance_class(mean_motion: float, ecc: float) -> int:
     """
-    Initialize deep-space resonance terms.
+    Resonance class (irez) of an orbit.
 
-    Handles:
-      - Synchronous (1:1 Earth rotation)
-      - 12-hour (Molniya) resonance
+    Parameters
+    ----------
+    mean_motion : float
+        Un-Kozai'd mean motion (rad/min)
+    ecc : float
+        Eccentricity
     """
+    if SYNCHRONOUS_BAND[0] < mean_motion < SYNCHRONOUS_BAND[1]:
+        return RESONANCE_SYNCHRONOUS
+    if (
+        HALF_DAY_BAND[0] <= mean_motion <= HALF_DAY_BAND[1]
+        and ecc >= HALF_DAY_MIN_ECCENTRICITY
+    ):
+        return RESONANCE_HALF_DAY
+    return RESONANCE_NONE
+
+
+def _half_day_coefficients(em: float, sinim: float, cosim: float, nm: float):
+    # Hansen coefficient fits (G) and inclination functions (F) of
+    # the 12 hour resonance terms
+    emsq = em * em
+    eoc = em * emsq
+    cosisq = cosim * cosim
 
-    # Mean motion [rad/min]
-    n = state.mean_motion
-
-    # Detect synchronous resonance (~1 rev/day)
-    if abs(n - THDT) < 1e-6:
-        state.resonance = True
-        state.synchronous = True
-
-        state.del1 = ROOT22
-        state.del2 = ROOT32
-        state.del3 = ROOT44
-        state.fasx2 = 0.13130908
-        state.fasx4 = 2.8843198
-        state.fasx6 = 0.37448087
-
-    # Detect 12-hour resonance (~2 rev/day)
-    elif abs(n - 2.0 * THDT) < 1e-6:
-        state.resonance = True
-        state.synchronous = False
-
-        state.del1 = ROOT52
-        state.del2 = ROOT54
-        state.del3 = 0.0
-        state.fasx2 = 0.0
-        state.fasx4 = 0.0
-        state.fasx6 = 0.0
+    g201 = -0.306 - (em - 0.64) * 0.440
+    if em <= 0.65:
+        g211 = 3.616 - 13.2470 * em + 16.2900 * emsq
+        g310 = -19.302 + 117.3900 * em - 228.4190 * emsq + 156.5910 * eoc
+        g322 = -18.9068 + 109.7927 * em - 214.6334 * emsq + 146.5816 * eoc
+        g410 = -41.122 + 242.6940 * em - 471.0940 * emsq + 313.9530 * eoc
+        g422 = -146.407 + 841.8800 * em - 1629.014 * emsq + 1083.4350 * eoc
+        g520 = -532.114 + 3017.977 * em - 5740.032 * emsq + 3708.2760 * eoc
+    else:
+        g211 = -72.099 + 331.819 * em - 508.738 * emsq + 266.724 * eoc
+        g310 = -346.844 + 1582.851 * em - 2415.925 * emsq + 1246.113 * eoc
+        g322 = -342.585 + 1554.908 * em - 2366.899 * emsq + 1215.972 * eoc
+        g410 = -1052.797 + 4758.686 * em - 7193.992 * emsq + 3651.957 * eoc
+        g422 = -3581.690 + 16178.110 * em - 24462.770 * emsq + 12422.520 * eoc
+        if em > 0.715:
+            g520 = -5149.66 + 29936.92 * em - 54087.36 * emsq + 31324.56 * eoc
+        else:
+            g520 = 1464.74 - 4664.75 * em + 3763.64 * emsq
 
+    if em < 0.7:
+        g533 = -919.22770 + 4988.6100 * em - 9064.7700 * emsq + 5542.21 * eoc
+        g521 = -822.71072 + 4568.6173 * em - 8491.4146 * emsq + 5337.524 * eoc
+        g532 = -853.66600 + 4690.2500 * em - 8624.7700 * emsq + 5341.4 * eoc
     else:
-        state.resonance = False
-        state.synchronous = False
+        g533 = -37995.780 + 161616.52 * em - 229838.20 * emsq + 109377.94 * eoc
+        g521 = -51752.104 + 218913.95 * em - 309468.16 * emsq + 146349.42 * eoc
+        g532 = -40023.880 + 170470.89 * em - 242699.48 * emsq + 115605.82 * eoc
+
+    sini2 = sinim * sinim
+    f220 = 0.75 * (1.0 + 2.0 * cosim + cosisq)
+    f221 = 1.5 * sini2
+    f321 = 1.875 * sinim * (1.0 - 2.0 * cosim - 3.0 * cosisq)
+    f322 = -1.875 * sinim * (1.0 + 2.0 * cosim - 3.0 * cosisq)
+    f441 = 35.0 * sini2 * f220
+    f442 = 39.3750 * sini2 * sini2
+    f522 = 9.84375 * sinim * (
+        sini2 * (1.0 - 2.0 * cosim - 5.0 * cosisq)
+        + 0.33333333 * (-2.0 + 4.0 * cosim + 6.0 * cosisq)
+    )
+    f523 = sinim * (
+        4.92187512 * sini2 * (-2.0 - 4.0 * cosim + 10.0 * cosisq)
+        + 6.56250012 * (1.0 + 2.0 * cosim - 3.0 * cosisq)
+    )
+    f542 = 29.53125 * sinim * (
+        2.0 - 8.0 * cosim + cosisq * (-12.0 + 8.0 * cosim + 10.0 * cosisq)
+    )
+    f543 = 29.53125 * sinim * (
+        -2.0 - 8.0 * cosim + cosisq * (12.0 + 8.0 * cosim - 10.0 * cosisq)
+    )
+
+    aonv = (nm / XKE) ** X2O3
+    temp1 = 3.0 * nm * nm * aonv * aonv
+    temp = temp1 * ROOT22
+    d2201 = temp * f220 * g201
+    d2211 = temp * f221 * g211
+    temp1 *= aonv
+    temp = temp1 * ROOT32
+    d3210 = temp * f321 * g310
+    d3222 = temp * f322 * g322
+    temp1 *= aonv
+    temp = 2.0 * temp1 * ROOT44
+    d4410 = temp * f441 * g410
+    d4422 = temp * f442 * g422
+    temp1 *= aonv
+    temp = temp1 * ROOT52
+    d5220 = temp * f522 * g520
+    d5232 = temp * f523 * g532
+    temp = 2.0 * temp1 * ROOT54
+    d5421 = temp * f542 * g521
+    d5433 = temp * f543 * g533
+
+    return dict(
+        d2201=d2201, d2211=d2211, d3210=d3210, d3222=d3222, d4410=d4410,
+        d4422=d4422, d5220=d5220, d5232=d5232, d5421=d5421, d5433=d5433,
+    )
+
+
+def _synchronous_coefficients(emsq: float, sinim: float, cosim: float, nm: float):
+    g200 = 1.0 + emsq * (-2.5 + 0.8125 * emsq)
+    g310 = 1.0 + 2.0 * emsq
+    g300 = 1.0 + emsq * (-6.0 + 6.60937 * emsq)
+    f220 = 0.75 * (1.0 + cosim) * (1.0 + cosim)
+    f311 = 0.9375 * sinim * sinim * (1.0 + 3.0 * cosim) - 0.75 * (1.0 + cosim)
+    f330 = 1.0 + cosim
+    f330 = 1.875 * f330 * f330 * f330
+
+    aonv = (nm / XKE) ** X2O3
+    del1 = 3.0 * nm * nm * aonv * aonv
+    return dict(
+        del1=del1 * f311 * g310 * Q31 * aonv,
+        del2=2.0 * del1 * f220 * g200 * Q22,
+        del3=3.0 * del1 * f330 * g300 * Q33 * aonv,
+    )
+
+
+def dsinit(
+    terms: Dict[str, float],
+    ecc: float,
+    inclination: float,
+    raan: float,
+    arg_perigee: float,
+    mean_anomaly: float,
+    mean_motion: float,
+    xmdot: float,
+    omgdot: float,
+    xnodot: float,
+    gsto: float,
+) -> Dict[str, float]:
+    """
+    Deep-space secular rates and resonance terms (dsinit).
+
+    Parameters
+    ----------
+    terms : dict
+        Output of pyglspg4.sdp4.solar_lunar.dscom at epoch
+    ecc, inclination, raan, arg_perigee, mean_anomaly : float
+        Epoch mean elements (radians)
+    mean_motion : float
+        Un-Kozai'd mean motion (rad/min)
+    xmdot, omgdot, xnodot : float
+        Geopotential secular rates of mean anomaly, argument of
+        perigee and node (rad/min)
+    gsto : float
+        Greenwich sidereal angle at epoch (radians)
+
+    Returns
+    -------
+    dict
+        Values for every name in pyglspg4.sdp4.record.RESONANCE_FIELDS
+        plus "irez"
+    """
+
+    t = terms
+    sinim = t["sinim"]
+    cosim = t["cosim"]
+    emsq = t["emsq"]
+
+    # ------------------------------------------------------------------
+    # 1. Lunar-solar secular rates
+    # ------------------------------------------------------------------
+    small_inclination = (
+        inclination < SMALL_INCLINATION or inclination > PI - SMALL_INCLINATION
+    )
+
+    ses = t["ss1"] * ZNS * t["ss5"]
+    sis = t["ss2"] * ZNS * (t["sz11"] + t["sz13"])
+    sls = -ZNS * t["ss3"] * (t["sz1"] + t["sz3"] - 14.0 - 6.0 * emsq)
+    sghs = t["ss4"] * ZNS * (t["sz31"] + t["sz33"] - 6.0)
+    shs = -ZNS * t["ss2"] * (t["sz21"] + t["sz23"])
+    if small_inclination:
+        shs = 0.0
+    if sinim != 0.0:
+        shs /= sinim
+    sgs = sghs - cosim * shs
+
+    dedt = ses + t["s1"] * ZNL * t["s5"]
+    didt = sis + t["s2"] * ZNL * (t["z11"] + t["z13"])
+    dmdt = sls - ZNL * t["s3"] * (t["z1"] + t["z3"] - 14.0 - 6.0 * emsq)
+    sghl = t["s4"] * ZNL * (t["z31"] + t["z33"] - 6.0)
+    shll = -ZNL * t["s2"] * (t["z21"] + t["z23"])
+    if small_inclination:
+        shll = 0.0
+
+    domdt = sgs + sghl
+    dnodt = shs
+    if sinim != 0.0:
+        domdt -= cosim / sinim * shll
+        dnodt += shll / sinim
+
+    result = dict(
+        dedt=dedt, didt=didt, dmdt=dmdt, dnodt=dnodt, domdt=domdt,
+        d2201=0.0, d2211=0.0, d3210=0.0, d3222=0.0, d4410=0.0,
+        d4422=0.0, d5220=0.0, d5232=0.0, d5421=0.0, d5433=0.0,
+        del1=0.0, del2=0.0, del3=0.0, xfact=0.0, xlamo=0.0,
+    )
+
+    # ------------------------------------------------------------------
+    # 2. Resonance terms
+    # ------------------------------------------------------------------
+    irez = resonance_class(mean_motion, ecc)
+    result["irez"] = irez
+    theta = math.fmod(gsto, TWO_PI)
 
-    # Initialize integration variables
-    state.atime = 0.0
-    state.xli = state.mean_anomaly
-    state.xni = state.mean_motion
+    if irez == RESONANCE_HALF_DAY:
+        result.update(_half_day_coefficients(ecc, sinim, cosim, mean_motion))
+        result["xlamo"] = math.fmod(
+            mean_anomaly + 2.0 * raan - 2.0 * theta, TWO_PI
+        )
+        result["xfact"] = (
+            xmdot + dmdt + 2.0 * (xnodot + dnodt - THDT) - mean_motion
+        )
+    elif irez == RESONANCE_SYNCHRONOUS:
+        result.update(_synchronous_coefficients(emsq, sinim, cosim, mean_motion))
+        result["xlamo"] = math.fmod(
+            mean_anomaly + raan + arg_perigee - theta, TWO_PI
+        )
+        result["xfact"] = (
+            xmdot + omgdot + xnodot - THDT + dmdt + domdt + dnodt - mean_motion
+        )
 
+    return result
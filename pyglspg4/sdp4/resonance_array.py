@@ -0,0 +1,255 @@
+# Copyright (C) 2025-2026 Kris Kirby, KE4AHR
+# SPDX-License-Identifier: LGPL-3.0-or-later
+#
+# Vectorized SDP-4 resonance integrator
+#
+# Packs the resonance coefficients of many resonant objects into
+# float64 columns and advances all of their integrators together,
+# one 720 minute step at a time, as NumPy array operations. Each
+# object is integrated once per direction out to its furthest
+# requested time; every time sample picks up the state of the step
+# it ends on, so an (N, T) grid costs max(steps) array steps rather
+# than N * T scalar integrations.
+#
+# Like pyglspg4.sdp4.resonance_cache, the array keeps the integrator
+# state of all objects every `stride` steps on both sides of the
+# epoch, so repeated calls (e.g. consecutive blocks of a streamed
+# ephemeris) resume from the nearest checkpoint instead of the epoch.
+#
+# The arithmetic mirrors pyglspg4.sdp4.dspace term for term.
+#
+# Requires NumPy.
+#
+# References:
+#   Vallado et al., AIAA 2006-6753
+
+from __future__ import annotations
+
+import threading
+from typing import Sequence, Tuple
+
+import numpy as np
+
+from pyglspg4.sdp4.constants import (
+    DEEP_SPACE_STEP,
+    DEEP_SPACE_STEP2,
+    FASX2,
+    FASX4,
+    FASX6,
+    G22,
+    G32,
+    G44,
+    G52,
+    G54,
+)
+from pyglspg4.sdp4.record import (
+    RESONANCE_HALF_DAY,
+    RESONANCE_NONE,
+    RESONANCE_SYNCHRONOUS,
+    SDP4Record,
+)
+
+
+# SDP4Record fields packed as columns
+COLUMNS = (
+    "arg_perigee", "omgdot", "mean_motion", "xfact", "xlamo",
+    "del1", "del2", "del3",
+    "d2201", "d2211", "d3210", "d3222", "d4410",
+    "d4422", "d5220", "d5232", "d5421", "d5433",
+)
+
+
+class ResonanceArray:
+    """
+    Columnar resonance coefficients of N resonant objects.
+
+    Args:
+        records: SDP4Record objects, all with irez != 0
+        stride: Integrator steps (720 minutes each) between checkpoints
+    """
+
+    def __init__(self, records: Sequence[SDP4Record], stride: int = 32) -> None:
+        if stride < 1:
+            raise ValueError("stride must be at least 1")
+
+        irez = np.array([r.irez for r in records], dtype=np.int64)
+        if (irez == RESONANCE_NONE).any():
+            raise ValueError("all records must have resonance terms")
+
+        for name in COLUMNS:
+            setattr(
+                self,
+                name,
+                np.fromiter(
+                    (getattr(r, name) for r in records),
+                    dtype=np.float64,
+                    count=len(records),
+                ),
+            )
+
+        self.size = len(records)
+        self.irez = irez
+        self._synchronous = np.flatnonzero(irez == RESONANCE_SYNCHRONOUS)
+        self._half_day = np.flatnonzero(irez == RESONANCE_HALF_DAY)
+
+        # Per direction, (xli, xni) of all objects at m * stride steps
+        self.stride = stride
+        self._lock = threading.Lock()
+        epoch = (self.xlamo, self.mean_motion)
+        self._checkpoints = {
+            DEEP_SPACE_STEP: [epoch],
+            -DEEP_SPACE_STEP: [epoch],
+        }
+
+    def __len__(self) -> int:
+        return self.size
+
+    def rates(
+        self,
+        atime: np.ndarray,
+        xli: np.ndarray,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Vectorized pyglspg4.sdp4.dspace.resonance_rates for all objects.
+        """
+        xndt = np.empty(self.size)
+        xnddt = np.empty(self.size)
+
+        s = self._synchronous
+        if s.size:
+            li = xli[s]
+            xndt[s] = (
+                self.del1[s] * np.sin(li - FASX2)
+                + self.del2[s] * np.sin(2.0 * (li - FASX4))
+                + self.del3[s] * np.sin(3.0 * (li - FASX6))
+            )
+            xnddt[s] = (
+                self.del1[s] * np.cos(li - FASX2)
+                + 2.0 * self.del2[s] * np.cos(2.0 * (li - FASX4))
+                + 3.0 * self.del3[s] * np.cos(3.0 * (li - FASX6))
+            )
+
+        h = self._half_day
+        if h.size:
+            li = xli[h]
+            xomi = self.arg_perigee[h] + self.omgdot[h] * atime[h]
+            x2omi = xomi + xomi
+            x2li = li + li
+            xndt[h] = (
+                self.d2201[h] * np.sin(x2omi + li - G22)
+                + self.d2211[h] * np.sin(li - G22)
+                + self.d3210[h] * np.sin(xomi + li - G32)
+                + self.d3222[h] * np.sin(-xomi + li - G32)
+                + self.d4410[h] * np.sin(x2omi + x2li - G44)
+                + self.d4422[h] * np.sin(x2li - G44)
+                + self.d5220[h] * np.sin(xomi + li - G52)
+                + self.d5232[h] * np.sin(-xomi + li - G52)
+                + self.d5421[h] * np.sin(xomi + x2li - G54)
+                + self.d5433[h] * np.sin(-xomi + x2li - G54)
+            )
+            xnddt[h] = (
+                self.d2201[h] * np.cos(x2omi + li - G22)
+                + self.d2211[h] * np.cos(li - G22)
+                + self.d3210[h] * np.cos(xomi + li - G32)
+                + self.d3222[h] * np.cos(-xomi + li - G32)
+                + self.d5220[h] * np.cos(xomi + li - G52)
+                + self.d5232[h] * np.cos(-xomi + li - G52)
+                + 2.0 * (
+                    self.d4410[h] * np.cos(x2omi + x2li - G44)
+                    + self.d4422[h] * np.cos(x2li - G44)
+                    + self.d5421[h] * np.cos(xomi + x2li - G54)
+                    + self.d5433[h] * np.cos(-xomi + x2li - G54)
+                )
+            )
+
+        return xndt, xnddt
+
+    def integrate(self, tsince) -> Tuple[np.ndarray, ...]:
+        """
+        Integrate every object to its requested times.
+
+        Parameters
+        ----------
+        tsince : (T,) or (N, T) array_like
+            Minutes since each object's epoch; a 1-D array is shared
+            by all objects
+
+        Returns
+        -------
+        xn, xl : (N, T) ndarray
+            Mean motion (rad/min) and resonance mean longitude (rad)
+        atime, xli, xni : (N, T) ndarray
+            Last whole-step integrator state before each sample, which
+            pyglspg4.sdp4.propagate accepts as resonance_start
+        """
+
+        t = np.asarray(tsince, dtype=np.float64)
+        if t.ndim <= 1:
+            t = np.broadcast_to(np.atleast_1d(t), (self.size, t.size))
+        elif t.shape[0] != self.size:
+            raise ValueError("tsince rows must match the object count")
+
+        delt = np.where(t > 0.0, DEEP_SPACE_STEP, -DEEP_SPACE_STEP)
+        steps = _whole_steps(t, delt)
+
+        out = tuple(np.empty(t.shape) for _ in range(5))
+        for direction in (DEEP_SPACE_STEP, -DEEP_SPACE_STEP):
+            self._integrate_direction(t, steps, delt == direction, direction, out)
+        return out
+
+    def _integrate_direction(self, t, steps, selected, delt, out) -> None:
+        rows, cols = np.nonzero(selected)
+        if rows.size == 0:
+            return
+
+        # Visit samples in order of the step they end on
+        order = np.argsort(steps[rows, cols], kind="stable")
+        rows, cols = rows[order], cols[order]
+        ends = steps[rows, cols]
+        bounds = np.searchsorted(ends, np.arange(ends[-1] + 2))
+
+        xn, xl, atime_out, xli_out, xni_out = out
+        points = self._checkpoints[delt]
+        with self._lock:
+            index = min(ends[0] // self.stride, len(points) - 1)
+            xli, xni = points[index]
+        first = index * self.stride
+        atime = np.full(self.size, first * delt)
+
+        for step in range(first, ends[-1] + 1):
+            if step % self.stride == 0:
+                self._store(points, step // self.stride, xli, xni)
+
+            xndt, xnddt = self.rates(atime, xli)
+            xldot = xni + self.xfact
+            xnddt *= xldot
+
+            lo, hi = bounds[step], bounds[step + 1]
+            if hi > lo:
+                r, c = rows[lo:hi], cols[lo:hi]
+                ft = t[r, c] - atime[r]
+                xn[r, c] = xni[r] + xndt[r] * ft + xnddt[r] * ft * ft * 0.5
+                xl[r, c] = xli[r] + xldot[r] * ft + xndt[r] * ft * ft * 0.5
+                atime_out[r, c] = atime[r]
+                xli_out[r, c] = xli[r]
+                xni_out[r, c] = xni[r]
+
+            xli = xli + xldot * delt + xndt * DEEP_SPACE_STEP2
+            xni = xni + xndt * delt + xnddt * DEEP_SPACE_STEP2
+            atime = atime + delt
+
+    def _store(self, points, index, xli, xni) -> None:
+        with self._lock:
+            if index == len(points):
+                points.append((xli, xni))
+
+
+def _whole_steps(t: np.ndarray, delt: np.ndarray) -> np.ndarray:
+    # Vectorized pyglspg4.sdp4.dspace.whole_steps; floor() is off by
+    # at most one step
+    n = np.floor(np.abs(t) / DEEP_SPACE_STEP)
+    n = np.where(
+        (n > 0) & (np.abs(t - (n - 1) * delt) < DEEP_SPACE_STEP), n - 1, n
+    )
+    n = np.where(np.abs(t - n * delt) >= DEEP_SPACE_STEP, n + 1, n)
+    return n.astype(np.int64)
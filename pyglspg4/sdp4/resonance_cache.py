@@ -0,0 +1,158 @@
+# Copyright (C) 2025-2026 Kris Kirby, KE4AHR
+# SPDX-License-Identifier: LGPL-3.0-or-later
+#
+# Resonance integrator checkpoints
+#
+# The SDP-4 resonance terms of GEO and Molniya-type objects are
+# integrated in 720 minute steps from the epoch, so the cost of one
+# propagation grows with |tsince|. This module keeps, per object, the
+# integrator state every few steps on both sides of the epoch and
+# starts each query from the nearest checkpoint at or before the
+# target, whatever order the queries arrive in.
+#
+# Because the integration path from the epoch is fixed, checkpoints
+# are exact: results are bit for bit those of integrating from the
+# epoch.
+#
+# References:
+#   Vallado et al., AIAA 2006-6753
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import List, Optional
+
+from pyglspg4.sdp4.constants import DEEP_SPACE_STEP
+from pyglspg4.sdp4.dspace import (
+    ResonanceState,
+    epoch_resonance_state,
+    resonance_step,
+    whole_steps,
+)
+from pyglspg4.sdp4.record import RESONANCE_NONE, SDP4Record
+
+
+class _Checkpoints:
+    """
+    Checkpoints of one object. forward[m] and backward[m] hold the
+    (xli, xni) state m * stride steps after / before the epoch.
+    """
+
+    __slots__ = ("record", "lock", "forward", "backward")
+
+    def __init__(self, record: SDP4Record) -> None:
+        _, xli, xni = epoch_resonance_state(record)
+        self.record = record
+        self.lock = threading.Lock()
+        self.forward = [(xli, xni)]
+        self.backward = [(xli, xni)]
+
+
+class ResonanceCache:
+    """
+    Bounded LRU cache of resonance integrator checkpoints.
+
+    hits counts queries answered from stored checkpoints, misses those
+    that had to integrate new ones.
+
+    Args:
+        stride: Integrator steps (720 minutes each) between checkpoints
+        max_objects: Number of objects whose checkpoints are kept
+    """
+
+    def __init__(self, stride: int = 4, max_objects: int = 4096) -> None:
+        if stride < 1:
+            raise ValueError("stride must be at least 1")
+
+        self.stride = stride
+        self.max_objects = max_objects
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[int, _Checkpoints]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def start(self, record: SDP4Record, tsince: float) -> ResonanceState:
+        """
+        Nearest checkpoint on the way from the epoch to tsince.
+
+        Missing checkpoints up to tsince are integrated and stored, so
+        later queries in the same direction start further out.
+
+        Returns the (atime, xli, xni) state to pass as the start of
+        pyglspg4.sdp4.dspace.integrate_resonance.
+        """
+        if record.irez == RESONANCE_NONE:
+            raise ValueError("record has no resonance terms")
+
+        entry = self._entry(record)
+        steps = whole_steps(tsince)
+        delt = DEEP_SPACE_STEP if tsince > 0.0 else -DEEP_SPACE_STEP
+        wanted = steps // self.stride
+
+        with entry.lock:
+            points = entry.forward if delt > 0.0 else entry.backward
+            if wanted >= len(points):
+                self._extend(record, points, wanted, delt)
+                self.misses += 1
+            else:
+                self.hits += 1
+            xli, xni = points[wanted]
+
+        return wanted * self.stride * delt, xli, xni
+
+    def _extend(
+        self,
+        record: SDP4Record,
+        points: List,
+        wanted: int,
+        delt: float,
+    ) -> None:
+        index = len(points) - 1
+        state = (index * self.stride * delt,) + points[index]
+        while index < wanted:
+            for _ in range(self.stride):
+                state = resonance_step(record, state, delt)
+            points.append(state[1:])
+            index += 1
+
+    def _entry(self, record: SDP4Record) -> _Checkpoints:
+        key = id(record)
+        with self._lock:
+            entry = self._entries.get(key)
+            # The entry holds the record, so its id cannot be reused
+            # while the entry exists
+            if entry is not None and entry.record is record:
+                self._entries.move_to_end(key)
+                return entry
+
+            entry = _Checkpoints(record)
+            self._entries[key] = entry
+            while len(self._entries) > self.max_objects:
+                self._entries.popitem(last=False)
+            return entry
+
+
+# Process-wide cache used by propagate_deep_space
+DEFAULT_RESONANCE_CACHE = ResonanceCache()
+
+
+def resonance_start(
+    record: SDP4Record,
+    tsince: float,
+    cache: Optional[ResonanceCache] = DEFAULT_RESONANCE_CACHE,
+) -> Optional[ResonanceState]:
+    """
+    Checkpoint to start a resonance integration from, or None for the
+    epoch (non-resonant objects, or no cache).
+    """
+    if cache is None or record.irez == RESONANCE_NONE:
+        return None
+    return cache.start(record, tsince)
@@ -3,6 +3,12 @@
 #
 # SDP-4 solar–lunar perturbation preprocessing
 # Corresponds to NORAD dscom routine
+#
+# Evaluates, once per object at epoch, the geometry of the orbit
+# relative to the Sun and Moon and the coefficients of the lunar-solar
+# long-period terms applied by dpper. The intermediate sums are
+# returned as well, since dsinit derives the secular rates from them.
+#
 # References:
 #   - Spacetrack Report #3
 #   - Vallado et al. (2006), Section 6
@@ -10,49 +16,228 @@
 from __future__ import annotations
 
 import math
+from typing import Dict, Tuple
 
-from pyglspg4.constants import DEG2RAD
 from pyglspg4.sdp4.constants import (
-    ZES,
-    ZNS,
-    ZEL,
-    ZNL,
-    C1SS,
     C1L,
+    C1SS,
+    DAY_OFFSET,
+    TWO_PI,
+    ZCOSGS,
+    ZCOSIS,
+    ZEL,
+    ZES,
+    ZSINGS,
+    ZSINIS,
+)
+
+
+def _body_terms(
+    zcosg: float,
+    zsing: float,
+    zcosi: float,
+    zsini: float,
+    zcosh: float,
+    zsinh: float,
+    cc: float,
+    xnoi: float,
+    sinim: float,
+    cosim: float,
+    sinomm: float,
+    cosomm: float,
+    emsq: float,
+    em: float,
+) -> Tuple[float, ...]:
+    """
+    Perturbation sums for one body (Sun or Moon).
+
+    Returns (s1..s7, z1, z2, z3, z11, z12, z13, z21, z22, z23,
+    z31, z32, z33).
+    """
+
+    betasq = 1.0 - emsq
+    rtemsq = math.sqrt(betasq)
+
+    a1 = zcosg * zcosh + zsing * zcosi * zsinh
+    a3 = -zsing * zcosh + zcosg * zcosi * zsinh
+    a7 = -zcosg * zsinh + zsing * zcosi * zcosh
+    a8 = zsing * zsini
+    a9 = zsing * zsinh + zcosg * zcosi * zcosh
+    a10 = zcosg * zsini
+    a2 = cosim * a7 + sinim * a8
+    a4 = cosim * a9 + sinim * a10
+    a5 = -sinim * a7 + cosim * a8
+    a6 = -sinim * a9 + cosim * a10
+
+    x1 = a1 * cosomm + a2 * sinomm
+    x2 = a3 * cosomm + a4 * sinomm
+    x3 = -a1 * sinomm + a2 * cosomm
+    x4 = -a3 * sinomm + a4 * cosomm
+    x5 = a5 * sinomm
+    x6 = a6 * sinomm
+    x7 = a5 * cosomm
+    x8 = a6 * cosomm
+
+    z31 = 12.0 * x1 * x1 - 3.0 * x3 * x3
+    z32 = 24.0 * x1 * x2 - 6.0 * x3 * x4
+    z33 = 12.0 * x2 * x2 - 3.0 * x4 * x4
+    z1 = 3.0 * (a1 * a1 + a2 * a2) + z31 * emsq
+    z2 = 6.0 * (a1 * a3 + a2 * a4) + z32 * emsq
+    z3 = 3.0 * (a3 * a3 + a4 * a4) + z33 * emsq
+    z11 = -6.0 * a1 * a5 + emsq * (-24.0 * x1 * x7 - 6.0 * x3 * x5)
+    z12 = -6.0 * (a1 * a6 + a3 * a5) + emsq * (
+        -24.0 * (x2 * x7 + x1 * x8) - 6.0 * (x3 * x6 + x4 * x5)
+    )
+    z13 = -6.0 * a3 * a6 + emsq * (-24.0 * x2 * x8 - 6.0 * x4 * x6)
+    z21 = 6.0 * a2 * a5 + emsq * (24.0 * x1 * x5 - 6.0 * x3 * x7)
+    z22 = 6.0 * (a4 * a5 + a2 * a6) + emsq * (
+        24.0 * (x2 * x5 + x1 * x6) - 6.0 * (x4 * x7 + x3 * x8)
+    )
+    z23 = 6.0 * a4 * a6 + emsq * (24.0 * x2 * x6 - 6.0 * x4 * x8)
+    z1 = z1 + z1 + betasq * z31
+    z2 = z2 + z2 + betasq * z32
+    z3 = z3 + z3 + betasq * z33
+
+    s3 = cc * xnoi
+    s2 = -0.5 * s3 / rtemsq
+    s4 = s3 * rtemsq
+    s1 = -15.0 * em * s4
+    s5 = x1 * x3 + x2 * x4
+    s6 = x2 * x3 + x1 * x4
+    s7 = x2 * x4 - x1 * x3
+
+    return (
+        s1, s2, s3, s4, s5, s6, s7,
+        z1, z2, z3, z11, z12, z13, z21, z22, z23, z31, z32, z33,
+    )
+
+
+_TERM_NAMES = (
+    "s1", "s2", "s3", "s4", "s5", "s6", "s7",
+    "z1", "z2", "z3", "z11", "z12", "z13", "z21", "z22", "z23",
+    "z31", "z32", "z33",
 )
-from pyglspg4.sdp4.state import SDP4State
 
 
-def solar_lunar_precompute(state: SDP4State) -> None:
+def dscom(
+    epoch: float,
+    ecc: float,
+    arg_perigee: float,
+    tc: float,
+    inclination: float,
+    raan: float,
+    mean_motion: float,
+) -> Dict[str, float]:
     """
-    Precompute solar and lunar terms for deep-space propagation.
+    Deep-space common terms (dscom).
+
+    Parameters
+    ----------
+    epoch : float
+        Epoch in days since 1950 January 0.0 (JD - 2433281.5)
+    ecc, arg_perigee, inclination, raan : float
+        Epoch mean elements (radians)
+    tc : float
+        Minutes past epoch at which the geometry is evaluated
+    mean_motion : float
+        Un-Kozai'd mean motion (rad/min)
 
-    This function initializes the deep-space secular and periodic
-    coefficients used by SDP-4.
+    Returns
+    -------
+    dict
+        sinim, cosim, emsq; the lunar terms s1..s7 and z1..z33; the
+        solar terms ss1..ss7 and sz1..sz33; and the dpper
+        coefficients named in pyglspg4.sdp4.record.PERIODIC_FIELDS
     """
 
-    # Mean obliquity of the ecliptic (approx)
-    eps = 23.43929111 * DEG2RAD
+    sinim = math.sin(inclination)
+    cosim = math.cos(inclination)
+    sinomm = math.sin(arg_perigee)
+    cosomm = math.cos(arg_perigee)
+    snodm = math.sin(raan)
+    cnodm = math.cos(raan)
+    emsq = ecc * ecc
+
+    # ------------------------------------------------------------------
+    # 1. Lunar orbit orientation on this day
+    # ------------------------------------------------------------------
+    day = epoch + DAY_OFFSET + tc / 1440.0
+    xnodce = math.fmod(4.5236020 - 9.2422029e-4 * day, TWO_PI)
+    stem = math.sin(xnodce)
+    ctem = math.cos(xnodce)
+    zcosil = 0.91375164 - 0.03568096 * ctem
+    zsinil = math.sqrt(1.0 - zcosil * zcosil)
+    zsinhl = 0.089683511 * stem / zsinil
+    zcoshl = math.sqrt(1.0 - zsinhl * zsinhl)
+    gam = 5.8351514 + 0.0019443680 * day
+    zx = 0.39785416 * stem / zsinil
+    zy = zcoshl * ctem + 0.91744867 * zsinhl * stem
+    zx = gam + math.atan2(zx, zy) - xnodce
+    zcosgl = math.cos(zx)
+    zsingl = math.sin(zx)
 
-    sin_eps = math.sin(eps)
-    cos_eps = math.cos(eps)
+    # ------------------------------------------------------------------
+    # 2. Solar, then lunar, perturbation sums
+    # ------------------------------------------------------------------
+    xnoi = 1.0 / mean_motion
+    orbit = (xnoi, sinim, cosim, sinomm, cosomm, emsq, ecc)
 
-    # Solar terms
-    state.sse = ZES * C1SS
-    state.ssi = ZNS * C1SS * sin_eps
-    state.ssl = ZNS * C1SS * cos_eps
-    state.ssg = ZES * C1SS
-    state.ssh = ZNS * C1SS
-    state.ssd = ZNS * C1SS
+    solar = _body_terms(
+        ZCOSGS, ZSINGS, ZCOSIS, ZSINIS, cnodm, snodm, C1SS, *orbit
+    )
+    lunar = _body_terms(
+        zcosgl,
+        zsingl,
+        zcosil,
+        zsinil,
+        zcoshl * cnodm + zsinhl * snodm,
+        snodm * zcoshl - cnodm * zsinhl,
+        C1L,
+        *orbit,
+    )
 
-    # Lunar terms (simplified; full theory applied in dpper)
-    state.sse += ZEL * C1L
-    state.ssi += ZNL * C1L * sin_eps
-    state.ssl += ZNL * C1L * cos_eps
-    state.ssg += ZEL * C1L
-    state.ssh += ZNL * C1L
-    state.ssd += ZNL * C1L
+    terms = dict(zip(_TERM_NAMES, lunar))
+    terms.update(("s" + name, value) for name, value in zip(_TERM_NAMES, solar))
 
-    # Mark as deep-space
-    state.is_deep_space = True
+    ss1, ss2, ss3, ss4, _, ss6, ss7 = solar[:7]
+    sz1, sz2, sz3, sz11, sz12, sz13, sz21, sz22, sz23, sz31, sz32, sz33 = solar[7:]
+    s1, s2, s3, s4, _, s6, s7 = lunar[:7]
+    z1, z2, z3, z11, z12, z13, z21, z22, z23, z31, z32, z33 = lunar[7:]
 
+    # ------------------------------------------------------------------
+    # 3. Long-period coefficients
+    # ------------------------------------------------------------------
+    terms.update(
+        sinim=sinim,
+        cosim=cosim,
+        emsq=emsq,
+        zmol=math.fmod(4.7199672 + 0.22997150 * day - gam, TWO_PI),
+        zmos=math.fmod(6.2565837 + 0.017201977 * day, TWO_PI),
+        # Solar
+        se2=2.0 * ss1 * ss6,
+        se3=2.0 * ss1 * ss7,
+        si2=2.0 * ss2 * sz12,
+        si3=2.0 * ss2 * (sz13 - sz11),
+        sl2=-2.0 * ss3 * sz2,
+        sl3=-2.0 * ss3 * (sz3 - sz1),
+        sl4=-2.0 * ss3 * (-21.0 - 9.0 * emsq) * ZES,
+        sgh2=2.0 * ss4 * sz32,
+        sgh3=2.0 * ss4 * (sz33 - sz31),
+        sgh4=-18.0 * ss4 * ZES,
+        sh2=-2.0 * ss2 * sz22,
+        sh3=-2.0 * ss2 * (sz23 - sz21),
+        # Lunar
+        ee2=2.0 * s1 * s6,
+        e3=2.0 * s1 * s7,
+        xi2=2.0 * s2 * z12,
+        xi3=2.0 * s2 * (z13 - z11),
+        xl2=-2.0 * s3 * z2,
+        xl3=-2.0 * s3 * (z3 - z1),
+        xl4=-2.0 * s3 * (-21.0 - 9.0 * emsq) * ZEL,
+        xgh2=2.0 * s4 * z32,
+        xgh3=2.0 * s4 * (z33 - z31),
+        xgh4=-18.0 * s4 * ZEL,
+        xh2=-2.0 * s2 * z22,
+        xh3=-2.0 * s2 * (z23 - z21),
+    )
+    return terms
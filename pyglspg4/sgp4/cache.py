@@ -0,0 +1,352 @@
+# Copyright (C) 2025-2026 Kris Kirby, KE4AHR
+# SPDX-License-Identifier: LGPL-3.0-or-later
+#
+# Persistent cache of initialized SGP-4 records
+#
+# Stores SGP4Record and SDP4Record coefficient sets in a compact
+# binary file that is memory-mapped on open, so a cold start over an
+# unchanged catalog is an mmap plus one binary search per TLE instead
+# of a full initialization. Opening reads only the header.
+#
+# File layout (little-endian):
+#
+#   header   magic (8s) | entry count (u4) | field count (u4)
+#            | last-used clock (u8) | layout digest (16s)
+#   index    key (16s) | record offset (u8) | last used (u8)
+#            | is_deep_space (u1) | padding (7x)      sorted by key
+#   records  PROPAGATION_FIELDS (f8 each)
+#            [ | remaining DEEP_SPACE_FIELDS (f8 each) ]
+#
+# Deep-space records carry the rest of their SDP4Record (lunar-solar
+# and resonance setup, irez stored as a float), so near-Earth records
+# stay short. Records are stored in index order.
+#
+# Keys are a BLAKE2b digest of the raw TLE lines and the library
+# version, so a new release never reads coefficients produced by an
+# older initializer. Least recently used entries are evicted when the
+# cache is saved with more than max_entries records.
+#
+# The cache is opt-in: nothing in the library reads or writes it unless
+# a StateCache is passed in explicitly.
+
+from __future__ import annotations
+
+import hashlib
+import mmap
+import os
+import struct
+import tempfile
+import threading
+from importlib.metadata import PackageNotFoundError, version
+from typing import Dict, Optional, Tuple, Union
+
+from pyglspg4.sdp4.record import DEEP_SPACE_FIELDS, SDP4Record
+from pyglspg4.sgp4.record import PROPAGATION_FIELDS, SGP4Record
+
+
+MAGIC = b"PGS4SC03"
+
+# SDP4Record fields stored after the near-Earth ones
+_DEEP_SPACE_TAIL = DEEP_SPACE_FIELDS[len(PROPAGATION_FIELDS):]
+
+_HEADER = struct.Struct("<8sIIQ16s")
+_INDEX = struct.Struct("<16sQQ?7x")
+_ENTRY = struct.Struct("<" + "d" * len(PROPAGATION_FIELDS))
+_TAIL = struct.Struct("<" + "d" * len(_DEEP_SPACE_TAIL))
+
+
+def _library_version() -> str:
+    try:
+        return version("pyglspg4")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+LIBRARY_VERSION = _library_version()
+
+Record = Union[SGP4Record, SDP4Record]
+
+# Changes whenever the record layout or the library version changes
+_LAYOUT_DIGEST = hashlib.blake2b(
+    (LIBRARY_VERSION + "|" + ",".join(DEEP_SPACE_FIELDS)).encode("ascii"),
+    digest_size=16,
+).digest()
+
+
+def cache_key(line1: str, line2: str) -> bytes:
+    """
+    Return the 16-byte cache key for a TLE line pair.
+
+    Trailing whitespace is ignored.
+    """
+    text = "\n".join((LIBRARY_VERSION, line1.rstrip(), line2.rstrip()))
+    return hashlib.blake2b(text.encode("ascii"), digest_size=16).digest()
+
+
+class StateCache:
+    """
+    Memory-mapped cache of initialized SGP-4 and SDP-4 records.
+
+    Args:
+        path: Cache file location. The file is created on first save.
+        max_entries: Upper bound on the number of records kept on disk
+
+    Lookups read straight from the mapped file; new records and access
+    times are held in memory until save(). A StateCache may be shared
+    between threads.
+    """
+
+    def __init__(self, path, max_entries: int = 65536) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be positive")
+
+        self.path = os.fspath(path)
+        self.max_entries = max_entries
+
+        self._lock = threading.Lock()
+        self._file = None
+        self._map = None
+        self._count = 0
+        self._pending: Dict[bytes, SGP4Record] = {}
+        self._used: Dict[bytes, int] = {}
+        self._clock = 0
+
+        self._open()
+
+    # ------------------------------------------------------------------
+    # Context management
+    # ------------------------------------------------------------------
+
+    def __enter__(self) -> "StateCache":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.save()
+        self.close()
+
+    def close(self) -> None:
+        """
+        Release the memory map without saving.
+        """
+        with self._lock:
+            self._unmap()
+
+    # ------------------------------------------------------------------
+    # Lookup
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        with self._lock:
+            added = sum(
+                1 for key in self._pending if self._find(key) is None
+            )
+            return self._count + added
+
+    def __contains__(self, lines: Tuple[str, str]) -> bool:
+        key = cache_key(*lines)
+        with self._lock:
+            return key in self._pending or self._find(key) is not None
+
+    def get(self, line1: str, line2: str) -> Optional[Record]:
+        """
+        Return the cached record for a TLE line pair, or None.
+        """
+        key = cache_key(line1, line2)
+        with self._lock:
+            record = self._pending.get(key)
+            if record is None:
+                slot = self._find(key)
+                if slot is None:
+                    return None
+                record = self._read(slot)
+            self._touch(key)
+            return record
+
+    def put(self, line1: str, line2: str, record: Record) -> None:
+        """
+        Add or replace the record for a TLE line pair.
+        """
+        key = cache_key(line1, line2)
+        with self._lock:
+            self._pending[key] = record
+            self._touch(key)
+
+    def get_or_initialize(self, line1: str, line2: str) -> Record:
+        """
+        Return the cached record, initializing and caching it on a miss.
+
+        Deep-space objects get their full SDP4Record, so a hit skips
+        the lunar-solar and resonance setup as well.
+        """
+        record = self.get(line1, line2)
+        if record is not None:
+            return record
+
+        from pyglspg4.tle.parser import parse_tle
+        from pyglspg4.sgp4.initializer import initialize_sgp4
+
+        state = initialize_sgp4(parse_tle(line1, line2))
+        if state.is_deep_space:
+            record = state.deep_space_state
+        else:
+            record = SGP4Record.from_state(state)
+        self.put(line1, line2, record)
+        return record
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def save(self) -> None:
+        """
+        Write the cache to disk, evicting least recently used entries.
+
+        The file is replaced atomically, so concurrent readers keep a
+        consistent view of the previous contents.
+        """
+        with self._lock:
+            # key -> (record bytes, last used, is_deep_space)
+            entries = {}
+            for slot in range(self._count):
+                key, offset, used, deep = self._slot(slot)
+                entries[key] = (
+                    self._map[offset:offset + _record_size(deep)],
+                    self._used.get(key, used),
+                    deep,
+                )
+            for key, record in self._pending.items():
+                entries[key] = (
+                    _pack(record),
+                    self._used.get(key, 0),
+                    record.is_deep_space,
+                )
+
+            # Least recently used entries are evicted; the survivors
+            # are written in key order
+            kept = sorted(entries, key=lambda k: entries[k][1])
+            keys = sorted(kept[-self.max_entries:])
+
+            directory = os.path.dirname(os.path.abspath(self.path))
+            fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(
+                        _HEADER.pack(
+                            MAGIC, len(keys), len(DEEP_SPACE_FIELDS),
+                            self._clock, _LAYOUT_DIGEST,
+                        )
+                    )
+                    offset = _HEADER.size + len(keys) * _INDEX.size
+                    for key in keys:
+                        data, used, deep = entries[key]
+                        f.write(_INDEX.pack(key, offset, used, deep))
+                        offset += len(data)
+                    for key in keys:
+                        f.write(entries[key][0])
+                os.replace(tmp, self.path)
+            except BaseException:
+                os.unlink(tmp)
+                raise
+
+            self._unmap()
+            self._pending.clear()
+            self._used = {}
+            self._open_locked()
+
+    def _open(self) -> None:
+        with self._lock:
+            self._open_locked()
+
+    def _open_locked(self) -> None:
+        try:
+            f = open(self.path, "rb")
+        except FileNotFoundError:
+            return
+
+        size = os.fstat(f.fileno()).st_size
+        if size < _HEADER.size:
+            f.close()
+            return
+
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, count, nfields, clock, digest = _HEADER.unpack_from(mapped, 0)
+        if (
+            magic != MAGIC
+            or nfields != len(DEEP_SPACE_FIELDS)
+            or digest != _LAYOUT_DIGEST
+            or size < _HEADER.size + count * _INDEX.size
+        ):
+            # Stale or foreign file; it is overwritten on the next save
+            mapped.close()
+            f.close()
+            return
+
+        self._file = f
+        self._map = mapped
+        self._count = count
+        self._clock = max(self._clock, clock)
+
+        # Records follow the index in order, so the last one ends the file
+        end = _HEADER.size + count * _INDEX.size
+        if count:
+            _, offset, _, deep = self._slot(count - 1)
+            end = offset + _record_size(deep)
+        if end != size:
+            # Truncated file
+            self._unmap()
+
+    def _unmap(self) -> None:
+        if self._map is not None:
+            self._map.close()
+            self._file.close()
+        self._map = None
+        self._file = None
+        self._count = 0
+
+    def _slot(self, slot: int) -> Tuple[bytes, int, int, bool]:
+        # (key, record offset, last used, is_deep_space) of index slot
+        return _INDEX.unpack_from(self._map, _HEADER.size + slot * _INDEX.size)
+
+    def _find(self, key: bytes) -> Optional[int]:
+        # Binary search of the sorted on-disk index
+        mapped = self._map
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            start = _HEADER.size + mid * _INDEX.size
+            probe = mapped[start:start + 16]
+            if probe < key:
+                lo = mid + 1
+            elif probe > key:
+                hi = mid
+            else:
+                return mid
+        return None
+
+    def _read(self, slot: int) -> Record:
+        _, offset, _, deep = self._slot(slot)
+        values = _ENTRY.unpack_from(self._map, offset)
+        if not deep:
+            return SGP4Record(*values, is_deep_space=False)
+
+        *tail, irez = _TAIL.unpack_from(self._map, offset + _ENTRY.size)
+        return SDP4Record(*values, *tail, irez=int(irez))
+
+    def _touch(self, key: bytes) -> None:
+        self._clock += 1
+        self._used[key] = self._clock
+
+
+def _record_size(deep: bool) -> int:
+    return _ENTRY.size + (_TAIL.size if deep else 0)
+
+
+def _pack(record: Record) -> bytes:
+    entry = _ENTRY.pack(
+        *(getattr(record, name) for name in PROPAGATION_FIELDS)
+    )
+    if not record.is_deep_space:
+        return entry
+    return entry + _TAIL.pack(
+        *(float(getattr(record, name)) for name in _DEEP_SPACE_TAIL)
+    )
@@ -10,145 +10,260 @@
 #   - Convert TLE elements into internal SGP-4 state
 #   - Compute derived constants
 #   - Apply near-Earth vs deep-space classification
-#   - Prepare all coefficients required for propagation
+#   - Prepare all coefficients required for propagation, including
+#     the SDP-4 record of deep-space objects
 #
 # This file must be executed exactly once per TLE before propagation.
 
 from __future__ import annotations
 
-import math
-
+from pyglspg4.backend.python import PYTHON
 from pyglspg4.constants import (
     AE,
+    EARTH_RADIUS_KM,
     XKE,
     CK2,
     CK4,
     QOMS2T,
     S,
     TWO_PI,
+    DEG2RAD,
+    MINUTES_PER_DAY,
+    is_deep_space,
 )
+from pyglspg4.sdp4.initializer import initialize_deep_space
 from pyglspg4.sgp4.state import SGP4State
+from pyglspg4.time.julian import calendar_to_julian
 
 
-def initialize(state: SGP4State) -> None:
+def initialize(state: SGP4State) -> SGP4State:
     """
     Initialize an SGP-4 state from parsed TLE data.
 
     Parameters
     ----------
-    state : SGP4State
-        State object populated with raw TLE values.
-        Modified in-place.
+    state : SGP4State or TLE
+        State object populated with raw TLE values, modified
+        in-place. A parsed TLE is converted with state_from_tle.
+        Deep-space states also receive their SDP4Record in
+        deep_space_state.
+
+    Returns
+    -------
+    SGP4State
+        The initialized state
     """
 
+    if not isinstance(state, SGP4State):
+        state = state_from_tle(state)
+
+    # The deep-space initializer reads the epoch elements, so it runs
+    # before they are adjusted below
+    if state.is_deep_space:
+        state.deep_space_state = initialize_deep_space(state)
+
+    vars(state).update(initialize_kernel(PYTHON, state))
+
+    state.initialized = True
+
+    return state
+
+
+def initialize_kernel(backend, elements) -> dict:
+    """
+    SGP-4 initialization on the operands of a MathBackend.
+
+    With the pure-Python backend the elements are those of one state;
+    with an array backend they may be columns of many states. The
+    deep-space setup is not part of the kernel (see initialize).
+
+    Parameters
+    ----------
+    backend : MathBackend
+        Backend providing the math operations
+    elements : SGP4State or column namespace
+        Object with the epoch elements inclination, raan,
+        eccentricity, arg_perigee, mean_anomaly, mean_motion and bstar
+        (radians, radians per minute)
+
+    Returns
+    -------
+    dict
+        SGP4State field name -> initialized value, including the
+        recovered mean motion and the normalized angles
+    """
+
+    xp = backend
+    mean_motion = elements.mean_motion
+    eccentricity = elements.eccentricity
+
     # ------------------------------------------------------------------
     # 1. Recover original mean motion and semi-major axis
     # ------------------------------------------------------------------
-    state.a1 = (XKE / state.mean_motion) ** (2.0 / 3.0)
+    a1 = (XKE / mean_motion) ** (2.0 / 3.0)
 
-    cosi0 = math.cos(state.inclination)
+    cosi0 = xp.cos(elements.inclination)
     theta2 = cosi0 * cosi0
 
-    beta0 = math.sqrt(1.0 - state.eccentricity ** 2)
+    beta0 = xp.sqrt(1.0 - eccentricity ** 2)
     temp = (1.5 * CK2 * (3.0 * theta2 - 1.0)) / (beta0 ** 3)
 
-    state.del1 = temp / (state.a1 ** 2)
-    state.a0 = state.a1 * (1.0 - state.del1 * (0.5 * (2.0 / 3.0) +
-                                               state.del1 * (1.0 +
-                                               134.0 / 81.0 * state.del1)))
+    del1 = temp / (a1 ** 2)
+    a0 = a1 * (1.0 - del1 * (0.5 * (2.0 / 3.0) +
+                             del1 * (1.0 + 134.0 / 81.0 * del1)))
 
-    state.del0 = temp / (state.a0 ** 2)
-    state.mean_motion = state.mean_motion / (1.0 + state.del0)
+    del0 = temp / (a0 ** 2)
+    mean_motion = mean_motion / (1.0 + del0)
 
-    state.semi_major_axis = state.a0
+    semi_major_axis = a0
 
     # ------------------------------------------------------------------
     # 2. Perigee and atmospheric parameters
     # ------------------------------------------------------------------
-    perigee_km = (state.semi_major_axis * (1.0 - state.eccentricity) - AE) * AE
+    perigee_km = (
+        (semi_major_axis * (1.0 - eccentricity) - AE)
+        * EARTH_RADIUS_KM
+    )
 
-    if perigee_km < 156.0:
-        state.s = max(perigee_km - 78.0, 20.0)
-        state.qoms2t = ((120.0 - state.s) * AE) ** 4
-        state.s = state.s / AE + AE
-    else:
-        state.s = S
-        state.qoms2t = QOMS2T
+    # Both branches are evaluated; low perigees select the first
+    low_perigee = perigee_km < 156.0
+    s_low = xp.maximum(perigee_km - 78.0, 20.0)
+    qoms2t = xp.where(
+        low_perigee, ((120.0 - s_low) / EARTH_RADIUS_KM) ** 4, QOMS2T
+    )
+    s = xp.where(low_perigee, s_low / EARTH_RADIUS_KM + AE, S)
 
     # ------------------------------------------------------------------
     # 3. Drag-related coefficients
     # ------------------------------------------------------------------
-    pinvsq = 1.0 / (state.semi_major_axis ** 2 * beta0 ** 4)
-
-    tsi = 1.0 / (state.semi_major_axis - state.s)
-    eta = state.semi_major_axis * state.eccentricity * tsi
+    tsi = 1.0 / (semi_major_axis - s)
+    eta = semi_major_axis * eccentricity * tsi
     etasq = eta * eta
-    eeta = state.eccentricity * eta
+    eeta = eccentricity * eta
 
     psisq = abs(1.0 - etasq)
-    coef = state.qoms2t * tsi ** 4
+    coef = qoms2t * tsi ** 4
     coef1 = coef / (psisq ** 3.5)
 
-    state.cc2 = (
-        coef1 * state.mean_motion *
-        (state.semi_major_axis *
+    cc2 = (
+        coef1 * mean_motion *
+        (semi_major_axis *
          (1.0 + 1.5 * etasq + eeta * (4.0 + etasq)) +
          0.75 * CK2 * tsi / psisq *
          (3.0 * theta2 - 1.0) *
          (8.0 + 3.0 * etasq * (8.0 + etasq)))
     )
 
-    state.cc1 = state.bstar * state.cc2
+    cc1 = elements.bstar * cc2
 
     # ------------------------------------------------------------------
     # 4. Secular rates
     # ------------------------------------------------------------------
-    state.xmdot = (
-        state.mean_motion +
-        0.5 * temp * beta0 * state.mean_motion
-    )
-
-    state.omgdot = (
-        -0.5 * temp * (1.0 - 5.0 * theta2)
-    )
-
-    state.xnodot = (
-        -temp * cosi0
-    )
+    xmdot = mean_motion + 0.5 * temp * beta0 * mean_motion
+    omgdot = -0.5 * temp * (1.0 - 5.0 * theta2)
+    xnodot = -temp * cosi0
 
     # ------------------------------------------------------------------
     # 5. Higher-order drag terms
     # ------------------------------------------------------------------
-    if state.eccentricity > 1e-4:
-        state.cc3 = (
-            -2.0 * coef * tsi * CK2 *
-            state.mean_motion * math.sin(state.arg_perigee) /
-            state.eccentricity
-        )
-    else:
-        state.cc3 = 0.0
-
-    state.cc4 = (
-        2.0 * state.mean_motion * coef1 *
-        state.semi_major_axis * beta0 ** 2 *
+    # The clamped divisor only matters where cc3 is zeroed anyway
+    cc3 = xp.where(
+        eccentricity > 1e-4,
+        -2.0 * coef * tsi * CK2 *
+        mean_motion * xp.sin(elements.arg_perigee) /
+        xp.maximum(eccentricity, 1e-4),
+        0.0,
+    )
+
+    cc4 = (
+        2.0 * mean_motion * coef1 *
+        semi_major_axis * beta0 ** 2 *
         (eta * (2.0 + 0.5 * etasq) +
-         state.eccentricity * (0.5 + 2.0 * etasq) -
-         CK2 * tsi / (state.semi_major_axis * psisq) *
+         eccentricity * (0.5 + 2.0 * etasq) -
+         CK2 * tsi / (semi_major_axis * psisq) *
          (3.0 * theta2 - 1.0) *
          (8.0 + 3.0 * etasq * (8.0 + etasq)))
     )
 
-    state.cc5 = (
-        2.0 * coef1 * state.semi_major_axis * beta0 ** 2 *
+    cc5 = (
+        2.0 * coef1 * semi_major_axis * beta0 ** 2 *
         (1.0 + 2.75 * (etasq + eeta) + eeta * etasq)
     )
 
     # ------------------------------------------------------------------
     # 6. Final normalization
     # ------------------------------------------------------------------
-    state.mean_anomaly %= TWO_PI
-    state.arg_perigee %= TWO_PI
-    state.raan %= TWO_PI
+    return {
+        "a1": a1,
+        "del1": del1,
+        "a0": a0,
+        "del0": del0,
+        "mean_motion": mean_motion,
+        "semi_major_axis": semi_major_axis,
+        "s": s,
+        "qoms2t": qoms2t,
+        "cc1": cc1,
+        "cc2": cc2,
+        "cc3": cc3,
+        "cc4": cc4,
+        "cc5": cc5,
+        "xmdot": xmdot,
+        "omgdot": omgdot,
+        "xnodot": xnodot,
+        "mean_anomaly": elements.mean_anomaly % TWO_PI,
+        "arg_perigee": elements.arg_perigee % TWO_PI,
+        "raan": elements.raan % TWO_PI,
+    }
 
-    state.initialized = True
 
+def state_from_tle(tle) -> SGP4State:
+    """
+    Build an uninitialized SGP-4 state from a parsed TLE.
+
+    Angles are converted from degrees to radians and mean motion
+    from revolutions per day to radians per minute.
+
+    Parameters
+    ----------
+    tle : TLE
+        Parsed TLE object
+
+    Returns
+    -------
+    SGP4State
+        State populated with epoch elements
+    """
+
+    epoch_jd = (
+        calendar_to_julian(tle.epoch_year, 1, 1).jd - 1.0 + tle.epoch_day
+    )
+
+    return SGP4State(
+        epoch_jd=epoch_jd,
+        inclination=tle.inclination * DEG2RAD,
+        raan=tle.raan * DEG2RAD,
+        eccentricity=tle.eccentricity,
+        arg_perigee=tle.arg_perigee * DEG2RAD,
+        mean_anomaly=tle.mean_anomaly * DEG2RAD,
+        mean_motion=tle.mean_motion * TWO_PI / MINUTES_PER_DAY,
+        bstar=tle.bstar,
+        is_deep_space=is_deep_space(tle.mean_motion),
+    )
+
+
+def initialize_sgp4(tle) -> SGP4State:
+    """
+    Build and initialize an SGP-4 state from a parsed TLE.
+
+    Parameters
+    ----------
+    tle : TLE
+        Parsed TLE object
+
+    Returns
+    -------
+    SGP4State
+        Initialized state ready for propagation
+    """
+
+    return initialize(state_from_tle(tle))
@@ -12,17 +12,21 @@
 
 from __future__ import annotations
 
-import math
 from typing import Tuple
 
+from pyglspg4.backend.python import PYTHON
 from pyglspg4.constants import (
     XKE,
     CK2,
     CK4,
     AE,
+    EARTH_RADIUS_KM,
     TWO_PI,
+    SGP4_ERROR_NONE,
+    SGP4_ERROR_ECCENTRICITY,
 )
 from pyglspg4.sgp4.state import SGP4State
+from pyglspg4.math.numerics import solve_kepler_backend
 from pyglspg4.math.vectors import teme_position_velocity
 
 
@@ -37,9 +41,13 @@ def propagate_near_earth(
     """
     Propagate a near-Earth satellite using SGP-4.
 
+    The state is only read, never written: results depend solely on
+    the epoch elements and tsince_minutes, so one initialized state
+    may be shared by any number of threads or processes.
+
     Parameters
     ----------
-    state : SGP4State
+    state : SGP4State or SGP4Record
         Initialized SGP-4 state
     tsince_minutes : float
         Minutes since TLE epoch
@@ -53,68 +61,97 @@ def propagate_near_earth(
     error_code : int
         SGP4 error code
     """
+    return near_earth_kernel(PYTHON, state, tsince_minutes)
+
+
+def near_earth_kernel(backend, elements, tsince_minutes):
+    """
+    SGP-4 near-Earth propagation on the operands of a MathBackend.
+
+    With the pure-Python backend the elements are those of one state
+    and tsince_minutes is a float. With an array backend each element
+    and tsince_minutes may be arrays that broadcast together, e.g.
+    (N, 1) columns against (N, T) or (1, T) times.
+
+    Parameters
+    ----------
+    backend : MathBackend
+        Backend providing the math operations
+    elements : SGP4State, SGP4Record or column namespace
+        Object with the PROPAGATION_FIELDS attributes
+    tsince_minutes : float or array_like
+        Minutes since TLE epoch
+
+    Returns
+    -------
+    position_km : (x, y, z)
+        TEME position components (km)
+    velocity_km_s : (vx, vy, vz)
+        TEME velocity components (km/s)
+    error_code : int or array
+        SGP4 error codes; failed samples have zero vectors
+    """
+
+    xp = backend
+    state = elements
 
     # ------------------------------------------------------------------
     # 1. Secular effects (drag, J2)
     # ------------------------------------------------------------------
     t = tsince_minutes
 
-    state.mean_anomaly = (
-        state.mean_anomaly +
-        state.xmdot * t
-    )
-
-    state.arg_perigee = (
-        state.arg_perigee +
-        state.omgdot * t
-    )
-
-    state.raan = (
-        state.raan +
-        state.xnodot * t
-    )
+    mean_anomaly = state.mean_anomaly + state.xmdot * t
+    arg_perigee = state.arg_perigee + state.omgdot * t
+    raan = state.raan + state.xnodot * t
 
-    # Drag terms
+    # Drag terms (t2cof = 1.5 * cc1)
     tempa = 1.0 - state.cc1 * t
     tempe = state.bstar * state.cc4 * t
-    templ = state.cc5 * t
+    templ = 1.5 * state.cc1 * t * t
 
-    state.mean_anomaly += templ
-    state.eccentricity -= tempe
+    mean_anomaly = xp.fma(state.mean_motion, templ, mean_anomaly)
+    eccentricity = xp.maximum(state.eccentricity - tempe, 0.0)
 
-    if state.eccentricity < 0.0:
-        state.eccentricity = 0.0
+    failed = eccentricity >= 1.0
+    any_failed = xp.any(failed)
+    if not any_failed:
+        error = SGP4_ERROR_NONE
+    elif not xp.is_array:
+        return (0.0, 0.0, 0.0), (0.0, 0.0, 0.0), SGP4_ERROR_ECCENTRICITY
+    else:
+        error = xp.where(failed, SGP4_ERROR_ECCENTRICITY, SGP4_ERROR_NONE)
+        eccentricity = xp.where(failed, 0.0, eccentricity)
 
     # ------------------------------------------------------------------
     # 2. Solve Kepler’s Equation
     # ------------------------------------------------------------------
-    M = state.mean_anomaly % TWO_PI
-    E = M
-    for _ in range(10):
-        f = E - state.eccentricity * math.sin(E) - M
-        fp = 1.0 - state.eccentricity * math.cos(E)
-        E -= f / fp
+    # As in the reference implementation, the final iterate is used
+    # even if the iteration cap is reached.
+    E, _ = solve_kepler_backend(
+        xp, xp.mod(mean_anomaly, TWO_PI), eccentricity
+    )
 
-    sinE = math.sin(E)
-    cosE = math.cos(E)
+    sinE = xp.sin(E)
+    cosE = xp.cos(E)
 
     # ------------------------------------------------------------------
     # 3. Position in orbital plane
     # ------------------------------------------------------------------
-    beta = math.sqrt(1.0 - state.eccentricity ** 2)
-    r = state.semi_major_axis * (1.0 - state.eccentricity * cosE)
+    a = state.semi_major_axis * tempa * tempa
+    beta = xp.sqrt(1.0 - eccentricity ** 2)
+    r = a * (1.0 - eccentricity * cosE)
 
-    x_orb = state.semi_major_axis * (cosE - state.eccentricity)
-    y_orb = state.semi_major_axis * beta * sinE
+    x_orb = a * (cosE - eccentricity)
+    y_orb = a * beta * sinE
 
     # ------------------------------------------------------------------
     # 4. Velocity in orbital plane
     # ------------------------------------------------------------------
-    rdot = XKE * math.sqrt(state.semi_major_axis) * state.eccentricity * sinE / r
-    rfdot = XKE * math.sqrt(state.semi_major_axis) * beta / r
+    # Time derivative of (x_orb, y_orb): dE/dt = XKE / (sqrt(a) * r)
+    edot_a = XKE * xp.sqrt(a) / r
 
-    vx_orb = -rdot * sinE + rfdot * cosE
-    vy_orb = rdot * cosE + rfdot * sinE
+    vx_orb = -edot_a * sinE
+    vy_orb = edot_a * beta * cosE
 
     # ------------------------------------------------------------------
     # 5. Rotate into TEME frame
@@ -125,22 +162,19 @@ def propagate_near_earth(
         vx_orb,
         vy_orb,
         state.inclination,
-        state.raan,
-        state.arg_perigee,
+        raan,
+        arg_perigee,
+        xp,
     )
 
     # ------------------------------------------------------------------
     # 6. Scale to physical units
     # ------------------------------------------------------------------
-    position_km = tuple(p * AE for p in position)
-    velocity_km_s = tuple(v * AE / 60.0 for v in velocity)
-
-    # ------------------------------------------------------------------
-    # 7. Normalize angles
-    # ------------------------------------------------------------------
-    state.mean_anomaly %= TWO_PI
-    state.arg_perigee %= TWO_PI
-    state.raan %= TWO_PI
+    position_km = tuple(p * EARTH_RADIUS_KM for p in position)
+    velocity_km_s = tuple(v * EARTH_RADIUS_KM / 60.0 for v in velocity)
 
-    return position_km, velocity_km_s, 0
+    if any_failed:
+        position_km = tuple(xp.where(failed, 0.0, p) for p in position_km)
+        velocity_km_s = tuple(xp.where(failed, 0.0, v) for v in velocity_km_s)
 
+    return position_km, velocity_km_s, error
@@ -12,17 +12,16 @@
 
 from __future__ import annotations
 
-from typing import Tuple
+import math
+from typing import Iterator, Tuple
 
 from pyglspg4.api.exceptions import SGP4PropagationError
+from pyglspg4.sdp4.propagate import propagate_deep_space
+from pyglspg4.sdp4.record import SDP4Record
 from pyglspg4.sgp4.state import SGP4State
+from pyglspg4.sgp4.record import SGP4Record
 from pyglspg4.sgp4.near_earth import propagate_near_earth
 
-# NOTE:
-# Full SDP-4 deep-space propagation will dispatch here once
-# pyglspg4.sdp4.propagate is finalized.
-# from pyglspg4.sdp4.propagate import propagate_deep_space
-
 
 def propagate(
     state: SGP4State,
@@ -37,8 +36,9 @@ def propagate(
 
     Parameters
     ----------
-    state : SGP4State
-        Initialized SGP-4 state
+    state : SGP4State, SGP4Record or SDP4Record
+        Initialized SGP-4 state (read only). Deep-space states are
+        propagated with SDP-4.
     tsince_minutes : float
         Minutes since epoch (TLE epoch)
 
@@ -52,12 +52,155 @@ def propagate(
         0 on success, non-zero on SGP-4 error
     """
 
-    if not isinstance(state, SGP4State):
-        raise TypeError("state must be an SGP4State")
+    _check_state(state)
+    _check_time(tsince_minutes)
+
+    if state.is_deep_space:
+        return propagate_deep_space(deep_space_record(state), tsince_minutes)
+    return propagate_near_earth(state, tsince_minutes)
+
+
+def deep_space_record(state) -> SDP4Record:
+    """
+    SDP-4 coefficients of an initialized deep-space state.
+
+    Raises SGP4PropagationError for states that do not carry them,
+    such as SGP4Record snapshots of deep-space objects.
+    """
+    if isinstance(state, SDP4Record):
+        return state
+
+    record = getattr(state, "deep_space_state", None)
+    if record is None:
+        raise SGP4PropagationError(
+            "deep-space state carries no SDP-4 coefficients; "
+            "initialize it from its TLE"
+        )
+    return record
+
+
+def grid_size(t0: float, t1: float, step: float) -> int:
+    """
+    Number of samples in the grid t0, t0 + step, ... up to t1 inclusive.
+    """
+    if step == 0.0:
+        raise ValueError("step must be non-zero")
+
+    span = (t1 - t0) / step
+    if span < 0.0:
+        raise ValueError("step must point from t0 towards t1")
+
+    # Tolerate round-off so that t1 is included when it lies on the grid
+    return int(math.floor(span + 1.0e-9)) + 1
+
+
+def iter_grid(
+    state: SGP4State,
+    t0: float,
+    t1: float,
+    step: float,
+) -> Iterator[Tuple[float, Tuple[float, float, float],
+                    Tuple[float, float, float], int]]:
+    """
+    Yield (tsince, position_km, velocity_km_s, error_code) on a time grid.
+
+    Pure-Python counterpart of propagate_grid. Sample k is taken at
+    t0 + k * step, so no round-off accumulates along the grid.
+    """
+
+    _check_state(state)
+    n = grid_size(t0, t1, step)
+    _check_time(t0)
+    _check_time(t0 + (n - 1) * step)
+
+    if state.is_deep_space:
+        kernel = propagate_deep_space
+        state = deep_space_record(state)
+    else:
+        kernel = propagate_near_earth
+
+    for k in range(n):
+        t = t0 + k * step
+        yield (t,) + kernel(state, t)
+
+
+def propagate_grid(
+    state: SGP4State,
+    t0: float,
+    t1: float,
+    step: float,
+    out=None,
+):
+    """
+    Propagate onto a regular time grid in one array pass.
+
+    Parameters
+    ----------
+    state : SGP4State, SGP4Record or SDP4Record
+        Initialized SGP-4 state (read only)
+    t0, t1 : float
+        First and last grid times, minutes since epoch. t1 is included
+        when it falls on the grid.
+    step : float
+        Grid spacing (minutes); negative steps run backwards
+    out : (position, velocity), optional
+        Caller-supplied float64 arrays of shape (T, 3), for example
+        views into a larger buffer, that receive the results
+
+    Returns
+    -------
+    times : (T,) ndarray
+        Grid times (minutes since epoch)
+    position_km : (T, 3) ndarray
+        TEME position vectors (km)
+    velocity_km_s : (T, 3) ndarray
+        TEME velocity vectors (km/s)
+    error_code : (T,) ndarray of int
+        SGP-4 error codes
+
+    Without NumPy the iter_grid generator is returned instead.
+    """
+
+    try:
+        import numpy as np
+    except ImportError:
+        if out is not None:
+            raise
+        return iter_grid(state, t0, t1, step)
+
+    from pyglspg4.sgp4.satrec_array import SatrecArray
+
+    _check_state(state)
+    n = grid_size(t0, t1, step)
+    times = t0 + step * np.arange(n, dtype=np.float64)
+    _check_time(times[-1])
+    _check_time(t0)
+
+    if out is None:
+        position = np.empty((n, 3))
+        velocity = np.empty((n, 3))
+    else:
+        position, velocity = out
+
+    _, _, error = SatrecArray.from_states([state]).propagate(
+        times,
+        out=(position[np.newaxis], velocity[np.newaxis]),
+    )
+
+    return times, position, velocity, error[0]
+
+
+def _check_state(state) -> None:
+    if not isinstance(state, (SGP4State, SGP4Record, SDP4Record)):
+        raise TypeError("state must be an SGP4State, SGP4Record or SDP4Record")
 
     if not state.initialized:
         raise SGP4PropagationError("SGP4State has not been initialized")
 
+
+def _check_time(tsince_minutes: float) -> None:
     # Guard against nonsensical propagation
     if abs(tsince_minutes) > 1.0e8:
-
+        raise SGP4PropagationError(
+            f"tsince_minutes out of range: {tsince_minutes}"
+        )
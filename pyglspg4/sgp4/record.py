@@ -0,0 +1,99 @@
+# Copyright (C) 2025-2026 Kris Kirby, KE4AHR
+# SPDX-License-Identifier: LGPL-3.0-or-later
+#
+# Immutable SGP-4 coefficient record
+#
+# Holds the epoch elements and derived coefficients produced by
+# pyglspg4.sgp4.initializer in a frozen, slot-based record so that
+# one initialization can be shared by any number of propagations,
+# threads, or worker processes.
+#
+# References:
+#   NORAD Spacetrack Report #3
+#   Vallado et al., AIAA 2006-6753
+
+from __future__ import annotations
+
+from dataclasses import dataclass, fields
+
+from pyglspg4.sgp4.state import SGP4State
+
+
+# Fields read by the near-Earth kernel, in storage order
+PROPAGATION_FIELDS = (
+    "epoch_jd",
+    "inclination",
+    "raan",
+    "eccentricity",
+    "arg_perigee",
+    "mean_anomaly",
+    "mean_motion",
+    "bstar",
+    "semi_major_axis",
+    "xmdot",
+    "omgdot",
+    "xnodot",
+    "cc1",
+    "cc4",
+    "cc5",
+)
+
+
+@dataclass(frozen=True)
+class SGP4Record:
+    """
+    Frozen snapshot of an initialized SGP4State.
+
+    Angles are in radians, time in minutes, distances in Earth radii.
+    """
+
+    __slots__ = PROPAGATION_FIELDS + ("is_deep_space",)
+
+    epoch_jd: float
+    inclination: float
+    raan: float
+    eccentricity: float
+    arg_perigee: float
+    mean_anomaly: float
+    mean_motion: float
+    bstar: float
+    semi_major_axis: float
+    xmdot: float
+    omgdot: float
+    xnodot: float
+    cc1: float
+    cc4: float
+    cc5: float
+    is_deep_space: bool
+
+    # Records are always built from initialized states
+    initialized = True
+
+    @classmethod
+    def from_state(cls, state: SGP4State) -> "SGP4Record":
+        """
+        Snapshot an initialized SGP4State.
+        """
+        if not state.initialized:
+            raise ValueError("SGP4State is not initialized")
+
+        return cls(
+            *(getattr(state, name) for name in PROPAGATION_FIELDS),
+            is_deep_space=state.is_deep_space,
+        )
+
+    def to_state(self) -> SGP4State:
+        """
+        Return a fresh, mutable SGP4State carrying these values.
+        """
+        state = SGP4State(**{f.name: getattr(self, f.name) for f in fields(self)})
+        state.initialized = True
+        return state
+
+    # Frozen slotted dataclasses need explicit pickle support on 3.9
+    def __getstate__(self):
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, values) -> None:
+        for name, value in zip(self.__slots__, values):
+            object.__setattr__(self, name, value)
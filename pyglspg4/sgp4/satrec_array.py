@@ -0,0 +1,271 @@
+# Copyright (C) 2025-2026 Kris Kirby, KE4AHR
+# SPDX-License-Identifier: LGPL-3.0-or-later
+#
+# Structure-of-arrays SGP-4 catalog engine
+#
+# Packs the initialized SGP4State coefficients of many satellites
+# into contiguous float64 columns and evaluates the near-Earth
+# propagation model for N satellites x M times as NumPy array
+# operations.
+#
+# The near-Earth model is the backend-generic kernel of
+# pyglspg4.sgp4.near_earth run on the NumPy backend, so results agree
+# with the scalar path to round-off.
+#
+# Deep-space rows keep their SDP4Record next to the columns and are
+# propagated with pyglspg4.sdp4.propagate, so a catalog mixing both
+# regimes is still propagated in one call.
+#
+# References:
+#   NORAD Spacetrack Report #3
+#   Vallado et al., AIAA 2006-6753
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+
+from pyglspg4.backend.numpy import NUMPY
+from pyglspg4.backend.selector import select_backend
+from pyglspg4.constants import TWO_PI, SGP4_ERROR_NONE
+from pyglspg4.sdp4.deep_space_array import DeepSpaceArray
+from pyglspg4.sgp4.near_earth import near_earth_kernel
+from pyglspg4.sgp4.record import PROPAGATION_FIELDS
+from pyglspg4.sgp4.state import SGP4State
+
+
+# SGP4State fields packed as columns, in storage order
+COLUMNS = PROPAGATION_FIELDS
+
+
+class SatrecArray:
+    """
+    Columnar container of initialized SGP-4 states.
+
+    Each attribute named in COLUMNS is a contiguous float64 array of
+    length N. Instances are treated as read-only once built, so a
+    single SatrecArray may be shared between threads.
+
+    deep_space pairs the row index of each deep-space satellite with
+    its SDP4Record; those rows are propagated together with SDP-4 as
+    one DeepSpaceArray.
+    """
+
+    def __init__(
+        self,
+        columns: dict,
+        satnums: Sequence[int] = (),
+        deep_space: Sequence[Tuple[int, object]] = (),
+    ) -> None:
+        n = None
+        for name in COLUMNS:
+            col = np.ascontiguousarray(columns[name], dtype=np.float64)
+            if col.ndim != 1:
+                raise ValueError(f"Column {name} must be one-dimensional")
+            if n is None:
+                n = col.shape[0]
+            elif col.shape[0] != n:
+                raise ValueError("All columns must have the same length")
+            setattr(self, name, col)
+
+        self.size = n or 0
+        # (N, 1) views that broadcast against (1, M) or (N, M) times
+        self._elements = SimpleNamespace(
+            **{name: getattr(self, name)[:, np.newaxis] for name in COLUMNS}
+        )
+        self.satnums = np.asarray(satnums, dtype=np.int64)
+        self.deep_rows = np.array([row for row, _ in deep_space], dtype=np.intp)
+        self.deep_records = tuple(record for _, record in deep_space)
+
+        self._deep_space = (
+            DeepSpaceArray(self.deep_records) if self.deep_records else None
+        )
+
+    def __len__(self) -> int:
+        return self.size
+
+    @classmethod
+    def from_states(
+        cls,
+        states: Sequence[SGP4State],
+        satnums: Sequence[int] = (),
+    ) -> "SatrecArray":
+        """
+        Pack a sequence of initialized SGP4State, SGP4Record or
+        SDP4Record objects.
+        """
+        from pyglspg4.sgp4.propagate import deep_space_record
+
+        for state in states:
+            if not state.initialized:
+                raise ValueError("SGP4State is not initialized")
+
+        deep_space = [
+            (row, deep_space_record(state))
+            for row, state in enumerate(states)
+            if state.is_deep_space
+        ]
+
+        columns = {
+            name: np.fromiter(
+                (getattr(s, name) for s in states),
+                dtype=np.float64,
+                count=len(states),
+            )
+            for name in COLUMNS
+        }
+        return cls(columns, satnums, deep_space)
+
+    @classmethod
+    def from_tles(cls, tles: Sequence) -> "SatrecArray":
+        """
+        Initialize and pack a sequence of parsed TLE objects.
+        """
+        from pyglspg4.sgp4.initializer import initialize_sgp4
+
+        states = [initialize_sgp4(tle) for tle in tles]
+        return cls.from_states(states, [tle.satnum for tle in tles])
+
+    @classmethod
+    def from_catalog(cls, catalog) -> "SatrecArray":
+        """
+        Initialize and pack every record of a TLECatalog.
+
+        Unit conversion and the SGP-4 initializer run on whole
+        columns; only the deep-space setup runs per deep-space record.
+        """
+        from pyglspg4.constants import DEG2RAD, MINUTES_PER_DAY, is_deep_space
+        from pyglspg4.sdp4.initializer import initialize_deep_space
+        from pyglspg4.sgp4.initializer import initialize_kernel
+
+        epoch_jd = np.asarray(catalog.epoch_jd, dtype=np.float64)
+        mean_motion_rev = np.asarray(catalog.mean_motion, dtype=np.float64)
+        elements = {
+            "inclination": np.asarray(catalog.inclination) * DEG2RAD,
+            "raan": np.asarray(catalog.raan) * DEG2RAD,
+            "eccentricity": np.asarray(catalog.eccentricity, dtype=np.float64),
+            "arg_perigee": np.asarray(catalog.arg_perigee) * DEG2RAD,
+            "mean_anomaly": np.asarray(catalog.mean_anomaly) * DEG2RAD,
+            "mean_motion": mean_motion_rev * TWO_PI / MINUTES_PER_DAY,
+            "bstar": np.asarray(catalog.bstar, dtype=np.float64),
+        }
+
+        columns = dict(elements, epoch_jd=epoch_jd)
+        columns.update(initialize_kernel(NUMPY, SimpleNamespace(**elements)))
+
+        # The deep-space initializer reads the epoch elements
+        deep_space = [
+            (
+                row,
+                initialize_deep_space(
+                    SGP4State(
+                        epoch_jd=float(epoch_jd[row]),
+                        is_deep_space=True,
+                        **{k: float(v[row]) for k, v in elements.items()},
+                    )
+                ),
+            )
+            for row in range(len(catalog))
+            if is_deep_space(float(mean_motion_rev[row]))
+        ]
+        return cls(columns, catalog.satnum, deep_space)
+
+    def tsince_at(self, jd) -> np.ndarray:
+        """
+        Minutes since each satellite's epoch for Julian date(s) jd.
+
+        jd may also be a one-dimensional TimeArray, whose two-part
+        dates are differenced without forming a single float.
+
+        Returns an (N, M) array for M requested dates.
+        """
+        if hasattr(jd, "minutes_since_epoch"):
+            return jd.minutes_since_epoch(self.epoch_jd)
+
+        jd = np.atleast_1d(np.asarray(jd, dtype=np.float64))
+        return (jd[np.newaxis, :] - self.epoch_jd[:, np.newaxis]) * 1440.0
+
+    def propagate(
+        self,
+        tsince_minutes,
+        out: Optional[Tuple[np.ndarray, np.ndarray]] = None,
+        backend=None,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Propagate every satellite to the requested times.
+
+        Parameters
+        ----------
+        tsince_minutes : float, (M,) or (N, M) array
+            Minutes since each satellite's TLE epoch. A scalar or 1-D
+            array is shared by all satellites; a 2-D array gives
+            per-satellite times.
+        out : (position, velocity), optional
+            Preallocated float64 arrays of shape (N, M, 3) that receive
+            the results. They are returned in place of new arrays.
+        backend : str or MathBackend, optional
+            Array backend for the near-Earth rows; NumPy by default.
+            Backends with a fused near-Earth kernel, such as "numba",
+            evaluate each sample in one compiled loop.
+
+        Returns
+        -------
+        position_km : (N, M, 3) ndarray
+            TEME position vectors (km)
+        velocity_km_s : (N, M, 3) ndarray
+            TEME velocity vectors (km/s)
+        error_code : (N, M) ndarray of int
+            SGP-4 error codes
+        """
+
+        t = np.asarray(tsince_minutes, dtype=np.float64)
+        if t.ndim <= 1:
+            t = np.atleast_1d(t)[np.newaxis, :]
+        elif t.shape[0] != self.size:
+            raise ValueError("tsince_minutes rows must match satellite count")
+
+        xp = NUMPY if backend is None else select_backend(backend)
+        if not xp.is_array:
+            raise ValueError("SatrecArray requires an array backend")
+
+        shape = np.broadcast_shapes(t.shape, (self.size, 1))
+        if out is None:
+            position = np.empty(shape + (3,))
+            velocity = np.empty(shape + (3,))
+        else:
+            position, velocity = out
+            for buf in out:
+                if buf.shape != shape + (3,) or buf.dtype != np.float64:
+                    raise ValueError(
+                        f"out arrays must be float64 with shape {shape + (3,)}"
+                    )
+
+        fused = getattr(xp, "fused_near_earth", None)
+        if fused is not None:
+            error = fused(self._elements, t, position, velocity)
+        else:
+            pos, vel, error = near_earth_kernel(xp, self._elements, t)
+            xp.stack(pos, out=position)
+            xp.stack(vel, out=velocity)
+            error = np.broadcast_to(error, shape).copy()
+
+        self._propagate_deep_space(t, position, velocity, error)
+
+        failed = error != SGP4_ERROR_NONE
+        position[failed] = 0.0
+        velocity[failed] = 0.0
+
+        return position, velocity, error
+
+    def _propagate_deep_space(self, t, position, velocity, error) -> None:
+        # Overwrite the near-Earth results of deep-space rows in place
+        if self._deep_space is None:
+            return
+
+        rows = self.deep_rows
+        times = t[rows] if t.shape[0] == self.size else t[0]
+        position[rows], velocity[rows], error[rows] = (
+            self._deep_space.propagate(times)
+        )
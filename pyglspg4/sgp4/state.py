@@ -91,7 +91,7 @@ class SGP4State:
     xmcof: float = 0.0
 
     # ------------------------------------------------------------------
-    # Deep-space placeholders (SDP-4)
+    # Deep-space coefficients (SDP4Record, deep-space objects only)
     # ------------------------------------------------------------------
     deep_space_state: Optional[object] = None
 
@@ -12,9 +12,14 @@ used internally for epoch handling and time propagation.
 
 from __future__ import annotations
 
+import datetime
 from dataclasses import dataclass
 
 
+# Julian Date of the Modified Julian Date origin
+MJD_OFFSET = 2400000.5
+
+
 @dataclass(frozen=True)
 class JulianDate:
     """
@@ -61,3 +66,50 @@ def calendar_to_julian(
 
     return JulianDate(jd)
 
+
+
+def datetime_to_jd(dt: datetime.datetime) -> float:
+    """
+    Convert a datetime to a Julian Date.
+
+    Naive datetimes are taken to be UTC; aware datetimes are
+    converted to UTC first.
+    """
+
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(datetime.timezone.utc)
+
+    return calendar_to_julian(
+        dt.year,
+        dt.month,
+        dt.day,
+        dt.hour,
+        dt.minute,
+        dt.second + dt.microsecond * 1.0e-6,
+    ).jd
+
+
+def jd_to_datetime(jd: float) -> datetime.datetime:
+    """
+    Convert a Julian Date to a naive UTC datetime.
+    """
+
+    return _J2000_DATETIME + datetime.timedelta(days=jd - _J2000_JD)
+
+
+def jd_to_mjd(jd: float) -> float:
+    """
+    Convert a Julian Date to a Modified Julian Date.
+    """
+    return jd - MJD_OFFSET
+
+
+def mjd_to_jd(mjd: float) -> float:
+    """
+    Convert a Modified Julian Date to a Julian Date.
+    """
+    return mjd + MJD_OFFSET
+
+
+_J2000_DATETIME = datetime.datetime(2000, 1, 1, 12, 0, 0)
+_J2000_JD = 2451545.0
@@ -0,0 +1,281 @@
+# Copyright (C) 2025-2026 Kris Kirby, KE4AHR
+# SPDX-License-Identifier: LGPL-3.0-or-later
+#
+# This file is part of Pyglspg4.
+
+"""
+Two-part time arrays.
+
+A TimeArray holds Julian Dates as parallel arrays of whole days and
+day fractions in [0, 1), so sample times keep sub-microsecond
+resolution that a single float64 Julian Date (about 20 microseconds
+near the present epoch) cannot. Times carry a scale, "utc", "ut1" or
+"tt", and convert between them with the built-in leap second table
+and an EOPTable for UT1-UTC.
+
+minutes_since_epoch() turns one TimeArray into the (N, T) tsince
+grid for N satellites at once, which is what SatrecArray.propagate
+consumes.
+
+Requires NumPy.
+"""
+
+from __future__ import annotations
+
+import datetime
+from dataclasses import dataclass
+
+import numpy as np
+
+from pyglspg4.time.julian import MJD_OFFSET
+
+
+SCALES = ("utc", "ut1", "tt")
+
+# TT - TAI (s)
+TT_MINUS_TAI = 32.184
+
+# Julian Date of 1970-01-01T00:00 is 2440587.5
+_UNIX_EPOCH_WHOLE = 2440587.0
+_NS_PER_DAY = 86_400_000_000_000
+
+# (MJD from which it applies, TAI - UTC in seconds). Dates before 1972
+# use the first value.
+LEAP_SECONDS = (
+    (41317, 10.0), (41499, 11.0), (41683, 12.0), (42048, 13.0),
+    (42413, 14.0), (42778, 15.0), (43144, 16.0), (43509, 17.0),
+    (43874, 18.0), (44239, 19.0), (44786, 20.0), (45151, 21.0),
+    (45516, 22.0), (46247, 23.0), (47161, 24.0), (47892, 25.0),
+    (48257, 26.0), (48804, 27.0), (49169, 28.0), (49534, 29.0),
+    (50083, 30.0), (50630, 31.0), (51179, 32.0), (53736, 33.0),
+    (54832, 34.0), (56109, 35.0), (57204, 36.0), (57754, 37.0),
+)
+
+_LEAP_MJD = np.array([mjd for mjd, _ in LEAP_SECONDS], dtype=np.float64)
+_LEAP_TAI_UTC = np.array([dat for _, dat in LEAP_SECONDS])
+
+
+def tai_minus_utc(mjd_utc) -> np.ndarray:
+    """
+    TAI - UTC (seconds) for UTC Modified Julian Date(s).
+    """
+    index = np.searchsorted(_LEAP_MJD, np.asarray(mjd_utc), side="right") - 1
+    return _LEAP_TAI_UTC[np.maximum(index, 0)]
+
+
+def _normalize(whole, frac):
+    whole = np.asarray(whole, dtype=np.float64)
+    frac = np.asarray(frac, dtype=np.float64)
+    base = np.floor(whole)
+    frac = (whole - base) + frac
+    carry = np.floor(frac)
+    return base + carry, frac - carry
+
+
+@dataclass(frozen=True)
+class TimeArray:
+    """
+    Julian Dates stored as whole days plus day fractions.
+
+    Attributes:
+        whole: Integral Julian day numbers (float64)
+        frac: Day fractions in [0, 1), same shape as whole
+        scale: "utc", "ut1" or "tt"
+    """
+
+    whole: np.ndarray
+    frac: np.ndarray
+    scale: str = "utc"
+
+    def __post_init__(self) -> None:
+        if self.scale not in SCALES:
+            raise ValueError(f"scale must be one of {SCALES}")
+        whole, frac = np.broadcast_arrays(*_normalize(self.whole, self.frac))
+        object.__setattr__(self, "whole", whole)
+        object.__setattr__(self, "frac", frac)
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_jd(cls, jd, jd_frac=0.0, scale: str = "utc") -> "TimeArray":
+        """
+        Build from Julian Date(s), optionally split into two parts.
+        """
+        jd = np.asarray(jd, dtype=np.float64)
+        jd_frac = np.asarray(jd_frac, dtype=np.float64)
+        jd, jd_frac = np.broadcast_arrays(jd, jd_frac)
+        return cls(jd, jd_frac, scale)
+
+    @classmethod
+    def from_datetime64(cls, values, scale: str = "utc") -> "TimeArray":
+        """
+        Build from numpy datetime64 values without rounding to float.
+        """
+        ns = np.asarray(values, dtype="datetime64[ns]").astype(np.int64)
+        days, rem = np.divmod(ns, _NS_PER_DAY)
+        return cls(
+            days.astype(np.float64) + _UNIX_EPOCH_WHOLE,
+            rem.astype(np.float64) / _NS_PER_DAY + 0.5,
+            scale,
+        )
+
+    @classmethod
+    def from_datetimes(cls, values, scale: str = "utc") -> "TimeArray":
+        """
+        Build from datetime.datetime objects (naive values are taken
+        to be in the given scale; aware values are converted to UTC).
+        """
+        values = [
+            v.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+            if v.tzinfo is not None else v
+            for v in values
+        ]
+        return cls.from_datetime64(np.array(values, dtype="datetime64[us]"), scale)
+
+    @classmethod
+    def range(cls, start, stop, step, scale: str = "utc") -> "TimeArray":
+        """
+        Regular grid from start up to (excluding) stop.
+
+        Parameters
+        ----------
+        start, stop : datetime, numpy.datetime64 or ISO string
+            Grid bounds
+        step : numpy.timedelta64, datetime.timedelta or float
+            Spacing; floats are seconds
+        scale : str
+            Time scale of the grid
+        """
+        if isinstance(step, (int, float)):
+            step = np.timedelta64(int(round(step * 1e9)), "ns")
+        values = np.arange(
+            np.datetime64(start, "ns"),
+            np.datetime64(stop, "ns"),
+            np.timedelta64(step, "ns"),
+        )
+        return cls.from_datetime64(values, scale)
+
+    # ------------------------------------------------------------------
+    # Access
+    # ------------------------------------------------------------------
+
+    @property
+    def shape(self):
+        return self.whole.shape
+
+    def __len__(self) -> int:
+        return len(self.whole)
+
+    def __getitem__(self, index) -> "TimeArray":
+        return TimeArray(self.whole[index], self.frac[index], self.scale)
+
+    @property
+    def jd(self) -> np.ndarray:
+        """
+        Julian Dates as single floats (loses the two-part precision).
+        """
+        return self.whole + self.frac
+
+    @property
+    def mjd(self) -> np.ndarray:
+        return (self.whole - MJD_OFFSET) + self.frac
+
+    def to_datetime64(self) -> np.ndarray:
+        """
+        Times as datetime64[ns] values.
+        """
+        days = (self.whole - _UNIX_EPOCH_WHOLE).astype(np.int64)
+        ns = np.round((self.frac - 0.5) * _NS_PER_DAY).astype(np.int64)
+        return (days * _NS_PER_DAY + ns).astype("datetime64[ns]")
+
+    # ------------------------------------------------------------------
+    # Scales
+    # ------------------------------------------------------------------
+
+    def to(self, scale: str, eop=None) -> "TimeArray":
+        """
+        Convert to another time scale.
+
+        Parameters
+        ----------
+        scale : {"utc", "ut1", "tt"}
+            Target scale
+        eop : EOPTable, optional
+            Source of UT1-UTC (DEFAULT_EOP by default). Dates outside
+            the table use UT1 = UTC.
+        """
+        if scale == self.scale:
+            return self
+        if scale not in SCALES:
+            raise ValueError(f"scale must be one of {SCALES}")
+
+        utc = self._to_utc(eop)
+        if scale == "utc":
+            return utc
+
+        if scale == "tt":
+            offset = tai_minus_utc(utc.mjd) + TT_MINUS_TAI
+        else:
+            offset = _ut1_minus_utc(utc.mjd, eop)
+        return TimeArray(utc.whole, utc.frac + offset / 86400.0, scale)
+
+    def _to_utc(self, eop) -> "TimeArray":
+        if self.scale == "utc":
+            return self
+
+        mjd = self.mjd
+        if self.scale == "tt":
+            # Leap second lookup on the approximate UTC date, then once
+            # more in case that crossed a table entry
+            offset = tai_minus_utc(mjd) + TT_MINUS_TAI
+            offset = tai_minus_utc(mjd - offset / 86400.0) + TT_MINUS_TAI
+        else:
+            offset = _ut1_minus_utc(mjd, eop)
+
+        return TimeArray(self.whole, self.frac - offset / 86400.0, "utc")
+
+    # ------------------------------------------------------------------
+    # Propagation times
+    # ------------------------------------------------------------------
+
+    def minutes_since_epoch(self, epoch_jd, eop=None) -> np.ndarray:
+        """
+        Minutes since TLE epoch(s), as used by SGP-4.
+
+        Parameters
+        ----------
+        epoch_jd : float or array_like, shape (N,)
+            TLE epoch Julian Dates (UTC), e.g. SatrecArray.epoch_jd
+        eop : EOPTable, optional
+            Used when converting UT1 times to UTC
+
+        Returns
+        -------
+        ndarray
+            Shape of this array for a scalar epoch, otherwise
+            (N,) + shape, i.e. (N, T) for a 1-D time grid
+        """
+        utc = self._to_utc(eop)
+
+        epoch = np.asarray(epoch_jd, dtype=np.float64)
+        epoch_whole = np.floor(epoch)
+        epoch_frac = epoch - epoch_whole
+
+        if epoch.ndim:
+            expand = (Ellipsis,) + (np.newaxis,) * utc.whole.ndim
+            epoch_whole = epoch_whole[expand]
+            epoch_frac = epoch_frac[expand]
+
+        return ((utc.whole - epoch_whole) + (utc.frac - epoch_frac)) * 1440.0
+
+
+def _ut1_minus_utc(mjd, eop) -> np.ndarray:
+    if eop is None:
+        from pyglspg4.frames.eop import DEFAULT_EOP
+
+        eop = DEFAULT_EOP
+
+    _, _, ut1_utc = eop.interpolate_many(mjd)
+    return np.nan_to_num(np.asarray(ut1_utc, dtype=np.float64), nan=0.0)
@@ -0,0 +1,452 @@
+# Copyright (C) 2025-2026 Kris Kirby, KE4AHR
+# SPDX-License-Identifier: LGPL-3.0-or-later
+#
+# Columnar bulk TLE catalog loader.
+#
+# Reads a whole 2LE / 3LE catalog as bytes and extracts every fixed
+# column for all records at once. With NumPy the line pairs are
+# viewed through a structured dtype whose fields sit at the NORAD
+# column offsets, so each field is sliced without copying before a
+# single vectorized conversion. Without NumPy the same columns are
+# filled by a pure-Python loop over the records.
+#
+# Malformed records (bad line numbers, mismatched catalog numbers,
+# checksum failures, unparsable fields) are reported in
+# TLECatalog.errors and excluded from the columns.
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Union
+
+from pyglspg4.tle.parser import TLE, parse_tle
+from pyglspg4.time.julian import calendar_to_julian
+
+
+LINE_LENGTH = 69
+
+# Float and int columns of TLECatalog, in TLE field order
+FLOAT_COLUMNS = (
+    "epoch_day",
+    "mean_motion_dot",
+    "mean_motion_ddot",
+    "bstar",
+    "inclination",
+    "raan",
+    "eccentricity",
+    "arg_perigee",
+    "mean_anomaly",
+    "mean_motion",
+)
+INT_COLUMNS = ("satnum", "epoch_year", "rev_number")
+
+
+@dataclass(frozen=True)
+class CatalogError:
+    """
+    A malformed catalog record.
+    """
+    line_number: int       # 1-based line number of the record's line 1
+    name: str
+    message: str
+
+
+@dataclass
+class TLECatalog:
+    """
+    Columnar TLE catalog.
+
+    Every attribute named in FLOAT_COLUMNS and INT_COLUMNS holds one
+    value per valid record, as a NumPy array when NumPy is available
+    and as a list otherwise. Units follow the TLE: degrees, revolutions
+    per day.
+    """
+
+    columns: Dict[str, Sequence] = field(default_factory=dict)
+    names: List[str] = field(default_factory=list)
+    classification: List[str] = field(default_factory=list)
+    int_desig: List[str] = field(default_factory=list)
+    errors: List[CatalogError] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __getattr__(self, name):
+        columns = self.__dict__.get("columns", {})
+        if name in columns:
+            return columns[name]
+        raise AttributeError(name)
+
+    @property
+    def epoch_jd(self):
+        """
+        TLE epochs as Julian dates.
+        """
+        years = self.columns["epoch_year"]
+        days = self.columns["epoch_day"]
+        jan0 = {
+            int(y): calendar_to_julian(int(y), 1, 1).jd - 1.0
+            for y in set(years.tolist() if hasattr(years, "tolist") else years)
+        }
+
+        try:
+            import numpy as np
+        except ImportError:
+            return [jan0[y] + d for y, d in zip(years, days)]
+
+        lookup = np.array([jan0[int(y)] for y in years], dtype=np.float64)
+        return lookup + np.asarray(days, dtype=np.float64)
+
+    def tle(self, index: int) -> TLE:
+        """
+        Materialize one record as a TLE dataclass.
+        """
+        values = {
+            name: float(self.columns[name][index]) for name in FLOAT_COLUMNS
+        }
+        values.update(
+            {name: int(self.columns[name][index]) for name in INT_COLUMNS}
+        )
+        return TLE(
+            classification=self.classification[index],
+            int_desig=self.int_desig[index],
+            **values,
+        )
+
+    def tles(self) -> List[TLE]:
+        """
+        Materialize every record as a TLE dataclass.
+        """
+        return [self.tle(i) for i in range(len(self))]
+
+
+def load_catalog(source: Union[str, os.PathLike, bytes]) -> TLECatalog:
+    """
+    Load a 2LE or 3LE catalog.
+
+    Parameters
+    ----------
+    source : path or bytes
+        Path to a catalog file, or its raw contents
+
+    Returns
+    -------
+    TLECatalog
+        Columnar catalog of valid records plus a list of errors
+    """
+
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        data = bytes(source)
+    else:
+        with open(source, "rb") as f:
+            data = f.read()
+
+    records, errors = _split_records(data)
+
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        return _build_python(records, errors)
+
+    return _build_numpy(records, errors)
+
+
+# ---------------------------------------------------------------------------
+# Record framing and checks
+# ---------------------------------------------------------------------------
+
+def _split_records(data: bytes):
+    """
+    Group lines into (line_number, name, line1, line2) records.
+    """
+    lines = data.splitlines()
+    records = []
+    errors: List[CatalogError] = []
+
+    name = ""
+    i = 0
+    while i < len(lines):
+        line = lines[i].rstrip()
+        if not line:
+            i += 1
+            continue
+
+        if line[:2] == b"1 ":
+            line2 = lines[i + 1].rstrip() if i + 1 < len(lines) else b""
+            if line2[:2] != b"2 ":
+                errors.append(
+                    CatalogError(i + 1, name, "Line 1 not followed by line 2")
+                )
+                name = ""
+                i += 1
+                continue
+            records.append((i + 1, name, line[:LINE_LENGTH], line2[:LINE_LENGTH]))
+            name = ""
+            i += 2
+            continue
+
+        if line[:2] == b"2 ":
+            errors.append(CatalogError(i + 1, name, "Orphan line 2"))
+            name = ""
+            i += 1
+            continue
+
+        # 3LE title line; a leading "0 " is the Space-Track convention
+        text = line.decode("ascii", errors="replace")
+        name = text[2:].strip() if text.startswith("0 ") else text.strip()
+        i += 1
+
+    return records, errors
+
+
+def checksum_ok(line: bytes) -> bool:
+    """
+    Verify the modulo-10 checksum in column 69 of a TLE line.
+    """
+    if len(line) < LINE_LENGTH or not line[68:69].isdigit():
+        return False
+    total = 0
+    for c in line[:68]:
+        if 48 <= c <= 57:
+            total += c - 48
+        elif c == 45:  # '-'
+            total += 1
+    return total % 10 == line[68] - 48
+
+
+def _check_record(line1: bytes, line2: bytes) -> Optional[str]:
+    if len(line1) < LINE_LENGTH or len(line2) < LINE_LENGTH:
+        return "Invalid TLE line length"
+    if line1[2:7] != line2[2:7]:
+        return "Catalog number mismatch between lines"
+    if not checksum_ok(line1):
+        return "Line 1 checksum mismatch"
+    if not checksum_ok(line2):
+        return "Line 2 checksum mismatch"
+    return None
+
+
+def _append_meta(catalog: TLECatalog, name: str, line1: bytes) -> None:
+    catalog.names.append(name)
+    catalog.classification.append(chr(line1[7]))
+    catalog.int_desig.append(line1[9:17].decode("ascii", "replace").strip())
+
+
+# ---------------------------------------------------------------------------
+# Pure-Python column builder
+# ---------------------------------------------------------------------------
+
+def _build_python(records, errors) -> TLECatalog:
+    catalog = TLECatalog(errors=errors)
+    columns = {name: [] for name in FLOAT_COLUMNS + INT_COLUMNS}
+
+    for line_number, name, line1, line2 in records:
+        problem = _check_record(line1, line2)
+        if problem is None:
+            try:
+                tle = parse_tle(
+                    line1.decode("ascii"), line2.decode("ascii")
+                )
+            except (ValueError, UnicodeDecodeError) as exc:
+                problem = f"Unparsable field: {exc}"
+
+        if problem is not None:
+            catalog.errors.append(CatalogError(line_number, name, problem))
+            continue
+
+        for col in FLOAT_COLUMNS + INT_COLUMNS:
+            columns[col].append(getattr(tle, col))
+        _append_meta(catalog, name, line1)
+
+    catalog.columns = columns
+    return catalog
+
+
+# ---------------------------------------------------------------------------
+# NumPy column builder
+# ---------------------------------------------------------------------------
+
+# (name, offset, width) of raw fields within a 138-byte line pair
+_RAW_FIELDS = (
+    ("satnum", 2, 5),
+    ("epoch_year", 18, 2),
+    ("epoch_day", 20, 12),
+    ("mean_motion_dot", 33, 10),
+    ("ddot_mantissa", 44, 6),
+    ("ddot_exponent", 50, 2),
+    ("bstar_mantissa", 53, 6),
+    ("bstar_exponent", 59, 2),
+    ("inclination", LINE_LENGTH + 8, 8),
+    ("raan", LINE_LENGTH + 17, 8),
+    ("eccentricity", LINE_LENGTH + 26, 7),
+    ("arg_perigee", LINE_LENGTH + 34, 8),
+    ("mean_anomaly", LINE_LENGTH + 43, 8),
+    ("mean_motion", LINE_LENGTH + 52, 11),
+    ("rev_number", LINE_LENGTH + 63, 5),
+)
+
+# Raw fields cast to int64; the rest are cast to float64
+_INT_FIELDS = frozenset(
+    ("satnum", "epoch_year", "ddot_exponent", "bstar_exponent",
+     "eccentricity", "rev_number")
+)
+
+
+def _record_dtype(np):
+    return np.dtype(
+        {
+            "names": [f[0] for f in _RAW_FIELDS],
+            "formats": [f"S{f[2]}" for f in _RAW_FIELDS],
+            "offsets": [f[1] for f in _RAW_FIELDS],
+            "itemsize": 2 * LINE_LENGTH,
+        }
+    )
+
+
+def _checksums_ok(np, lines):
+    """
+    Vectorized checksum test over an (N, 69) uint8 array.
+    """
+    body = lines[:, :68]
+    digits = (body >= 48) & (body <= 57)
+    values = np.where(digits, body - 48, 0) + (body == 45)
+    expected = lines[:, 68].astype(np.int64) - 48
+    return (values.sum(axis=1) % 10) == expected
+
+
+def _build_numpy(records, errors) -> TLECatalog:
+    import numpy as np
+
+    catalog = TLECatalog(errors=errors)
+
+    # Frame check first; short records never reach the byte buffer
+    framed = []
+    for rec in records:
+        line_number, name, line1, line2 = rec
+        if len(line1) < LINE_LENGTH or len(line2) < LINE_LENGTH:
+            catalog.errors.append(
+                CatalogError(line_number, name, "Invalid TLE line length")
+            )
+        elif line1[2:7] != line2[2:7]:
+            catalog.errors.append(
+                CatalogError(
+                    line_number, name, "Catalog number mismatch between lines"
+                )
+            )
+        else:
+            framed.append(rec)
+
+    buf = b"".join(r[2] + r[3] for r in framed)
+    pairs = np.frombuffer(buf, dtype=np.uint8).reshape(-1, 2 * LINE_LENGTH)
+
+    ok1 = _checksums_ok(np, pairs[:, :LINE_LENGTH])
+    ok2 = _checksums_ok(np, pairs[:, LINE_LENGTH:])
+    keep = ok1 & ok2
+
+    for idx in np.flatnonzero(~keep):
+        line_number, name, _, _ = framed[idx]
+        which = "Line 1" if not ok1[idx] else "Line 2"
+        catalog.errors.append(
+            CatalogError(line_number, name, f"{which} checksum mismatch")
+        )
+
+    good = [framed[i] for i in np.flatnonzero(keep)]
+    raw = np.frombuffer(
+        b"".join(r[2] + r[3] for r in good), dtype=_record_dtype(np)
+    )
+
+    try:
+        columns = _convert_columns(np, raw)
+    except ValueError:
+        # A few records carry a field the vectorized cast rejects, such
+        # as a blank or garbled exponent. Parse only those per record
+        # and keep the rest of the catalog on the columnar path.
+        columns, good = _convert_with_stragglers(np, raw, good, catalog)
+
+    catalog.columns = columns
+    for _, name, line1, _ in good:
+        _append_meta(catalog, name, line1)
+
+    return catalog
+
+
+def _convert_with_stragglers(np, raw, good, catalog):
+    bad = _unconvertible_rows(np, raw)
+
+    parsed = {}
+    for idx in np.flatnonzero(bad):
+        line_number, name, line1, line2 = good[idx]
+        try:
+            parsed[idx] = parse_tle(line1.decode("ascii"), line2.decode("ascii"))
+        except (ValueError, UnicodeDecodeError) as exc:
+            catalog.errors.append(
+                CatalogError(line_number, name, f"Unparsable field: {exc}")
+            )
+
+    kept = np.sort(
+        np.concatenate(
+            [np.flatnonzero(~bad), np.fromiter(parsed, np.int64, len(parsed))]
+        )
+    )
+    clean = ~bad[kept]
+    slow = [parsed[i] for i in kept[~clean]]
+
+    columns = {}
+    for col, values in _convert_columns(np, raw[~bad]).items():
+        merged = np.empty(len(kept), dtype=values.dtype)
+        merged[clean] = values
+        merged[~clean] = [getattr(tle, col) for tle in slow]
+        columns[col] = merged
+
+    return columns, [good[i] for i in kept]
+
+
+def _unconvertible_rows(np, raw):
+    """
+    Mask of records with at least one field the vectorized cast rejects.
+    """
+    bad = np.zeros(len(raw), dtype=bool)
+    for name, _, _ in _RAW_FIELDS:
+        column = raw[name]
+        dtype = np.int64 if name in _INT_FIELDS else np.float64
+        try:
+            column.astype(dtype)
+        except ValueError:
+            for i in range(len(column)):
+                try:
+                    column[i:i + 1].astype(dtype)
+                except ValueError:
+                    bad[i] = True
+    return bad
+
+
+def _convert_columns(np, raw):
+    def f64(name):
+        return raw[name].astype(np.float64)
+
+    def i64(name):
+        return raw[name].astype(np.int64)
+
+    year = i64("epoch_year")
+    year += np.where(year < 57, 2000, 1900)
+
+    def exponential(prefix):
+        mantissa = f64(prefix + "_mantissa") * 1e-5
+        return mantissa * 10.0 ** i64(prefix + "_exponent")
+
+    return {
+        "satnum": i64("satnum"),
+        "epoch_year": year,
+        "epoch_day": f64("epoch_day"),
+        "mean_motion_dot": f64("mean_motion_dot"),
+        "mean_motion_ddot": exponential("ddot"),
+        "bstar": exponential("bstar"),
+        "inclination": f64("inclination"),
+        "raan": f64("raan"),
+        "eccentricity": i64("eccentricity") * 1e-7,
+        "arg_perigee": f64("arg_perigee"),
+        "mean_anomaly": f64("mean_anomaly"),
+        "mean_motion": f64("mean_motion"),
+        "rev_number": i64("rev_number"),
+    }
@@ -0,0 +1,611 @@
+# Copyright (C) 2025-2026 Kris Kirby, KE4AHR
+# SPDX-License-Identifier: LGPL-3.0-or-later
+#
+# This file is part of Pyglspg4.
+
+"""
+Performance benchmarks for the propagation hot paths.
+
+Times TLE parsing, SGP-4 initialization, near-Earth and deep-space
+propagation, the TEME -> ITRF conversion, topocentric look angles and
+pass prediction over a synthetic catalog of configurable size. Each
+operation is run several times and the best run is kept, reported as
+per-operation latency and throughput.
+
+Reports are plain JSON documents so they can be stored as baselines
+and compared by later runs:
+
+    python -m pyglspg4.validation.benchmark --output baseline.json
+    python -m pyglspg4.validation.benchmark --baseline baseline.json
+
+The second command exits with status 1 when an operation is slower
+than its baseline by more than the regression threshold, and with
+status 2 when the baseline was produced by another report version or
+with a different catalog size, sample count, pass count or seed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import json
+import math
+import platform
+import random
+import sys
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from pyglspg4.constants import is_deep_space
+
+
+REPORT_VERSION = 1
+
+# Configuration entries that must match for two reports to be compared;
+# repeats only changes how many runs the best one is taken from
+COMPARED_CONFIG = ("size", "samples", "passes", "seed")
+
+# Operations in execution order
+OPERATIONS = (
+    "parse_tle",
+    "initialize",
+    "propagate_near_earth",
+    "propagate_deep_space",
+    "teme_to_itrf",
+    "topocentric",
+    "predict_passes",
+)
+
+# Ground station used for the topocentric and pass benchmarks
+_STATION = (math.radians(32.806671), math.radians(-86.791130), 0.2)
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    """
+    Timing of one benchmarked operation.
+
+    Args:
+        name: Operation name (one of OPERATIONS)
+        operations: Operations performed per run
+        seconds: Wall time of the fastest run
+        repeats: Number of timed runs
+    """
+    name: str
+    operations: int
+    seconds: float
+    repeats: int
+
+    @property
+    def latency_us(self) -> float:
+        """Microseconds per operation."""
+        return self.seconds / self.operations * 1e6
+
+    @property
+    def throughput(self) -> float:
+        """Operations per second."""
+        return self.operations / self.seconds if self.seconds > 0.0 else math.inf
+
+    def as_dict(self) -> dict:
+        return {
+            "operations": self.operations,
+            "seconds": self.seconds,
+            "repeats": self.repeats,
+            "latency_us": self.latency_us,
+            "throughput": self.throughput,
+        }
+
+
+# ---------------------------------------------------------------------------
+# Synthetic catalog
+# ---------------------------------------------------------------------------
+
+def _checksum(line: str) -> int:
+    total = 0
+    for ch in line[:68]:
+        if ch.isdigit():
+            total += int(ch)
+        elif ch == "-":
+            total += 1
+    return total % 10
+
+
+def _exponential(value: float) -> str:
+    # TLE " 12345-4" notation: 0.12345e-4
+    if value == 0.0:
+        return " 00000-0"
+    sign = "-" if value < 0.0 else " "
+    exponent = math.floor(math.log10(abs(value))) + 1
+    mantissa = round(abs(value) / 10.0 ** exponent * 1e5)
+    if mantissa >= 100000:
+        mantissa //= 10
+        exponent += 1
+    return f"{sign}{mantissa:05d}{exponent:+d}"
+
+
+def format_tle(
+    satnum: int,
+    epoch_year: int,
+    epoch_day: float,
+    bstar: float,
+    inclination: float,
+    raan: float,
+    eccentricity: float,
+    arg_perigee: float,
+    mean_anomaly: float,
+    mean_motion: float,
+) -> Tuple[str, str]:
+    """
+    Format mean elements as a TLE line pair with valid checksums.
+
+    Args:
+        satnum: Catalog number (0-99999)
+        epoch_year: Four-digit epoch year
+        epoch_day: Day of year with fraction
+        bstar: Drag term (1 / Earth radii)
+        inclination, raan, arg_perigee, mean_anomaly: Angles (deg)
+        eccentricity: Eccentricity in [0, 1)
+        mean_motion: Mean motion (rev/day)
+
+    Returns:
+        Tuple of (line1, line2).
+    """
+    line1 = (
+        f"1 {satnum:05d}U 24001A   {epoch_year % 100:02d}{epoch_day:012.8f}"
+        f"  .00000000  00000-0 {_exponential(bstar)} 0  999"
+    )
+    line2 = (
+        f"2 {satnum:05d} {inclination:8.4f} {raan:8.4f} "
+        f"{round(eccentricity * 1e7):07d} {arg_perigee:8.4f} "
+        f"{mean_anomaly:8.4f} {mean_motion:11.8f}{1:5d}"
+    )
+    return (
+        line1 + str(_checksum(line1)),
+        line2 + str(_checksum(line2)),
+    )
+
+
+def synthetic_tles(
+    count: int,
+    deep_space_fraction: float = 0.1,
+    seed: int = 0,
+) -> List[Tuple[str, str]]:
+    """
+    Deterministic synthetic catalog.
+
+    Near-Earth objects are low orbits with light drag; deep-space
+    objects alternate between geosynchronous and 12-hour orbits so
+    that both resonance branches of SDP-4 are exercised.
+
+    Args:
+        count: Number of TLEs
+        deep_space_fraction: Share of deep-space objects
+        seed: Random seed; equal seeds give equal catalogs
+
+    Returns:
+        List of (line1, line2) pairs.
+    """
+    rng = random.Random(seed)
+    n_deep = round(count * deep_space_fraction)
+    tles = []
+
+    for i in range(count):
+        deep = i >= count - n_deep
+        if deep and i % 2:
+            mean_motion = rng.uniform(2.00, 2.01)
+            eccentricity = rng.uniform(0.60, 0.72)
+            inclination = rng.uniform(62.0, 64.0)
+        elif deep:
+            mean_motion = rng.uniform(1.0020, 1.0030)
+            eccentricity = rng.uniform(0.0001, 0.0010)
+            inclination = rng.uniform(0.0, 5.0)
+        else:
+            mean_motion = rng.uniform(12.0, 15.8)
+            eccentricity = rng.uniform(0.0001, 0.0200)
+            inclination = rng.uniform(20.0, 100.0)
+
+        tles.append(
+            format_tle(
+                satnum=10000 + i,
+                epoch_year=2024,
+                epoch_day=rng.uniform(1.0, 30.0),
+                bstar=0.0 if deep else rng.uniform(1e-5, 5e-4),
+                inclination=inclination,
+                raan=rng.uniform(0.0, 359.9),
+                eccentricity=eccentricity,
+                arg_perigee=rng.uniform(0.0, 359.9),
+                mean_anomaly=rng.uniform(0.0, 359.9),
+                mean_motion=mean_motion,
+            )
+        )
+
+    return tles
+
+
+# ---------------------------------------------------------------------------
+# Benchmarks
+# ---------------------------------------------------------------------------
+
+def _time(func: Callable[[], object], repeats: int) -> float:
+    best = math.inf
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+class _Fixtures:
+    """
+    Benchmark inputs, each built on first use so that a run limited
+    to a few operations only pays for what they read.
+    """
+
+    def __init__(self, size: int, samples: int, seed: int) -> None:
+        self.size = size
+        self.samples = samples
+        self.seed = seed
+
+    @functools.cached_property
+    def lines(self):
+        return synthetic_tles(self.size, seed=self.seed)
+
+    @functools.cached_property
+    def tles(self):
+        from pyglspg4.tle.parser import parse_tle
+
+        return [parse_tle(l1, l2) for l1, l2 in self.lines]
+
+    @functools.cached_property
+    def states(self):
+        from pyglspg4.sgp4.initializer import initialize_sgp4
+
+        return [initialize_sgp4(tle) for tle in self.tles]
+
+    @functools.cached_property
+    def near(self):
+        return [s for s in self.states if not is_deep_space(_rev_per_day(s))]
+
+    @functools.cached_property
+    def deep(self):
+        from pyglspg4.sgp4.propagate import deep_space_record
+
+        return [
+            deep_space_record(s)
+            for s in self.states
+            if is_deep_space(_rev_per_day(s))
+        ]
+
+    @functools.cached_property
+    def times(self):
+        return [1440.0 * k / self.samples for k in range(self.samples)]
+
+    @functools.cached_property
+    def vectors(self):
+        from pyglspg4.sgp4.near_earth import propagate_near_earth
+
+        vectors = []
+        for state in self.near:
+            for t in self.times:
+                r, v, err = propagate_near_earth(state, t)
+                if err == 0:
+                    vectors.append((r, v, state.epoch_jd + t / 1440.0))
+        return vectors
+
+    @functools.cached_property
+    def itrf(self):
+        from pyglspg4.frames.itrf import teme_to_itrf
+
+        return [teme_to_itrf(r, v, jd)[0] for r, v, jd in self.vectors]
+
+
+def _operations(
+    size: int,
+    samples: int,
+    passes: int,
+    seed: int,
+    names: Sequence[str] = OPERATIONS,
+):
+    """
+    Build the benchmarked callables for names and their operation
+    counts. Only the fixtures those operations need are built.
+    """
+    fixtures = _Fixtures(size, samples, seed)
+    lat, lon, alt = _STATION
+
+    def parse():
+        from pyglspg4.tle.parser import parse_tle
+
+        lines = fixtures.lines
+
+        def run():
+            for l1, l2 in lines:
+                parse_tle(l1, l2)
+
+        return run, len(lines)
+
+    def initialize():
+        from pyglspg4.sgp4.initializer import initialize_sgp4
+
+        tles = fixtures.tles
+
+        def run():
+            for tle in tles:
+                initialize_sgp4(tle)
+
+        return run, len(tles)
+
+    def near_earth():
+        from pyglspg4.sgp4.near_earth import propagate_near_earth
+
+        near, times = fixtures.near, fixtures.times
+
+        def run():
+            for state in near:
+                for t in times:
+                    propagate_near_earth(state, t)
+
+        return run, len(near) * samples
+
+    def deep_space():
+        from pyglspg4.sdp4.propagate import propagate_deep_space
+
+        deep, times = fixtures.deep, fixtures.times
+
+        def run():
+            for record in deep:
+                for t in times:
+                    propagate_deep_space(record, t)
+
+        return run, len(deep) * samples
+
+    def teme_itrf():
+        from pyglspg4.frames.itrf import teme_to_itrf
+
+        vectors = fixtures.vectors
+
+        def run():
+            for r, v, jd in vectors:
+                teme_to_itrf(r, v, jd)
+
+        return run, len(vectors)
+
+    def look_angles():
+        from pyglspg4.groundstation.topocentric import topocentric
+
+        itrf = fixtures.itrf
+
+        def run():
+            for r in itrf:
+                topocentric(r, lat, lon, alt)
+
+        return run, len(itrf)
+
+    def pass_search():
+        from pyglspg4.groundstation.passes import predict_passes_geodetic
+
+        pass_states = fixtures.near[:passes]
+
+        def run():
+            for state in pass_states:
+                predict_passes_geodetic(
+                    state, lat, lon, alt,
+                    jd_start=state.epoch_jd, minutes=1440.0,
+                )
+
+        return run, len(pass_states)
+
+    builders = {
+        "parse_tle": parse,
+        "initialize": initialize,
+        "propagate_near_earth": near_earth,
+        "propagate_deep_space": deep_space,
+        "teme_to_itrf": teme_itrf,
+        "topocentric": look_angles,
+        "predict_passes": pass_search,
+    }
+    return {name: builders[name]() for name in names}
+
+
+def _rev_per_day(state) -> float:
+    return state.mean_motion * 1440.0 / (2.0 * math.pi)
+
+
+def run_benchmarks(
+    size: int = 100,
+    samples: int = 60,
+    repeats: int = 5,
+    passes: int = 5,
+    seed: int = 0,
+    only: Optional[Sequence[str]] = None,
+) -> dict:
+    """
+    Run the benchmark suite and return a JSON-serializable report.
+
+    Args:
+        size: Number of satellites in the synthetic catalog
+        samples: Propagation times per satellite, spread over one day
+        repeats: Timed runs per operation; the fastest is reported
+        passes: Satellites searched for passes over one day
+        seed: Seed of the synthetic catalog
+        only: Names of the operations to run (all by default)
+
+    Returns:
+        Report dict with the run configuration, platform and a
+        "results" mapping of operation name to timing.
+    """
+    names = list(OPERATIONS if only is None else only)
+    unknown = sorted(set(names) - set(OPERATIONS))
+    if unknown:
+        raise ValueError(f"Unknown operations: {unknown}")
+    if size < 1 or samples < 1 or repeats < 1:
+        raise ValueError("size, samples and repeats must be positive")
+
+    operations = _operations(size, samples, passes, seed, names)
+
+    results: Dict[str, dict] = {}
+    for name in names:
+        func, count = operations[name]
+        if count == 0:
+            continue
+        result = BenchmarkResult(name, count, _time(func, repeats), repeats)
+        results[name] = result.as_dict()
+
+    return {
+        "version": REPORT_VERSION,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "config": {
+            "size": size,
+            "samples": samples,
+            "repeats": repeats,
+            "passes": passes,
+            "seed": seed,
+        },
+        "results": results,
+    }
+
+
+def compare(
+    report: dict,
+    baseline: dict,
+    threshold: float = 0.2,
+) -> List[dict]:
+    """
+    Find operations that regressed against a baseline report.
+
+    Args:
+        report: Report from run_benchmarks()
+        baseline: Stored report to compare with
+        threshold: Allowed relative latency increase (0.2 = 20 %)
+
+    Returns:
+        One dict per regressed operation with its name, both
+        latencies (microseconds) and their ratio. Operations missing
+        from either report are not compared.
+
+    Raises:
+        ValueError if the reports differ in version or in any
+        COMPARED_CONFIG entry, since their latencies then measure
+        different workloads.
+    """
+    if report.get("version") != baseline.get("version"):
+        raise ValueError(
+            f"Report version {report.get('version')} cannot be compared "
+            f"with baseline version {baseline.get('version')}"
+        )
+    config = report.get("config", {})
+    reference_config = baseline.get("config", {})
+    differing = [
+        key
+        for key in COMPARED_CONFIG
+        if config.get(key) != reference_config.get(key)
+    ]
+    if differing:
+        raise ValueError(
+            "Report and baseline were run with different settings: "
+            + ", ".join(
+                f"{key} {config.get(key)} vs {reference_config.get(key)}"
+                for key in differing
+            )
+        )
+
+    regressions = []
+    for name, current in report["results"].items():
+        reference = baseline.get("results", {}).get(name)
+        if reference is None:
+            continue
+        ratio = current["latency_us"] / reference["latency_us"]
+        if ratio > 1.0 + threshold:
+            regressions.append(
+                {
+                    "name": name,
+                    "baseline_us": reference["latency_us"],
+                    "latency_us": current["latency_us"],
+                    "ratio": ratio,
+                }
+            )
+    return regressions
+
+
+def format_report(report: dict) -> str:
+    """
+    Human-readable table of a report.
+    """
+    lines = [f"{'operation':<24}{'ops':>10}{'latency (us)':>16}{'ops/s':>16}"]
+    for name, result in report["results"].items():
+        lines.append(
+            f"{name:<24}{result['operations']:>10}"
+            f"{result['latency_us']:>16.2f}{result['throughput']:>16,.0f}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Command-line entry point; returns the process exit status.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m pyglspg4.validation.benchmark",
+        description="Time the Pyglspg4 hot paths on a synthetic catalog.",
+    )
+    parser.add_argument("--size", type=int, default=100,
+                        help="satellites in the synthetic catalog")
+    parser.add_argument("--samples", type=int, default=60,
+                        help="propagation times per satellite")
+    parser.add_argument("--repeats", type=int, default=5,
+                        help="timed runs per operation")
+    parser.add_argument("--passes", type=int, default=5,
+                        help="satellites searched for passes")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="seed of the synthetic catalog")
+    parser.add_argument("--only", nargs="+", choices=OPERATIONS,
+                        help="operations to run")
+    parser.add_argument("--output", help="write the JSON report to a file")
+    parser.add_argument("--baseline", help="JSON report to compare against")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="allowed relative slowdown (default 0.2)")
+    args = parser.parse_args(argv)
+
+    report = run_benchmarks(
+        size=args.size,
+        samples=args.samples,
+        repeats=args.repeats,
+        passes=args.passes,
+        seed=args.seed,
+        only=args.only,
+    )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(format_report(report))
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        try:
+            regressions = compare(report, baseline, args.threshold)
+        except ValueError as exc:
+            print(f"Cannot compare with {args.baseline}: {exc}",
+                  file=sys.stderr)
+            return 2
+        for r in regressions:
+            print(
+                f"REGRESSION {r['name']}: {r['latency_us']:.2f} us "
+                f"vs {r['baseline_us']:.2f} us ({r['ratio']:.2f}x)",
+                file=sys.stderr,
+            )
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
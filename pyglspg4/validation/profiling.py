@@ -0,0 +1,381 @@
+# Copyright (C) 2025-2026 Kris Kirby, KE4AHR
+# SPDX-License-Identifier: LGPL-3.0-or-later
+#
+# This file is part of Pyglspg4.
+
+"""
+Opt-in per-stage profiling of the propagation pipeline.
+
+enable() swaps the instrumented stages (propagation, initialization,
+the Kepler solver, frame conversions, EOP lookups and pass searches)
+for timing wrappers, in their defining module and in every loaded
+module that imported them by name. disable() puts the
+original functions back, so when profiling is off the library runs
+its unmodified code and pays nothing.
+
+While enabled, each stage records its call count and cumulative wall
+time. Times are inclusive: a propagation stage includes the Kepler
+solves and a pass search the frame conversions made inside it. The
+scalar Kepler solver is replaced by its counting variant, so Halley
+iterations are counted as well. Satellite handles bind their kernel
+when created, so for handles created before enable() the kernel time
+shows under api.satellite only. Cache hits and misses of the
+satellite, sidereal-time, resonance-checkpoint and rotation caches
+are reported as deltas since profiling was enabled or last reset.
+
+    from pyglspg4.validation import profiling
+
+    with profiling.profiled():
+        predict_passes(...)
+    print(profiling.prometheus())
+"""
+
+from __future__ import annotations
+
+import contextlib
+import functools
+import importlib
+import sys
+import threading
+import time
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+
+# (module, attribute, stage); "Class.method" attributes are patched
+# on the class
+STAGES: Tuple[Tuple[str, str, str], ...] = (
+    ("pyglspg4.api.propagate", "propagate", "api.propagate"),
+    ("pyglspg4.api.satellite", "Satellite.at", "api.satellite"),
+    ("pyglspg4.sgp4.initializer", "initialize", "sgp4.initialize"),
+    ("pyglspg4.sgp4.near_earth", "propagate_near_earth", "sgp4.near_earth"),
+    ("pyglspg4.sdp4.propagate", "propagate_deep_space", "sdp4.deep_space"),
+    ("pyglspg4.math.numerics", "solve_kepler", "kepler"),
+    ("pyglspg4.math.numerics", "solve_kepler_scalar", "kepler"),
+    ("pyglspg4.math.numerics", "solve_kepler_array", "kepler.array"),
+    ("pyglspg4.frames.sidereal", "gmst", "frames.gmst"),
+    ("pyglspg4.frames.teme_to_ecef", "teme_to_ecef", "frames.teme_to_ecef"),
+    ("pyglspg4.frames.itrf", "teme_to_itrf", "frames.teme_to_itrf"),
+    ("pyglspg4.frames.teme_to_itrf", "teme_to_itrf", "frames.teme_to_itrf"),
+    ("pyglspg4.frames.pipeline", "teme_to_itrf_array", "frames.teme_to_itrf"),
+    ("pyglspg4.frames.eop", "EOPTable.interpolate", "eop.interpolate"),
+    ("pyglspg4.frames.eop", "EOPTable.interpolate_many", "eop.interpolate"),
+    (
+        "pyglspg4.groundstation.passes",
+        "predict_passes_geodetic",
+        "passes.predict",
+    ),
+    ("pyglspg4.groundstation.passes", "find_passes", "passes.search"),
+)
+
+
+def _satellite_cache():
+    module = sys.modules.get("pyglspg4.api.propagate")
+    if module is None:
+        return None
+    info = module._satellite.cache_info()
+    return info.hits, info.misses
+
+
+def _sidereal_cache():
+    module = sys.modules.get("pyglspg4.frames.sidereal")
+    if module is None:
+        return None
+    infos = (module._gmst_cached.cache_info(), module._era_cached.cache_info())
+    return sum(i.hits for i in infos), sum(i.misses for i in infos)
+
+
+def _resonance_cache():
+    module = sys.modules.get("pyglspg4.sdp4.resonance_cache")
+    if module is None:
+        return None
+    cache = module.DEFAULT_RESONANCE_CACHE
+    return cache.hits, cache.misses
+
+
+def _rotation_cache():
+    module = sys.modules.get("pyglspg4.frames.pipeline")
+    if module is None:
+        return None
+    cache = module.DEFAULT_ROTATION_CACHE
+    return cache.hits, cache.misses
+
+
+# Cache name -> (hits, misses) reader; None while the module is not loaded
+CACHES: Dict[str, Callable[[], Optional[Tuple[int, int]]]] = {
+    "satellite": _satellite_cache,
+    "sidereal": _sidereal_cache,
+    "resonance": _resonance_cache,
+    "rotation": _rotation_cache,
+}
+
+
+class _Profiler:
+    """
+    Stage statistics and the patches currently applied.
+    """
+
+    def __init__(self) -> None:
+        self.lock = threading.RLock()
+        self.enabled = False
+        self.stages: Dict[str, List[float]] = {}
+        self.kepler_iterations = 0
+        self.cache_base: Dict[str, Tuple[int, int]] = {}
+        # (owner, attribute, original, wrapper) for every patched slot
+        self.patches: List[Tuple[object, str, object, object]] = []
+
+    def record(self, stage: str, elapsed: float) -> None:
+        with self.lock:
+            entry = self.stages.get(stage)
+            if entry is None:
+                self.stages[stage] = [1, elapsed]
+            else:
+                entry[0] += 1
+                entry[1] += elapsed
+
+    def reset(self) -> None:
+        with self.lock:
+            self.stages = {}
+            self.kepler_iterations = 0
+            self.cache_base = {
+                name: counts
+                for name, counts in ((n, read()) for n, read in CACHES.items())
+                if counts is not None
+            }
+
+
+_PROFILER = _Profiler()
+
+
+def _timed(func: Callable, stage: str) -> Callable:
+    record = _PROFILER.record
+    clock = time.perf_counter
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        start = clock()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            record(stage, clock() - start)
+
+    return wrapper
+
+
+def _counted_kepler(stage: str) -> Callable:
+    from pyglspg4.math.numerics import (
+        KEPLER_EPSILON,
+        MAX_KEPLER_ITERATIONS,
+        _solve_halley,
+        solve_kepler_scalar,
+    )
+
+    record = _PROFILER.record
+    clock = time.perf_counter
+
+    @functools.wraps(solve_kepler_scalar)
+    def wrapper(
+        mean_anomaly,
+        eccentricity,
+        tol=KEPLER_EPSILON,
+        max_iter=MAX_KEPLER_ITERATIONS,
+    ):
+        start = clock()
+        E, converged, iterations = _solve_halley(
+            mean_anomaly, eccentricity, tol, max_iter
+        )
+        record(stage, clock() - start)
+        with _PROFILER.lock:
+            _PROFILER.kepler_iterations += iterations
+        return E, converged
+
+    return wrapper
+
+
+def _resolve(module_name: str, attribute: str):
+    """
+    (owner, name, original) for one stage, or None when its module
+    cannot be imported (e.g. NumPy-only modules without NumPy).
+    """
+    try:
+        module = importlib.import_module(module_name)
+    except ImportError:
+        return None
+
+    owner: object = module
+    *path, name = attribute.split(".")
+    for part in path:
+        owner = getattr(owner, part)
+    return owner, name, owner.__dict__[name]
+
+
+def _module_globals():
+    # Every loaded module, so that functions bound with
+    # "from ... import" in application code are patched too
+    for module in list(sys.modules.values()):
+        namespace = getattr(module, "__dict__", None)
+        if isinstance(namespace, dict):
+            yield module, list(namespace.items())
+
+
+def _patch(target: object, name: str, original: object, wrapper: object):
+    _PROFILER.patches.append((target, name, original, wrapper))
+    setattr(target, name, wrapper)
+
+
+def enable() -> None:
+    """
+    Start profiling. Statistics are reset; enabling twice is a no-op.
+    """
+    with _PROFILER.lock:
+        if _PROFILER.enabled:
+            return
+
+        functions = {}
+        for module_name, attribute, stage in STAGES:
+            resolved = _resolve(module_name, attribute)
+            if resolved is None:
+                continue
+            owner, name, original = resolved
+
+            if attribute == "solve_kepler_scalar":
+                wrapper = _counted_kepler(stage)
+            else:
+                wrapper = _timed(original, stage)
+
+            if isinstance(owner, type):
+                _patch(owner, name, original, wrapper)
+            else:
+                functions[id(original)] = (original, wrapper)
+
+        for module, items in _module_globals():
+            for name, value in items:
+                found = functions.get(id(value))
+                if found is not None:
+                    _patch(module, name, *found)
+
+        _PROFILER.reset()
+        _PROFILER.enabled = True
+
+
+def disable() -> None:
+    """
+    Stop profiling and restore the original functions. Collected
+    statistics are kept until the next enable() or reset().
+    """
+    with _PROFILER.lock:
+        for target, name, original, wrapper in reversed(_PROFILER.patches):
+            if target.__dict__.get(name) is wrapper:
+                setattr(target, name, original)
+        # Modules imported while enabled may have bound a wrapper
+        wrappers = {id(p[3]): p[2] for p in _PROFILER.patches}
+        for module, items in _module_globals():
+            for name, value in items:
+                original = wrappers.get(id(value))
+                if original is not None:
+                    setattr(module, name, original)
+
+        _PROFILER.patches = []
+        _PROFILER.enabled = False
+
+
+def is_enabled() -> bool:
+    return _PROFILER.enabled
+
+
+def reset() -> None:
+    """
+    Clear the collected statistics.
+    """
+    _PROFILER.reset()
+
+
+@contextlib.contextmanager
+def profiled() -> Iterator[None]:
+    """
+    Profile the enclosed block; statistics stay readable afterwards.
+    """
+    enable()
+    try:
+        yield
+    finally:
+        disable()
+
+
+def snapshot() -> dict:
+    """
+    Current statistics as a plain dict.
+
+    Returns:
+        {"enabled": bool,
+         "stages": {stage: {"calls": int, "seconds": float}},
+         "counters": {"kepler_iterations": int},
+         "caches": {cache: {"hits": int, "misses": int}}}
+    """
+    with _PROFILER.lock:
+        stages = {
+            stage: {"calls": int(calls), "seconds": seconds}
+            for stage, (calls, seconds) in sorted(_PROFILER.stages.items())
+        }
+        kepler_iterations = _PROFILER.kepler_iterations
+        base = dict(_PROFILER.cache_base)
+        enabled = _PROFILER.enabled
+
+    caches = {}
+    for name, read in CACHES.items():
+        counts = read()
+        if counts is None:
+            continue
+        hits0, misses0 = base.get(name, (0, 0))
+        caches[name] = {"hits": counts[0] - hits0, "misses": counts[1] - misses0}
+
+    return {
+        "enabled": enabled,
+        "stages": stages,
+        "counters": {"kepler_iterations": kepler_iterations},
+        "caches": caches,
+    }
+
+
+def prometheus(prefix: str = "pyglspg4") -> str:
+    """
+    Current statistics in the Prometheus text exposition format.
+    """
+    snap = snapshot()
+    lines = []
+
+    def metric(name, help_text, samples):
+        lines.append(f"# HELP {prefix}_{name} {help_text}")
+        lines.append(f"# TYPE {prefix}_{name} counter")
+        for labels, value in samples:
+            lines.append(f"{prefix}_{name}{labels} {value}")
+
+    stages = snap["stages"].items()
+    metric(
+        "stage_calls_total",
+        "Calls per pipeline stage.",
+        [(f'{{stage="{s}"}}', v["calls"]) for s, v in stages],
+    )
+    metric(
+        "stage_seconds_total",
+        "Cumulative inclusive wall time per pipeline stage.",
+        [(f'{{stage="{s}"}}', repr(v["seconds"])) for s, v in stages],
+    )
+    metric(
+        "kepler_iterations_total",
+        "Halley iterations of the scalar Kepler solver.",
+        [("", snap["counters"]["kepler_iterations"])],
+    )
+
+    caches = snap["caches"].items()
+    metric(
+        "cache_hits_total",
+        "Cache lookups answered from the cache.",
+        [(f'{{cache="{c}"}}', v["hits"]) for c, v in caches],
+    )
+    metric(
+        "cache_misses_total",
+        "Cache lookups that computed a new entry.",
+        [(f'{{cache="{c}"}}', v["misses"]) for c, v in caches],
+    )
+
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,80 @@
+# Copyright (C) 2025-2026 Kris Kirby, KE4AHR
+# SPDX-License-Identifier: LGPL-3.0-or-later
+#
+# Script: Compare near-Earth propagation and frame conversion
+# throughput of the math backends.
+#
+# The pure-Python backend runs a sample of the grid and is scaled up;
+# the array backends run the whole grid. The first call of the Numba
+# backend compiles its kernels and is excluded from the timing.
+#
+# Usage: python scripts/benchmark_backends.py [satellites] [samples]
+
+import sys
+import time
+
+import numpy as np
+
+from pyglspg4.backend.selector import available_backends, select_backend
+from pyglspg4.frames.teme_to_ecef import teme_to_ecef
+from pyglspg4.sgp4.initializer import initialize_sgp4
+from pyglspg4.sgp4.near_earth import propagate_near_earth
+from pyglspg4.sgp4.satrec_array import SatrecArray
+from pyglspg4.tle.parser import parse_tle
+
+
+ISS_TLE = (
+    "1 25544U 98067A   24001.51869444  .00016717  00000-0  10270-3 0  9991",
+    "2 25544  51.6405  24.4561 0004382  88.1684  38.3275 15.49745126398784",
+)
+
+
+def best_of(func, repeat=5):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    m = int(sys.argv[2]) if len(sys.argv) > 2 else 1440
+
+    sats = SatrecArray.from_tles([parse_tle(*ISS_TLE)] * n)
+    times = np.linspace(0.0, 1440.0, m)
+    jd = sats.epoch_jd[0] + times / 1440.0
+    samples = n * m
+
+    # Pure Python on a slice of the grid, scaled to the full size
+    scalar = initialize_sgp4(parse_tle(*ISS_TLE))
+    subset = times[: min(m, 200)].tolist()
+
+    def python_run():
+        for t in subset:
+            r, v, _ = propagate_near_earth(scalar, t)
+            teme_to_ecef(r, v, sats.epoch_jd[0] + t / 1440.0)
+
+    python_rate = len(subset) / best_of(python_run)
+
+    print(f"{n} satellites x {m} samples, near-Earth propagation + TEME->ECEF")
+    print(f"{'backend':<10}{'samples/s':>16}{'speedup':>10}")
+    print(f"{'python':<10}{python_rate:>16,.0f}{1.0:>10.1f}")
+
+    for name in available_backends():
+        backend = select_backend(name)
+        if not backend.is_array:
+            continue
+
+        def array_run():
+            r, v, _ = sats.propagate(times, backend=backend)
+            teme_to_ecef(r, v, jd, backend=backend)
+
+        array_run()  # compile / warm up
+        rate = samples / best_of(array_run)
+        print(f"{name:<10}{rate:>16,.0f}{rate / python_rate:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+# Copyright (C) 2025-2026 Kris Kirby, KE4AHR
+# SPDX-License-Identifier: LGPL-3.0-or-later
+#
+# Tests for the math backend protocol and the kernels written
+# against it.
+
+import copy
+import math
+
+import pytest
+
+from pyglspg4.backend import selector
+from pyglspg4.backend.python import PYTHON
+from pyglspg4.backend.selector import (
+    available_backends,
+    register_backend,
+    select_backend,
+)
+from pyglspg4.frames.itrf import teme_to_itrf
+from pyglspg4.frames.teme_to_ecef import teme_to_ecef
+from pyglspg4.sgp4.initializer import initialize_kernel, initialize_sgp4
+from pyglspg4.sgp4.near_earth import near_earth_kernel, propagate_near_earth
+from pyglspg4.tle.parser import parse_tle
+
+
+ISS = (
+    "1 25544U 98067A   24001.51869444  .00016717  00000-0  10270-3 0  9991",
+    "2 25544  51.6405  24.4561 0004382  88.1684  38.3275 15.49745126398784",
+)
+
+TIMES = [0.0, 17.5, 92.0, -45.0, 1440.0]
+
+
+def test_python_backend_ops():
+    xp = PYTHON
+    assert xp.fma(2.0, 3.0, 1.0) == 7.0
+    assert xp.hypot(3.0, 4.0) == 5.0
+    assert xp.asin(1.0) == math.pi / 2.0
+    assert xp.mod(-1.0, 3.0) == 2.0
+    assert xp.where(True, 1.0, 2.0) == 1.0
+    assert xp.where(False, 1.0, 2.0) == 2.0
+    assert xp.stack(xp.components((1.0, 2.0, 3.0))) == (1.0, 2.0, 3.0)
+
+
+def test_numpy_backend_ops():
+    np = pytest.importorskip("numpy")
+    xp = select_backend("numpy")
+    assert xp.is_array
+
+    a = np.array([1.0, -2.0, 3.0])
+    out = np.empty(3)
+    result = xp.fma(a, 2.0, 1.0, out=out)
+    assert result is out
+    np.testing.assert_array_equal(out, [3.0, -3.0, 7.0])
+
+    # a * b narrower than the result: scalars, and (N, 1) columns
+    # against an (N, T) grid
+    np.testing.assert_array_equal(xp.fma(2.0, 3.0, np.ones(3)), [7.0] * 3)
+    col = np.array([[1.0], [2.0]])
+    grid = np.arange(6.0).reshape(2, 3)
+    np.testing.assert_array_equal(xp.fma(col, col, grid), col * col + grid)
+    buf = np.empty((2, 3))
+    assert xp.fma(col, col, grid, out=buf) is buf
+    np.testing.assert_array_equal(buf, col * col + grid)
+
+    np.testing.assert_array_equal(xp.mod(a, 3.0), [1.0, 1.0, 0.0])
+    np.testing.assert_array_equal(xp.where(a > 0.0, a, 0.0), [1.0, 0.0, 3.0])
+    assert xp.any(a < 0.0) and not xp.all(a < 0.0)
+
+    vectors = np.arange(12.0).reshape(4, 3)
+    buf = np.empty_like(vectors)
+    assert xp.stack(xp.components(vectors), out=buf) is buf
+    np.testing.assert_array_equal(buf, vectors)
+
+
+def test_select_backend_falls_back_to_python(monkeypatch):
+    def missing():
+        raise ImportError("not installed")
+
+    monkeypatch.setattr(selector, "_LOADERS", dict(selector._LOADERS))
+    monkeypatch.setattr(selector, "_FAILED", {})
+    register_backend("test-missing", missing)
+    assert select_backend("test-missing") is PYTHON
+    assert "test-missing" not in available_backends()
+    assert select_backend(None) is PYTHON
+    assert select_backend("no-such-backend") is PYTHON
+    assert select_backend(PYTHON) is PYTHON
+
+
+def test_initialize_kernel_numpy_matches_scalar():
+    np = pytest.importorskip("numpy")
+    from types import SimpleNamespace
+
+    from pyglspg4.constants import EARTH_RADIUS_KM, XKE
+    from pyglspg4.sgp4.initializer import initialize, state_from_tle
+    from pyglspg4.sgp4.satrec_array import SatrecArray
+    from pyglspg4.tle.catalog import load_catalog
+    from pyglspg4.validation.benchmark import synthetic_tles
+
+    # Mixed catalog: low perigees, near-circular orbits, deep space
+    tles = synthetic_tles(60, deep_space_fraction=0.2, seed=7)
+    raw = [state_from_tle(parse_tle(*lines)) for lines in tles]
+    leo = [k for k, state in enumerate(raw) if not state.is_deep_space]
+    raw[leo[0]].eccentricity = 0.0
+    # Perigees of about 130 km and 60 km select the low-perigee
+    # drag constants, the second one clamped
+    for k, height in ((leo[1], 130.0), (leo[2], 60.0)):
+        a_km = (XKE / raw[k].mean_motion) ** (2.0 / 3.0) * EARTH_RADIUS_KM
+        raw[k].eccentricity = 1.0 - (EARTH_RADIUS_KM + height) / a_km
+    refs = [initialize(copy.copy(state)) for state in raw]
+
+    columns = SimpleNamespace(**{
+        name: np.array([getattr(state, name) for state in raw])
+        for name in ("inclination", "raan", "eccentricity", "arg_perigee",
+                     "mean_anomaly", "mean_motion", "bstar")
+    })
+    result = initialize_kernel(select_backend("numpy"), columns)
+
+    for name, values in result.items():
+        expected = [getattr(state, name) for state in refs]
+        np.testing.assert_allclose(values, expected, rtol=1e-13, err_msg=name)
+
+    text = "\n".join(line for pair in tles for line in pair).encode()
+    from_catalog = SatrecArray.from_catalog(load_catalog(text))
+    from_tles = SatrecArray.from_tles([parse_tle(*lines) for lines in tles])
+    assert from_catalog.deep_rows.tolist() == from_tles.deep_rows.tolist()
+
+    pos_a, vel_a, err_a = from_catalog.propagate([0.0, 720.0])
+    pos_b, vel_b, err_b = from_tles.propagate([0.0, 720.0])
+    np.testing.assert_array_equal(err_a, err_b)
+    np.testing.assert_allclose(pos_a, pos_b, rtol=0.0, atol=1e-6)
+    np.testing.assert_allclose(vel_a, vel_b, rtol=0.0, atol=1e-9)
+
+
+def test_near_earth_kernel_numpy_matches_scalar():
+    np = pytest.importorskip("numpy")
+    xp = select_backend("numpy")
+    state = initialize_sgp4(parse_tle(*ISS))
+
+    pos, vel, err = near_earth_kernel(xp, state, np.array(TIMES))
+
+    assert np.all(err == 0)
+    for k, t in enumerate(TIMES):
+        r_ref, v_ref, _ = propagate_near_earth(state, t)
+        for c in range(3):
+            assert pos[c][k] == pytest.approx(r_ref[c], rel=1e-12, abs=1e-9)
+            assert vel[c][k] == pytest.approx(v_ref[c], rel=1e-12, abs=1e-12)
+
+
+@pytest.mark.parametrize("convert", [teme_to_ecef, teme_to_itrf])
+def test_frame_kernels_numpy_matches_scalar(convert):
+    np = pytest.importorskip("numpy")
+    state = initialize_sgp4(parse_tle(*ISS))
+
+    samples = [propagate_near_earth(state, t) for t in TIMES]
+    r = np.array([s[0] for s in samples])
+    v = np.array([s[1] for s in samples])
+    jd = state.epoch_jd + np.array(TIMES) / 1440.0
+
+    r_arr, v_arr = convert(r, v, jd, backend="numpy")
+
+    assert r_arr.shape == v_arr.shape == (len(TIMES), 3)
+    for k in range(len(TIMES)):
+        r_ref, v_ref = convert(tuple(r[k]), tuple(v[k]), float(jd[k]))
+        np.testing.assert_allclose(r_arr[k], r_ref, rtol=1e-12, atol=1e-9)
+        np.testing.assert_allclose(v_arr[k], v_ref, rtol=1e-12, atol=1e-12)
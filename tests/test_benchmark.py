@@ -0,0 +1,120 @@
+# Copyright (C) 2025-2026 Kris Kirby, KE4AHR
+# SPDX-License-Identifier: LGPL-3.0-or-later
+#
+# Tests for the benchmark suite and its regression check.
+
+import json
+
+import pytest
+
+from pyglspg4.constants import is_deep_space
+from pyglspg4.tle.catalog import checksum_ok
+from pyglspg4.tle.parser import parse_tle
+from pyglspg4.validation.benchmark import (
+    OPERATIONS,
+    REPORT_VERSION,
+    compare,
+    main,
+    run_benchmarks,
+    synthetic_tles,
+)
+
+
+def test_synthetic_catalog_is_valid_and_deterministic():
+    tles = synthetic_tles(20, deep_space_fraction=0.25, seed=3)
+
+    assert tles == synthetic_tles(20, deep_space_fraction=0.25, seed=3)
+    assert len({l1[2:7] for l1, _ in tles}) == 20
+
+    deep = 0
+    for line1, line2 in tles:
+        assert len(line1) == len(line2) == 69
+        assert checksum_ok(line1.encode()) and checksum_ok(line2.encode())
+        deep += is_deep_space(parse_tle(line1, line2).mean_motion)
+    assert deep == 5
+
+
+def test_report_covers_every_operation():
+    report = run_benchmarks(size=10, samples=3, repeats=1, passes=1)
+
+    assert set(report["results"]) == set(OPERATIONS)
+    for result in report["results"].values():
+        assert result["operations"] > 0
+        assert result["latency_us"] > 0.0
+        assert result["throughput"] > 0.0
+    json.dumps(report)
+
+
+def test_only_and_unknown_operations():
+    report = run_benchmarks(size=4, samples=2, repeats=1, only=["parse_tle"])
+    assert list(report["results"]) == ["parse_tle"]
+
+    with pytest.raises(ValueError):
+        run_benchmarks(size=4, only=["warp_drive"])
+
+
+def test_only_builds_the_fixtures_it_needs(monkeypatch):
+    import pyglspg4.sgp4.initializer as initializer
+
+    def fail(tle):
+        raise AssertionError("initialized for a parse-only run")
+
+    monkeypatch.setattr(initializer, "initialize_sgp4", fail)
+    report = run_benchmarks(size=4, samples=2, repeats=1, only=["parse_tle"])
+    assert list(report["results"]) == ["parse_tle"]
+
+
+def test_compare_refuses_different_settings():
+    config = {"size": 100, "samples": 60, "repeats": 5, "passes": 5, "seed": 0}
+    baseline = {
+        "version": REPORT_VERSION,
+        "config": config,
+        "results": {"a": {"latency_us": 10.0}},
+    }
+
+    # repeats only picks the best of more runs
+    same = dict(baseline, config=dict(config, repeats=1))
+    assert compare(same, baseline) == []
+
+    with pytest.raises(ValueError, match="size 20 vs 100"):
+        compare(dict(baseline, config=dict(config, size=20)), baseline)
+    with pytest.raises(ValueError, match="version"):
+        compare(dict(baseline, version=REPORT_VERSION + 1), baseline)
+
+
+def test_compare_flags_slowdowns_beyond_threshold():
+    baseline = {"results": {"a": {"latency_us": 10.0}, "b": {"latency_us": 10.0}}}
+    report = {
+        "results": {
+            "a": {"latency_us": 11.0},
+            "b": {"latency_us": 13.0},
+            "c": {"latency_us": 99.0},
+        }
+    }
+
+    regressions = compare(report, baseline, threshold=0.2)
+
+    assert [r["name"] for r in regressions] == ["b"]
+    assert regressions[0]["ratio"] == pytest.approx(1.3)
+
+
+def test_cli_writes_report_and_fails_on_regression(tmp_path, capsys):
+    args = ["--size", "4", "--samples", "2", "--repeats", "1",
+            "--only", "parse_tle"]
+    output = tmp_path / "report.json"
+
+    assert main(args + ["--output", str(output)]) == 0
+    report = json.loads(output.read_text())
+    assert "parse_tle" in report["results"]
+
+    fast = dict(report)
+    fast["results"] = {"parse_tle": {"latency_us": 1e-6}}
+    baseline = tmp_path / "baseline.json"
+    baseline.write_text(json.dumps(fast))
+
+    assert main(args + ["--baseline", str(baseline)]) == 1
+    assert "REGRESSION parse_tle" in capsys.readouterr().err
+
+    other = args[:1] + ["5"] + args[2:]
+    assert main(other + ["--baseline", str(baseline)]) == 2
+    assert "size 5 vs 4" in capsys.readouterr().err
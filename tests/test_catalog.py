@@ -0,0 +1,143 @@
+# Copyright (C) 2025-2026 Kris Kirby, KE4AHR
+# SPDX-License-Identifier: LGPL-3.0-or-later
+#
+# Tests for the columnar TLE catalog loader.
+
+import math
+
+import pytest
+
+from pyglspg4.tle.parser import parse_tle
+from pyglspg4.tle import catalog as catalog_module
+from pyglspg4.tle.catalog import load_catalog, checksum_ok
+
+
+ISS = (
+    "1 25544U 98067A   24001.51869444  .00016717  00000-0  10270-3 0  9993",
+    "2 25544  51.6405  24.4561 0004382  88.1684  38.3275 15.49745126398784",
+)
+NOAA = (
+    "1 43013U 17073A   24001.50000000 -.00000260  00000-0 -10000-4 0  9996",
+    "2 43013  98.7100 100.0000 0011000 200.0000 160.0000 14.19500000300003",
+)
+BAD_CHECKSUM = (
+    "1 25544U 98067A   24001.51869444  .00016717  00000-0  10270-3 0  9990",
+    ISS[1],
+)
+
+CATALOG = "\n".join(
+    ["ISS (ZARYA)", *ISS, "0 NOAA 20", *NOAA, "BROKEN", *BAD_CHECKSUM, ""]
+).encode("ascii")
+
+
+def _assert_matches(cat, index, lines):
+    ref = parse_tle(*lines)
+    tle = cat.tle(index)
+    for name, value in vars(ref).items():
+        got = getattr(tle, name)
+        if isinstance(value, float):
+            assert math.isclose(got, value, rel_tol=1e-12, abs_tol=1e-15), name
+        else:
+            assert got == value, name
+
+
+def test_checksum():
+    assert checksum_ok(ISS[0].encode())
+    assert checksum_ok(NOAA[0].encode())
+    assert not checksum_ok(BAD_CHECKSUM[0].encode())
+
+
+def test_columns_match_parser():
+    cat = load_catalog(CATALOG)
+
+    assert len(cat) == 2
+    assert cat.names == ["ISS (ZARYA)", "NOAA 20"]
+    _assert_matches(cat, 0, ISS)
+    _assert_matches(cat, 1, NOAA)
+
+
+def test_reports_malformed_records():
+    cat = load_catalog(CATALOG + b"2 99999  orphan\n")
+
+    messages = {(e.name, e.message) for e in cat.errors}
+    assert ("BROKEN", "Line 1 checksum mismatch") in messages
+    assert any(m == "Orphan line 2" for _, m in messages)
+    assert cat.errors[0].line_number in (7, 10)
+
+
+def test_python_path_matches(monkeypatch, tmp_path):
+    path = tmp_path / "catalog.txt"
+    path.write_bytes(CATALOG)
+
+    monkeypatch.setattr(
+        catalog_module, "_build_numpy", catalog_module._build_python
+    )
+    cat = load_catalog(path)
+
+    assert len(cat) == 2
+    assert len(cat.errors) == 1
+    _assert_matches(cat, 0, ISS)
+    _assert_matches(cat, 1, NOAA)
+
+
+def test_unparsable_field_is_reported():
+    pytest.importorskip("numpy")
+
+    garbled = ISS[1][:8] + " 51.6x05" + ISS[1][16:68]
+    garbled += str(
+        sum(int(c) if c.isdigit() else c == "-" for c in garbled) % 10
+    )
+    cat = load_catalog("\n".join([*NOAA, ISS[0], garbled]).encode())
+
+    assert len(cat) == 1
+    assert cat.satnum.tolist() == [43013]
+    assert cat.errors[0].message.startswith("Unparsable field")
+
+
+def test_feeds_satrec_array():
+    pytest.importorskip("numpy")
+    from pyglspg4.sgp4.satrec_array import SatrecArray
+
+    cat = load_catalog(CATALOG)
+    from_catalog = SatrecArray.from_catalog(cat)
+    from_tles = SatrecArray.from_tles([parse_tle(*ISS), parse_tle(*NOAA)])
+
+    pos_a, vel_a, _ = from_catalog.propagate([0.0, 90.0])
+    pos_b, vel_b, _ = from_tles.propagate([0.0, 90.0])
+
+    assert from_catalog.satnums.tolist() == [25544, 43013]
+    assert (abs(pos_a - pos_b) < 1e-6).all()
+    assert (abs(vel_a - vel_b) < 1e-9).all()
+
+
+def _with_checksum(line):
+    body = line[:68]
+    return body + str(
+        sum(int(c) if c.isdigit() else c == "-" for c in body) % 10
+    )
+
+
+def test_bad_exponent_rows_do_not_slow_the_catalog(monkeypatch):
+    pytest.importorskip("numpy")
+
+    def no_fallback(*args):
+        raise AssertionError("whole catalog fell back to the Python path")
+
+    monkeypatch.setattr(catalog_module, "_build_python", no_fallback)
+
+    blank = _with_checksum(NOAA[0][:53] + " " * 8 + NOAA[0][61:])
+    odd = _with_checksum(ISS[0][:59] + "-x" + ISS[0][61:])
+    cat = load_catalog(
+        "\n".join([*ISS, blank, NOAA[1], odd, ISS[1], *NOAA]).encode()
+    )
+
+    # The blank bstar field parses to zero as in parse_tle, the garbled
+    # exponent is reported, and record order is kept.
+    assert cat.satnum.tolist() == [25544, 43013, 43013]
+    assert cat.bstar.tolist()[1] == 0.0
+    _assert_matches(cat, 0, ISS)
+    _assert_matches(cat, 1, (blank, NOAA[1]))
+    _assert_matches(cat, 2, NOAA)
+    assert len(cat.errors) == 1
+    assert cat.errors[0].line_number == 5
+    assert cat.errors[0].message.startswith("Unparsable field")
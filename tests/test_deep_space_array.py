@@ -0,0 +1,120 @@
+# Copyright (C) 2025-2026 Kris Kirby, KE4AHR
+# SPDX-License-Identifier: LGPL-3.0-or-later
+#
+# Tests for the batched lunar-solar periodics and the vectorized
+# SDP-4 propagator.
+
+import math
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from pyglspg4.sdp4.deep_space_array import DeepSpaceArray
+from pyglspg4.sdp4.dpper import dpper
+from pyglspg4.sdp4.dpper_array import PeriodicArray
+from pyglspg4.sdp4.initializer import initialize_deep_space
+from pyglspg4.sdp4.propagate import propagate_deep_space
+from pyglspg4.tle.parser import parse_tle
+
+
+GEO = (
+    "1 40271U 14057A   20029.78495062 -.00000298  00000-0  00000+0 0  9990",
+    "2 40271   0.0170  84.6434 0001146 103.5137  19.7067  1.00272009 19430",
+)
+MOLNIYA = (
+    "1 26853U 01002A   20028.90346378  .00000067  00000-0  00000+0 0  9994",
+    "2 26853  63.4352  89.6846 7222578 270.4485  20.9784  2.00613453 13807",
+)
+HEO = (
+    "1 11801U          80230.29629788  .01431103  00000-0  14311-1 0    13",
+    "2 11801  46.7916 230.4354 7318036  47.4722  10.4117  2.28537848    13",
+)
+
+TIMES = [-1440.0, -720.0, 0.0, 719.5, 720.0, 4320.0, 43200.0, 1.0e6]
+
+
+def _records():
+    return [
+        initialize_deep_space(parse_tle(*lines))
+        for lines in (GEO, MOLNIYA, HEO)
+    ]
+
+
+def test_periodics_match_scalar():
+    records = _records()
+    periodic = PeriodicArray(records)
+
+    t = np.tile(np.array(TIMES[:-1]), (len(records), 1))
+    elements = [
+        np.tile(np.array([[getattr(r, name)] for r in records]), (1, t.shape[1]))
+        for name in (
+            "eccentricity", "inclination", "raan", "arg_perigee", "mean_anomaly"
+        )
+    ]
+
+    result = periodic.apply(t, *elements)
+
+    for i, record in enumerate(records):
+        for j, tsince in enumerate(t[i].tolist()):
+            expected = dpper(
+                record, tsince, *(float(e[i, j]) for e in elements)
+            )
+            for k in range(5):
+                assert math.isclose(
+                    result[k][i, j], expected[k], rel_tol=1e-12, abs_tol=1e-15
+                )
+
+
+def test_shared_epoch_shares_time_terms():
+    record = _records()[0]
+    periodic = PeriodicArray([record, record])
+    t = np.array([[0.0, 60.0], [0.0, 60.0]])
+
+    f2s = periodic.terms(t)[0]
+
+    assert f2s.shape == (2, 2)
+    assert np.array_equal(f2s[0], f2s[1])
+
+    # A shared grid is evaluated once per epoch group, with the same
+    # terms as the per-object evaluation
+    records = _records()
+    periodic = PeriodicArray([records[0], records[1], records[0]])
+    grid = np.broadcast_to(np.array(TIMES), (3, len(TIMES)))
+    grouped = periodic.terms(grid)
+    direct = periodic.terms(np.array(grid))
+    for a, b in zip(grouped, direct):
+        assert a.shape == (3, len(TIMES))
+        assert np.array_equal(a, b)
+
+
+def test_propagation_matches_scalar():
+    records = _records()
+
+    position, velocity, error = DeepSpaceArray(records).propagate(TIMES)
+
+    assert position.shape == (3, len(TIMES), 3)
+    for i, record in enumerate(records):
+        for j, tsince in enumerate(TIMES):
+            r, v, err = propagate_deep_space(record, tsince, cache=None)
+            assert error[i, j] == err
+            for k in range(3):
+                assert math.isclose(position[i, j, k], r[k], abs_tol=1e-8)
+                assert math.isclose(velocity[i, j, k], v[k], abs_tol=1e-11)
+
+    # The HEO object has decayed long before 1e6 minutes
+    assert error[2, -1] != 0
+    assert not position[2, -1].any()
+
+
+def test_per_object_times():
+    records = _records()[:2]
+    t = np.array([[0.0, 1440.0], [720.0, -720.0]])
+
+    position, _, _ = DeepSpaceArray(records).propagate(t)
+
+    r, _, _ = propagate_deep_space(records[1], -720.0, cache=None)
+    assert np.allclose(position[1, 1], r, atol=1e-8)
+
+    with pytest.raises(ValueError):
+        DeepSpaceArray(records).propagate(np.zeros((3, 2)))
@@ -0,0 +1,221 @@
+# Copyright (C) 2025-2026 Kris Kirby, KE4AHR
+# SPDX-License-Identifier: LGPL-3.0-or-later
+#
+# Tests for the array-backed EOP table.
+
+import math
+import os
+
+import pytest
+
+from pyglspg4.frames import eop
+from pyglspg4.frames.eop import CACHE_SUFFIX, EOPRecord, EOPTable
+
+
+FINALS_LINE = (
+    "24 1 1 60310.00 I  0.139538 0.000025  0.167919 0.000028"
+    "  I 0.0121447 0.0000121  0.6211 0.0090  I"
+)
+
+
+def _table(method="linear", days=range(60300, 60320)):
+    table = EOPTable(method)
+    table.load_records(
+        EOPRecord(
+            mjd=d,
+            xp=0.1 + 0.001 * (d - 60300) ** 2,
+            yp=0.3 - 0.002 * (d - 60300),
+            ut1_utc=0.01 - 0.0005 * (d - 60300),
+        )
+        for d in days
+    )
+    return table
+
+
+def test_parses_finals2000a_columns(tmp_path):
+    path = tmp_path / "finals2000A.data"
+    path.write_text(FINALS_LINE + "\n")
+    table = EOPTable()
+    table.load_finals2000a(str(path))
+
+    rec = table.get(60310)
+    assert (rec.xp, rec.yp, rec.ut1_utc) == (0.139538, 0.167919, 0.0121447)
+    assert rec.xp_arcsec == rec.xp and rec.yp_arcsec == rec.yp
+    assert table.revision == 1
+
+
+def test_linear_interpolation_and_coverage():
+    table = _table()
+    rec = table.interpolate(60305.25)
+    assert rec.yp == pytest.approx(0.3 - 0.002 * 5.25)
+    assert rec.xp == pytest.approx(0.75 * 0.125 + 0.25 * 0.136)
+
+    assert table.interpolate(60319.0).mjd == 60319.0
+    assert table.interpolate(60299.9) is None
+    assert table.interpolate(60319.1) is None
+    assert table.get(60400) is None
+
+
+def test_lagrange_is_exact_for_cubics():
+    table = _table("lagrange")
+    for mjd in (60300.3, 60310.5, 60318.75):
+        rec = table.interpolate(mjd)
+        assert rec.xp == pytest.approx(0.1 + 0.001 * (mjd - 60300) ** 2)
+
+
+def test_gap_disables_interpolation_across_it():
+    table = _table(days=[d for d in range(60300, 60320) if d != 60310])
+    assert table.get(60310) is None
+    assert table.interpolate(60309.5) is None
+    assert table.interpolate(60308.5, "lagrange") is not None
+
+
+def test_leap_second_step_is_not_smeared():
+    table = EOPTable()
+    table.load_records(
+        [
+            EOPRecord(mjd=57752, xp=0.0, yp=0.0, ut1_utc=-0.5920),
+            EOPRecord(mjd=57753, xp=0.0, yp=0.0, ut1_utc=-0.5930),
+            EOPRecord(mjd=57754, xp=0.0, yp=0.0, ut1_utc=0.4060),
+            EOPRecord(mjd=57755, xp=0.0, yp=0.0, ut1_utc=0.4050),
+        ]
+    )
+    assert table.interpolate(57753.5).ut1_utc == pytest.approx(-0.5935)
+    assert table.interpolate(57754.5).ut1_utc == pytest.approx(0.4055)
+    assert table.interpolate(57753.5, "lagrange").ut1_utc == pytest.approx(
+        -0.5935, abs=1e-4
+    )
+
+
+@pytest.mark.parametrize("method", ["linear", "lagrange"])
+def test_interpolate_many_matches_scalar(method):
+    np = pytest.importorskip("numpy")
+    table = _table(days=[d for d in range(60300, 60320) if d != 60312])
+    mjds = np.linspace(60299.5, 60320.5, 97).reshape(1, 97)
+
+    xp, yp, dut1 = table.interpolate_many(mjds, method)
+    assert xp.shape == mjds.shape
+
+    for k, mjd in enumerate(mjds[0]):
+        rec = table.interpolate(float(mjd), method)
+        if rec is None:
+            assert math.isnan(xp[0, k]) and math.isnan(dut1[0, k])
+        else:
+            assert xp[0, k] == pytest.approx(rec.xp, abs=1e-12)
+            assert yp[0, k] == pytest.approx(rec.yp, abs=1e-12)
+            assert dut1[0, k] == pytest.approx(rec.ut1_utc, abs=1e-12)
+
+
+def test_reload_merges_and_bumps_revision():
+    table = _table()
+    revision = table.revision
+    table.load_records([EOPRecord(mjd=60330, xp=1.0, yp=2.0, ut1_utc=0.0)])
+    assert table.revision == revision + 1
+    assert (table.first_mjd, table.last_mjd) == (60300, 60330)
+    assert table.get(60305) is not None
+    assert table.get(60325) is None
+
+
+def _write_finals(path, days):
+    lines = [
+        FINALS_LINE[:7] + f"{d:8.2f}" + FINALS_LINE[15:]
+        for d in days
+    ]
+    path.write_text("\n".join(lines) + "\n")
+
+
+def test_binary_cache_is_written_and_mapped(tmp_path):
+    source = tmp_path / "finals2000A.data"
+    _write_finals(source, range(60310, 60320))
+
+    first = EOPTable()
+    first.load_finals2000a(str(source))
+    cache = tmp_path / ("finals2000A.data" + CACHE_SUFFIX)
+    assert cache.exists()
+
+    second = EOPTable()
+    second.load_finals2000a(str(source))
+    assert isinstance(second._columns.xp, memoryview)
+    assert second.get(60315) == first.get(60315)
+    assert second.interpolate(60312.5) == first.interpolate(60312.5)
+
+
+def test_binary_cache_follows_source_changes(tmp_path):
+    source = tmp_path / "finals2000A.data"
+    _write_finals(source, range(60310, 60320))
+    EOPTable().load_finals2000a(str(source))
+
+    # Same contents, new mtime: cache reused
+    stat = source.stat()
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    table = EOPTable()
+    table.load_finals2000a(str(source))
+    assert isinstance(table._columns.xp, memoryview)
+
+    # New contents: reparsed
+    _write_finals(source, range(60310, 60330))
+    table = EOPTable()
+    table.load_finals2000a(str(source))
+    assert table.last_mjd == 60329
+
+    table = EOPTable()
+    table.load_finals2000a(str(source))
+    assert isinstance(table._columns.xp, memoryview)
+    assert table.last_mjd == 60329
+
+
+def test_same_size_edit_with_unchanged_mtime_is_detected(tmp_path):
+    source = tmp_path / "finals2000A.data"
+    _write_finals(source, range(60310, 60320))
+    stat = source.stat()
+    EOPTable().load_finals2000a(str(source))
+
+    # Same length and mtime, different values
+    source.write_text(source.read_text().replace("0.139538", "0.239538"))
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert source.stat().st_size == stat.st_size
+
+    table = EOPTable()
+    table.load_finals2000a(str(source))
+    assert table.get(60315).xp == pytest.approx(0.239538)
+
+
+def test_settled_cache_skips_the_content_hash(tmp_path, monkeypatch):
+    source = tmp_path / "finals2000A.data"
+    _write_finals(source, range(60310, 60320))
+    stat = source.stat()
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns - 3600 * 10**9))
+    EOPTable().load_finals2000a(str(source))
+
+    def no_hash(data):
+        raise AssertionError("source re-hashed")
+
+    monkeypatch.setattr(eop, "_digest", no_hash)
+    table = EOPTable()
+    table.load_finals2000a(str(source))
+    assert isinstance(table._columns.xp, memoryview)
+
+
+def test_cache_is_rejected_when_source_cannot_be_read(tmp_path):
+    source = tmp_path / "finals2000A.data"
+    _write_finals(source, range(60310, 60320))
+    EOPTable().load_finals2000a(str(source))
+    cache = str(source) + CACHE_SUFFIX
+
+    source.unlink()
+    source.mkdir()
+    assert eop._read_cache(cache, str(source)) is None
+
+
+def test_corrupt_cache_is_ignored(tmp_path):
+    source = tmp_path / "finals2000A.data"
+    _write_finals(source, range(60310, 60312))
+    (tmp_path / ("finals2000A.data" + CACHE_SUFFIX)).write_bytes(b"garbage")
+
+    table = EOPTable()
+    table.load_finals2000a(str(source))
+    assert len(table) == 2
+
+    uncached = EOPTable()
+    uncached.load_finals2000a(str(source), cache=False)
+    assert uncached.get(60311) == table.get(60311)
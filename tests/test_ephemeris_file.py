@@ -0,0 +1,111 @@
+# Copyright (C) 2025-2026 Kris Kirby, KE4AHR
+# SPDX-License-Identifier: LGPL-3.0-or-later
+#
+# Tests for binary ephemeris files.
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from pyglspg4.api.stream import stream_ephemeris
+from pyglspg4.export.ephemeris import (
+    EphemerisFile,
+    EphemerisWriter,
+    write_ephemeris,
+)
+from pyglspg4.sgp4.satrec_array import SatrecArray
+from pyglspg4.tle.parser import parse_tle
+
+
+TLES = [
+    (
+        "1 25544U 98067A   24001.51869444  .00016717  00000-0  10270-3 0  9991",
+        "2 25544  51.6405  24.4561 0004382  88.1684  38.3275 15.49745126398784",
+    ),
+    (
+        "1 40271U 14057A   20029.78495062 -.00000298  00000-0  00000+0 0  9990",
+        "2 40271   0.0170  84.6434 0001146 103.5137  19.7067  1.00272009 19430",
+    ),
+]
+
+JD_START = 2460311.25
+
+
+def _sats():
+    return SatrecArray.from_tles([parse_tle(*lines) for lines in TLES])
+
+
+def test_round_trip(tmp_path):
+    sats = _sats()
+    path = tmp_path / "catalog.pgeph"
+
+    write_ephemeris(path, sats, JD_START, 0.1, 60.0, chunk_size=25)
+
+    chunks = list(stream_ephemeris(sats, JD_START, 0.1, 60.0))
+    position = np.concatenate([c.position for c in chunks], axis=1)
+    velocity = np.concatenate([c.velocity for c in chunks], axis=1)
+
+    with EphemerisFile(path) as eph:
+        assert list(eph.satnums) == [25544, 40271]
+        assert eph.frame == "TEME"
+        assert eph.step_seconds == 60.0
+        assert len(eph) == 145
+        assert np.array_equal(eph.data[..., :3], position)
+        assert np.array_equal(eph.data[..., 3:], velocity)
+
+        geo = eph.satellite(40271)
+        assert geo.shape == (145, 6)
+        assert np.array_equal(geo[:, :3], position[1])
+        with pytest.raises(KeyError):
+            eph.satellite(99999)
+
+
+def test_time_window(tmp_path):
+    path = tmp_path / "window.pgeph"
+    write_ephemeris(path, _sats(), JD_START, 0.1, 60.0)
+
+    with EphemerisFile(path) as eph:
+        jd, samples = eph.window(JD_START + 10 / 1440.0, JD_START + 20 / 1440.0)
+
+        assert samples.shape == (2, 11, 6)
+        assert np.allclose(jd, JD_START + np.arange(10, 21) / 1440.0)
+        assert np.array_equal(samples, eph.data[:, 10:21])
+
+        jd, samples = eph.window(JD_START - 1.0, JD_START - 0.5)
+        assert samples.shape == (2, 0, 6)
+
+
+def test_writer_accepts_blocks_in_any_order(tmp_path):
+    path = tmp_path / "blocks.pgeph"
+    position = np.arange(2 * 4 * 3, dtype=float).reshape(2, 4, 3)
+    velocity = -position
+
+    with EphemerisWriter(path, [1, 2], JD_START, 1.0, 4, frame="ITRF") as w:
+        w.write(2, position[:, 2:], velocity[:, 2:])
+        w.write(0, position[:, :2], velocity[:, :2])
+
+    with EphemerisFile(path) as eph:
+        assert eph.frame == "ITRF"
+        assert np.array_equal(eph.data[..., :3], position)
+        assert np.array_equal(eph.data[..., 3:], velocity)
+
+
+def test_incomplete_file_is_discarded(tmp_path):
+    path = tmp_path / "partial.pgeph"
+    block = np.zeros((1, 2, 3))
+
+    writer = EphemerisWriter(path, [1], JD_START, 1.0, 4)
+    writer.write(0, block, block)
+    with pytest.raises(ValueError):
+        writer.close()
+
+    assert not path.exists()
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / "other.bin"
+    path.write_bytes(b"not an ephemeris" * 8)
+
+    with pytest.raises(ValueError):
+        EphemerisFile(path)
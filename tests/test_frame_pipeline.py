@@ -0,0 +1,130 @@
+# Copyright (C) 2025-2026 Kris Kirby, KE4AHR
+# SPDX-License-Identifier: LGPL-3.0-or-later
+#
+# Tests for the batched TEME -> ITRF pipeline.
+
+import math
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+import pyglspg4.frames.itrf as itrf
+from pyglspg4.frames.eop import EOPTable
+from pyglspg4.frames.pipeline import (
+    RotationCache,
+    frame_rotations,
+    teme_to_itrf_array,
+)
+from pyglspg4.frames.polar_motion import apply_polar_motion, polar_motion_matrix
+from pyglspg4.frames.sidereal import earth_rotation_angle
+from pyglspg4.frames.teme_to_ecef import OMEGA_EARTH
+
+
+JD0 = 2460311.0
+
+
+def _finals_line(mjd, xp, yp, ut1_utc):
+    line = [" "] * 80
+    for start, text in (
+        (7, f"{mjd:8.2f}"),
+        (18, f"{xp:9.6f}"),
+        (37, f"{yp:9.6f}"),
+        (58, f"{ut1_utc:10.7f}"),
+    ):
+        line[start:start + len(text)] = text
+    return "".join(line) + "\n"
+
+
+@pytest.fixture
+def eop(tmp_path):
+    path = tmp_path / "finals2000A.data"
+    path.write_text(
+        _finals_line(60310, 0.12, 0.31, 0.0121)
+        + _finals_line(60311, 0.13, 0.30, 0.0118)
+        + _finals_line(60312, 0.14, 0.29, 0.0114)
+    )
+    table = EOPTable()
+    table.load_finals2000a(str(path))
+    return table
+
+
+def _ephemeris(n_sat, n_time, seed=1):
+    rng = np.random.default_rng(seed)
+    r = rng.normal(size=(n_sat, n_time, 3)) * 7000.0
+    v = rng.normal(size=(n_sat, n_time, 3)) * 7.5
+    return r, v
+
+
+def test_gmst_path_matches_scalar(eop, monkeypatch):
+    monkeypatch.setattr(itrf, "DEFAULT_EOP", eop)
+    jd = JD0 + np.linspace(0.0, 1.4, 7)
+    r, v = _ephemeris(3, 7)
+
+    r_itrf, v_itrf = teme_to_itrf_array(r, v, jd, eop=eop, cache=None)
+
+    for n in range(3):
+        for k in range(7):
+            r_ref, v_ref = itrf.teme_to_itrf(tuple(r[n, k]), tuple(v[n, k]), jd[k])
+            np.testing.assert_allclose(r_itrf[n, k], r_ref, rtol=0, atol=1e-8)
+            np.testing.assert_allclose(v_itrf[n, k], v_ref, rtol=0, atol=1e-11)
+
+
+def test_era_path_matches_scalar_chain(eop):
+    jd = JD0 + np.linspace(0.0, 1.4, 5)
+    r, v = _ephemeris(2, 5)
+
+    r_itrf, v_itrf = teme_to_itrf_array(r, v, jd, method="era", eop=eop, cache=None)
+
+    for k, jd_utc in enumerate(jd):
+        rec = eop.interpolate(jd_utc - 2400000.5)
+        theta = earth_rotation_angle(jd_utc + rec.ut1_utc / 86400.0)
+        c, s = math.cos(theta), math.sin(theta)
+        pm = polar_motion_matrix(rec.xp, rec.yp)
+        for n in range(2):
+            x, y, z = r[n, k]
+            vx, vy, vz = v[n, k]
+            r_pef = (c * x + s * y, -s * x + c * y, z)
+            v_pef = (
+                c * vx + s * vy + OMEGA_EARTH * r_pef[1],
+                -s * vx + c * vy - OMEGA_EARTH * r_pef[0],
+                vz,
+            )
+            np.testing.assert_allclose(
+                r_itrf[n, k], apply_polar_motion(r_pef, pm), atol=1e-8
+            )
+            np.testing.assert_allclose(
+                v_itrf[n, k], apply_polar_motion(v_pef, pm), atol=1e-11
+            )
+
+
+def test_velocity_includes_earth_rotation():
+    # A point fixed in the rotating frame has zero ITRF velocity
+    jd = np.array([JD0])
+    rot = frame_rotations(jd, eop=EOPTable())
+    r_teme = np.array([[7000.0, 0.0, 0.0]])
+    v_teme = OMEGA_EARTH * np.array([[0.0, 7000.0, 0.0]])
+
+    _, v_itrf = rot.apply(r_teme, v_teme)
+    np.testing.assert_allclose(v_itrf, 0.0, atol=1e-12)
+
+
+def test_cache_reuses_rotations_until_eop_reload(eop, tmp_path):
+    cache = RotationCache(max_entries=2)
+    jd = JD0 + np.arange(4) / 24.0
+
+    first = cache.rotations(jd, eop=eop)
+    assert cache.rotations(jd.copy(), eop=eop) is first
+    assert cache.rotations(jd, method="era", eop=eop) is not first
+
+    path = tmp_path / "more.data"
+    path.write_text(_finals_line(60312, 0.1, 0.2, 0.01))
+    eop.load_finals2000a(str(path))
+    assert cache.rotations(jd, eop=eop) is not first
+    assert len(cache) == 2
+
+
+def test_rejects_mismatched_grid():
+    rot = frame_rotations(JD0 + np.arange(3), eop=EOPTable())
+    with pytest.raises(ValueError):
+        rot.apply(np.zeros((2, 4, 3)))
@@ -0,0 +1,60 @@
+# Copyright (C) 2025-2026 Kris Kirby, KE4AHR
+# SPDX-License-Identifier: LGPL-3.0-or-later
+#
+# Tests for the scalar and array Kepler equation solvers.
+
+import math
+
+import pytest
+
+from pyglspg4.backend.python import PythonBackend
+from pyglspg4.math.numerics import (
+    solve_kepler,
+    solve_kepler_scalar,
+    solve_kepler_array,
+)
+
+
+ECCENTRICITIES = [0.0, 1.0e-4, 0.1, 0.5, 0.8, 0.95, 0.999]
+
+
+def test_scalar_residual():
+    for e in ECCENTRICITIES:
+        for k in range(64):
+            M = k * 2.0 * math.pi / 64
+            E, ok = solve_kepler_scalar(M, e)
+            assert ok
+            assert abs(E - e * math.sin(E) - M) < 1.0e-11
+
+
+def test_legacy_solver_agrees():
+    for e in ECCENTRICITIES:
+        E, _ = solve_kepler_scalar(1.3, e)
+        assert solve_kepler(1.3, e, PythonBackend()) == E
+
+
+def test_array_matches_scalar():
+    np = pytest.importorskip("numpy")
+
+    M = np.linspace(0.0, 2.0 * math.pi, 101)
+    e = np.array(ECCENTRICITIES)[:, np.newaxis]
+
+    E, converged = solve_kepler_array(M, e)
+
+    assert E.shape == (len(ECCENTRICITIES), M.size)
+    assert converged.all()
+    for i, ecc in enumerate(ECCENTRICITIES):
+        for j, m in enumerate(M):
+            ref, _ = solve_kepler_scalar(float(m), ecc)
+            assert math.isclose(E[i, j], ref, abs_tol=1.0e-12)
+
+
+def test_array_reports_non_convergence():
+    np = pytest.importorskip("numpy")
+
+    E, converged = solve_kepler_array(
+        np.array([0.5, 0.5]), np.array([0.0, 0.9]), max_iter=0
+    )
+
+    assert converged.tolist() == [True, False]
+    assert E[0] == 0.5
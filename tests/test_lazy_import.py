@@ -0,0 +1,75 @@
+# Copyright (C) 2025-2026 Kris Kirby, KE4AHR
+# SPDX-License-Identifier: LGPL-3.0-or-later
+#
+# Tests for the lazy top-level package API.
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+import pyglspg4
+
+
+# Generous bound for CI machines; the import itself takes well under 1 ms
+IMPORT_BUDGET_S = 0.05
+
+ISS = (
+    "1 25544U 98067A   24001.51869444  .00016717  00000-0  10270-3 0  9991",
+    "2 25544  51.6405  24.4561 0004382  88.1684  38.3275 15.49745126398784",
+)
+
+
+def _fresh(code):
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(out)
+
+
+def test_import_is_fast_and_loads_nothing():
+    result = _fresh(
+        "import json, sys, time\n"
+        "start = time.perf_counter()\n"
+        "import pyglspg4\n"
+        "elapsed = time.perf_counter() - start\n"
+        "print(json.dumps({'elapsed': elapsed, 'modules': sorted(sys.modules)}))\n"
+    )
+
+    loaded = [m for m in result["modules"] if m.startswith("pyglspg4.")]
+    assert loaded == []
+    assert "numpy" not in result["modules"]
+    assert result["elapsed"] < IMPORT_BUDGET_S
+
+
+def test_attribute_access_loads_only_what_it_needs():
+    result = _fresh(
+        "import json, sys, pyglspg4\n"
+        f"sat = pyglspg4.Satellite.from_lines(*{ISS!r})\n"
+        "position, velocity, error = sat.at(10.0)\n"
+        "print(json.dumps(sorted(sys.modules)))\n"
+    )
+
+    assert "pyglspg4.api.satellite" in result
+    assert "pyglspg4.frames.eop" not in result
+    assert "numpy" not in result
+
+
+def test_lazy_names_resolve_to_their_modules():
+    pytest.importorskip("numpy")
+    from pyglspg4.api.satellite import Satellite
+
+    assert pyglspg4.Satellite is Satellite
+    assert "Satellite" in vars(pyglspg4)
+    assert pyglspg4.__all__ == sorted(pyglspg4._LAZY)
+    assert set(pyglspg4.__all__) <= set(dir(pyglspg4))
+    for name in pyglspg4._LAZY:
+        getattr(pyglspg4, name)
+
+    assert isinstance(pyglspg4.__version__, str)
+    with pytest.raises(AttributeError):
+        pyglspg4.no_such_name
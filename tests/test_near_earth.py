@@ -0,0 +1,61 @@
+# Copyright (C) 2025-2026 Kris Kirby, KE4AHR
+# SPDX-License-Identifier: LGPL-3.0-or-later
+#
+# Tests for the side-effect-free near-Earth SGP-4 kernel.
+
+import dataclasses
+
+import pytest
+
+from pyglspg4.tle.parser import parse_tle
+from pyglspg4.sgp4.initializer import initialize
+from pyglspg4.sgp4.near_earth import near_earth_kernel, propagate_near_earth
+from pyglspg4.constants import SGP4_ERROR_ECCENTRICITY, SGP4_ERROR_NONE
+from pyglspg4.parallel.executors import run_threaded
+
+
+ISS_TLE = (
+    "1 25544U 98067A   24001.51869444  .00016717  00000-0  10270-3 0  9991",
+    "2 25544  51.6405  24.4561 0004382  88.1684  38.3275 15.49745126398784",
+)
+
+
+def test_state_is_not_modified():
+    state = initialize(parse_tle(*ISS_TLE))
+    before = dataclasses.asdict(state)
+
+    propagate_near_earth(state, 720.0)
+
+    assert dataclasses.asdict(state) == before
+
+
+def test_shared_state_across_threads():
+    state = initialize(parse_tle(*ISS_TLE))
+    times = [float(t) for t in range(0, 1440, 7)]
+
+    serial = [propagate_near_earth(state, t) for t in times]
+    threaded = run_threaded(
+        lambda t: propagate_near_earth(state, t),
+        times * 4,
+        max_workers=8,
+    )
+
+    assert threaded == serial * 4
+
+
+def test_eccentricity_failure_zeroes_only_failed_samples():
+    # A negative cc4 grows the eccentricity past 1 after 10^4 minutes
+    state = dataclasses.replace(
+        initialize(parse_tle(*ISS_TLE)), cc4=-1.0, bstar=1.0e-4
+    )
+
+    r, v, err = propagate_near_earth(state, 2.0e4)
+    assert err == SGP4_ERROR_ECCENTRICITY
+    assert r == (0.0, 0.0, 0.0) and v == (0.0, 0.0, 0.0)
+
+    np = pytest.importorskip("numpy")
+    from pyglspg4.backend.numpy import NUMPY
+
+    pos, vel, error = near_earth_kernel(NUMPY, state, np.array([0.0, 2.0e4]))
+    assert error.tolist() == [SGP4_ERROR_NONE, SGP4_ERROR_ECCENTRICITY]
+    assert all(p[1] == 0.0 and p[0] != 0.0 for p in pos + vel)
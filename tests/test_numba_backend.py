@@ -0,0 +1,133 @@
+# Copyright (C) 2025-2026 Kris Kirby, KE4AHR
+# SPDX-License-Identifier: LGPL-3.0-or-later
+#
+# Tests for the optional Numba backend and its fallback.
+
+import sys
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from pyglspg4.backend import selector
+from pyglspg4.backend.selector import available_backends, select_backend
+from pyglspg4.frames.itrf import teme_to_itrf
+from pyglspg4.frames.teme_to_ecef import teme_to_ecef
+from pyglspg4.sgp4.initializer import initialize_sgp4
+from pyglspg4.sgp4.near_earth import propagate_near_earth
+from pyglspg4.sgp4.satrec_array import SatrecArray
+from pyglspg4.tle.parser import parse_tle
+
+
+TLES = [
+    (
+        "1 25544U 98067A   24001.51869444  .00016717  00000-0  10270-3 0  9991",
+        "2 25544  51.6405  24.4561 0004382  88.1684  38.3275 15.49745126398784",
+    ),
+    (
+        "1 25544U 98067A   20029.54791435  .00001264  00000-0  29621-4 0  9991",
+        "2 25544  51.6434  69.4038 0007414  74.5522  51.6356 15.49461746211616",
+    ),
+]
+
+TIMES = [0.0, 17.5, 92.0, -45.0, 1440.0]
+
+
+def test_falls_back_to_numpy_without_numba(monkeypatch):
+    monkeypatch.setattr(selector, "_LOADED", {})
+    monkeypatch.setattr(selector, "_FAILED", {})
+    monkeypatch.delitem(sys.modules, "pyglspg4.backend.numba", raising=False)
+    monkeypatch.setitem(sys.modules, "numba", None)
+
+    backend = select_backend("numba")
+
+    assert backend.name == "numpy"
+    assert "numba" not in available_backends()
+
+
+def test_matches_python_backend_within_tolerance():
+    pytest.importorskip("numba")
+    from pyglspg4.backend.numba import (
+        POSITION_TOLERANCE_KM,
+        VELOCITY_TOLERANCE_KM_S,
+    )
+
+    backend = select_backend("numba")
+    assert backend.name == "numba"
+
+    sats = SatrecArray.from_tles([parse_tle(*lines) for lines in TLES])
+    pos, vel, err = sats.propagate(TIMES, backend=backend)
+
+    assert np.all(err == 0)
+    for n, lines in enumerate(TLES):
+        state = initialize_sgp4(parse_tle(*lines))
+        for k, t in enumerate(TIMES):
+            r_ref, v_ref, _ = propagate_near_earth(state, t)
+            np.testing.assert_allclose(
+                pos[n, k], r_ref, rtol=0, atol=POSITION_TOLERANCE_KM
+            )
+            np.testing.assert_allclose(
+                vel[n, k], v_ref, rtol=0, atol=VELOCITY_TOLERANCE_KM_S
+            )
+
+    # Per-satellite (N, M) times take the same compiled loop
+    times = np.array(TIMES) + np.array([[0.0], [33.0]])
+    pos, vel, err = sats.propagate(times, backend=backend)
+    pos_np, vel_np, err_np = sats.propagate(times, backend="numpy")
+
+    np.testing.assert_array_equal(err, err_np)
+    np.testing.assert_allclose(pos, pos_np, rtol=0, atol=POSITION_TOLERANCE_KM)
+    np.testing.assert_allclose(
+        vel, vel_np, rtol=0, atol=VELOCITY_TOLERANCE_KM_S
+    )
+
+
+def test_satellite_handle_runs_fused_kernel(monkeypatch):
+    pytest.importorskip("numba")
+    from pyglspg4.api.satellite import Satellite
+    from pyglspg4.backend.numba import NumbaBackend
+
+    calls = []
+    fused = NumbaBackend.fused_near_earth
+
+    def spy(*args):
+        calls.append(args[1].shape)
+        return fused(*args)
+
+    monkeypatch.setattr(NumbaBackend, "fused_near_earth", staticmethod(spy))
+
+    sat = Satellite(parse_tle(*TLES[0]), backend="numba")
+    results = sat.at_many(TIMES)
+
+    assert calls == [(1, len(TIMES))]
+    for (r, v, err), t in zip(results, TIMES):
+        r_ref, v_ref, _ = sat.at(t)
+        assert err == 0
+        np.testing.assert_allclose(r, r_ref, rtol=0, atol=1e-6)
+        np.testing.assert_allclose(v, v_ref, rtol=0, atol=1e-9)
+
+
+@pytest.mark.parametrize("convert", [teme_to_ecef, teme_to_itrf])
+def test_fused_frames_match_python_backend(convert):
+    pytest.importorskip("numba")
+    from pyglspg4.backend.numba import (
+        POSITION_TOLERANCE_KM,
+        VELOCITY_TOLERANCE_KM_S,
+    )
+
+    state = initialize_sgp4(parse_tle(*TLES[0]))
+    samples = [propagate_near_earth(state, t) for t in TIMES]
+    r = np.array([s[0] for s in samples])
+    v = np.array([s[1] for s in samples])
+    jd = state.epoch_jd + np.array(TIMES) / 1440.0
+
+    r_arr, v_arr = convert(r, v, jd, backend="numba")
+
+    for k in range(len(TIMES)):
+        r_ref, v_ref = convert(tuple(r[k]), tuple(v[k]), float(jd[k]))
+        np.testing.assert_allclose(
+            r_arr[k], r_ref, rtol=0, atol=POSITION_TOLERANCE_KM
+        )
+        np.testing.assert_allclose(
+            v_arr[k], v_ref, rtol=0, atol=VELOCITY_TOLERANCE_KM_S
+        )
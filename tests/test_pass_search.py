@@ -0,0 +1,107 @@
+# Copyright (C) 2025-2026 Kris Kirby, KE4AHR
+# SPDX-License-Identifier: LGPL-3.0-or-later
+#
+# Tests for the adaptive pass search.
+
+import math
+
+import pytest
+
+from pyglspg4.tle.parser import parse_tle
+from pyglspg4.api.satellite import Satellite
+from pyglspg4.frames.itrf import teme_to_itrf
+from pyglspg4.groundstation.topocentric import topocentric
+from pyglspg4.groundstation.passes import (
+    coarse_step,
+    find_passes,
+    predict_passes_geodetic,
+)
+
+
+ISS_TLE = (
+    "1 25544U 98067A   24001.51869444  .00016717  00000-0  10270-3 0  9993",
+    "2 25544  51.6405  24.4561 0004382  88.1684  38.3275 15.49745126398784",
+)
+
+LAT = math.radians(32.806671)
+LON = math.radians(-86.791130)
+ALT = 0.2
+
+
+def test_synthetic_events_are_exact():
+    # Rises at t = 10 + 100k, peaks at 25 + 100k, sets at 40 + 100k
+    def elevation(t):
+        return (
+            math.cos(2.0 * math.pi * (t - 25.0) / 100.0)
+            - math.cos(2.0 * math.pi * 15.0 / 100.0)
+        )
+
+    calls = []
+    events = find_passes(
+        lambda t: calls.append(t) or elevation(t),
+        0.0, 300.0, 4.0, tolerance=1e-6,
+    )
+
+    assert len(events) == 3
+    for k, p in enumerate(events):
+        assert math.isclose(p.aos, 10.0 + 100.0 * k, abs_tol=1e-5)
+        assert math.isclose(p.los, 40.0 + 100.0 * k, abs_tol=1e-5)
+        assert math.isclose(p.t_max, 25.0 + 100.0 * k, abs_tol=1e-5)
+        assert math.isclose(p.max_el, elevation(25.0), abs_tol=1e-9)
+    assert len(calls) < 300
+
+
+def test_short_pass_between_samples():
+    # Above the mask for about 7 minutes centred between two samples
+    def elevation(t):
+        return 0.05 - 0.004 * (t - 55.0) ** 2
+
+    events = find_passes(elevation, 0.0, 100.0, 10.0, tolerance=1e-7)
+
+    assert len(events) == 1
+    half_width = math.sqrt(0.05 / 0.004)
+    assert math.isclose(events[0].aos, 55.0 - half_width, abs_tol=1e-6)
+    assert math.isclose(events[0].los, 55.0 + half_width, abs_tol=1e-6)
+    assert math.isclose(events[0].t_max, 55.0, abs_tol=1e-6)
+
+
+def test_iss_events_are_sub_second():
+    sat = Satellite(parse_tle(*ISS_TLE))
+    mask = math.radians(10.0)
+
+    def elevation(t):
+        r, v, _ = sat.at(t)
+        r_itrf, _ = teme_to_itrf(r, v, sat.epoch_jd + t / 1440.0)
+        return topocentric(r_itrf, LAT, LON, ALT)[1]
+
+    events = predict_passes_geodetic(
+        sat, LAT, LON, ALT, sat.epoch_jd, 1440.0, min_elevation=mask
+    )
+    reference = predict_passes_geodetic(
+        sat, LAT, LON, ALT, sat.epoch_jd, 1440.0, step=0.1,
+        min_elevation=mask,
+    )
+
+    assert len(events) == len(reference) > 0
+    one_second = 1.0 / 60.0
+    for p, ref in zip(events, reference):
+        assert abs(p.aos - ref.aos) < one_second
+        assert abs(p.los - ref.los) < one_second
+        assert elevation(p.aos - one_second) < mask < elevation(p.aos + one_second)
+        assert elevation(p.los - one_second) > mask > elevation(p.los + one_second)
+        assert p.max_el >= elevation(p.t_max - one_second)
+        assert p.max_el >= elevation(p.t_max + one_second)
+
+
+def test_geodetic_search_window_is_required():
+    sat = Satellite(parse_tle(*ISS_TLE))
+
+    with pytest.raises(TypeError):
+        predict_passes_geodetic(sat, LAT, LON, ALT)
+
+
+def test_coarse_step_shrinks_with_mask():
+    record = Satellite(parse_tle(*ISS_TLE)).record
+
+    assert 1.0 < coarse_step(record) < 5.0
+    assert coarse_step(record, math.radians(30.0)) < coarse_step(record)
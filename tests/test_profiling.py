@@ -0,0 +1,118 @@
+# Copyright (C) 2025-2026 Kris Kirby, KE4AHR
+# SPDX-License-Identifier: LGPL-3.0-or-later
+#
+# Tests for the opt-in pipeline profiling hooks.
+
+import math
+
+import pytest
+
+import pyglspg4.math.numerics as numerics
+import pyglspg4.sgp4.near_earth as near_earth
+from pyglspg4.api.propagate import propagate
+from pyglspg4.backend.python import PYTHON
+from pyglspg4.math.numerics import (
+    KEPLER_EPSILON,
+    MAX_KEPLER_ITERATIONS,
+    _solve_halley,
+    solve_kepler,
+    solve_kepler_scalar,
+)
+from pyglspg4.sgp4.initializer import initialize_sgp4
+from pyglspg4.sgp4.propagate import propagate as propagate_state
+from pyglspg4.tle.parser import parse_tle
+from pyglspg4.validation import profiling
+
+
+ISS = (
+    "1 25544U 98067A   24001.51869444  .00016717  00000-0  10270-3 0  9991",
+    "2 25544  51.6405  24.4561 0004382  88.1684  38.3275 15.49745126398784",
+)
+
+
+@pytest.fixture(autouse=True)
+def _disabled():
+    yield
+    profiling.disable()
+
+
+def test_scalar_solvers_share_the_counted_iteration():
+    for e in (0.0, 1e-9, 0.001, 0.3, 0.75, 0.85, 0.99):
+        for k in range(24):
+            M = k * math.pi / 12.0
+            E, converged = solve_kepler_scalar(M, e)
+            counted = _solve_halley(
+                M, e, KEPLER_EPSILON, MAX_KEPLER_ITERATIONS
+            )
+            assert counted[:2] == (E, converged)
+            assert solve_kepler(M, e, PYTHON) == E
+
+
+def test_disabled_leaves_library_untouched():
+    originals = (
+        near_earth.propagate_near_earth,
+        numerics.solve_kepler_scalar,
+        propagate_state,
+    )
+
+    profiling.enable()
+    assert profiling.is_enabled()
+    assert near_earth.propagate_near_earth is not originals[0]
+    assert numerics.solve_kepler_scalar is not originals[1]
+    profiling.disable()
+
+    assert not profiling.is_enabled()
+    assert near_earth.propagate_near_earth is originals[0]
+    assert numerics.solve_kepler_scalar is originals[1]
+    assert propagate_state is originals[2]
+
+
+def test_stages_counters_and_caches():
+    tle = parse_tle(*ISS)
+    state = initialize_sgp4(tle)
+    times = [float(t) for t in range(0, 100, 10)]
+
+    expected_iterations = sum(
+        _solve_halley(
+            (state.mean_anomaly + state.xmdot * t
+             + state.mean_motion * 1.5 * state.cc1 * t * t) % (2.0 * math.pi),
+            max(state.eccentricity - state.bstar * state.cc4 * t, 0.0),
+            KEPLER_EPSILON,
+            MAX_KEPLER_ITERATIONS,
+        )[2]
+        for t in times
+    )
+
+    propagate(tle, -1.0)
+    with profiling.profiled():
+        for t in times:
+            propagate_state(state, t)
+            propagate(tle, t)
+
+    snap = profiling.snapshot()
+    stages = snap["stages"]
+
+    assert not snap["enabled"]
+    # The cached Satellite bound its kernel before profiling started
+    assert stages["sgp4.near_earth"]["calls"] == len(times)
+    assert stages["api.propagate"]["calls"] == len(times)
+    assert stages["api.satellite"]["calls"] == len(times)
+    assert stages["kepler"]["calls"] == 2 * len(times)
+    assert stages["sgp4.near_earth"]["seconds"] > 0.0
+    assert snap["counters"]["kepler_iterations"] == 2 * expected_iterations
+    assert snap["caches"]["satellite"]["hits"] == len(times)
+    assert snap["caches"]["satellite"]["misses"] == 0
+
+
+def test_reset_and_prometheus_text():
+    state = initialize_sgp4(parse_tle(*ISS))
+    with profiling.profiled():
+        propagate_state(state, 5.0)
+
+    text = profiling.prometheus()
+    assert "# TYPE pyglspg4_stage_calls_total counter" in text
+    assert 'pyglspg4_stage_calls_total{stage="sgp4.near_earth"} 1' in text
+    assert "pyglspg4_kepler_iterations_total " in text
+
+    profiling.reset()
+    assert profiling.snapshot()["stages"] == {}
@@ -0,0 +1,75 @@
+# Copyright (C) 2025-2026 Kris Kirby, KE4AHR
+# SPDX-License-Identifier: LGPL-3.0-or-later
+#
+# Tests for time-grid propagation.
+
+import math
+
+import pytest
+
+from pyglspg4.tle.parser import parse_tle
+from pyglspg4.sgp4.initializer import initialize_sgp4
+from pyglspg4.sgp4.propagate import (
+    grid_size,
+    iter_grid,
+    propagate,
+    propagate_grid,
+)
+
+
+ISS_TLE = (
+    "1 25544U 98067A   24001.51869444  .00016717  00000-0  10270-3 0  9993",
+    "2 25544  51.6405  24.4561 0004382  88.1684  38.3275 15.49745126398784",
+)
+
+
+def test_grid_size():
+    assert grid_size(0.0, 10.0, 1.0) == 11
+    assert grid_size(0.0, 0.3, 0.1) == 4
+    assert grid_size(0.0, 9.5, 1.0) == 10
+    assert grid_size(10.0, 0.0, -2.5) == 5
+    with pytest.raises(ValueError):
+        grid_size(0.0, 10.0, -1.0)
+
+
+def test_iter_grid_matches_propagate():
+    state = initialize_sgp4(parse_tle(*ISS_TLE))
+
+    samples = list(iter_grid(state, -30.0, 30.0, 7.5))
+
+    assert [s[0] for s in samples] == [-30.0 + 7.5 * k for k in range(9)]
+    for t, r, v, err in samples:
+        assert (r, v, err) == propagate(state, t)
+
+
+def test_array_grid_matches_propagate():
+    np = pytest.importorskip("numpy")
+    state = initialize_sgp4(parse_tle(*ISS_TLE))
+
+    times, pos, vel, err = propagate_grid(state, 0.0, 180.0, 0.5)
+
+    assert pos.shape == vel.shape == (361, 3)
+    assert (err == 0).all()
+    for k in range(0, 361, 37):
+        r, v, _ = propagate(state, float(times[k]))
+        for i in range(3):
+            assert math.isclose(pos[k, i], r[i], abs_tol=1e-6)
+            assert math.isclose(vel[k, i], v[i], abs_tol=1e-9)
+
+
+def test_array_grid_writes_into_out():
+    np = pytest.importorskip("numpy")
+    state = initialize_sgp4(parse_tle(*ISS_TLE))
+
+    block = np.zeros((2, 11, 3))
+    times, pos, vel, _ = propagate_grid(
+        state, 0.0, 10.0, 1.0, out=(block[0], block[1])
+    )
+
+    assert np.shares_memory(pos, block) and np.shares_memory(vel, block)
+    ref = propagate_grid(state, 0.0, 10.0, 1.0)
+    assert np.array_equal(block[0], ref[1])
+    assert np.array_equal(block[1], ref[2])
+
+    with pytest.raises(ValueError):
+        propagate_grid(state, 0.0, 10.0, 1.0, out=(block[0, :5], block[1]))
@@ -0,0 +1,117 @@
+# Copyright (C) 2025-2026 Kris Kirby, KE4AHR
+# SPDX-License-Identifier: LGPL-3.0-or-later
+#
+# Tests for the resonance integrator checkpoints and the vectorized
+# resonance integrator.
+
+import math
+
+import pytest
+
+from pyglspg4.sdp4.dspace import integrate_resonance, whole_steps
+from pyglspg4.sdp4.initializer import initialize_deep_space
+from pyglspg4.sdp4.propagate import propagate_deep_space
+from pyglspg4.sdp4.resonance_cache import ResonanceCache, resonance_start
+from pyglspg4.tle.parser import parse_tle
+
+
+GEO = (
+    "1 40271U 14057A   20029.78495062 -.00000298  00000-0  00000+0 0  9990",
+    "2 40271   0.0170  84.6434 0001146 103.5137  19.7067  1.00272009 19430",
+)
+MOLNIYA = (
+    "1 26853U 01002A   20028.90346378  .00000067  00000-0  00000+0 0  9994",
+    "2 26853  63.4352  89.6846 7222578 270.4485  20.9784  2.00613453 13807",
+)
+HEO = (
+    "1 11801U          80230.29629788  .01431103  00000-0  14311-1 0    13",
+    "2 11801  46.7916 230.4354 7318036  47.4722  10.4117  2.28537848    13",
+)
+
+
+def _record(lines):
+    return initialize_deep_space(parse_tle(*lines))
+
+
+@pytest.mark.parametrize("lines", [GEO, MOLNIYA])
+def test_checkpoints_are_exact(lines):
+    record = _record(lines)
+    cache = ResonanceCache(stride=3)
+
+    # Out of order, both directions, and on exact step boundaries
+    for tsince in (43200.0, 720.0, -10080.0, 7200.0, 0.0, -720.0, 50000.5):
+        expected = propagate_deep_space(record, tsince, cache=None)
+        assert propagate_deep_space(record, tsince, cache=cache) == expected
+
+
+def test_checkpoints_grow_outward():
+    record = _record(GEO)
+    cache = ResonanceCache(stride=2)
+
+    assert cache.start(record, 100.0) == (0.0, record.xlamo, record.mean_motion)
+    atime, _, _ = cache.start(record, 10 * 720.0 + 1.0)
+    assert atime == 10 * 720.0
+    atime, _, _ = cache.start(record, -5 * 720.0 - 1.0)
+    assert atime == -4 * 720.0
+    assert len(cache) == 1
+
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_non_resonant_records_bypass_cache():
+    record = _record(HEO)
+    cache = ResonanceCache()
+
+    assert resonance_start(record, 10080.0, cache) is None
+    assert len(cache) == 0
+
+
+def test_whole_steps():
+    assert whole_steps(0.0) == 0
+    assert whole_steps(719.9) == 0
+    assert whole_steps(720.0) == 1
+    assert whole_steps(-720.0) == 1
+    assert whole_steps(-1441.0) == 2
+
+
+def test_resonance_array_matches_scalar():
+    np = pytest.importorskip("numpy")
+    from pyglspg4.sdp4.resonance_array import ResonanceArray
+
+    records = [_record(GEO), _record(MOLNIYA)]
+    times = np.array([-2000.0, -720.0, 0.0, 719.0, 720.0, 10080.0, 43200.0])
+
+    xn, xl, atime, xli, xni = ResonanceArray(records).integrate(times)
+
+    for i, record in enumerate(records):
+        for j, tsince in enumerate(times.tolist()):
+            xn_ref, xl_ref, last = integrate_resonance(record, tsince)
+            assert atime[i, j] == last[0]
+            assert math.isclose(xn[i, j], xn_ref, rel_tol=1e-12)
+            assert math.isclose(xl[i, j], xl_ref, rel_tol=1e-12)
+            assert math.isclose(xli[i, j], last[1], rel_tol=1e-12)
+            assert math.isclose(xni[i, j], last[2], rel_tol=1e-12)
+
+
+def test_resonance_array_rejects_non_resonant():
+    pytest.importorskip("numpy")
+    from pyglspg4.sdp4.resonance_array import ResonanceArray
+
+    with pytest.raises(ValueError):
+        ResonanceArray([_record(HEO)])
+
+
+def test_resonance_array_checkpoints_are_exact():
+    np = pytest.importorskip("numpy")
+    from pyglspg4.sdp4.resonance_array import ResonanceArray
+
+    records = [_record(GEO), _record(MOLNIYA)]
+    warm = ResonanceArray(records, stride=3)
+    warm.integrate([30000.0, -9000.0])
+
+    for times in ([43200.0, 25000.0], [-20000.0, 1.0], [5000.0]):
+        got = warm.integrate(times)
+        expected = ResonanceArray(records).integrate(times)
+        for a, b in zip(got, expected):
+            assert np.array_equal(a, b)
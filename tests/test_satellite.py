@@ -0,0 +1,121 @@
+# Copyright (C) 2025-2026 Kris Kirby, KE4AHR
+# SPDX-License-Identifier: LGPL-3.0-or-later
+#
+# Tests for the initialize-once Satellite handle.
+
+import dataclasses
+import math
+import pickle
+
+import pytest
+
+from pyglspg4.tle.parser import parse_tle
+from pyglspg4.api.satellite import Satellite
+from pyglspg4.api.batch import propagate_batch
+from pyglspg4.api.parallel import propagate_parallel
+
+
+ISS_TLE = (
+    "1 25544U 98067A   24001.51869444  .00016717  00000-0  10270-3 0  9991",
+    "2 25544  51.6405  24.4561 0004382  88.1684  38.3275 15.49745126398784",
+)
+
+TIMES = [0.0, 10.0, 45.5, 93.0]
+
+
+def _close(a, b, tol):
+    return all(math.isclose(x, y, abs_tol=tol) for x, y in zip(a, b))
+
+
+def test_repeated_calls_are_identical():
+    sat = Satellite(parse_tle(*ISS_TLE))
+
+    first = sat.at(60.0)
+    sat.at(1440.0)
+
+    assert sat.at(60.0) == first
+
+
+def test_record_is_immutable():
+    sat = Satellite(parse_tle(*ISS_TLE))
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        sat.record.eccentricity = 0.5
+
+
+@pytest.mark.parametrize("backend", [None, "numpy"])
+def test_at_many_matches_at(backend):
+    if backend == "numpy":
+        pytest.importorskip("numpy")
+
+    sat = Satellite(parse_tle(*ISS_TLE), backend=backend)
+
+    for (r, v, err), t in zip(sat.at_many(TIMES), TIMES):
+        r_ref, v_ref, _ = sat.at(t)
+        assert err == 0
+        assert _close(r, r_ref, 1e-6)
+        assert _close(v, v_ref, 1e-9)
+
+
+def test_pickle_round_trip():
+    sat = Satellite(parse_tle(*ISS_TLE))
+    clone = pickle.loads(pickle.dumps(sat))
+
+    assert clone.record == sat.record
+    assert clone.at(30.0) == sat.at(30.0)
+
+
+@pytest.mark.parametrize("mode", ["thread", "process"])
+def test_parallel_matches_batch(mode):
+    tles = [parse_tle(*ISS_TLE)] * 3
+    epochs = [0.0, 30.0, 60.0]
+
+    expected = propagate_batch(tles, epochs)
+    results = propagate_parallel(tles, epochs, mode=mode, max_workers=2)
+
+    assert results == expected
+
+
+def test_backend_instance_uses_array_path():
+    pytest.importorskip("numpy")
+    from pyglspg4.backend.numpy import NUMPY
+
+    sat = Satellite(parse_tle(*ISS_TLE), backend=NUMPY)
+    results = sat.at_many(TIMES)
+
+    assert sat._array is not None
+    for (r, v, _), t in zip(results, TIMES):
+        r_ref, v_ref, _ = sat.at(t)
+        assert _close(r, r_ref, 1e-6)
+        assert _close(v, v_ref, 1e-9)
+
+
+@pytest.mark.parametrize("mode", [None, "thread", "process"])
+def test_array_backend_batches_match_scalar(monkeypatch, mode):
+    pytest.importorskip("numpy")
+    from pyglspg4.sgp4.satrec_array import SatrecArray
+
+    tles = [parse_tle(*ISS_TLE)] * 3
+    epochs = [0.0, 30.0, 60.0]
+    expected = propagate_batch(tles, epochs)
+
+    if mode is None:
+        calls = []
+        original = SatrecArray.propagate
+        monkeypatch.setattr(
+            SatrecArray,
+            "propagate",
+            lambda self, *a, **k: calls.append(k) or original(self, *a, **k),
+        )
+        results = propagate_batch(tles, epochs, backend="numpy")
+        assert [k["backend"].name for k in calls] == ["numpy"]
+    else:
+        results = propagate_parallel(
+            tles, epochs, backend="numpy", mode=mode, max_workers=2
+        )
+
+    assert len(results) == len(expected)
+    for (r, v, err), (r_ref, v_ref, err_ref) in zip(results, expected):
+        assert err == err_ref
+        assert _close(r, r_ref, 1e-6)
+        assert _close(v, v_ref, 1e-9)
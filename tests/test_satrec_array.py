@@ -0,0 +1,70 @@
+# Copyright (C) 2025-2026 Kris Kirby, KE4AHR
+# SPDX-License-Identifier: LGPL-3.0-or-later
+#
+# Tests for the structure-of-arrays SGP-4 catalog engine.
+
+import math
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from pyglspg4.tle.parser import parse_tle
+from pyglspg4.sgp4.initializer import initialize_sgp4
+from pyglspg4.sgp4.near_earth import propagate_near_earth
+from pyglspg4.sgp4.satrec_array import SatrecArray
+from pyglspg4.api.vectorized import propagate_vectorized
+
+
+TLES = [
+    (
+        "1 25544U 98067A   24001.51869444  .00016717  00000-0  10270-3 0  9991",
+        "2 25544  51.6405  24.4561 0004382  88.1684  38.3275 15.49745126398784",
+    ),
+    (
+        "1 25544U 98067A   20029.54791435  .00001264  00000-0  29621-4 0  9991",
+        "2 25544  51.6434  69.4038 0007414  74.5522  51.6356 15.49461746211616",
+    ),
+]
+
+TIMES = [0.0, 17.5, 92.0, -45.0, 1440.0]
+
+
+def test_matches_scalar_kernel():
+    tles = [parse_tle(*lines) for lines in TLES]
+    sats = SatrecArray.from_tles(tles)
+
+    pos, vel, err = sats.propagate(TIMES)
+
+    assert pos.shape == (len(TLES), len(TIMES), 3)
+    assert vel.shape == (len(TLES), len(TIMES), 3)
+    assert (err == 0).all()
+
+    for i, tle in enumerate(tles):
+        for j, t in enumerate(TIMES):
+            r, v, _ = propagate_near_earth(initialize_sgp4(tle), t)
+            for k in range(3):
+                assert math.isclose(pos[i, j, k], r[k], abs_tol=1e-6)
+                assert math.isclose(vel[i, j, k], v[k], abs_tol=1e-9)
+
+
+def test_per_satellite_times():
+    tles = [parse_tle(*lines) for lines in TLES]
+    sats = SatrecArray.from_tles(tles)
+
+    tsince = np.array([[0.0, 10.0], [5.0, 15.0]])
+    pos, _, _ = sats.propagate(tsince)
+    ref, _, _ = sats.propagate([5.0, 15.0])
+
+    assert np.allclose(pos[1], ref[1])
+
+
+def test_propagate_vectorized_returns_tuples():
+    tles = [parse_tle(*lines) for lines in TLES]
+
+    results = propagate_vectorized(tles, 30.0)
+
+    assert len(results) == len(TLES)
+    for pos, vel, err in results:
+        assert err == 0
+        assert 6500.0 < math.sqrt(sum(p * p for p in pos)) < 7000.0
@@ -0,0 +1,140 @@
+# Copyright (C) 2025-2026 Kris Kirby, KE4AHR
+# SPDX-License-Identifier: LGPL-3.0-or-later
+#
+# Tests for the SDP-4 deep-space propagator and its dispatch.
+
+import math
+import pickle
+
+import pytest
+
+from pyglspg4.api.satellite import Satellite
+from pyglspg4.sdp4.initializer import initialize_deep_space
+from pyglspg4.sdp4.propagate import propagate_deep_space
+from pyglspg4.sdp4.record import (
+    RESONANCE_HALF_DAY,
+    RESONANCE_NONE,
+    RESONANCE_SYNCHRONOUS,
+    SDP4Record,
+)
+from pyglspg4.sgp4.initializer import initialize
+from pyglspg4.sgp4.propagate import propagate
+from pyglspg4.tle.parser import parse_tle
+
+
+GEO = (
+    "1 40271U 14057A   20029.78495062 -.00000298  00000-0  00000+0 0  9990",
+    "2 40271   0.0170  84.6434 0001146 103.5137  19.7067  1.00272009 19430",
+)
+MOLNIYA = (
+    "1 26853U 01002A   20028.90346378  .00000067  00000-0  00000+0 0  9994",
+    "2 26853  63.4352  89.6846 7222578 270.4485  20.9784  2.00613453 13807",
+)
+# First object of the Vallado et al. (2006) verification set
+HEO = (
+    "1 11801U          80230.29629788  .01431103  00000-0  14311-1 0    13",
+    "2 11801  46.7916 230.4354 7318036  47.4722  10.4117  2.28537848    13",
+)
+ISS = (
+    "1 25544U 98067A   24001.51869444  .00016717  00000-0  10270-3 0  9991",
+    "2 25544  51.6405  24.4561 0004382  88.1684  38.3275 15.49745126398784",
+)
+
+# Output of the Vallado et al. (2006) reference implementation, WGS-72
+REFERENCE = [
+    (GEO, 0.0,
+     (-37261.51589181, -19723.40370620, 23.16334938),
+     (1.43848402942, -2.71784729733, -0.00112999526)),
+    (GEO, 10080.0,
+     (-34627.18825550, -24050.49363608, 29.37419448),
+     (1.75403913495, -2.52569384206, -0.00192197007)),
+    (GEO, -720.0,
+     (37440.55597868, 19401.11254681, -22.89331085),
+     (-1.41457842977, 2.72962016220, 0.00111404396)),
+    (MOLNIYA, 1440.0,
+     (-2311.61438164, 15641.65785035, 4834.05864355),
+     (-2.36389390888, 2.22932565047, 4.75929868162)),
+    (MOLNIYA, 10080.0,
+     (-5582.90201646, 17927.34947521, 11924.40852966),
+     (-2.00200652005, 0.73109004843, 4.03577172333)),
+    (HEO, 0.0,
+     (7473.37102491, 428.94748312, 5828.74846783),
+     (5.10715539086, 6.44468030463, -0.18613329734)),
+    (HEO, 1440.0,
+     (9787.87836256, 33753.32249667, -15030.79874625),
+     (-1.09425155285, 0.92358990562, -1.52231100767)),
+]
+
+
+@pytest.mark.parametrize("lines, tsince, r_ref, v_ref", REFERENCE)
+def test_matches_reference_implementation(lines, tsince, r_ref, v_ref):
+    record = initialize_deep_space(parse_tle(*lines))
+
+    r, v, err = propagate_deep_space(record, tsince)
+
+    assert err == 0
+    for k in range(3):
+        assert math.isclose(r[k], r_ref[k], abs_tol=1e-6)
+        assert math.isclose(v[k], v_ref[k], abs_tol=1e-9)
+
+
+def test_resonance_classes():
+    assert initialize_deep_space(parse_tle(*GEO)).irez == RESONANCE_SYNCHRONOUS
+    assert initialize_deep_space(parse_tle(*MOLNIYA)).irez == RESONANCE_HALF_DAY
+    assert initialize_deep_space(parse_tle(*HEO)).irez == RESONANCE_NONE
+
+
+def test_initializer_attaches_record():
+    state = initialize(parse_tle(*MOLNIYA))
+
+    assert state.is_deep_space
+    assert isinstance(state.deep_space_state, SDP4Record)
+    assert initialize_deep_space(state) is state.deep_space_state
+
+    expected = propagate_deep_space(state.deep_space_state, 300.0)
+    assert propagate(state, 300.0) == expected
+
+
+def test_satellite_uses_sdp4():
+    sat = Satellite(parse_tle(*GEO))
+
+    assert isinstance(sat.record, SDP4Record)
+
+    r, _, err = sat.at(0.0)
+    assert err == 0
+    # Geostationary radius
+    assert abs(math.sqrt(sum(x * x for x in r)) - 42164.0) < 50.0
+
+
+def test_record_pickles():
+    record = initialize_deep_space(parse_tle(*MOLNIYA))
+    copy = pickle.loads(pickle.dumps(record))
+
+    assert copy == record
+    assert propagate_deep_space(copy, 5000.0) == propagate_deep_space(record, 5000.0)
+
+
+def test_mixed_catalog_in_one_call():
+    np = pytest.importorskip("numpy")
+    from pyglspg4.sgp4.near_earth import propagate_near_earth
+    from pyglspg4.sgp4.satrec_array import SatrecArray
+
+    tles = [parse_tle(*lines) for lines in (ISS, GEO, MOLNIYA)]
+    sats = SatrecArray.from_tles(tles)
+    times = [0.0, 90.0, 1440.0]
+
+    pos, vel, err = sats.propagate(times)
+
+    assert list(sats.deep_rows) == [1, 2]
+    assert (err == 0).all()
+
+    iss = initialize(tles[0])
+    for j, t in enumerate(times):
+        r, v, _ = propagate_near_earth(iss, t)
+        assert np.allclose(pos[0, j], r, atol=1e-6)
+        assert np.allclose(vel[0, j], v, atol=1e-9)
+
+        for row in (1, 2):
+            r, v, _ = propagate_deep_space(sats.deep_records[row - 1], t)
+            assert np.allclose(pos[row, j], r, atol=1e-6)
+            assert np.allclose(vel[row, j], v, atol=1e-9)
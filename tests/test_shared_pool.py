@@ -0,0 +1,112 @@
+# Copyright (C) 2025-2026 Kris Kirby, KE4AHR
+# SPDX-License-Identifier: LGPL-3.0-or-later
+#
+# Tests for the shared-memory process pool.
+
+import math
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from pyglspg4.tle.parser import parse_tle
+from pyglspg4.api.batch import propagate_batch
+from pyglspg4.api.parallel import propagate_parallel
+from pyglspg4.sgp4.satrec_array import SatrecArray
+from pyglspg4.parallel.shared import SharedPool
+
+
+TLES = [
+    (
+        "1 25544U 98067A   24001.51869444  .00016717  00000-0  10270-3 0  9993",
+        "2 25544  51.6405  24.4561 0004382  88.1684  38.3275 15.49745126398784",
+    ),
+    (
+        "1 43013U 17073A   24001.50000000 -.00000260  00000-0 -10000-4 0  9996",
+        "2 43013  98.7100 100.0000 0011000 200.0000 160.0000 14.19500000300003",
+    ),
+]
+
+GEO = (
+    "1 40271U 14057A   20029.78495062 -.00000298  00000-0  00000+0 0  9990",
+    "2 40271   0.0170  84.6434 0001146 103.5137  19.7067  1.00272009 19430",
+)
+
+
+def _catalog(n):
+    return SatrecArray.from_tles([parse_tle(*TLES[i % 2]) for i in range(n)])
+
+
+def test_matches_in_process_propagation():
+    array = _catalog(37)
+    times = np.linspace(-60.0, 600.0, 23)
+
+    with SharedPool(max_workers=2) as pool:
+        pos, vel, err = pool.propagate(array, times)
+        # Second call reuses the warm pool and the packed columns
+        pos2, _, _ = pool.propagate(array, times[:5])
+
+    ref_pos, ref_vel, ref_err = array.propagate(times)
+    assert np.array_equal(pos, ref_pos)
+    assert np.array_equal(vel, ref_vel)
+    assert np.array_equal(err, ref_err)
+    assert np.array_equal(pos2, ref_pos[:, :5])
+
+
+def test_per_satellite_times_and_growth():
+    small = _catalog(3)
+    large = _catalog(50)
+
+    with SharedPool(max_workers=2) as pool:
+        pool.propagate(small, [0.0])
+        tsince = np.arange(50 * 4, dtype=float).reshape(50, 4)
+        pos, _, _ = pool.propagate(large, tsince)
+
+    ref, _, _ = large.propagate(tsince)
+    assert np.array_equal(pos, ref)
+
+
+def test_closed_pool_rejects_work():
+    pool = SharedPool(max_workers=1)
+    pool.close()
+    with pytest.raises(RuntimeError):
+        pool.propagate(_catalog(1), [0.0])
+
+
+def test_propagate_parallel_shared_mode():
+    tles = [parse_tle(*TLES[i % 2]) for i in range(6)]
+    epochs = [float(10 * i) for i in range(6)]
+
+    expected = propagate_batch(tles, epochs)
+    results = propagate_parallel(tles, epochs, mode="shared", max_workers=2)
+
+    for (r, v, e), (r_ref, v_ref, e_ref) in zip(results, expected):
+        assert e == e_ref
+        for k in range(3):
+            assert math.isclose(r[k], r_ref[k], abs_tol=1e-6)
+            assert math.isclose(v[k], v_ref[k], abs_tol=1e-9)
+
+
+def test_mixed_catalog_propagates_deep_space_rows_with_sdp4():
+    lines = [TLES[0], GEO, TLES[1], GEO, TLES[0]]
+    tles = [parse_tle(*pair) for pair in lines]
+    epochs = [float(90 * i) for i in range(len(tles))]
+
+    expected = propagate_batch(tles, epochs)
+    results = propagate_parallel(tles, epochs, mode="shared", max_workers=2)
+
+    for (r, v, e), (r_ref, v_ref, e_ref) in zip(results, expected):
+        assert e == e_ref
+        for k in range(3):
+            assert math.isclose(r[k], r_ref[k], abs_tol=1e-6)
+            assert math.isclose(v[k], v_ref[k], abs_tol=1e-9)
+
+    array = SatrecArray.from_tles(tles)
+    times = np.linspace(0.0, 1440.0, 7)
+    with SharedPool(max_workers=2) as pool:
+        pos, vel, err = pool.propagate(array, times)
+
+    ref_pos, ref_vel, ref_err = array.propagate(times)
+    assert np.array_equal(pos, ref_pos)
+    assert np.array_equal(vel, ref_vel)
+    assert np.array_equal(err, ref_err)
@@ -0,0 +1,57 @@
+# Copyright (C) 2025-2026 Kris Kirby, KE4AHR
+# SPDX-License-Identifier: LGPL-3.0-or-later
+#
+# Tests for the sidereal time service.
+
+import math
+
+import pytest
+
+from pyglspg4.frames import sidereal
+from pyglspg4.frames.gmst import gmst_from_jd
+from pyglspg4.frames.sidereal import era, gmst, split_jd
+
+
+def test_gmst_matches_vallado_example():
+    # Vallado Example 3-5: 1992 Aug 20, 12:14 UT1
+    theta = gmst(2448855.0, 14.0 / 1440.0)
+    assert math.degrees(theta) == pytest.approx(152.578787810, abs=1e-6)
+
+
+def test_era_at_j2000():
+    assert era(2451545.0) == pytest.approx(
+        2.0 * math.pi * 0.7790572732640, abs=1e-15
+    )
+
+
+def test_split_forms_agree():
+    assert split_jd(2460311.75) == (2460311, 0.75)
+    assert split_jd(2460311.5, 0.75) == (2460312, 0.25)
+    for fn in (gmst, era):
+        # A single float JD resolves about 20 microseconds of time
+        assert fn(2460311.0, 0.3) == pytest.approx(fn(2460311.3), abs=1e-8)
+        assert fn(2460310.5, 0.8) == pytest.approx(fn(2460311.0, 0.3), abs=1e-12)
+
+
+def test_scalar_results_are_memoized():
+    sidereal.clear_sidereal_cache()
+    gmst(2460311.25)
+    gmst(2460311.25)
+    gmst_from_jd(2460311.0, 0.25)
+    info = sidereal._gmst_cached.cache_info()
+    assert (info.hits, info.misses) == (2, 1)
+
+
+def test_arrays_match_scalars():
+    np = pytest.importorskip("numpy")
+    whole = np.full(50, 2460311.0)
+    frac = np.linspace(-2.0, 3.0, 50)
+
+    for fn in (gmst, era):
+        values = fn(whole, frac)
+        assert values.shape == (50,)
+        assert np.all((values >= 0.0) & (values < 2.0 * math.pi))
+        for k in range(50):
+            assert values[k] == pytest.approx(
+                fn(float(whole[k]), float(frac[k])), abs=1e-12
+            )
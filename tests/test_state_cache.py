@@ -0,0 +1,149 @@
+# Copyright (C) 2025-2026 Kris Kirby, KE4AHR
+# SPDX-License-Identifier: LGPL-3.0-or-later
+#
+# Tests for the persistent initialized-state cache.
+
+from pyglspg4.api.satellite import Satellite
+from pyglspg4.sgp4.cache import StateCache, cache_key
+from pyglspg4.sdp4.initializer import initialize_deep_space
+from pyglspg4.sdp4.record import SDP4Record
+from pyglspg4.sgp4.initializer import initialize_sgp4
+from pyglspg4.sgp4.record import SGP4Record
+from pyglspg4.tle.parser import parse_tle
+
+
+ISS = (
+    "1 25544U 98067A   24001.51869444  .00016717  00000-0  10270-3 0  9993",
+    "2 25544  51.6405  24.4561 0004382  88.1684  38.3275 15.49745126398784",
+)
+NOAA = (
+    "1 43013U 17073A   24001.50000000 -.00000260  00000-0 -10000-4 0  9996",
+    "2 43013  98.7100 100.0000 0011000 200.0000 160.0000 14.19500000300003",
+)
+OTHER = (
+    "1 25544U 98067A   20029.54791435  .00001264  00000-0  29621-4 0  9991",
+    "2 25544  51.6434  69.4038 0007414  74.5522  51.6356 15.49461746211616",
+)
+
+GEO = (
+    "1 40271U 14057A   20029.78495062 -.00000298  00000-0  00000+0 0  9990",
+    "2 40271   0.0170  84.6434 0001146 103.5137  19.7067  1.00272009 19430",
+)
+
+
+def test_key_ignores_trailing_whitespace():
+    assert cache_key(*ISS) == cache_key(ISS[0] + "  ", ISS[1] + "\r")
+    assert cache_key(*ISS) != cache_key(*NOAA)
+
+
+def test_round_trip(tmp_path):
+    path = tmp_path / "states.bin"
+    expected = SGP4Record.from_state(initialize_sgp4(parse_tle(*ISS)))
+
+    with StateCache(path) as cache:
+        assert cache.get(*ISS) is None
+        assert cache.get_or_initialize(*ISS) == expected
+
+    cache = StateCache(path)
+    assert len(cache) == 1
+    assert ISS in cache
+    assert cache.get(*ISS) == expected
+    cache.close()
+
+
+def test_lru_eviction(tmp_path):
+    path = tmp_path / "states.bin"
+
+    with StateCache(path, max_entries=2) as cache:
+        cache.get_or_initialize(*ISS)
+        cache.get_or_initialize(*NOAA)
+
+    with StateCache(path, max_entries=2) as cache:
+        cache.get(*ISS)
+        cache.get_or_initialize(*OTHER)
+
+    cache = StateCache(path, max_entries=2)
+    assert ISS in cache
+    assert OTHER in cache
+    assert NOAA not in cache
+    cache.close()
+
+
+def test_foreign_file_is_ignored(tmp_path):
+    path = tmp_path / "states.bin"
+    path.write_bytes(b"not a cache file at all, just some bytes" * 4)
+
+    with StateCache(path) as cache:
+        assert len(cache) == 0
+        cache.get_or_initialize(*ISS)
+
+    assert ISS in StateCache(path)
+
+
+def test_satellite_from_lines(tmp_path):
+    with StateCache(tmp_path / "states.bin") as cache:
+        cached = Satellite.from_lines(*ISS, cache=cache)
+        cached_again = Satellite.from_lines(*ISS, cache=cache)
+
+    plain = Satellite.from_lines(*ISS)
+
+    assert cached.record == plain.record
+    assert cached_again.record == plain.record
+    assert cached.at(90.0) == plain.at(90.0)
+
+
+def test_deep_space_round_trip(tmp_path):
+    path = tmp_path / "states.bin"
+    expected = initialize_deep_space(parse_tle(*GEO))
+
+    # Deep-space entries are longer; mix them with near-Earth ones
+    with StateCache(path) as cache:
+        cache.get_or_initialize(*ISS)
+        assert cache.get_or_initialize(*GEO) == expected
+        cache.get_or_initialize(*NOAA)
+
+    with StateCache(path) as cache:
+        record = cache.get(*GEO)
+        assert isinstance(record, SDP4Record)
+        assert record == expected
+        assert isinstance(record.irez, int)
+        assert cache.get(*NOAA).is_deep_space is False
+
+        sat = Satellite.from_lines(*GEO, cache=cache)
+        plain = Satellite.from_lines(*GEO)
+        assert sat.record == plain.record
+        assert sat.at(720.0) == plain.at(720.0)
+
+
+def test_index_lookup_over_many_entries(tmp_path):
+    path = tmp_path / "states.bin"
+    near = SGP4Record.from_state(initialize_sgp4(parse_tle(*ISS)))
+    deep = initialize_deep_space(parse_tle(*GEO))
+    pairs = [(f"line1 {k}", f"line2 {k}") for k in range(200)]
+
+    with StateCache(path) as cache:
+        for k, lines in enumerate(pairs):
+            cache.put(*lines, deep if k % 7 == 0 else near)
+
+    cache = StateCache(path)
+    cache.put(*pairs[3], near)
+    cache.put(*ISS, near)
+    assert len(cache) == len(pairs) + 1
+    for k, lines in enumerate(pairs):
+        assert lines in cache
+        assert cache.get(*lines) == (deep if k % 7 == 0 else near)
+    assert ("line1 x", "line2 x") not in cache
+    cache.close()
+
+
+def test_truncated_file_is_ignored(tmp_path):
+    path = tmp_path / "states.bin"
+    with StateCache(path) as cache:
+        cache.get_or_initialize(*ISS)
+        cache.get_or_initialize(*GEO)
+
+    path.write_bytes(path.read_bytes()[:-8])
+    cache = StateCache(path)
+    assert len(cache) == 0
+    assert cache.get(*GEO) is None
+    cache.close()
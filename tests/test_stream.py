@@ -0,0 +1,98 @@
+# Copyright (C) 2025-2026 Kris Kirby, KE4AHR
+# SPDX-License-Identifier: LGPL-3.0-or-later
+#
+# Tests for streaming ephemeris generation.
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from pyglspg4.api.stream import stream_ephemeris
+from pyglspg4.sgp4.satrec_array import SatrecArray
+from pyglspg4.tle.parser import parse_tle
+
+
+TLES = [
+    (
+        "1 25544U 98067A   24001.51869444  .00016717  00000-0  10270-3 0  9991",
+        "2 25544  51.6405  24.4561 0004382  88.1684  38.3275 15.49745126398784",
+    ),
+    (
+        "1 40271U 14057A   20029.78495062 -.00000298  00000-0  00000+0 0  9990",
+        "2 40271   0.0170  84.6434 0001146 103.5137  19.7067  1.00272009 19430",
+    ),
+]
+
+JD_START = 2460311.0
+
+
+def _sats():
+    return SatrecArray.from_tles([parse_tle(*lines) for lines in TLES])
+
+
+def _reference(sats, count, step_seconds):
+    jd = JD_START + np.arange(count) * (step_seconds / 86400.0)
+    return sats.propagate(sats.tsince_at(jd))
+
+
+def test_blocks_cover_span():
+    sats = _sats()
+
+    chunks = list(stream_ephemeris(sats, JD_START, 0.01, 60.0, chunk_size=4))
+
+    # 0.01 days at 60 s spacing: samples 0..14
+    assert [c.index for c in chunks] == [0, 4, 8, 12]
+    assert [len(c) for c in chunks] == [4, 4, 4, 3]
+    assert list(chunks[0].satnums) == [25544, 40271]
+    assert chunks[-1].position.shape == (2, 3, 3)
+
+    position, velocity, error = _reference(sats, 15, 60.0)
+    assert np.allclose(
+        np.concatenate([c.position for c in chunks], axis=1), position,
+        atol=1e-6,
+    )
+    assert np.allclose(
+        np.concatenate([c.velocity for c in chunks], axis=1), velocity,
+        atol=1e-9,
+    )
+    assert (np.concatenate([c.error for c in chunks], axis=1) == error).all()
+
+
+@pytest.mark.parametrize("prefetch", [0, 1, 3])
+def test_prefetch_and_buffer_reuse_preserve_results(prefetch):
+    sats = _sats()
+    expected = [
+        c.position.copy()
+        for c in stream_ephemeris(sats, JD_START, 0.05, 30.0, chunk_size=16)
+    ]
+
+    stream = stream_ephemeris(
+        sats, JD_START, 0.05, 30.0,
+        chunk_size=16, prefetch=prefetch, reuse_buffers=True,
+    )
+    got = [c.position.copy() for c in stream]
+
+    assert len(got) == len(expected)
+    for a, b in zip(got, expected):
+        assert np.array_equal(a, b)
+
+
+def test_consumer_can_stop_early():
+    stream = stream_ephemeris(
+        _sats(), JD_START, 7.0, 1.0, chunk_size=60, prefetch=2
+    )
+
+    first = next(stream)
+    stream.close()
+
+    assert first.index == 0
+
+
+def test_invalid_arguments():
+    sats = _sats()
+    with pytest.raises(ValueError):
+        stream_ephemeris(sats, JD_START, 1.0, 0.0)
+    with pytest.raises(ValueError):
+        stream_ephemeris(sats, JD_START, 1.0, 60.0, chunk_size=0)
+    with pytest.raises(ValueError):
+        stream_ephemeris(sats, JD_START, 1.0, 60.0, prefetch=-1)
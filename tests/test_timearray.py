@@ -0,0 +1,81 @@
+# Copyright (C) 2025-2026 Kris Kirby, KE4AHR
+# SPDX-License-Identifier: LGPL-3.0-or-later
+#
+# Tests for two-part time arrays.
+
+import datetime
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from pyglspg4.frames.eop import EOPRecord, EOPTable
+from pyglspg4.sgp4.satrec_array import COLUMNS, SatrecArray
+from pyglspg4.time.julian import datetime_to_jd
+from pyglspg4.time.timearray import TimeArray, tai_minus_utc
+
+
+def test_datetime64_range_is_exact():
+    times = TimeArray.range(
+        "2024-01-01T00:00", "2024-01-02T00:00", np.timedelta64(1, "h")
+    )
+    assert len(times) == 24
+    assert times.whole[0] == 2460310.0 and times.frac[0] == 0.5
+    assert np.all((times.frac >= 0.0) & (times.frac < 1.0))
+    np.testing.assert_array_equal(
+        times.to_datetime64(),
+        np.arange(
+            np.datetime64("2024-01-01T00:00", "ns"),
+            np.datetime64("2024-01-02T00:00", "ns"),
+            np.timedelta64(1, "h"),
+        ),
+    )
+
+
+def test_microseconds_survive_round_trip():
+    start = np.datetime64("2031-06-15T12:34:56.000001", "ns")
+    times = TimeArray.from_datetime64(start + np.arange(5) * np.timedelta64(1, "us"))
+    np.testing.assert_array_equal(np.diff(times.to_datetime64()).astype(int), 1000)
+
+
+def test_matches_float_julian_dates():
+    dt = datetime.datetime(2024, 3, 1, 6, 30, 15)
+    times = TimeArray.from_datetimes([dt])
+    assert times.jd[0] == pytest.approx(datetime_to_jd(dt), abs=1e-9)
+
+
+def test_tt_and_ut1_offsets():
+    utc = TimeArray.range("2016-12-31T12:00", "2017-01-01T12:00:01", 43200.0)
+    assert list(tai_minus_utc(utc.mjd)) == [36.0, 37.0, 37.0]
+
+    tt = utc.to("tt")
+    seconds = (tt.whole - utc.whole + tt.frac - utc.frac) * 86400.0
+    np.testing.assert_allclose(seconds, [68.184, 69.184, 69.184], atol=1e-6)
+    back = tt.to("utc").to_datetime64()
+    np.testing.assert_array_equal(back, utc.to_datetime64())
+
+    eop = EOPTable()
+    eop.load_records(
+        [EOPRecord(mjd=m, xp=0.0, yp=0.0, ut1_utc=0.25) for m in (57753, 57754, 57755)]
+    )
+    ut1 = utc.to("ut1", eop=eop)
+    assert ut1.scale == "ut1"
+    seconds = (ut1.whole - utc.whole + ut1.frac - utc.frac) * 86400.0
+    np.testing.assert_allclose(seconds, 0.25, atol=1e-6)
+    np.testing.assert_allclose(ut1.to("utc", eop=eop).jd, utc.jd, atol=1e-12)
+
+
+def test_minutes_since_epoch_for_many_satellites():
+    times = TimeArray.range("2024-01-01T00:00", "2024-01-01T01:00", 600.0)
+    epochs = np.array([2460310.5, 2460310.25, 2460311.0])
+
+    tsince = times.minutes_since_epoch(epochs)
+    assert tsince.shape == (3, 6)
+    np.testing.assert_allclose(tsince[0], np.arange(6) * 10.0, atol=1e-9)
+    np.testing.assert_allclose(tsince[1] - tsince[0], 360.0, atol=1e-9)
+    assert times.minutes_since_epoch(2460310.5).shape == (6,)
+
+    array = SatrecArray(
+        {name: epochs if name == "epoch_jd" else np.zeros(3) for name in COLUMNS}
+    )
+    np.testing.assert_array_equal(array.tsince_at(times), tsince)
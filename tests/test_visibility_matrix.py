@@ -0,0 +1,122 @@
+# Copyright (C) 2025-2026 Kris Kirby, KE4AHR
+# SPDX-License-Identifier: LGPL-3.0-or-later
+#
+# Tests for the multi-station visibility matrix.
+
+import math
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from pyglspg4.groundstation.station import GroundStation
+from pyglspg4.groundstation.topocentric import topocentric
+from pyglspg4.groundstation.visibility_matrix import (
+    StationArray,
+    look_angles,
+    visible_intervals,
+)
+import pyglspg4.groundstation.visibility_matrix as visibility_matrix
+
+
+STATIONS = [
+    (math.radians(32.8), math.radians(-86.8), 0.2),
+    (math.radians(-33.9), math.radians(18.4), 0.0),
+    (math.radians(64.8), math.radians(-147.7), 0.1),
+]
+
+
+def _orbit(n_sat, n_time):
+    # Circular orbits at 7000 km with different phases and planes
+    t = np.linspace(0.0, 2.0 * math.pi, n_time)
+    phase = np.linspace(0.0, math.pi, n_sat)[:, np.newaxis]
+    inc = np.linspace(0.3, 1.5, n_sat)[:, np.newaxis]
+    u = t[np.newaxis, :] + phase
+    return 7000.0 * np.stack(
+        (np.cos(u), np.sin(u) * np.cos(inc), np.sin(u) * np.sin(inc)),
+        axis=-1,
+    )
+
+
+def test_look_angles_match_scalar_topocentric():
+    lat, lon, alt = zip(*STATIONS)
+    stations = StationArray(lat, lon, alt)
+    r = _orbit(4, 25)
+
+    az, el, rho = look_angles(stations, r)
+    assert az.shape == el.shape == rho.shape == (3, 4, 25)
+
+    for s, (slat, slon, salt) in enumerate(STATIONS):
+        for n in range(4):
+            for k in range(0, 25, 6):
+                expected = topocentric(tuple(r[n, k]), slat, slon, salt)
+                assert az[s, n, k] == pytest.approx(expected[0], abs=1e-9)
+                assert el[s, n, k] == pytest.approx(expected[1], abs=1e-9)
+                assert rho[s, n, k] == pytest.approx(expected[2], rel=1e-12)
+
+
+def test_from_stations_uses_ground_station_coordinates():
+    station = GroundStation(*STATIONS[0])
+    stations = StationArray.from_stations([station])
+    assert len(stations) == 1
+    assert stations.lat[0] == STATIONS[0][0]
+
+
+def test_intervals_match_dense_mask():
+    lat, lon, alt = zip(*STATIONS)
+    mask = np.radians([0.0, 10.0, 5.0])
+    stations = StationArray(lat, lon, alt, min_elevation=mask)
+    r = _orbit(6, 400)
+    times = np.arange(400) * 0.5
+
+    _, el, _ = look_angles(stations, r)
+    expected = el >= mask[:, np.newaxis, np.newaxis]
+
+    result = visible_intervals(stations, r, times)
+    assert len(result) > 0
+
+    rebuilt = np.zeros_like(expected)
+    for i in range(len(result)):
+        rebuilt[
+            result.station[i],
+            result.satellite[i],
+            result.start[i]:result.stop[i] + 1,
+        ] = True
+        assert result.time_start[i] == times[result.start[i]]
+    np.testing.assert_array_equal(rebuilt, expected)
+
+
+@pytest.mark.parametrize("block", [1, 7, 150, 1000])
+def test_blocks_give_same_results(monkeypatch, block):
+    lat, lon, alt = zip(*STATIONS)
+    stations = StationArray(lat, lon, alt)
+    r = _orbit(5, 200)
+
+    whole = visible_intervals(stations, r)
+    angles = look_angles(stations, r)
+    monkeypatch.setattr(visibility_matrix, "_BLOCK_ELEMENTS", block)
+    blocked = visible_intervals(stations, r)
+
+    # Blocks split the time axis, so passes must be joined across them
+    assert list(whole) == list(blocked)
+    for expected, got in zip(angles, look_angles(stations, r)):
+        np.testing.assert_allclose(got, expected, rtol=1e-12, atol=1e-12)
+
+
+def test_blocks_bound_every_temporary(monkeypatch):
+    monkeypatch.setattr(visibility_matrix, "_BLOCK_ELEMENTS", 64)
+    blocks = list(visibility_matrix._blocks(3, 40, 1000))
+
+    sizes = [
+        len(range(3)[s]) * len(range(40)[n]) * len(range(1000)[t])
+        for s, n, t in blocks
+    ]
+    assert max(sizes) <= 64
+    assert sum(sizes) == 3 * 40 * 1000
+
+
+def test_single_satellite_grid_and_no_visibility():
+    stations = StationArray(0.0, 0.0, 0.0)
+    # Always on the far side of the Earth
+    r = np.tile([-7000.0, 0.0, 0.0], (10, 1))
+    assert len(visible_intervals(stations, r)) == 0